@@ -0,0 +1,33 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+import argparse
+import json
+
+from bijux_vex.bench.mmr import DEFAULT_CANDIDATES, DEFAULT_MMR_K, run_mmr_benchmark
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare the reference and NumPy MMR diversity rerank paths."
+    )
+    parser.add_argument("--candidates", type=int, default=DEFAULT_CANDIDATES)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--top-k", type=int, default=DEFAULT_MMR_K)
+    parser.add_argument("--diversity-lambda", type=float, default=0.5)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    result = run_mmr_benchmark(
+        candidates=args.candidates,
+        dimension=args.dimension,
+        top_k=args.top_k,
+        diversity_lambda=args.diversity_lambda,
+        repeats=args.repeats,
+    )
+    print(json.dumps(result, indent=2))
+    return 0 if result["same_order"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
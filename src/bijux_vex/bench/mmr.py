@@ -0,0 +1,59 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+import statistics
+import time
+from typing import Any
+
+from bijux_vex.bench.dataset import DEFAULT_DIMENSION, DEFAULT_SEED
+from bijux_vex.domain.execution_algorithms.mmr import (
+    mmr_order_matrix,
+    mmr_order_reference,
+)
+
+DEFAULT_CANDIDATES = 500
+DEFAULT_MMR_K = 10
+
+
+def run_mmr_benchmark(
+    *,
+    candidates: int = DEFAULT_CANDIDATES,
+    dimension: int = DEFAULT_DIMENSION,
+    top_k: int = DEFAULT_MMR_K,
+    diversity_lambda: float = 0.5,
+    repeats: int = 3,
+    seed: int = DEFAULT_SEED,
+) -> dict[str, Any]:
+    """Time the pure-Python and NumPy MMR paths on the same candidate set."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    query = tuple(float(v) for v in rng.normal(size=dimension))
+    rows = [
+        tuple(float(v) for v in row) for row in rng.normal(size=(candidates, dimension))
+    ]
+    paths = {"reference": mmr_order_reference, "matrix": mmr_order_matrix}
+    timings: dict[str, list[float]] = {name: [] for name in paths}
+    orders: dict[str, list[int]] = {}
+    for _ in range(max(1, repeats)):
+        for name, fn in paths.items():
+            start = time.perf_counter()
+            orders[name] = fn(query, rows, diversity_lambda, top_k)
+            timings[name].append((time.perf_counter() - start) * 1000.0)
+    reference_ms = statistics.median(timings["reference"])
+    matrix_ms = statistics.median(timings["matrix"])
+    return {
+        "candidates": candidates,
+        "dimension": dimension,
+        "top_k": top_k,
+        "diversity_lambda": diversity_lambda,
+        "repeats": max(1, repeats),
+        "reference_ms": reference_ms,
+        "matrix_ms": matrix_ms,
+        "speedup": reference_ms / matrix_ms if matrix_ms else float("inf"),
+        "same_order": orders["reference"] == orders["matrix"],
+    }
+
+
+__all__ = ["DEFAULT_CANDIDATES", "DEFAULT_MMR_K", "run_mmr_benchmark"]
@@ -2,10 +2,14 @@
 # Copyright © 2025 Bijan Mousavi
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import threading
 from typing import NoReturn, cast
 
 from fastapi import FastAPI, Header, HTTPException, Response
 
+from bijux_vex.boundaries.api.engine_pool import EnginePool
 from bijux_vex.boundaries.exception_bridge import (
     is_refusal,
     record_failure,
@@ -16,6 +20,7 @@ from bijux_vex.boundaries.pydantic_edges.models import (
     BackendCapabilitiesReport,
     CreateRequest,
     ExecutionArtifactRequest,
+    ExecutionBatchRequestPayload,
     ExecutionRequestPayload,
     ExplainRequest,
     IngestRequest,
@@ -29,12 +34,48 @@ from bijux_vex.core.config import (
 from bijux_vex.core.errors import BijuxError
 from bijux_vex.core.runtime.vector_execution import RandomnessProfile
 from bijux_vex.core.types import ExecutionBudget
+from bijux_vex.infra.embeddings.registry import preload_embedding_models
 from bijux_vex.infra.run_store import RunStore
-from bijux_vex.services.execution_engine import VectorExecutionEngine
+from bijux_vex.services.execution_engine import close_shared_resources
+
+_POOL_LOCK = threading.Lock()
+
+
+def _engine_pool(app: FastAPI) -> EnginePool:
+    # Apps driven without lifespan events (e.g. a bare TestClient) get
+    # their pool on first use.
+    with _POOL_LOCK:
+        pool = getattr(app.state, "engine_pool", None)
+        if pool is None:
+            pool = app.state.engine_pool = EnginePool()
+        return cast(EnginePool, pool)
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    preload_embedding_models()
+    pool = _engine_pool(app)
+    with _POOL_LOCK:
+        app.state.engine_pool_users = getattr(app.state, "engine_pool_users", 0) + 1
+    try:
+        yield
+    finally:
+        # Overlapping lifespans share the pool; the last one out closes it.
+        with _POOL_LOCK:
+            app.state.engine_pool_users -= 1
+            last = app.state.engine_pool_users == 0
+            if last:
+                app.state.engine_pool = None
+        if last:
+            pool.close()
+            close_shared_resources()
 
 
 def build_app() -> FastAPI:
-    app = FastAPI(title="bijux-vex execution API", version="v1")
+    app = FastAPI(title="bijux-vex execution API", version="v1", lifespan=_lifespan)
+
+    def _engines() -> EnginePool:
+        return _engine_pool(app)
 
     refusal_example = {
         "error": {
@@ -127,12 +168,13 @@ def build_app() -> FastAPI:
         response: Response,
         correlation_id: str | None = Header(None, alias="X-Correlation-Id"),
     ) -> BackendCapabilitiesReport:
-        engine = VectorExecutionEngine()
         if correlation_id:
             response.headers["X-Correlation-Id"] = correlation_id
+        with _engines().lease() as engine:
+            report = engine.capabilities()
         return cast(
             BackendCapabilitiesReport,
-            BackendCapabilitiesReport.model_validate(engine.capabilities()),
+            BackendCapabilitiesReport.model_validate(report),
         )
 
     @app.get(
@@ -155,8 +197,8 @@ def build_app() -> FastAPI:
     ) -> dict[str, object]:
         if correlation_id:
             response.headers["X-Correlation-Id"] = correlation_id
-        engine = VectorExecutionEngine()
-        return engine.list_artifacts(limit=limit, offset=offset)
+        with _engines().lease() as engine:
+            return engine.list_artifacts(limit=limit, offset=offset)
 
     @app.get(
         "/runs",
@@ -221,7 +263,8 @@ def build_app() -> FastAPI:
         try:
             if correlation_id:
                 response.headers["X-Correlation-Id"] = correlation_id
-            return VectorExecutionEngine().create(req)
+            with _engines().lease(exclusive=True) as engine:
+                return engine.create(req)
         except BijuxError as exc:
             _raise_http_error(exc, correlation_id)
         except Exception as exc:  # pragma: no cover - unexpected
@@ -275,17 +318,16 @@ def build_app() -> FastAPI:
                 req = req.model_copy(update={"correlation_id": correlation_id})
             if idempotency_key and req.idempotency_key is None:
                 req = req.model_copy(update={"idempotency_key": idempotency_key})
-            engine = VectorExecutionEngine(
-                config=_config_from_payload(
-                    vector_store=req.vector_store,
-                    vector_store_uri=req.vector_store_uri,
-                    vector_store_options=req.vector_store_options,
-                    embed_provider=req.embed_provider,
-                    embed_model=req.embed_model,
-                    cache_embeddings=req.cache_embeddings,
-                )
+            config = _config_from_payload(
+                vector_store=req.vector_store,
+                vector_store_uri=req.vector_store_uri,
+                vector_store_options=req.vector_store_options,
+                embed_provider=req.embed_provider,
+                embed_model=req.embed_model,
+                cache_embeddings=req.cache_embeddings,
             )
-            result = engine.ingest(req)
+            with _engines().lease(config, exclusive=True) as engine:
+                result = engine.ingest(req)
             response.headers["X-Correlation-Id"] = str(
                 result.get("correlation_id") or req.correlation_id or ""
             )
@@ -344,14 +386,13 @@ def build_app() -> FastAPI:
         try:
             if correlation_id:
                 response.headers["X-Correlation-Id"] = correlation_id
-            engine = VectorExecutionEngine(
-                config=_config_from_payload(
-                    vector_store=req.vector_store,
-                    vector_store_uri=req.vector_store_uri,
-                    vector_store_options=req.vector_store_options,
-                )
+            config = _config_from_payload(
+                vector_store=req.vector_store,
+                vector_store_uri=req.vector_store_uri,
+                vector_store_options=req.vector_store_options,
             )
-            return engine.materialize(req)
+            with _engines().lease(config, exclusive=True) as engine:
+                return engine.materialize(req)
         except BijuxError as exc:
             _raise_http_error(exc, correlation_id)
         except Exception as exc:  # pragma: no cover
@@ -415,14 +456,85 @@ def build_app() -> FastAPI:
         try:
             if correlation_id and req.correlation_id is None:
                 req = req.model_copy(update={"correlation_id": correlation_id})
-            engine = VectorExecutionEngine(
-                config=_config_from_payload(
-                    vector_store=req.vector_store,
-                    vector_store_uri=req.vector_store_uri,
-                    vector_store_options=req.vector_store_options,
-                )
+            config = _config_from_payload(
+                vector_store=req.vector_store,
+                vector_store_uri=req.vector_store_uri,
+                vector_store_options=req.vector_store_options,
             )
-            result = engine.execute(req)
+            with _engines().lease(config) as engine:
+                result = engine.execute(req)
+            response.headers["X-Correlation-Id"] = result.get("correlation_id", "")
+            return result
+        except BijuxError as exc:
+            _raise_http_error(exc, req.correlation_id or correlation_id)
+        except Exception as exc:  # pragma: no cover
+            raise HTTPException(status_code=500, detail="internal error") from exc
+
+    @app.post(
+        "/execute/batch",
+        openapi_extra={
+            "requestBody": {
+                "content": {
+                    "application/json": {
+                        "examples": {
+                            "execute_batch": {
+                                "value": {
+                                    "artifact_id": "art-1",
+                                    "vectors": [[0.0, 1.0, 0.0], [1.0, 0.0, 0.0]],
+                                    "top_k": 3,
+                                    "execution_contract": "deterministic",
+                                    "execution_intent": "exact_validation",
+                                    "execution_mode": "strict",
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        responses={
+            200: {
+                "content": {
+                    "application/json": {
+                        "examples": {
+                            "execute_batch": {
+                                "value": {
+                                    "results": [["vec-1"], ["vec-2"]],
+                                    "correlation_id": "req-example",
+                                    "execution_contract": "deterministic",
+                                    "execution_contract_status": "stable",
+                                    "replayable": True,
+                                    "execution_ids": ["exec-1", "exec-2"],
+                                }
+                            }
+                        }
+                    }
+                }
+            },
+            422: {
+                "content": {
+                    "application/json": {
+                        "examples": {"refusal": {"value": refusal_example}}
+                    }
+                }
+            },
+        },
+    )  # type: ignore[untyped-decorator]
+    def execute_batch(
+        req: ExecutionBatchRequestPayload,
+        response: Response,
+        correlation_id: str | None = Header(None, alias="X-Correlation-Id"),
+    ) -> dict[str, object]:
+        try:
+            if correlation_id and req.correlation_id is None:
+                req = req.model_copy(update={"correlation_id": correlation_id})
+            config = _config_from_payload(
+                vector_store=req.vector_store,
+                vector_store_uri=req.vector_store_uri,
+                vector_store_options=req.vector_store_options,
+            )
+            with _engines().lease(config) as engine:
+                result = engine.execute_batch(req)
             response.headers["X-Correlation-Id"] = result.get("correlation_id", "")
             return result
         except BijuxError as exc:
@@ -464,7 +576,8 @@ def build_app() -> FastAPI:
         correlation_id: str | None = Header(None, alias="X-Correlation-Id"),
     ) -> dict[str, object]:
         try:
-            result = VectorExecutionEngine().explain(req)
+            with _engines().lease() as engine:
+                result = engine.explain(req)
             if correlation_id:
                 response.headers["X-Correlation-Id"] = correlation_id
             return result
@@ -532,12 +645,13 @@ def build_app() -> FastAPI:
                     max_memory_mb=req.execution_budget.max_memory_mb,
                     max_error=req.execution_budget.max_error,
                 )
-            return VectorExecutionEngine().replay(
-                request_text,
-                artifact_id=req.artifact_id,
-                randomness_profile=randomness_profile,
-                execution_budget=execution_budget,
-            )
+            with _engines().lease() as engine:
+                return engine.replay(
+                    request_text,
+                    artifact_id=req.artifact_id,
+                    randomness_profile=randomness_profile,
+                    execution_budget=execution_budget,
+                )
         except BijuxError as exc:
             _raise_http_error(exc, correlation_id)
         except Exception as exc:  # pragma: no cover
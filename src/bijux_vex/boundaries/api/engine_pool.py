@@ -0,0 +1,215 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+"""
+App-scoped pool of execution engines for the HTTP boundary.
+
+Engines are keyed by the resolved configuration: the per-request
+``ExecutionConfig`` plus every ``BIJUX_VEX_*`` environment variable the
+engine reads at construction. Each engine is reused across requests, so
+in-memory state (memory backend, resident indices, idempotency cache)
+survives between calls.
+
+Queries (execute, explain, compare, listings) share an engine; ingest and
+artifact mutation lease it exclusively. Shared leases still write: execute
+records its results in the ledger. That is safe because the stores lock
+internally: a write transaction holds the backend's transaction lock (the
+SQLite connection lock, or the memory backend's ``tx_lock``) and memory
+readers take ``data_lock``, so they never observe a commit half applied.
+The exclusive lease only keeps the corpus and the artifacts fixed for the
+length of a request.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict
+import json
+import os
+import threading
+
+from bijux_vex.core.config import ExecutionConfig
+from bijux_vex.core.errors import BackendUnavailableError
+from bijux_vex.infra.logging import log_event
+from bijux_vex.services.execution_engine import VectorExecutionEngine
+
+DEFAULT_MAX_ENGINES = 4
+_ENV_PREFIX = "BIJUX_VEX_"
+
+
+def _config_key(config: ExecutionConfig) -> str:
+    env = {k: v for k, v in os.environ.items() if k.startswith(_ENV_PREFIX)}
+    return json.dumps(
+        {"config": asdict(config), "env": env}, sort_keys=True, default=str
+    )
+
+
+class _ReadWriteLock:
+    """Shared holders run together; an exclusive holder waits them out first."""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        with self._cond:
+            # Queued writers go first so a steady read load cannot starve them.
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        with self._cond:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+class _PooledEngine:
+    __slots__ = ("access", "engine", "leases", "retired")
+
+    def __init__(self, engine: VectorExecutionEngine) -> None:
+        self.engine = engine
+        self.access = _ReadWriteLock()
+        self.leases = 0
+        self.retired = False
+
+
+class EnginePool:
+    """
+    Bounded LRU of engines, one per config variant.
+
+    Evicted engines are closed once their last lease ends. Engines that hold
+    ingested data only in memory are never evicted: when every resident
+    engine does, a new variant is refused instead of dropping that state.
+    """
+
+    def __init__(self, max_engines: int | None = None) -> None:
+        if max_engines is None:
+            raw = os.getenv("BIJUX_VEX_API_MAX_ENGINES")
+            max_engines = int(raw) if raw else DEFAULT_MAX_ENGINES
+        self.max_engines = max(1, max_engines)
+        self._entries: OrderedDict[str, _PooledEngine] = OrderedDict()
+        self._lock = threading.Lock()
+        self._closed = False
+        self.created = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @contextmanager
+    def lease(
+        self, config: ExecutionConfig | None = None, *, exclusive: bool = False
+    ) -> Iterator[VectorExecutionEngine]:
+        entry = self._acquire(config or ExecutionConfig())
+        try:
+            access = entry.access.exclusive() if exclusive else entry.access.shared()
+            with access:
+                yield entry.engine
+        finally:
+            self._release(entry)
+
+    def close(self) -> None:
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            self._closed = True
+            idle = [entry for entry in entries if self._retire(entry)]
+        for entry in idle:
+            self._close_engine(entry)
+        log_event("engine_pool_closed", engines=len(entries))
+
+    def _acquire(self, config: ExecutionConfig) -> _PooledEngine:
+        key = _config_key(config)
+        evicted: _PooledEngine | None = None
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("engine pool is closed")
+            entry = self._entries.get(key)
+            if entry is None:
+                entry, evicted = self._create(key, config)
+            else:
+                self._entries.move_to_end(key)
+            entry.leases += 1
+        if evicted is not None:
+            self._close_engine(evicted)
+        return entry
+
+    def _create(
+        self, key: str, config: ExecutionConfig
+    ) -> tuple[_PooledEngine, _PooledEngine | None]:
+        """Add an engine for ``key``; also returns an evicted engine left idle."""
+        victim: str | None = None
+        if len(self._entries) >= self.max_engines:
+            victim = next(
+                (
+                    candidate
+                    for candidate, entry in self._entries.items()
+                    if not entry.engine.holds_state_in_memory
+                ),
+                None,
+            )
+            if victim is None:
+                raise BackendUnavailableError(
+                    message=(
+                        "engine pool is full of engines holding in-memory state; "
+                        "raise BIJUX_VEX_API_MAX_ENGINES or use a persistent backend"
+                    )
+                )
+        # Construction touches shared process state (backend pool,
+        # vector store registry); keep it under the pool lock.
+        entry = _PooledEngine(
+            VectorExecutionEngine(config=config, background_rebuild=True)
+        )
+        self._entries[key] = entry
+        self.created += 1
+        if victim is None:
+            return entry, None
+        evicted = self._entries.pop(victim)
+        self.evictions += 1
+        return entry, evicted if self._retire(evicted) else None
+
+    def _release(self, entry: _PooledEngine) -> None:
+        with self._lock:
+            entry.leases -= 1
+            close = entry.retired and entry.leases == 0
+        if close:
+            self._close_engine(entry)
+
+    @staticmethod
+    def _retire(entry: _PooledEngine) -> bool:
+        """Mark ``entry`` for closing; True when no lease is holding it."""
+        entry.retired = True
+        return entry.leases == 0
+
+    @staticmethod
+    def _close_engine(entry: _PooledEngine) -> None:
+        try:
+            entry.engine.close()
+        except Exception as exc:  # pragma: no cover - best effort shutdown
+            log_event("engine_close_failed", error=str(exc))
+
+
+__all__ = ["DEFAULT_MAX_ENGINES", "EnginePool"]
@@ -33,12 +33,14 @@ from bijux_vex.boundaries.exception_bridge import (
 )
 from bijux_vex.boundaries.pydantic_edges.models import (
     ExecutionArtifactRequest,
+    ExecutionBatchRequestPayload,
     ExecutionBudgetPayload,
     ExecutionRequestPayload,
     ExplainRequest,
     IngestRequest,
     RandomnessProfilePayload,
 )
+from bijux_vex.contracts.resources import StoredVectors
 from bijux_vex.core.config import (
     EmbeddingCacheConfig,
     EmbeddingConfig,
@@ -57,6 +59,7 @@ from bijux_vex.domain.execution_requests import scoring
 from bijux_vex.domain.execution_requests.compare import _rank_instability
 from bijux_vex.infra.adapters.vectorstore_registry import VECTOR_STORES
 from bijux_vex.infra.embeddings.registry import EMBEDDING_PROVIDERS
+from bijux_vex.infra.ingest_sources import DEFAULT_INGEST_BATCH_SIZE
 from bijux_vex.infra.logging import enable_trace, trace_events
 from bijux_vex.infra.metrics import METRICS
 from bijux_vex.infra.run_store import RunStore
@@ -75,6 +78,22 @@ app.add_typer(artifact_app, name="artifact")
 ND_WARMUP_OPTION = typer.Option(
     None, "--nd-warmup-queries", help="Path to JSON warmup query vectors"
 )
+QUERIES_OPTION = typer.Option(
+    None,
+    "--queries",
+    help="Path to query vectors (.npy or JSON list) executed as one batch",
+)
+INGEST_SOURCE_OPTION = typer.Option(
+    None,
+    "--source",
+    help="Stream documents from a JSONL or NPY file in batched transactions",
+)
+INGEST_TEXTS_OPTION = typer.Option(
+    None, "--texts", help="Documents for an NPY --source, one per line"
+)
+INGEST_CHECKPOINT_OPTION = typer.Option(
+    None, "--checkpoint", help="Checkpoint file used to resume a --source ingest"
+)
 ND_TUNE_CACHE_OPTION = typer.Option(
     None, "--cache", help="Optional path to cache tuning results"
 )
@@ -226,6 +245,26 @@ def _parse_intent(raw: str) -> ExecutionIntent:
     return ExecutionIntent(raw)
 
 
+def _load_query_vectors(path: Path) -> list[tuple[float, ...]]:
+    if path.suffix.lower() == ".npy":
+        try:
+            import numpy as np
+        except Exception as exc:  # pragma: no cover
+            raise ValidationError(message="--queries .npy files require numpy") from exc
+        matrix = np.load(path, allow_pickle=False)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+        if matrix.ndim != 2:
+            raise ValidationError(message="--queries array must be 2-dimensional")
+        return [tuple(row) for row in matrix.astype(float).tolist()]
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(payload, list) or not all(
+        isinstance(row, list) for row in payload
+    ):
+        raise ValidationError(message="--queries JSON must be a list of vectors")
+    return [tuple(float(v) for v in row) for row in payload]
+
+
 def _load_config(config_path: Path | None) -> ExecutionConfig | None:
     if not config_path:
         return None
@@ -421,8 +460,12 @@ def audit(
 @no_type_check
 def ingest(
     ctx: typer.Context,
-    doc: str = typer.Option(..., "--doc"),
+    doc: str | None = typer.Option(None, "--doc"),
     vector: str | None = typer.Option(None, "--vector"),
+    source: Path | None = INGEST_SOURCE_OPTION,
+    texts: Path | None = INGEST_TEXTS_OPTION,
+    batch_size: int = typer.Option(DEFAULT_INGEST_BATCH_SIZE, "--batch-size"),
+    checkpoint: Path | None = INGEST_CHECKPOINT_OPTION,
     embed_model: str | None = typer.Option(None, "--embed-model"),
     embed_provider: str | None = typer.Option(None, "--embed-provider"),
     cache_embeddings: str | None = typer.Option(None, "--cache-embeddings"),
@@ -432,18 +475,12 @@ def ingest(
     dry_run: bool = typer.Option(False, "--dry-run"),
 ) -> None:
     try:
+        if (doc is None) == (source is None):
+            raise ValidationError(message="Provide exactly one of --doc or --source")
+        if source is not None and vector:
+            raise ValidationError(message="--vector cannot be combined with --source")
         resolved_correlation_id = _resolve_correlation_id(correlation_id)
         base_config = _load_config(ctx.obj.config_path) if ctx.obj else None
-        req = IngestRequest(
-            documents=[doc],
-            vectors=[json.loads(vector)] if vector else None,
-            embed_model=embed_model,
-            embed_provider=embed_provider,
-            cache_embeddings=cache_embeddings,
-            correlation_id=resolved_correlation_id,
-            vector_store=vector_store,
-            vector_store_uri=vector_store_uri,
-        )
         config = _build_config(
             vector_store=vector_store,
             vector_store_uri=vector_store_uri,
@@ -452,6 +489,18 @@ def ingest(
             cache_embeddings=cache_embeddings,
             base_config=base_config,
         )
+        req = None
+        if doc is not None:
+            req = IngestRequest(
+                documents=[doc],
+                vectors=[json.loads(vector)] if vector else None,
+                embed_model=embed_model,
+                embed_provider=embed_provider,
+                cache_embeddings=cache_embeddings,
+                correlation_id=resolved_correlation_id,
+                vector_store=vector_store,
+                vector_store_uri=vector_store_uri,
+            )
         if dry_run:
             output = {
                 "resolved_config": _config_to_dict(config),
@@ -469,7 +518,19 @@ def ingest(
             _emit(ctx, output)
             return
         engine = VectorExecutionEngine(config=config)
-        result = engine.ingest(req)
+        if req is not None:
+            result = engine.ingest(req)
+        else:
+            result = engine.ingest_stream(
+                source,
+                texts=texts,
+                batch_size=batch_size,
+                checkpoint=checkpoint,
+                embed_provider=embed_provider,
+                embed_model=embed_model,
+                cache_embeddings=cache_embeddings,
+                correlation_id=resolved_correlation_id,
+            )
         _emit(ctx, result)
     except BijuxError as exc:
         record_failure(exc)
@@ -655,6 +716,7 @@ def execute(
     ctx: typer.Context,
     request_text: str | None = None,
     vector: str | None = None,
+    queries: Path | None = QUERIES_OPTION,
     top_k: int = 5,
     artifact_id: str = typer.Option(
         "art-1", "--artifact-id", help="Target execution artifact id"
@@ -773,6 +835,9 @@ def execute(
     nd_space: str | None = typer.Option(
         None, "--nd-space", help="HNSW space override: l2|cosine|ip"
     ),
+    nd_num_threads: int | None = typer.Option(
+        None, "--nd-num-threads", help="HNSW build threads (-1 uses every core)"
+    ),
     compare_to: str | None = typer.Option(
         None, "--compare-to", help="Compare ND run to exact (exact)"
     ),
@@ -794,15 +859,13 @@ def execute(
             if randomness_sources
             else None
         )
-        req = ExecutionRequestPayload(
-            request_text=request_text,
-            vector=tuple(vector_parsed) if vector_parsed else None,
-            top_k=top_k,
-            artifact_id=artifact_id,
-            execution_contract=contract,
-            execution_intent=intent,
-            execution_mode=mode,
-            randomness_profile=RandomnessProfilePayload.model_validate(
+        fields = {
+            "top_k": top_k,
+            "artifact_id": artifact_id,
+            "execution_contract": contract,
+            "execution_intent": intent,
+            "execution_mode": mode,
+            "randomness_profile": RandomnessProfilePayload.model_validate(
                 {
                     "seed": randomness_seed,
                     "sources": sources,
@@ -812,41 +875,57 @@ def execute(
             )
             if contract is ExecutionContract.NON_DETERMINISTIC
             else None,
-            execution_budget=ExecutionBudgetPayload(
+            "execution_budget": ExecutionBudgetPayload(
                 max_latency_ms=max_latency_ms,
                 max_memory_mb=max_memory_mb,
                 max_error=max_error,
             ),
-            nd_profile=nd_profile,
-            nd_target_recall=nd_target_recall,
-            nd_latency_budget_ms=nd_latency_budget_ms,
-            nd_witness_rate=nd_witness_rate,
-            nd_witness_sample_k=nd_witness_sample_k,
-            nd_witness_mode=nd_witness_mode,
-            nd_build_on_demand=nd_build_on_demand,
-            nd_candidate_k=nd_candidate_k,
-            nd_diversity_lambda=nd_diversity_lambda,
-            nd_normalize_vectors=nd_normalize_vectors,
-            nd_normalize_query=nd_normalize_query,
-            nd_outlier_threshold=nd_outlier_threshold,
-            nd_low_signal_margin=nd_low_signal_margin,
-            nd_adaptive_k=nd_adaptive_k,
-            nd_low_signal_refuse=nd_low_signal_refuse,
-            nd_replay_strict=nd_replay_strict,
-            nd_warmup_queries=str(nd_warmup_queries) if nd_warmup_queries else None,
-            nd_incremental_index=nd_incremental_index,
-            nd_max_candidates=nd_max_candidates,
-            nd_max_index_memory_mb=nd_max_index_memory_mb,
-            nd_two_stage=nd_two_stage,
-            nd_m=nd_m,
-            nd_ef_construction=nd_ef_construction,
-            nd_ef_search=nd_ef_search,
-            nd_max_ef_search=nd_max_ef_search,
-            nd_space=nd_space,
-            correlation_id=resolved_correlation_id,
-            vector_store=vector_store,
-            vector_store_uri=vector_store_uri,
-        )
+            "nd_profile": nd_profile,
+            "nd_target_recall": nd_target_recall,
+            "nd_latency_budget_ms": nd_latency_budget_ms,
+            "nd_witness_rate": nd_witness_rate,
+            "nd_witness_sample_k": nd_witness_sample_k,
+            "nd_witness_mode": nd_witness_mode,
+            "nd_build_on_demand": nd_build_on_demand,
+            "nd_candidate_k": nd_candidate_k,
+            "nd_diversity_lambda": nd_diversity_lambda,
+            "nd_normalize_vectors": nd_normalize_vectors,
+            "nd_normalize_query": nd_normalize_query,
+            "nd_outlier_threshold": nd_outlier_threshold,
+            "nd_low_signal_margin": nd_low_signal_margin,
+            "nd_adaptive_k": nd_adaptive_k,
+            "nd_low_signal_refuse": nd_low_signal_refuse,
+            "nd_replay_strict": nd_replay_strict,
+            "nd_warmup_queries": str(nd_warmup_queries) if nd_warmup_queries else None,
+            "nd_incremental_index": nd_incremental_index,
+            "nd_max_candidates": nd_max_candidates,
+            "nd_max_index_memory_mb": nd_max_index_memory_mb,
+            "nd_two_stage": nd_two_stage,
+            "nd_m": nd_m,
+            "nd_ef_construction": nd_ef_construction,
+            "nd_ef_search": nd_ef_search,
+            "nd_max_ef_search": nd_max_ef_search,
+            "nd_space": nd_space,
+            "nd_num_threads": nd_num_threads,
+            "correlation_id": resolved_correlation_id,
+            "vector_store": vector_store,
+            "vector_store_uri": vector_store_uri,
+        }
+        req: ExecutionRequestPayload | ExecutionBatchRequestPayload
+        if queries is not None:
+            if vector_parsed or request_text:
+                raise ValidationError(
+                    message="--queries cannot be combined with --vector or --request-text"
+                )
+            req = ExecutionBatchRequestPayload(
+                vectors=_load_query_vectors(queries), **fields
+            )
+        else:
+            req = ExecutionRequestPayload(
+                request_text=request_text,
+                vector=tuple(vector_parsed) if vector_parsed else None,
+                **fields,
+            )
         base_config = _load_config(ctx.obj.config_path) if ctx.obj else None
         config = _build_config(
             vector_store=vector_store,
@@ -882,6 +961,13 @@ def execute(
                 message="compare-to exact requires --compare-artifact-id"
             )
         engine = VectorExecutionEngine(config=config)
+        if isinstance(req, ExecutionBatchRequestPayload):
+            if compare_to or explain:
+                raise ValidationError(
+                    message="--queries cannot be combined with --compare-to or --explain"
+                )
+            _emit(ctx, engine.execute_batch(req))
+            return
         result = engine.execute(req)
         if compare_to == "exact":
             comparison = engine.compare(
@@ -1151,9 +1237,11 @@ def vdb_rebuild(
             artifact = engine.stores.ledger.get_artifact(engine.default_artifact_id)
             if artifact is None:
                 raise ValidationError(message="No artifact available for ANN rebuild")
-            vectors = list(engine.stores.vectors.list_vectors())
             index_info = ann_runner.build_index(
-                artifact.artifact_id, vectors, artifact.metric, None
+                artifact.artifact_id,
+                StoredVectors(engine.stores.vectors),
+                artifact.metric,
+                None,
             )
             index_hash = index_info.get("index_hash") if index_info else None
             extra = (("ann_index_info", json.dumps(index_info, sort_keys=True)),)
@@ -1477,18 +1565,20 @@ def artifact_pack(
         base_config = _load_config(ctx.obj.config_path) if ctx.obj else None
         config_payload = _redact_config(base_config)
         engine = VectorExecutionEngine()
+        result_ids = run.result.get("results", []) if run.result else []
+        stored = engine.stores.vectors.get_vectors(result_ids)
         vectors_payload: dict[str, object] = {}
         if include_vectors:
             vectors_payload["vectors"] = []
-            for vid in run.result.get("results", []) if run.result else []:
-                vec = engine.stores.vectors.get_vector(vid)
+            for vid in result_ids:
+                vec = stored.get(vid)
                 if vec:
                     vectors_payload["vectors"].append(
                         {"vector_id": vid, "values": list(vec.values)}
                     )
         vector_hashes = []
-        for vid in run.result.get("results", []) if run.result else []:
-            vec = engine.stores.vectors.get_vector(vid)
+        for vid in result_ids:
+            vec = stored.get(vid)
             if vec:
                 vector_hashes.append(
                     {"vector_id": vid, "hash": fingerprint(vec.values)}
@@ -55,7 +55,9 @@ class RandomnessProfilePayload(StrictModel):
     non_replayable: bool = False
 
 
-class ExecutionRequestPayload(StrictModel):
+class ExecutionSettingsPayload(StrictModel):
+    """Artifact, contract and ND settings shared by single and batch requests."""
+
     artifact_id: str | None = None
     request_text: str | None = None
     vector: tuple[float, ...] | None = None
@@ -91,17 +93,12 @@ class ExecutionRequestPayload(StrictModel):
     nd_ef_search: int | None = None
     nd_max_ef_search: int | None = None
     nd_space: str | None = None
+    nd_num_threads: int | None = None
     correlation_id: str | None = None
     vector_store: str | None = None
     vector_store_uri: str | None = None
     vector_store_options: dict[str, str] | None = None
 
-    @model_validator(mode="after")  # type: ignore[untyped-decorator]
-    def ensure_one_of_request_or_vector(self) -> Self:
-        if self.request_text is None and self.vector is None:
-            raise ValueError("request_text or vector is required")
-        return self
-
     @model_validator(mode="after")  # type: ignore[untyped-decorator]
     def ensure_randomness_for_nd(self) -> Self:
         from bijux_vex.boundaries.pydantic_edges.validators import (
@@ -112,6 +109,33 @@ class ExecutionRequestPayload(StrictModel):
         return self
 
 
+class ExecutionRequestPayload(ExecutionSettingsPayload):
+    @model_validator(mode="after")  # type: ignore[untyped-decorator]
+    def ensure_one_of_request_or_vector(self) -> Self:
+        if self.request_text is None and self.vector is None:
+            raise ValueError("request_text or vector is required")
+        return self
+
+
+class ExecutionBatchRequestPayload(ExecutionSettingsPayload):
+    """Many query vectors executed against one artifact with shared settings."""
+
+    vectors: list[tuple[float, ...]] = Field(min_length=1)
+
+    @model_validator(mode="after")  # type: ignore[untyped-decorator]
+    def ensure_batch_vectors(self) -> Self:
+        if self.vector is not None:
+            raise ValueError("use vectors for batch execution")
+        if len({len(vec) for vec in self.vectors}) != 1:
+            raise ValueError("batch vectors must share one dimension")
+        return self
+
+    def single_request(self, vector: tuple[float, ...]) -> ExecutionRequestPayload:
+        """The single-query request carrying these settings and ``vector``."""
+        settings = self.model_dump(exclude={"vectors"})
+        return ExecutionRequestPayload(**{**settings, "vector": vector})
+
+
 class ExecutionArtifactRequest(StrictModel):
     execution_contract: ExecutionContract
     index_mode: str | None = None
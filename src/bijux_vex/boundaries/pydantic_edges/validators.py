@@ -50,6 +50,7 @@ def validate_execution_request_payload(payload: object) -> None:
         "nd_ef_search",
         "nd_max_ef_search",
         "nd_space",
+        "nd_num_threads",
     )
     if contract is ExecutionContract.DETERMINISTIC:
         if execution_mode is not ExecutionMode.STRICT:
@@ -105,5 +106,8 @@ def validate_execution_request_payload(payload: object) -> None:
     nd_space = getattr(payload, "nd_space", None)
     if nd_space not in {None, "l2", "cosine", "ip"}:
         raise ValueError("nd_space must be l2|cosine|ip")
+    nd_num_threads = getattr(payload, "nd_num_threads", None)
+    if nd_num_threads is not None and not (nd_num_threads > 0 or nd_num_threads == -1):
+        raise ValueError("nd_num_threads must be positive or -1")
     if randomness_profile:
         validate_randomness_payload(payload)
@@ -5,10 +5,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
-from typing import NamedTuple
+from collections.abc import Iterable, Iterator, Sequence, Set
+from dataclasses import replace
+from typing import Any, NamedTuple
 
 from bijux_vex.core.execution_result import ExecutionResult
+from bijux_vex.core.metadata_filter import MetadataFilter, vector_tags
 from bijux_vex.core.types import (
     Chunk,
     Document,
@@ -95,6 +97,138 @@ class VectorSource(ABC):
     def delete_vector(self, tx: Tx, vector_id: str) -> None:
         """Remove a vector."""
 
+    def get_vectors(self, vector_ids: Iterable[str]) -> dict[str, Vector]:
+        """Vectors by ID in one call; absent IDs are omitted. Sources may override to bulk-read."""
+        found: dict[str, Vector] = {}
+        for vector_id in vector_ids:
+            if vector_id not in found:
+                vector = self.get_vector(vector_id)
+                if vector is not None:
+                    found[vector_id] = vector
+        return found
+
+    def get_chunks(self, chunk_ids: Iterable[str]) -> dict[str, Chunk]:
+        """Chunks by ID in one call; absent IDs are omitted. Sources may override to bulk-read."""
+        found: dict[str, Chunk] = {}
+        for chunk_id in chunk_ids:
+            if chunk_id not in found:
+                chunk = self.get_chunk(chunk_id)
+                if chunk is not None:
+                    found[chunk_id] = chunk
+        return found
+
+    def put_batch(
+        self,
+        tx: Tx,
+        documents: Sequence[Document],
+        chunks: Sequence[Chunk],
+        vectors: Sequence[Vector],
+    ) -> None:
+        """Insert or replace many records in one call; sources may override to bulk-write."""
+        for document in documents:
+            self.put_document(tx, document)
+        for chunk in chunks:
+            self.put_chunk(tx, chunk)
+        for vector in vectors:
+            self.put_vector(tx, vector)
+
+    def vector_revision(self) -> object | None:
+        """Opaque token that changes whenever stored vectors change; None disables caching."""
+        return None
+
+    def vector_matrix(self, dimension: int) -> object | None:
+        """Columnar view of stored vectors of one dimension, if the source keeps one."""
+        return None
+
+    def vector_count(self) -> int:
+        """Number of stored vectors; sources may override to count without listing."""
+        return sum(1 for _ in self.list_vectors())
+
+    def vector_blocks(self, size: int) -> Iterator[tuple[tuple[str, ...], Any]]:
+        """
+        Stored vectors in id order as (ids, rows) blocks of one dimension.
+
+        Blocks hold at most ``size`` rows; ``rows`` is an (n, dimension)
+        array or a list of value tuples. Sources may override to decode whole
+        pages without building Vector objects.
+        """
+        ids: list[str] = []
+        rows: list[tuple[float, ...]] = []
+        dimension = 0
+        for vector in self.list_vectors():
+            if ids and (len(ids) >= size or vector.dimension != dimension):
+                yield tuple(ids), rows
+                ids, rows = [], []
+            dimension = vector.dimension
+            ids.append(vector.vector_id)
+            rows.append(vector.values)
+        if ids:
+            yield tuple(ids), rows
+
+    def filter_vector_ids(self, metadata_filter: MetadataFilter) -> frozenset[str]:
+        """Vector ids matching a metadata filter; sources may answer from an index."""
+        chunks: dict[str, Chunk | None] = {}
+        documents: dict[str, Document | None] = {}
+        allowed: set[str] = set()
+        for vector in self.list_vectors():
+            if vector.chunk_id not in chunks:
+                chunks[vector.chunk_id] = self.get_chunk(vector.chunk_id)
+            chunk = chunks[vector.chunk_id]
+            document_id = chunk.document_id if chunk else ""
+            if document_id not in documents:
+                documents[document_id] = (
+                    self.get_document(document_id) if document_id else None
+                )
+            document = documents[document_id]
+            if metadata_filter.matches(
+                document_id=document_id,
+                chunk_id=vector.chunk_id,
+                source_uri=document.source if document else None,
+                tags=vector_tags(vector.metadata),
+            ):
+                allowed.add(vector.vector_id)
+        return frozenset(allowed)
+
+    def query_allowed(
+        self, artifact_id: str, request: ExecutionRequest, allowed: Set[str]
+    ) -> Iterable[Result]:
+        """
+        ``query`` restricted to ``allowed`` vector ids, still returning up to top_k.
+
+        The default ranks the whole corpus; sources override it to score only
+        the allowed vectors.
+        """
+        if not allowed:
+            return []
+        total = sum(1 for _ in self.list_vectors())
+        ranked = [
+            res
+            for res in self.query(artifact_id, replace(request, top_k=max(total, 1)))
+            if res.vector_id in allowed
+        ][: request.top_k]
+        return [replace(res, rank=idx) for idx, res in enumerate(ranked, start=1)]
+
+
+class StoredVectors:
+    """
+    Every vector of a source, iterable as Vector objects.
+
+    Index builds that can consume matrix blocks read ``blocks`` instead, so
+    the source streams decoded pages rather than materializing the corpus.
+    """
+
+    def __init__(self, source: VectorSource) -> None:
+        self.source = source
+
+    def __iter__(self) -> Iterator[Vector]:
+        return iter(self.source.list_vectors())
+
+    def __len__(self) -> int:
+        return self.source.vector_count()
+
+    def blocks(self, size: int) -> Iterator[tuple[tuple[str, ...], Any]]:
+        return self.source.vector_blocks(size)
+
 
 class ExecutionLedger(ABC):
     """Registers execution artifacts and connects them to vector sets without implying database semantics."""
@@ -119,6 +253,11 @@ class ExecutionLedger(ABC):
     def put_execution_result(self, tx: Tx, result: ExecutionResult) -> None:
         """Persist a completed execution result keyed by execution_id/signature."""
 
+    def put_execution_results(self, tx: Tx, results: Sequence[ExecutionResult]) -> None:
+        """Persist a batch of results; retention keeps the whole batch."""
+        for result in results:
+            self.put_execution_result(tx, result)
+
     @abstractmethod
     def get_execution_result(self, execution_id: str) -> ExecutionResult | None:
         """Load a previously persisted execution result."""
@@ -76,6 +76,8 @@ class ApproximationReport:
     degraded: bool = False
     degradation_reason: str | None = None
     notes: tuple[str, ...] = ()
+    quantization: str | None = None
+    quantization_error: float | None = None
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+"""
+Metadata filters shared by vector sources and vector-store adapters.
+
+A filter restricts a query to vectors whose chunk, document, document
+source, and tags match; sources turn it into an allow-set of vector ids
+before scoring.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+import json
+from typing import Any
+
+from bijux_vex.core.errors import ValidationError
+
+FILTER_KEYS = frozenset({"doc_id", "chunk_id", "source_uri", "tags"})
+
+
+@dataclass(frozen=True)
+class MetadataFilter:
+    """Id and source sets match any member; ``tags`` must all be present."""
+
+    document_ids: frozenset[str] | None = None
+    chunk_ids: frozenset[str] | None = None
+    source_uris: frozenset[str] | None = None
+    tags: frozenset[str] = frozenset()
+
+    @property
+    def is_empty(self) -> bool:
+        return (
+            self.document_ids is None
+            and self.chunk_ids is None
+            and self.source_uris is None
+            and not self.tags
+        )
+
+    def matches(
+        self,
+        *,
+        document_id: str,
+        chunk_id: str,
+        source_uri: str | None,
+        tags: Iterable[str],
+    ) -> bool:
+        if self.document_ids is not None and document_id not in self.document_ids:
+            return False
+        if self.chunk_ids is not None and chunk_id not in self.chunk_ids:
+            return False
+        if self.source_uris is not None and source_uri not in self.source_uris:
+            return False
+        return self.tags.issubset(tags)
+
+
+def parse_filter(spec: Mapping[str, Any]) -> MetadataFilter:
+    unknown = set(spec) - FILTER_KEYS
+    if unknown:
+        raise ValidationError(message=f"Unsupported filter keys: {sorted(unknown)}")
+    return MetadataFilter(
+        document_ids=_id_set(spec, "doc_id"),
+        chunk_ids=_id_set(spec, "chunk_id"),
+        source_uris=_id_set(spec, "source_uri"),
+        tags=frozenset(_as_strings(spec.get("tags"))),
+    )
+
+
+def vector_tags(
+    metadata: tuple[tuple[str, str], ...] | Mapping[str, Any] | None,
+) -> frozenset[str]:
+    """Tags stored under the ``tags`` metadata key (a list, JSON list, or CSV)."""
+    if not metadata:
+        return frozenset()
+    raw = dict(metadata).get("tags")
+    if isinstance(raw, str):
+        text = raw.strip()
+        if text.startswith("["):
+            try:
+                raw = json.loads(text)
+            except json.JSONDecodeError:
+                raw = text
+        if isinstance(raw, str):
+            raw = [part.strip() for part in raw.split(",")]
+    return frozenset(tag for tag in _as_strings(raw) if tag)
+
+
+def _id_set(spec: Mapping[str, Any], key: str) -> frozenset[str] | None:
+    if key not in spec:
+        return None
+    return frozenset(_as_strings(spec[key]))
+
+
+def _as_strings(value: Any) -> list[str]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [str(item) for item in value]
+    return [str(value)]
+
+
+__all__ = ["FILTER_KEYS", "MetadataFilter", "parse_filter", "vector_tags"]
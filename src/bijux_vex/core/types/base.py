@@ -106,6 +106,7 @@ class NDSettings:
     ef_search: int | None = None
     max_ef_search: int | None = None
     space: str | None = None
+    num_threads: int | None = None
 
 
 @dataclass(frozen=True)
@@ -197,6 +198,13 @@ class ExecutionRequest:
                     raise InvariantError(
                         message="nd_settings.latency_budget_ms must be positive"
                     )
+                if self.nd_settings.num_threads is not None and not (
+                    self.nd_settings.num_threads > 0
+                    or self.nd_settings.num_threads == -1
+                ):
+                    raise InvariantError(
+                        message="nd_settings.num_threads must be positive or -1"
+                    )
                 if self.nd_settings.witness_rate is not None and not (
                     0.0 < self.nd_settings.witness_rate <= 1.0
                 ):
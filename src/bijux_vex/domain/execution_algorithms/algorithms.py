@@ -2,7 +2,7 @@
 # Copyright © 2025 Bijan Mousavi
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import replace
 import math
 
@@ -10,13 +10,29 @@ from bijux_vex.contracts.resources import VectorSource
 from bijux_vex.core.contracts.execution_contract import ExecutionContract
 from bijux_vex.core.errors import InvariantError, ValidationError
 from bijux_vex.core.runtime.vector_execution import RandomnessProfile, VectorExecution
-from bijux_vex.core.types import ExecutionArtifact, ExecutionRequest, Result, Vector
+from bijux_vex.core.types import (
+    Chunk,
+    ExecutionArtifact,
+    ExecutionRequest,
+    Result,
+    Vector,
+)
 from bijux_vex.domain.execution_algorithms.base import (
     VectorExecutionAlgorithm,
     register_algorithm,
 )
+from bijux_vex.domain.execution_algorithms.exact_matrix import (
+    MATRIX_CACHE,
+    VectorMatrix,
+    exact_top_k,
+    exact_top_k_batch,
+    matrix_available,
+    matrix_supported,
+)
+from bijux_vex.domain.execution_algorithms.mmr import mmr_order
 from bijux_vex.domain.execution_requests import scoring
 from bijux_vex.infra.adapters.ann_base import AnnExecutionRequestRunner
+from bijux_vex.infra.vector_segment import segment_store_for
 
 
 class ExactVectorExecutionAlgorithm(VectorExecutionAlgorithm):
@@ -55,13 +71,21 @@ class ExactVectorExecutionAlgorithm(VectorExecutionAlgorithm):
                 message="execution vector required", invariant_id="INV-020"
             )
         query_vec = request.vector
+        if matrix_available():
+            vm = _vector_matrix(vectors, artifact, len(query_vec))
+            if matrix_supported(artifact.metric, query_vec, vm):
+                winners = exact_top_k(artifact.metric, query_vec, vm, request.top_k)
+                return _matrix_results(request, artifact, vm, winners, vectors, {})
+        matching = [
+            _ensure_tuple(vector)
+            for vector in vectors.list_vectors()
+            if vector.dimension == len(query_vec)
+        ]
+        chunks = vectors.get_chunks(vector.chunk_id for vector in matching)
         scored: list[Result] = []
-        for vector in vectors.list_vectors():
-            vector = _ensure_tuple(vector)
-            if len(query_vec) != vector.dimension:
-                continue
+        for vector in matching:
             score = scoring.score(artifact.metric, query_vec, vector.values)
-            chunk = vectors.get_chunk(vector.chunk_id)
+            chunk = chunks.get(vector.chunk_id)
             document_id = chunk.document_id if chunk else ""
             scored.append(
                 Result(
@@ -88,6 +112,33 @@ class ExactVectorExecutionAlgorithm(VectorExecutionAlgorithm):
             )
         return limited
 
+    def execute_batch(
+        self,
+        executions: Sequence[VectorExecution],
+        artifact: ExecutionArtifact,
+        vectors: VectorSource,
+    ) -> list[list[Result]]:
+        queries = [ex.request.vector for ex in executions]
+        if not executions or any(q is None for q in queries):
+            return super().execute_batch(executions, artifact, vectors)
+        dimensions = {len(q or ()) for q in queries}
+        if len(dimensions) != 1 or not matrix_available():
+            return super().execute_batch(executions, artifact, vectors)
+        vm = _vector_matrix(vectors, artifact, dimensions.pop())
+        if not all(matrix_supported(artifact.metric, q or (), vm) for q in queries):
+            return super().execute_batch(executions, artifact, vectors)
+        top_k = max(ex.request.top_k for ex in executions)
+        winners = exact_top_k_batch(
+            artifact.metric, [tuple(q or ()) for q in queries], vm, top_k
+        )
+        chunks: dict[str, Chunk | None] = {}
+        return [
+            _matrix_results(
+                ex.request, artifact, vm, rows[: ex.request.top_k], vectors, chunks
+            )
+            for ex, rows in zip(executions, winners, strict=True)
+        ]
+
 
 class ApproximateAnnAlgorithm(VectorExecutionAlgorithm):
     name = "ann_approximate"
@@ -131,8 +182,28 @@ class ApproximateAnnAlgorithm(VectorExecutionAlgorithm):
             return self.runner.deterministic_fallback(
                 artifact.artifact_id, execution.request
             )
-        self.runner.set_randomness_profile(execution.randomness)
-        request = execution.request
+        return self.execute_batch([execution], artifact, vectors)[0]
+
+    def execute_batch(
+        self,
+        executions: Sequence[VectorExecution],
+        artifact: ExecutionArtifact,
+        vectors: VectorSource,
+    ) -> list[list[Result]]:
+        if getattr(self.runner, "force_fallback", False) or not executions:
+            return super().execute_batch(executions, artifact, vectors)
+        self.runner.set_randomness_profile(executions[0].randomness)
+        requests = [self._candidate_request(ex.request) for ex in executions]
+        candidate_lists = self.runner.approximate_batch(artifact, requests)
+        return [
+            self._finalize(ex, artifact, vectors, list(candidates), request.top_k)
+            for ex, request, candidates in zip(
+                executions, requests, candidate_lists, strict=True
+            )
+        ]
+
+    @staticmethod
+    def _candidate_request(request: ExecutionRequest) -> ExecutionRequest:
         nd_settings = request.nd_settings
         if request.vector is None:
             raise ValidationError(
@@ -145,9 +216,19 @@ class ApproximateAnnAlgorithm(VectorExecutionAlgorithm):
             candidate_k = min(candidate_k, int(nd_settings.max_candidates))
         if candidate_k != request.top_k:
             request = replace(request, top_k=candidate_k)
-        candidates = list(self.runner.approximate_request(artifact, request))
+        return request
+
+    def _finalize(
+        self,
+        execution: VectorExecution,
+        artifact: ExecutionArtifact,
+        vectors: VectorSource,
+        candidates: list[Result],
+        candidate_k: int,
+    ) -> list[Result]:
+        nd_settings = execution.request.nd_settings
         if not candidates:
-            return ()
+            return []
         need_rescore = True
         if nd_settings and nd_settings.two_stage is False:
             if candidate_k == execution.request.top_k:
@@ -178,9 +259,11 @@ class ApproximateAnnAlgorithm(VectorExecutionAlgorithm):
         qvec = _maybe_normalize(
             query_vec, nd_settings.normalize_query if nd_settings else False
         )
+        found = vectors.get_vectors(res.vector_id for res in candidates)
+        chunks = vectors.get_chunks(res.chunk_id for res in candidates)
         rescored: list[Result] = []
         for res in candidates:
-            vec = vectors.get_vector(res.vector_id)
+            vec = found.get(res.vector_id)
             if vec is None:
                 continue
             tvec = _ensure_tuple(vec).values
@@ -188,7 +271,7 @@ class ApproximateAnnAlgorithm(VectorExecutionAlgorithm):
                 tvec, nd_settings.normalize_vectors if nd_settings else False
             )
             score = scoring.score(artifact.metric, qvec, tvec)
-            chunk = vectors.get_chunk(res.chunk_id)
+            chunk = chunks.get(res.chunk_id)
             document_id = chunk.document_id if chunk else res.document_id
             rescored.append(
                 Result(
@@ -205,7 +288,7 @@ class ApproximateAnnAlgorithm(VectorExecutionAlgorithm):
         if nd_settings and nd_settings.diversity_lambda is not None:
             rescored = _mmr_rerank(
                 rescored,
-                vectors,
+                found,
                 qvec,
                 artifact.metric,
                 float(nd_settings.diversity_lambda),
@@ -225,6 +308,48 @@ class ApproximateAnnAlgorithm(VectorExecutionAlgorithm):
         return limited
 
 
+def _vector_matrix(
+    vectors: VectorSource, artifact: ExecutionArtifact, dimension: int
+) -> VectorMatrix:
+    # A mapped segment for the artifact beats rebuilding the matrix per process.
+    segments = segment_store_for(vectors)
+    if segments is not None:
+        mapped = segments.matrix(artifact, dimension)
+        if mapped is not None:
+            return mapped
+    return MATRIX_CACHE.get(vectors, artifact.artifact_id, dimension)
+
+
+def _matrix_results(
+    request: ExecutionRequest,
+    artifact: ExecutionArtifact,
+    vm: VectorMatrix,
+    winners: list[tuple[float, str, int]],
+    vectors: VectorSource,
+    chunks: dict[str, Chunk | None],
+) -> list[Result]:
+    missing = {vm.chunk_ids[row] for _, _, row in winners} - chunks.keys()
+    if missing:
+        fetched = vectors.get_chunks(missing)
+        chunks.update({chunk_id: fetched.get(chunk_id) for chunk_id in missing})
+    ranked: list[Result] = []
+    for rank, (score, vector_id, row) in enumerate(winners, start=1):
+        chunk_id = vm.chunk_ids[row]
+        chunk = chunks[chunk_id]
+        ranked.append(
+            Result(
+                request_id=request.request_id,
+                document_id=chunk.document_id if chunk else "",
+                chunk_id=chunk_id,
+                vector_id=vector_id,
+                artifact_id=artifact.artifact_id,
+                score=score,
+                rank=rank,
+            )
+        )
+    return ranked
+
+
 def build_ann_algorithm(runner: AnnExecutionRequestRunner) -> ApproximateAnnAlgorithm:
     algo = ApproximateAnnAlgorithm(runner)
     register_algorithm(algo)
@@ -258,54 +383,23 @@ def _maybe_normalize(vec: tuple[float, ...], enabled: bool) -> tuple[float, ...]
 
 def _mmr_rerank(
     results: list[Result],
-    vectors: VectorSource,
+    vectors: Mapping[str, Vector],
     query_vec: tuple[float, ...],
     metric: str,
     diversity_lambda: float,
     k: int,
 ) -> list[Result]:
+    """``vectors`` holds the candidates' vectors, hydrated once by the caller."""
     if not results:
         return results
-    diversity_lambda = min(1.0, max(0.0, diversity_lambda))
-    selected: list[Result] = []
-    candidates = results[:]
-    query_sim: dict[str, float] = {}
-    for res in candidates:
-        vec = vectors.get_vector(res.vector_id)
-        if vec is None:
-            continue
-        v = _ensure_tuple(vec).values
-        query_sim[res.vector_id] = _cosine_similarity(query_vec, v)
-    while candidates and len(selected) < k:
-        best = None
-        best_score = None
-        for res in candidates:
-            sim_q = query_sim.get(res.vector_id, 0.0)
-            sim_selected = 0.0
-            for chosen in selected:
-                chosen_vec = vectors.get_vector(chosen.vector_id)
-                if chosen_vec is None:
-                    continue
-                sim_selected = max(
-                    sim_selected,
-                    _cosine_similarity(query_vec, _ensure_tuple(chosen_vec).values),
-                )
-            mmr = diversity_lambda * sim_q - (1.0 - diversity_lambda) * sim_selected
-            if best_score is None or mmr > best_score:
-                best_score = mmr
-                best = res
-        if best is None:
-            break
-        selected.append(best)
-        candidates = [c for c in candidates if c.vector_id != best.vector_id]
-    return selected + candidates
-
-
-def _cosine_similarity(a: tuple[float, ...], b: tuple[float, ...]) -> float:
-    denom = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(x * x for x in b))
-    if denom == 0:
-        return 0.0
-    return sum(x * y for x, y in zip(a, b, strict=True)) / denom
+    rows: list[tuple[float, ...] | None] = []
+    for res in results:
+        vec = vectors.get(res.vector_id)
+        rows.append(_ensure_tuple(vec).values if vec is not None else None)
+    order = mmr_order(query_vec, rows, diversity_lambda, k)
+    chosen = set(order)
+    selected = [results[idx] for idx in order]
+    return selected + [res for idx, res in enumerate(results) if idx not in chosen]
 
 
 register_algorithms()
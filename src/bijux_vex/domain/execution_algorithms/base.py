@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 
 from bijux_vex.contracts.resources import VectorSource
 from bijux_vex.core.contracts.execution_contract import ExecutionContract
@@ -31,6 +31,15 @@ class VectorExecutionAlgorithm(ABC):
         vectors: VectorSource,
     ) -> Iterable[Result]: ...
 
+    def execute_batch(
+        self,
+        executions: Sequence[VectorExecution],
+        artifact: ExecutionArtifact,
+        vectors: VectorSource,
+    ) -> list[list[Result]]:
+        """Execute several requests sharing one plan; one result list per request."""
+        return [list(self.execute(ex, artifact, vectors)) for ex in executions]
+
 
 _REGISTRY: dict[str, VectorExecutionAlgorithm] = {}
 
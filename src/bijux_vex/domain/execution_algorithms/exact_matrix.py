@@ -0,0 +1,359 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+"""
+Matrix-backed exact scan.
+
+Distances are computed for the whole corpus with one matrix-vector
+product, then every row whose vectorized score could still land in the
+top-k (given a rounding error bound) is rescored with ``scoring.score``.
+The returned scores and ordering are therefore identical to the
+per-vector Python loop; the matrix only decides which rows are worth
+rescoring. With int8 quantization enabled the first pass reads a
+quantized shadow of the matrix instead (see ``quantized``).
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, cast
+import weakref
+
+from bijux_vex.contracts.resources import VectorSource
+from bijux_vex.core.types import Vector
+from bijux_vex.domain.execution_requests import scoring
+
+if TYPE_CHECKING:  # pragma: no cover
+    from bijux_vex.domain.execution_algorithms.quantized import QuantizedMatrix
+    from bijux_vex.domain.execution_algorithms.sharded_exact import (
+        ShardedExactScanner,
+    )
+
+from bijux_vex.infra.optional_deps import np
+
+MATRIX_METRICS = frozenset({"l2", "cosine", "dot"})
+# Rows with larger magnitudes risk overflow in the expanded l2 form.
+_MAX_SAFE_MAGNITUDE = 1e150
+_EPS = sys.float_info.epsilon
+# Upper bound on (queries x rows) cells scored per matrix product in a batch.
+_BATCH_BLOCK_CELLS = 1 << 22
+
+
+def matrix_available() -> bool:
+    return np is not None
+
+
+@dataclass(frozen=True)
+class VectorMatrix:
+    """
+    Contiguous (n, d) view over a vector set.
+
+    ``live_rows`` restricts scans to a subset of rows (e.g. skipping
+    tombstones); ``max_abs`` is the largest absolute component, NaN if any
+    component is not finite.
+    """
+
+    vector_ids: tuple[str, ...]
+    chunk_ids: tuple[str, ...]
+    matrix: Any
+    norms: Any
+    dimension: int
+    live_rows: Any = None
+    max_abs: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self.vector_ids)
+
+    def rows(self) -> Any:
+        if self.live_rows is not None:
+            return self.live_rows
+        return np.arange(len(self.vector_ids))
+
+
+def build_vector_matrix(vectors: Iterable[Vector], dimension: int) -> VectorMatrix:
+    if np is None:
+        raise RuntimeError("numpy is required for matrix execution")
+    selected = sorted(
+        (v for v in vectors if v.dimension == dimension), key=lambda v: v.vector_id
+    )
+    matrix = np.array([v.values for v in selected], dtype=np.float64).reshape(
+        len(selected), dimension
+    )
+    return VectorMatrix(
+        vector_ids=tuple(v.vector_id for v in selected),
+        chunk_ids=tuple(v.chunk_id for v in selected),
+        matrix=np.ascontiguousarray(matrix),
+        norms=np.sqrt(np.einsum("ij,ij->i", matrix, matrix)),
+        dimension=dimension,
+        max_abs=max_abs(matrix),
+    )
+
+
+def max_abs(matrix: Any) -> float:
+    if not matrix.size:
+        return 0.0
+    return float(np.max(np.abs(matrix)))
+
+
+class VectorMatrixCache:
+    """
+    Per-source LRU of matrices keyed by artifact, invalidated by vector revision.
+
+    Sources whose ``vector_matrix`` returns a view serve their own storage.
+    """
+
+    def __init__(self, max_entries: int = 8) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: weakref.WeakKeyDictionary[
+            VectorSource, OrderedDict[tuple[str, int], tuple[object, VectorMatrix]]
+        ] = weakref.WeakKeyDictionary()
+
+    def get(
+        self, vectors: VectorSource, artifact_id: str, dimension: int
+    ) -> VectorMatrix:
+        provided = vectors.vector_matrix(dimension)
+        if provided is not None:
+            return cast(VectorMatrix, provided)
+        revision = vectors.vector_revision()
+        key = (artifact_id, dimension)
+        if revision is not None:
+            with self._lock:
+                per_source = self._entries.get(vectors)
+                cached = per_source.get(key) if per_source is not None else None
+                if cached is not None and cached[0] == revision:
+                    per_source.move_to_end(key)  # type: ignore[union-attr]
+                    return cached[1]
+        matrix = build_vector_matrix(vectors.list_vectors(), dimension)
+        if revision is not None:
+            with self._lock:
+                per_source = self._entries.setdefault(vectors, OrderedDict())
+                per_source[key] = (revision, matrix)
+                per_source.move_to_end(key)
+                while len(per_source) > self.max_entries:
+                    per_source.popitem(last=False)
+        return matrix
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = weakref.WeakKeyDictionary()
+
+
+MATRIX_CACHE = VectorMatrixCache()
+
+
+def _approximate_scores(
+    metric: str, dots: Any, q_norm: float, norms: Any, dimension: int
+) -> tuple[Any, Any]:
+    slack = 8.0 * (dimension + 8) * _EPS
+    if metric == "l2":
+        approx = norms * norms - 2.0 * dots + q_norm * q_norm
+        return approx, slack * (norms + q_norm) ** 2
+    if metric == "dot":
+        return dots, slack * norms * q_norm
+    approx = -(dots / (norms * q_norm))
+    return approx, np.full(len(norms), 4.0 * slack)
+
+
+def matrix_supported(metric: str, query: Sequence[float], vm: VectorMatrix) -> bool:
+    """True when the vectorized bound is valid and scoring cannot raise."""
+    if np is None or metric not in MATRIX_METRICS or not len(vm):
+        return False
+    if not vm.max_abs <= _MAX_SAFE_MAGNITUDE:
+        return False
+    q = np.asarray(query, dtype=np.float64)
+    if not max_abs(q) <= _MAX_SAFE_MAGNITUDE:
+        return False
+    if metric != "cosine":
+        return True
+    return float(np.linalg.norm(q)) != 0.0 and not bool(
+        np.any(vm.norms[vm.rows()] == 0.0)
+    )
+
+
+def exact_top_k(
+    metric: str,
+    query: Sequence[float],
+    vm: VectorMatrix,
+    k: int,
+    rows: Any = None,
+) -> list[tuple[float, str, int]]:
+    """
+    Return ``(score, vector_id, row)`` for the k best rows in tie-break order.
+
+    ``rows`` optionally restricts the scan to a subset of row indices
+    (defaults to ``vm.rows()``). Callers must check ``matrix_supported`` first.
+    """
+    if k <= 0 or not len(vm):
+        return []
+    scanner = _scanner_for(vm)
+    if scanner is not None:
+        return scanner.top_k_batch(metric, [query], vm, k, rows)[0]
+    quantized = _quantized_for(vm)
+    if quantized is not None:
+        return _quantized_top_k(metric, query, vm, quantized, k, rows)
+    q = np.asarray(query, dtype=np.float64)
+    return _select(metric, query, vm.matrix @ q, vm, k, rows)
+
+
+def exact_top_k_batch(
+    metric: str,
+    queries: Sequence[Sequence[float]],
+    vm: VectorMatrix,
+    k: int,
+    rows: Any = None,
+) -> list[list[tuple[float, str, int]]]:
+    """
+    ``exact_top_k`` for many queries, sharing one matrix-matrix product.
+
+    Queries are processed in blocks so the (queries, rows) score matrix
+    stays bounded.
+    """
+    if k <= 0 or not len(vm):
+        return [[] for _ in queries]
+    scanner = _scanner_for(vm)
+    if scanner is not None:
+        return scanner.top_k_batch(metric, queries, vm, k, rows)
+    quantized = _quantized_for(vm)
+    if quantized is not None:
+        return [
+            _quantized_top_k(metric, query, vm, quantized, k, rows) for query in queries
+        ]
+    block = max(1, _BATCH_BLOCK_CELLS // len(vm))
+    out: list[list[tuple[float, str, int]]] = []
+    for start in range(0, len(queries), block):
+        chunk = queries[start : start + block]
+        q = np.asarray(chunk, dtype=np.float64).reshape(len(chunk), vm.dimension)
+        dots = q @ vm.matrix.T
+        out.extend(
+            _select(metric, query, dots[idx], vm, k, rows)
+            for idx, query in enumerate(chunk)
+        )
+    return out
+
+
+def _scanner_for(vm: VectorMatrix) -> ShardedExactScanner | None:
+    # Imported lazily: the sharded scanner builds on this module.
+    from bijux_vex.domain.execution_algorithms.sharded_exact import sharded_scanner
+
+    scanner = sharded_scanner()
+    return scanner if scanner is not None and scanner.applies(vm) else None
+
+
+def _quantized_for(vm: VectorMatrix) -> QuantizedMatrix | None:
+    from bijux_vex.domain.execution_algorithms.quantized import quantized_matrix
+
+    return quantized_matrix(vm)
+
+
+def _quantized_top_k(
+    metric: str,
+    query: Sequence[float],
+    vm: VectorMatrix,
+    quantized: QuantizedMatrix,
+    k: int,
+    rows: Any,
+) -> list[tuple[float, str, int]]:
+    from bijux_vex.domain.execution_algorithms.quantized import quantized_top_k
+
+    return quantized_top_k(metric, query, vm, quantized, k, rows)
+
+
+def rescore_rows(
+    metric: str,
+    query: Sequence[float],
+    matrix: Any,
+    norms: Any,
+    k: int,
+    rows: Any = None,
+) -> list[tuple[float, int]]:
+    """
+    ``(score, row)`` for every row of ``matrix`` that may rank in the top k.
+
+    Rows tied at the cut-off are all kept, so callers order the result by
+    ``(score, vector_id)`` and truncate. Used by shard workers, which see a
+    bare matrix without vector ids.
+    """
+    q = np.asarray(query, dtype=np.float64)
+    if rows is None:
+        candidates = np.arange(len(matrix))
+        dots = matrix @ q
+    else:
+        candidates = np.asarray(rows, dtype=np.int64)
+        norms = norms[candidates]
+        dots = matrix[candidates] @ q
+    if k <= 0 or not len(candidates):
+        return []
+    return _rescore(metric, query, dots, norms, matrix, candidates, k)
+
+
+def _select(
+    metric: str,
+    query: Sequence[float],
+    dots: Any,
+    vm: VectorMatrix,
+    k: int,
+    rows: Any,
+) -> list[tuple[float, str, int]]:
+    candidates = vm.rows() if rows is None else np.asarray(rows, dtype=np.int64)
+    if not len(candidates):
+        return []
+    scored = [
+        (score, vm.vector_ids[row], row)
+        for score, row in _rescore(
+            metric,
+            query,
+            dots[candidates],
+            vm.norms[candidates],
+            vm.matrix,
+            candidates,
+            k,
+        )
+    ]
+    scored.sort(key=lambda item: (item[0], item[1]))
+    return scored[:k]
+
+
+def _rescore(
+    metric: str,
+    query: Sequence[float],
+    dots: Any,
+    norms: Any,
+    matrix: Any,
+    candidates: Any,
+    k: int,
+) -> list[tuple[float, int]]:
+    """``dots`` and ``norms`` are aligned with ``candidates`` (rows of ``matrix``)."""
+    q = np.asarray(query, dtype=np.float64)
+    q_norm = float(np.sqrt(q @ q))
+    approx, slack = _approximate_scores(metric, dots, q_norm, norms, matrix.shape[1])
+    if len(candidates) > k:
+        upper = approx + slack
+        bound = np.partition(upper, k - 1)[k - 1]
+        candidates = candidates[approx - slack <= bound]
+    query_tuple = tuple(query)
+    return [
+        (
+            scoring.score(metric, query_tuple, tuple(matrix[row].tolist())),
+            int(row),
+        )
+        for row in candidates.tolist()
+    ]
+
+
+__all__ = [
+    "MATRIX_CACHE",
+    "MATRIX_METRICS",
+    "VectorMatrix",
+    "VectorMatrixCache",
+    "build_vector_matrix",
+    "exact_top_k",
+    "exact_top_k_batch",
+    "matrix_available",
+    "matrix_supported",
+    "max_abs",
+    "rescore_rows",
+]
@@ -0,0 +1,126 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+"""
+Maximal marginal relevance (MMR) selection order.
+
+Each step picks the candidate maximising
+``lambda * sim(query, c) - (1 - lambda) * max(0, max sim(c, s) for s selected)``
+under cosine similarity; ties go to the earliest candidate. The matrix path
+computes the query and candidate-to-candidate similarities once and keeps
+the max-similarity-to-selected vector up to date as candidates are picked,
+so a step costs O(n) instead of O(n * |selected| * d).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+import math
+from typing import Any
+
+from bijux_vex.infra.optional_deps import np
+
+
+def mmr_order(
+    query: Sequence[float],
+    rows: Sequence[Sequence[float] | None],
+    diversity_lambda: float,
+    k: int,
+) -> list[int]:
+    """
+    Indices of ``rows`` in MMR selection order, at most ``k`` of them.
+
+    Rows that are ``None`` (no stored vector) have zero similarity to
+    everything. Uses NumPy when available and the reference loop otherwise.
+    """
+    if np is None:
+        return mmr_order_reference(query, rows, diversity_lambda, k)
+    return mmr_order_matrix(query, rows, diversity_lambda, k)
+
+
+def mmr_order_matrix(
+    query: Sequence[float],
+    rows: Sequence[Sequence[float] | None],
+    diversity_lambda: float,
+    k: int,
+) -> list[int]:
+    if np is None:  # pragma: no cover - optional dependency
+        raise RuntimeError("numpy is required for the matrix MMR path")
+    n = len(rows)
+    steps = min(k, n)
+    if steps <= 0:
+        return []
+    lam = min(1.0, max(0.0, diversity_lambda))
+    dimension = len(query)
+    matrix: Any = np.zeros((n, dimension), dtype=np.float64)
+    for idx, row in enumerate(rows):
+        if row is not None:
+            matrix[idx] = row
+    norms = np.linalg.norm(matrix, axis=1)
+    units = np.divide(
+        matrix, norms[:, None], out=np.zeros_like(matrix), where=norms[:, None] > 0
+    )
+    q = np.asarray(query, dtype=np.float64)
+    q_norm = float(np.linalg.norm(q))
+    query_sim = units @ (q / q_norm) if q_norm else np.zeros(n)
+    pairwise = units @ units.T
+    relevance = lam * query_sim
+    redundancy_weight = 1.0 - lam
+    max_selected = np.zeros(n)
+    taken: Any = np.zeros(n, dtype=bool)
+    order: list[int] = []
+    for _ in range(steps):
+        scores = relevance - redundancy_weight * max_selected
+        scores[taken] = -np.inf
+        best = int(np.argmax(scores))
+        order.append(best)
+        taken[best] = True
+        np.maximum(max_selected, pairwise[best], out=max_selected)
+    return order
+
+
+def mmr_order_reference(
+    query: Sequence[float],
+    rows: Sequence[Sequence[float] | None],
+    diversity_lambda: float,
+    k: int,
+) -> list[int]:
+    """Pure-Python MMR; the behavioural reference for the matrix path."""
+    lam = min(1.0, max(0.0, diversity_lambda))
+    query_sim = [
+        _cosine_similarity(query, row) if row is not None else 0.0 for row in rows
+    ]
+    remaining = list(range(len(rows)))
+    order: list[int] = []
+    while remaining and len(order) < k:
+        best: int | None = None
+        best_score = -math.inf
+        for idx in remaining:
+            row = rows[idx]
+            sim_selected = 0.0
+            if row is not None:
+                for chosen in order:
+                    chosen_row = rows[chosen]
+                    if chosen_row is None:
+                        continue
+                    sim_selected = max(
+                        sim_selected, _cosine_similarity(row, chosen_row)
+                    )
+            score = lam * query_sim[idx] - (1.0 - lam) * sim_selected
+            if best is None or score > best_score:
+                best_score = score
+                best = idx
+        if best is None:  # pragma: no cover - remaining is non-empty
+            break
+        order.append(best)
+        remaining.remove(best)
+    return order
+
+
+def _cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
+    denom = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(x * x for x in b))
+    if denom == 0:
+        return 0.0
+    return sum(x * y for x, y in zip(a, b, strict=True)) / denom
+
+
+__all__ = ["mmr_order", "mmr_order_matrix", "mmr_order_reference"]
@@ -0,0 +1,311 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+"""
+Int8 scalar-quantized shadow copies of vector matrices.
+
+Each dimension is calibrated to the min/max of its column and mapped onto
+256 levels stored as int8, an eighth of the float64 matrix. Calibration
+also records, per dimension, the largest reconstruction error actually
+seen, which bounds how far a score computed from codes can drift from the
+exact score for any query.
+
+Two consumers scan codes instead of full-precision rows:
+
+* the exact path keeps every row whose quantized score, widened by that
+  bound, could still reach the top k, and rescores only those with
+  ``scoring.score``; results are identical to the full scan;
+* the int8 ANN runner shortlists ``candidate_k`` rows by quantized score
+  and leaves exact rescoring to the plan's ``rescore_exact`` step.
+
+Quantization is off unless ``BIJUX_VEX_QUANTIZATION=int8``.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+import os
+import sys
+import threading
+from typing import Any
+import weakref
+
+from bijux_vex.core.errors import ValidationError
+from bijux_vex.domain.execution_algorithms.exact_matrix import (
+    VectorMatrix,
+    _approximate_scores,
+    rescore_rows,
+)
+from bijux_vex.infra.optional_deps import np
+
+QUANTIZATION_MODES = frozenset({"none", "int8"})
+_LEVELS = 255
+_OFFSET = 128
+_EPS = sys.float_info.epsilon
+_EPS32 = 2.0**-23
+# Upper bound on code cells widened to float32 at once.
+_BLOCK_CELLS = 1 << 20
+_MAX_ENTRIES = 8
+
+
+@dataclass(frozen=True)
+class QuantizedMatrix:
+    """
+    Int8 codes for the rows of a ``VectorMatrix``.
+
+    A component decodes as ``low + (code + 128) * scale``; ``error`` is the
+    per-dimension bound on ``|value - decoded|``.
+    """
+
+    codes: Any
+    low: Any
+    scale: Any
+    error: Any
+    dimension: int
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def max_error(self) -> float:
+        return float(np.max(self.error)) if self.error.size else 0.0
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.codes.nbytes)
+
+    def calibration(self) -> dict[str, list[float]]:
+        return {
+            "low": self.low.tolist(),
+            "high": (self.low + _LEVELS * self.scale).tolist(),
+        }
+
+    def decode(self, rows: Any) -> Any:
+        codes = self.codes[np.asarray(rows, dtype=np.int64)]
+        return self.low + (codes.astype(np.float64) + _OFFSET) * self.scale
+
+    def dots(self, query: Any, rows: Any = None) -> tuple[Any, float]:
+        """Dot products with the decoded rows and a bound on their error."""
+        q = np.asarray(query, dtype=np.float64)
+        weights = (q * self.scale).astype(np.float32)
+        base = float(q @ (self.low + _OFFSET * self.scale))
+        codes = self.codes if rows is None else self.codes[rows]
+        block = max(1, _BLOCK_CELLS // max(1, self.dimension))
+        out: Any = np.empty(len(codes), dtype=np.float64)
+        for start in range(0, len(codes), block):
+            widened = codes[start : start + block].astype(np.float32)
+            out[start : start + block] = widened @ weights
+        out += base
+        abs_q = np.abs(q)
+        magnitude = float(abs_q @ (np.abs(self.low) + 2 * _OFFSET * self.scale))
+        rounding = (
+            4.0 * (self.dimension + 8) * _EPS32 * _OFFSET * float(abs_q @ self.scale)
+            + 8.0 * (self.dimension + 8) * _EPS * magnitude
+        )
+        return out, float(abs_q @ self.error) + rounding
+
+
+def quantize_matrix(vm: VectorMatrix) -> QuantizedMatrix:
+    """Calibrate per-dimension min/max over ``vm`` and encode every row."""
+    if np is None:
+        raise RuntimeError("numpy is required for quantization")
+    dimension = vm.dimension
+    if not len(vm):
+        empty: Any = np.zeros(dimension, dtype=np.float64)
+        return QuantizedMatrix(
+            codes=np.zeros((0, dimension), dtype=np.int8),
+            low=empty,
+            scale=empty,
+            error=empty,
+            dimension=dimension,
+        )
+    matrix = vm.matrix
+    low = np.asarray(matrix.min(axis=0), dtype=np.float64)
+    scale = (np.asarray(matrix.max(axis=0), dtype=np.float64) - low) / _LEVELS
+    safe = np.where(scale > 0.0, scale, 1.0)
+    codes: Any = np.empty((len(vm), dimension), dtype=np.int8)
+    error: Any = np.zeros(dimension, dtype=np.float64)
+    block = max(1, _BLOCK_CELLS // max(1, dimension))
+    for start in range(0, len(vm), block):
+        values = np.asarray(matrix[start : start + block], dtype=np.float64)
+        levels = np.clip(np.rint((values - low) / safe), 0, _LEVELS)
+        levels[:, scale == 0.0] = 0
+        codes[start : start + block] = (levels - _OFFSET).astype(np.int8)
+        decoded = low + levels * scale
+        error = np.maximum(error, np.max(np.abs(values - decoded), axis=0))
+    # Decoding itself rounds; cover it so the bound holds for the decoded values.
+    error = error + 4.0 * _EPS * (np.abs(low) + _LEVELS * scale)
+    return QuantizedMatrix(
+        codes=codes, low=low, scale=scale, error=error, dimension=dimension
+    )
+
+
+def _scores(
+    metric: str,
+    query: Sequence[float],
+    qm: QuantizedMatrix,
+    norms: Any,
+    rows: Any,
+) -> tuple[Any, Any]:
+    """Quantized scores for ``rows`` and how far the exact scores may differ."""
+    dots, bound = qm.dots(query, rows)
+    q = np.asarray(query, dtype=np.float64)
+    q_norm = float(np.sqrt(q @ q))
+    row_norms = norms if rows is None else norms[rows]
+    approx, slack = _approximate_scores(metric, dots, q_norm, row_norms, qm.dimension)
+    if metric == "l2":
+        return approx, slack + 2.0 * bound
+    if metric == "dot":
+        return approx, slack + bound
+    return approx, slack + bound / (row_norms * q_norm)
+
+
+def quantized_scores(
+    metric: str,
+    query: Sequence[float],
+    qm: QuantizedMatrix,
+    norms: Any,
+    rows: Any = None,
+) -> Any:
+    """Scores computed from codes, in ``scoring.score`` order (lower is better)."""
+    return _scores(metric, query, qm, norms, rows)[0]
+
+
+def quantized_top_k(
+    metric: str,
+    query: Sequence[float],
+    vm: VectorMatrix,
+    qm: QuantizedMatrix,
+    k: int,
+    rows: Any = None,
+) -> list[tuple[float, str, int]]:
+    """
+    ``exact_top_k`` with the first pass over int8 codes.
+
+    Only rows whose widened quantized score could reach the top k are
+    read at full precision, so results are identical to the full scan.
+    """
+    if k <= 0 or not len(vm):
+        return []
+    candidates = vm.rows() if rows is None else np.asarray(rows, dtype=np.int64)
+    if not len(candidates):
+        return []
+    if len(candidates) > k:
+        approx, slack = _scores(metric, query, qm, vm.norms, candidates)
+        bound = np.partition(approx + slack, k - 1)[k - 1]
+        candidates = candidates[approx - slack <= bound]
+    scored = [
+        (score, vm.vector_ids[row], row)
+        for score, row in rescore_rows(
+            metric, query, vm.matrix, vm.norms, k, candidates
+        )
+    ]
+    scored.sort(key=lambda item: (item[0], item[1]))
+    return scored[:k]
+
+
+def quantized_shortlist(
+    metric: str,
+    query: Sequence[float],
+    vm: VectorMatrix,
+    qm: QuantizedMatrix,
+    candidate_k: int,
+    rows: Any = None,
+) -> list[tuple[float, int]]:
+    """``(quantized score, row)`` for the best ``candidate_k`` rows, best first."""
+    candidates = vm.rows() if rows is None else np.asarray(rows, dtype=np.int64)
+    if candidate_k <= 0 or not len(candidates):
+        return []
+    approx = quantized_scores(metric, query, qm, vm.norms, candidates)
+    if len(candidates) > candidate_k:
+        keep = np.argpartition(approx, candidate_k - 1)[:candidate_k]
+        candidates, approx = candidates[keep], approx[keep]
+    order = np.lexsort((candidates, approx))
+    return [(float(approx[idx]), int(candidates[idx])) for idx in order.tolist()]
+
+
+class QuantizedMatrixCache:
+    """Codes per live ``VectorMatrix``, dropped when the matrix is collected."""
+
+    def __init__(self, max_entries: int = _MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[int, QuantizedMatrix] = OrderedDict()
+
+    def get(self, vm: VectorMatrix) -> QuantizedMatrix:
+        key = id(vm)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached
+        quantized = quantize_matrix(vm)
+        with self._lock:
+            if key not in self._entries:
+                weakref.finalize(vm, self._forget, key, quantized)
+            self._entries[key] = quantized
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return quantized
+
+    def _forget(self, key: int, quantized: QuantizedMatrix) -> None:
+        with self._lock:
+            if self._entries.get(key) is quantized:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+QUANTIZED_CACHE = QuantizedMatrixCache()
+
+_MODE: str | None = None
+_MODE_LOCK = threading.Lock()
+
+
+def configure_quantization(mode: str | None) -> str:
+    """Set the process-wide mode; None re-reads ``BIJUX_VEX_QUANTIZATION``."""
+    global _MODE
+    resolved = (
+        (mode if mode is not None else os.getenv("BIJUX_VEX_QUANTIZATION")) or "none"
+    ).lower()
+    if resolved not in QUANTIZATION_MODES:
+        raise ValidationError(
+            message=f"Unsupported quantization mode {resolved!r}; expected one of "
+            + ", ".join(sorted(QUANTIZATION_MODES))
+        )
+    with _MODE_LOCK:
+        _MODE = resolved
+    QUANTIZED_CACHE.clear()
+    return resolved
+
+
+def quantization_mode() -> str:
+    if _MODE is None:
+        return configure_quantization(None)
+    return _MODE
+
+
+def quantized_matrix(vm: VectorMatrix) -> QuantizedMatrix | None:
+    """Codes for ``vm`` when int8 quantization is enabled, else None."""
+    if np is None or quantization_mode() != "int8":
+        return None
+    return QUANTIZED_CACHE.get(vm)
+
+
+__all__ = [
+    "QUANTIZATION_MODES",
+    "QUANTIZED_CACHE",
+    "QuantizedMatrix",
+    "QuantizedMatrixCache",
+    "configure_quantization",
+    "quantization_mode",
+    "quantize_matrix",
+    "quantized_matrix",
+    "quantized_scores",
+    "quantized_shortlist",
+    "quantized_top_k",
+]
@@ -0,0 +1,298 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+"""
+Process-pool sharded exact scan for multi-core hosts.
+
+A ``VectorMatrix`` is copied once into a shared-memory segment (matrix rows
+followed by their norms). Persistent worker processes attach to it by name
+and each scores a contiguous shard of rows with the same bounded rescore as
+the single-process scan, returning every row that could still reach the
+top-k. The parent merges the shard candidates on ``(score, vector_id)``,
+the order ``exact_top_k`` sorts by, so results are bit-identical to
+single-process execution.
+
+Sharding is off unless ``BIJUX_VEX_EXACT_SHARDS`` asks for more than one
+worker; matrices smaller than ``BIJUX_VEX_EXACT_SHARD_MIN_ROWS`` rows stay
+in-process, where pickling the query costs more than the scan.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+import contextlib
+from dataclasses import dataclass
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+import os
+import threading
+from typing import Any
+import weakref
+
+from bijux_vex.domain.execution_algorithms.exact_matrix import (
+    VectorMatrix,
+    rescore_rows,
+)
+from bijux_vex.infra.optional_deps import np
+
+DEFAULT_SHARD_MIN_ROWS = 50_000
+# Segments kept alive in the parent and attached in each worker.
+_MAX_SEGMENTS = 4
+
+
+@dataclass(frozen=True)
+class _ShardTask:
+    segment: str
+    rows: int
+    dimension: int
+    metric: str
+    queries: tuple[tuple[float, ...], ...]
+    k: int
+    start: int
+    stop: int
+    subset: Any = None
+
+
+class _Segment:
+    def __init__(self, vm: VectorMatrix) -> None:
+        rows, dimension = len(vm), vm.dimension
+        self.rows = rows
+        self.dimension = dimension
+        self.shm = SharedMemory(create=True, size=max(1, rows * (dimension + 1) * 8))
+        matrix, norms = _views(self.shm, rows, dimension)
+        matrix[:] = vm.matrix[:rows]
+        norms[:] = vm.norms[:rows]
+        del matrix, norms
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def release(self) -> None:
+        self.shm.close()
+        with contextlib.suppress(FileNotFoundError):
+            self.shm.unlink()
+
+
+def _views(shm: SharedMemory, rows: int, dimension: int) -> tuple[Any, Any]:
+    matrix = np.ndarray((rows, dimension), dtype=np.float64, buffer=shm.buf)
+    norms = np.ndarray(
+        (rows,), dtype=np.float64, buffer=shm.buf, offset=rows * dimension * 8
+    )
+    return matrix, norms
+
+
+class ShardedExactScanner:
+    """Persistent process pool plus the shared-memory segments it scans."""
+
+    def __init__(self, workers: int, min_rows: int = DEFAULT_SHARD_MIN_ROWS) -> None:
+        self.workers = workers
+        self.min_rows = min_rows
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._segments: OrderedDict[int, _Segment] = OrderedDict()
+
+    def applies(self, vm: VectorMatrix) -> bool:
+        return np is not None and self.workers > 1 and len(vm) >= self.min_rows
+
+    def top_k_batch(
+        self,
+        metric: str,
+        queries: Sequence[Sequence[float]],
+        vm: VectorMatrix,
+        k: int,
+        rows: Any = None,
+    ) -> list[list[tuple[float, str, int]]]:
+        if k <= 0 or not len(vm):
+            return [[] for _ in queries]
+        segment = self._segment(vm)
+        frozen = tuple(tuple(float(v) for v in q) for q in queries)
+        futures = [
+            self._pool().submit(
+                _scan_shard,
+                _ShardTask(
+                    segment=segment.name,
+                    rows=segment.rows,
+                    dimension=segment.dimension,
+                    metric=metric,
+                    queries=frozen,
+                    k=k,
+                    start=start,
+                    stop=stop,
+                    subset=subset,
+                ),
+            )
+            for start, stop, subset in self._shards(vm, rows)
+        ]
+        return _merge(futures, vm, len(frozen), k)
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+            segments = list(self._segments.values())
+            self._segments.clear()
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        for segment in segments:
+            segment.release()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a threaded server process is not safe.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _segment(self, vm: VectorMatrix) -> _Segment:
+        key = id(vm)
+        with self._lock:
+            segment = self._segments.get(key)
+            if segment is not None:
+                self._segments.move_to_end(key)
+                return segment
+            segment = self._segments[key] = _Segment(vm)
+            weakref.finalize(vm, self._forget, key, segment)
+            while len(self._segments) > _MAX_SEGMENTS:
+                _, evicted = self._segments.popitem(last=False)
+                evicted.release()
+            return segment
+
+    def _forget(self, key: int, segment: _Segment) -> None:
+        with self._lock:
+            if self._segments.get(key) is segment:
+                del self._segments[key]
+            else:
+                return
+        segment.release()
+
+    def _shards(self, vm: VectorMatrix, rows: Any) -> list[tuple[int, int, Any]]:
+        if rows is None and vm.live_rows is None:
+            bounds = np.linspace(0, len(vm), self.workers + 1).astype(np.int64)
+            return [
+                (int(lo), int(hi), None)
+                for lo, hi in zip(bounds[:-1], bounds[1:], strict=True)
+                if hi > lo
+            ]
+        subset = vm.rows() if rows is None else np.asarray(rows, dtype=np.int64)
+        return [
+            (0, 0, part)
+            for part in np.array_split(np.sort(subset), self.workers)
+            if len(part)
+        ]
+
+
+def _merge(
+    futures: list[Future[list[list[tuple[float, int]]]]],
+    vm: VectorMatrix,
+    query_count: int,
+    k: int,
+) -> list[list[tuple[float, str, int]]]:
+    merged: list[list[tuple[float, str, int]]] = [[] for _ in range(query_count)]
+    for future in futures:
+        for idx, found in enumerate(future.result()):
+            merged[idx].extend((score, vm.vector_ids[row], row) for score, row in found)
+    for scored in merged:
+        scored.sort(key=lambda item: (item[0], item[1]))
+        del scored[k:]
+    return merged
+
+
+_ATTACHED: OrderedDict[str, tuple[SharedMemory, Any, Any]] = OrderedDict()
+
+
+def _attached(task: _ShardTask) -> tuple[Any, Any]:
+    entry = _ATTACHED.get(task.segment)
+    if entry is None:
+        shm = SharedMemory(name=task.segment)
+        matrix, norms = _views(shm, task.rows, task.dimension)
+        entry = _ATTACHED[task.segment] = (shm, matrix, norms)
+        while len(_ATTACHED) > _MAX_SEGMENTS:
+            _, (old, _matrix, _norms) = _ATTACHED.popitem(last=False)
+            del _matrix, _norms
+            old.close()
+    _ATTACHED.move_to_end(task.segment)
+    return entry[1], entry[2]
+
+
+def _scan_shard(task: _ShardTask) -> list[list[tuple[float, int]]]:
+    """Worker entry point: shard candidates for every query, rows in global numbering."""
+    matrix, norms = _attached(task)
+    if task.subset is not None:
+        return [
+            rescore_rows(task.metric, query, matrix, norms, task.k, task.subset)
+            for query in task.queries
+        ]
+    shard_matrix = matrix[task.start : task.stop]
+    shard_norms = norms[task.start : task.stop]
+    return [
+        [
+            (score, row + task.start)
+            for score, row in rescore_rows(
+                task.metric, query, shard_matrix, shard_norms, task.k
+            )
+        ]
+        for query in task.queries
+    ]
+
+
+_SCANNER: ShardedExactScanner | None = None
+_SCANNER_LOCK = threading.Lock()
+_CONFIGURED = False
+
+
+def configure_sharding(
+    workers: int | None, min_rows: int = DEFAULT_SHARD_MIN_ROWS
+) -> ShardedExactScanner | None:
+    """Replace the process-wide scanner; ``workers`` of None or <= 1 disables it."""
+    global _SCANNER, _CONFIGURED
+    with _SCANNER_LOCK:
+        previous = _SCANNER
+        _SCANNER = _build(workers, min_rows)
+        _CONFIGURED = True
+        current = _SCANNER
+    if previous is not None:
+        previous.close()
+    return current
+
+
+def sharded_scanner() -> ShardedExactScanner | None:
+    """Process-wide scanner, configured from the environment on first use."""
+    global _SCANNER, _CONFIGURED
+    if _CONFIGURED:
+        return _SCANNER
+    with _SCANNER_LOCK:
+        if not _CONFIGURED:
+            raw_min = os.getenv("BIJUX_VEX_EXACT_SHARD_MIN_ROWS")
+            _SCANNER = _build(
+                int(os.getenv("BIJUX_VEX_EXACT_SHARDS") or 0),
+                int(raw_min) if raw_min else DEFAULT_SHARD_MIN_ROWS,
+            )
+            _CONFIGURED = True
+        return _SCANNER
+
+
+def shutdown_sharding() -> None:
+    """Stop the scanner's worker processes; the next sharded scan restarts them."""
+    with _SCANNER_LOCK:
+        scanner = _SCANNER
+    if scanner is not None:
+        scanner.close()
+
+
+def _build(workers: int | None, min_rows: int) -> ShardedExactScanner | None:
+    if workers is None or workers <= 1:
+        return None
+    return ShardedExactScanner(workers, min_rows)
+
+
+__all__ = [
+    "DEFAULT_SHARD_MIN_ROWS",
+    "ShardedExactScanner",
+    "configure_sharding",
+    "sharded_scanner",
+    "shutdown_sharding",
+]
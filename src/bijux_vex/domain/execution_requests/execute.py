@@ -2,12 +2,12 @@
 # Copyright © 2025 Bijan Mousavi
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, replace
 
 from bijux_vex.contracts.resources import ExecutionResources
 from bijux_vex.core.contracts.execution_contract import ExecutionContract
-from bijux_vex.core.errors import BijuxError
+from bijux_vex.core.errors import BijuxError, BudgetExceededError
 from bijux_vex.core.execution_result import (
     ExecutionResult,
     NDDecisionTrace,
@@ -23,6 +23,7 @@ from bijux_vex.domain.execution_requests.nd_quality import (
     build_witness_report,
     should_run_witness,
 )
+from bijux_vex.domain.execution_requests.plan import run_plan_batch
 from bijux_vex.domain.execution_requests.planning import start_session
 from bijux_vex.domain.execution_requests.postprocess import (
     build_execution_result,
@@ -54,10 +55,11 @@ def execute_request(
     resources: ExecutionResources,
     ann_runner: AnnExecutionRequestRunner | None = None,
     decision_trace: NDDecisionTrace | None = None,
+    precomputed: Iterable[Result] | None = None,
 ) -> tuple[ExecutionResult, Iterable[Result]]:
     require_randomness(session, ann_runner)
     results_buffer, status, failure_reason, approximation = collect_results(
-        session, resources, ann_runner
+        session, resources, ann_runner, precomputed
     )
     cost = estimate_cost(session.request, results_buffer)
     status, failure_reason = apply_budget_outcomes(
@@ -128,10 +130,68 @@ def execute_request(
     return execution_result, tuple(results_buffer)
 
 
+def execute_request_batch(
+    session: ExecutionSession,
+    requests: Sequence[ExecutionRequest],
+    resources: ExecutionResources,
+    ann_runner: AnnExecutionRequestRunner | None = None,
+    decision_trace: NDDecisionTrace | None = None,
+) -> list[tuple[ExecutionResult, Iterable[Result]]]:
+    """
+    Execute many requests under one session and plan.
+
+    The corpus is scored once for the whole batch; each request still gets
+    its own execution id, budget accounting and ExecutionResult.
+    """
+    require_randomness(session, ann_runner)
+    sessions = [_request_session(session, request) for request in requests]
+    batches: Sequence[Iterable[Result] | None]
+    try:
+        batches = run_plan_batch(
+            session.plan,
+            [s.execution for s in sessions],
+            session.artifact,
+            resources,
+            ann_runner=ann_runner,
+            budget=session.budget,
+        )
+    except BudgetExceededError:
+        # Let each request hit the budget on its own so partial results and
+        # failure reasons match single-query execution.
+        batches = [None] * len(sessions)
+    return [
+        execute_request(
+            request_session,
+            resources,
+            ann_runner=ann_runner,
+            decision_trace=decision_trace,
+            precomputed=results,
+        )
+        for request_session, results in zip(sessions, batches, strict=True)
+    ]
+
+
+def _request_session(
+    session: ExecutionSession, request: ExecutionRequest
+) -> ExecutionSession:
+    if request is session.request:
+        return session
+    return replace(
+        session,
+        request=request,
+        execution=replace(session.execution, request=request),
+    )
+
+
 # Re-export for compatibility
 from bijux_vex.core.runtime.execution_session import ExecutionSession  # noqa: E402
 
-__all__ = ["start_execution_session", "execute_request", "ExecutionSession"]
+__all__ = [
+    "start_execution_session",
+    "execute_request",
+    "execute_request_batch",
+    "ExecutionSession",
+]
 
 
 @dataclass(frozen=True)
@@ -29,6 +29,7 @@ def collect_results(
     session: ExecutionSession,
     resources: ExecutionResources,
     ann_runner: AnnExecutionRequestRunner | None,
+    precomputed: Iterable[Result] | None = None,
 ) -> tuple[list[Result], ExecutionStatus, str | None, ApproximationReport | None]:
     enforce_transition(session.state, ExecutionState.RUNNING)
     counters = {"vectors": 0, "distance": 0, "ann_probes": 0}
@@ -38,13 +39,17 @@ def collect_results(
     approximation: ApproximationReport | None = None
     try:
         _preflight_budget(session.budget)
-        results_iter = run_plan(
-            session.plan,
-            session.execution,
-            session.artifact,
-            resources,
-            ann_runner=ann_runner,
-            budget=session.budget,
+        results_iter = (
+            precomputed
+            if precomputed is not None
+            else run_plan(
+                session.plan,
+                session.execution,
+                session.artifact,
+                resources,
+                ann_runner=ann_runner,
+                budget=session.budget,
+            )
         )
     except BudgetExceededError as exc:
         failure_reason = _budget_failure_reason(exc)
@@ -2,7 +2,7 @@
 # Copyright © 2025 Bijan Mousavi
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 
 from bijux_vex.contracts.resources import ExecutionResources
 from bijux_vex.core.contracts.execution_contract import ExecutionContract
@@ -17,7 +17,10 @@ from bijux_vex.core.runtime.execution_plan import ExecutionPlan, RandomnessSourc
 from bijux_vex.core.runtime.vector_execution import RandomnessProfile, VectorExecution
 from bijux_vex.core.types import ExecutionArtifact, ExecutionRequest, Result
 from bijux_vex.domain.execution_algorithms import algorithms
-from bijux_vex.domain.execution_algorithms.base import get_algorithm
+from bijux_vex.domain.execution_algorithms.base import (
+    VectorExecutionAlgorithm,
+    get_algorithm,
+)
 from bijux_vex.infra.adapters.ann_base import AnnExecutionRequestRunner
 
 
@@ -65,6 +68,36 @@ def run_plan(
         raise InvariantError(
             message="run_plan requires an execution plan and execution context"
         )
+    algo = _select_algorithm(plan, execution.contract, resources, ann_runner, budget)
+    return algo.execute(execution, artifact, resources.vectors)
+
+
+def run_plan_batch(
+    plan: ExecutionPlan,
+    executions: Sequence[VectorExecution],
+    artifact: ExecutionArtifact,
+    resources: ExecutionResources,
+    ann_runner: AnnExecutionRequestRunner | None = None,
+    budget: dict[str, int | float] | None = None,
+) -> list[list[Result]]:
+    """Run one plan for several executions in a single pass over the corpus."""
+    if plan is None:  # pragma: no cover - defensive
+        raise InvariantError(message="batched run_plan requires an execution plan")
+    if not executions:
+        return []
+    algo = _select_algorithm(
+        plan, executions[0].contract, resources, ann_runner, budget
+    )
+    return algo.execute_batch(executions, artifact, resources.vectors)
+
+
+def _select_algorithm(
+    plan: ExecutionPlan,
+    contract: ExecutionContract,
+    resources: ExecutionResources,
+    ann_runner: AnnExecutionRequestRunner | None,
+    budget: dict[str, int | float] | None,
+) -> VectorExecutionAlgorithm:
     # Ensure plan immutability: recompute fingerprint and reject tampering.
     canonical_payload = (
         plan.algorithm,
@@ -82,7 +115,7 @@ def run_plan(
             message="ExecutionPlan fingerprint mismatch; plan mutated or rebuilt",
             invariant_id="INV-030",
         )
-    if execution.contract is ExecutionContract.DETERMINISTIC:
+    if contract is ExecutionContract.DETERMINISTIC:
         algo = get_algorithm(algorithms.ExactVectorExecutionAlgorithm.name)
         if budget and budget.get("max_vectors") is not None:
             total_vectors = len(tuple(resources.vectors.list_vectors()))
@@ -90,7 +123,7 @@ def run_plan(
                 raise InvariantError(
                     message="Budget would be exceeded before deterministic execution begins"
                 )
-        return algo.execute(execution, artifact, resources.vectors)
+        return algo
     if ann_runner is None:
         capability = None
         if resources.capabilities:
@@ -109,11 +142,10 @@ def run_plan(
             message="ANN probes budget exhausted before execution",
             invariant_id="INV-021",
         )
-    algo = algorithms.build_ann_algorithm(ann_runner)
-    return algo.execute(execution, artifact, resources.vectors)
+    return algorithms.build_ann_algorithm(ann_runner)
 
 
-__all__ = ["ExecutionPlan", "build_execution_plan", "run_plan"]
+__all__ = ["ExecutionPlan", "build_execution_plan", "run_plan", "run_plan_batch"]
 
 
 def _validate_contract_alignment(
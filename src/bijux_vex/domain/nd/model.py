@@ -2,13 +2,13 @@
 # Copyright © 2026 Bijan Mousavi
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass, replace
 import json
 from pathlib import Path
 from typing import Any
 
-from bijux_vex.contracts.resources import ExecutionResources
+from bijux_vex.contracts.resources import ExecutionResources, StoredVectors
 from bijux_vex.core.contracts.execution_contract import ExecutionContract
 from bijux_vex.core.errors import (
     AnnIndexBuildError,
@@ -26,11 +26,13 @@ from bijux_vex.core.types import (
 )
 from bijux_vex.domain.execution_requests.execute import (
     execute_request,
+    execute_request_batch,
     start_execution_session,
 )
 from bijux_vex.domain.execution_requests.plan import build_execution_plan
 from bijux_vex.domain.nd.randomness import require_randomness_for_nd
 from bijux_vex.infra.adapters.ann_base import AnnExecutionRequestRunner
+from bijux_vex.infra.adapters.ann_fallback import ExactFallbackAnnRunner
 from bijux_vex.infra.logging import log_event
 
 
@@ -53,11 +55,14 @@ class NDExecutionModel:
         ann_runner: AnnExecutionRequestRunner | None,
         latest_vector_fingerprint: str | None = None,
         tx_factory: Callable[[], Any] | None = None,
+        schedule_rebuild: Callable[[ExecutionArtifact, NDSettings | None], object]
+        | None = None,
     ) -> None:
         self._stores = stores
         self._ann_runner = ann_runner
         self._latest_vector_fingerprint = latest_vector_fingerprint
         self._tx_factory = tx_factory
+        self._schedule_rebuild = schedule_rebuild
 
     def build_settings(self, req: object) -> NDSettings | None:
         nd_settings = NDSettings(
@@ -87,6 +92,7 @@ class NDExecutionModel:
             ef_search=getattr(req, "nd_ef_search", None),
             max_ef_search=getattr(req, "nd_max_ef_search", None),
             space=getattr(req, "nd_space", None),
+            num_threads=getattr(req, "nd_num_threads", None),
         )
         nd_fields = (
             "nd_profile",
@@ -114,6 +120,7 @@ class NDExecutionModel:
             "nd_ef_search",
             "nd_max_ef_search",
             "nd_space",
+            "nd_num_threads",
         )
         has_nd_fields = any(
             getattr(req, field, None) not in (None, False) for field in nd_fields
@@ -190,13 +197,23 @@ class NDExecutionModel:
                 raise AnnIndexBuildError(
                     message="ANN index invalidated; rebuild required (incremental_index=false)"
                 )
+            if (
+                not build_on_demand
+                and artifact.index_state == "invalidated"
+                and self._schedule_rebuild is not None
+            ):
+                return self._serve_during_rebuild(
+                    artifact, nd_settings, ann_runner, index_info
+                )
             if not build_on_demand:
                 raise AnnIndexBuildError(
                     message="ANN index missing; run materialize --index-mode ann or set --nd-build-on-demand"
                 )
-            vectors = list(self._stores.vectors.list_vectors())
             index_info = ann_runner.build_index(
-                artifact.artifact_id, vectors, artifact.metric, nd_settings
+                artifact.artifact_id,
+                StoredVectors(self._stores.vectors),
+                artifact.metric,
+                nd_settings,
             )
             index_hash = index_info.get("index_hash") if index_info else None
             extra: tuple[tuple[str, str], ...] = (
@@ -215,6 +232,25 @@ class NDExecutionModel:
                 self._stores.ledger.put_artifact(tx, artifact)
         return artifact
 
+    def _serve_during_rebuild(
+        self,
+        artifact: ExecutionArtifact,
+        nd_settings: NDSettings | None,
+        ann_runner: AnnExecutionRequestRunner,
+        index_info: dict[str, object] | None,
+    ) -> ExecutionArtifact:
+        """Queue a background rebuild; serve the stale index or exact search."""
+        if self._schedule_rebuild is not None:
+            self._schedule_rebuild(artifact, nd_settings)
+        if not index_info:
+            self._ann_runner = ExactFallbackAnnRunner(ann_runner)
+        log_event(
+            "nd_serving_during_rebuild",
+            artifact_id=artifact.artifact_id,
+            serving="stale_index" if index_info else "exact_fallback",
+        )
+        return artifact
+
     def validate_index_invariants(self, artifact: ExecutionArtifact) -> None:
         if artifact.execution_contract is not ExecutionContract.NON_DETERMINISTIC:
             return
@@ -301,6 +337,38 @@ class NDExecutionModel:
         execution_result = self._stage_postprocess(execution_result, decision_trace)
         return execution_result, results
 
+    def execute_batch(
+        self,
+        artifact: ExecutionArtifact,
+        requests: Sequence[ExecutionRequest],
+        randomness: RandomnessProfile | None,
+        build_on_demand: bool,
+    ) -> list[tuple[Any, Iterable[Any]]]:
+        """Plan and check the index once, then probe it for all requests."""
+        session = self._stage_plan(
+            artifact, requests[0], randomness, build_on_demand=build_on_demand
+        )
+        plan = self.plan(artifact, requests[0], randomness)
+        decision_trace = NDDecisionTrace(
+            runner=type(plan.runner).__name__,
+            params=tuple(sorted(plan.params.items())),
+            budget=tuple(sorted(_budget_items(plan.budget))),
+            refusal=None,
+            degradation=None,
+            notes=(),
+        )
+        outcomes = execute_request_batch(
+            session,
+            requests,
+            self._stores,
+            ann_runner=self._ann_runner,
+            decision_trace=decision_trace,
+        )
+        return [
+            (self._stage_postprocess(result, decision_trace), results)
+            for result, results in outcomes
+        ]
+
     def _stage_plan(
         self,
         artifact: ExecutionArtifact,
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence, Set
 
 from bijux_vex.core.contracts.execution_contract import ExecutionContract
 from bijux_vex.core.errors import InvariantError
@@ -63,11 +63,34 @@ class AnnExecutionRequestRunner(ABC):
         _ = (artifact_id, vectors, metric, nd_settings)
         return {}
 
+    def apply_delta(
+        self,
+        artifact_id: str,
+        added: Iterable[Vector],
+        removed: Iterable[str] = (),
+    ) -> dict[str, object]:
+        """
+        Apply an incremental change set to a built index.
+
+        Returns the updated index metadata, or an empty dict when the delta
+        was not applied and the index must be rebuilt.
+        """
+        _ = (artifact_id, added, removed)
+        return {}
+
+    def flush(self) -> None:
+        """Write out index changes a runner defers; a no-op for most runners."""
+        return None
+
     def index_info(self, artifact_id: str) -> dict[str, object]:
         """Return index metadata for introspection."""
         _ = artifact_id
         return {}
 
+    def catalog_stats(self) -> dict[str, object]:
+        """Residency counters for runners that keep several indices loaded."""
+        return {}
+
     def warmup(self, artifact_id: str, queries: Iterable[Iterable[float]]) -> None:
         _ = (artifact_id, queries)
         return None
@@ -93,6 +116,27 @@ class AnnExecutionRequestRunner(ABC):
     ) -> Iterable[Result]:
         """Return an approximate set of results for the given artifact/contract."""
 
+    def approximate_batch(
+        self, artifact: ExecutionArtifact, requests: Sequence[ExecutionRequest]
+    ) -> list[Iterable[Result]]:
+        """Approximate results for several requests; runners may share one probe."""
+        return [self.approximate_request(artifact, request) for request in requests]
+
+    def approximate_filtered(
+        self, artifact: ExecutionArtifact, request: ExecutionRequest, allowed: Set[str]
+    ) -> Iterable[Result]:
+        """
+        Approximate results restricted to ``allowed`` vector ids.
+
+        The default post-filters an unrestricted probe and may return fewer
+        than top_k; runners that can filter during search override it.
+        """
+        return [
+            res
+            for res in self.approximate_request(artifact, request)
+            if res.vector_id in allowed
+        ]
+
     @abstractmethod
     def approximation_report(
         self,
@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from bijux_vex.core.execution_result import ApproximationReport
+from bijux_vex.core.types import ExecutionArtifact, ExecutionRequest, Result
+from bijux_vex.infra.adapters.ann_base import AnnExecutionRequestRunner
+
+
+class ExactFallbackAnnRunner(AnnExecutionRequestRunner):
+    """
+    Serve ND requests by exact search while the wrapped runner has no index.
+
+    Used while a background rebuild is in flight and no previous index is
+    resident; everything but query execution delegates to ``inner``.
+    """
+
+    force_fallback = True
+
+    def __init__(self, inner: AnnExecutionRequestRunner) -> None:
+        self.inner = inner
+
+    @property
+    def randomness_sources(self) -> tuple[str, ...]:
+        return self.inner.randomness_sources
+
+    @property
+    def reproducibility_bounds(self) -> str:
+        return "exact fallback while the ANN index rebuilds"
+
+    def deterministic_fallback(
+        self, artifact_id: str, request: ExecutionRequest
+    ) -> Iterable[Result]:
+        return self.inner.deterministic_fallback(artifact_id, request)
+
+    def index_info(self, artifact_id: str) -> dict[str, object]:
+        return self.inner.index_info(artifact_id)
+
+    def catalog_stats(self) -> dict[str, object]:
+        return self.inner.catalog_stats()
+
+    def set_randomness_profile(self, randomness: object | None) -> None:
+        self.inner.set_randomness_profile(randomness)
+
+    def approximate_request(
+        self, artifact: ExecutionArtifact, request: ExecutionRequest
+    ) -> Iterable[Result]:
+        return self.deterministic_fallback(artifact.artifact_id, request)
+
+    def approximation_report(
+        self,
+        artifact: ExecutionArtifact,
+        request: ExecutionRequest,
+        results: Iterable[Result],
+    ) -> ApproximationReport:
+        _ = (artifact, request, results)
+        return ApproximationReport(
+            recall_at_k=1.0,
+            rank_displacement=0.0,
+            distance_error=0.0,
+            algorithm="exact_fallback",
+            algorithm_version="v1",
+            backend=type(self.inner).__name__,
+            randomness_sources=self.randomness_sources,
+            deterministic_fallback_used=True,
+            truncation_ratio=1.0,
+            query_parameters=(("index_state", "rebuilding"),),
+        )
+
+
+__all__ = ["ExactFallbackAnnRunner"]
@@ -2,18 +2,22 @@
 # Copyright © 2025 Bijan Mousavi
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Iterator, Sequence, Set, Sized
+import itertools
 import json
+import os
 from pathlib import Path
+import threading
 import time
 from typing import Any
+import weakref
 
 try:  # pragma: no cover - optional dependency
     import hnswlib
 except Exception:  # pragma: no cover - optional dependency
     hnswlib = None
 
-from bijux_vex.contracts.resources import VectorSource
+from bijux_vex.contracts.resources import StoredVectors, VectorSource
 from bijux_vex.core.errors import (
     AnnIndexBuildError,
     BudgetExceededError,
@@ -30,9 +34,26 @@ from bijux_vex.core.types import (
     Vector,
 )
 from bijux_vex.infra.adapters.ann_base import AnnExecutionRequestRunner
+from bijux_vex.infra.adapters.hnsw.catalog import (
+    CatalogEntry,
+    HnswIndexCatalog,
+    estimate_index_bytes,
+)
+from bijux_vex.infra.adapters.hnsw.coalescer import KnnCoalescer
+from bijux_vex.infra.adapters.hnsw.id_table import IdTable, write_id_table
 from bijux_vex.infra.adapters.hnsw.metadata import as_dict, validate_index_meta
-from bijux_vex.infra.adapters.hnsw.params import as_int, resolve_space
+from bijux_vex.infra.adapters.hnsw.params import (
+    as_int,
+    resolve_space,
+    resolve_threads,
+)
 from bijux_vex.infra.logging import log_event
+from bijux_vex.infra.optional_deps import np
+
+# Vectors converted to one float32 array and inserted per add_items call.
+_BUILD_CHUNK = 65_536
+# Labels a resident index may add or tombstone before deltas are written out.
+_PERSIST_EVERY = 4096
 
 
 class HnswAnnRunner(AnnExecutionRequestRunner):
@@ -40,20 +61,71 @@ class HnswAnnRunner(AnnExecutionRequestRunner):
 
     INDEX_VERSION = 1
 
-    def __init__(self, vectors: VectorSource, index_dir: str | Path | None = None):
+    def __init__(
+        self,
+        vectors: VectorSource,
+        index_dir: str | Path | None = None,
+        max_resident_mb: float | None = None,
+        num_threads: int | None = None,
+        query_threads: int | None = None,
+        use_mmap: bool | None = None,
+        persist_every: int | None = None,
+    ):
         if hnswlib is None:  # pragma: no cover - optional dependency
             raise RuntimeError("hnswlib is required for HnswAnnRunner")
         self.vectors = vectors
-        self._index: Any | None = None
-        self._ids: list[str] = []
+        if max_resident_mb is None:
+            env_ceiling = os.getenv("BIJUX_VEX_HNSW_MAX_RESIDENT_MB")
+            max_resident_mb = float(env_ceiling) if env_ceiling else None
+        if num_threads is None:
+            env_threads = os.getenv("BIJUX_VEX_HNSW_BUILD_THREADS")
+            num_threads = int(env_threads) if env_threads else -1
+        self.num_threads = num_threads
+        if query_threads is None:
+            env_query_threads = os.getenv("BIJUX_VEX_HNSW_QUERY_THREADS")
+            query_threads = int(env_query_threads) if env_query_threads else -1
+        self._coalescer = KnnCoalescer(resolve_threads(None, query_threads))
+        if use_mmap is None:
+            use_mmap = (os.getenv("BIJUX_VEX_HNSW_MMAP") or "1").lower() not in {
+                "0",
+                "false",
+                "no",
+            }
+        self.use_mmap = use_mmap
+        if persist_every is None:
+            env_persist = os.getenv("BIJUX_VEX_HNSW_PERSIST_EVERY")
+            persist_every = int(env_persist) if env_persist else _PERSIST_EVERY
+        self.persist_every = max(1, persist_every)
+        self._catalog = HnswIndexCatalog(max_resident_mb, on_evict=self._evict)
         self._index_info: dict[str, dict[str, object]] = {}
         self._index_dir = Path(index_dir) if index_dir else None
         if self._index_dir:
             self._index_dir.mkdir(parents=True, exist_ok=True)
-        self._last_query_metadata: dict[str, object] = {}
-        self._active_seed: int | None = None
+            # Deltas not yet written out reach disk when the runner is
+            # collected or the interpreter exits, even if nobody calls flush.
+            weakref.finalize(self, _flush_catalog, self._catalog, self._index_dir)
+        # Seed and last-query metadata are per request, so per thread.
+        self._local = threading.local()
         self._adaptive_ef_search: dict[str, int] = {}
 
+    @property
+    def _active_seed(self) -> int | None:
+        seed: int | None = getattr(self._local, "seed", None)
+        return seed
+
+    @_active_seed.setter
+    def _active_seed(self, seed: int | None) -> None:
+        self._local.seed = seed
+
+    @property
+    def _last_query_metadata(self) -> dict[str, object]:
+        metadata: dict[str, object] = getattr(self._local, "query_metadata", {})
+        return metadata
+
+    @_last_query_metadata.setter
+    def _last_query_metadata(self, metadata: dict[str, object]) -> None:
+        self._local.query_metadata = metadata
+
     @property
     def randomness_sources(self) -> tuple[str, ...]:
         return ("hnswlib",)
@@ -66,6 +138,10 @@ class HnswAnnRunner(AnnExecutionRequestRunner):
     def supports_seed(self) -> bool:
         return True
 
+    @property
+    def supports_incremental(self) -> bool:
+        return True
+
     @property
     def supports_compaction(self) -> bool:
         return True
@@ -86,7 +162,30 @@ class HnswAnnRunner(AnnExecutionRequestRunner):
     def approximate_request(
         self, artifact: ExecutionArtifact, request: ExecutionRequest
     ) -> Iterable[Result]:
-        return self._hnsw_results(artifact, request)
+        return self._hnsw_results(artifact, [request])[0]
+
+    def approximate_batch(
+        self, artifact: ExecutionArtifact, requests: Sequence[ExecutionRequest]
+    ) -> list[Iterable[Result]]:
+        if not requests:
+            return []
+        return list(self._hnsw_results(artifact, requests))
+
+    def approximate_filtered(
+        self, artifact: ExecutionArtifact, request: ExecutionRequest, allowed: Set[str]
+    ) -> Iterable[Result]:
+        try:
+            return self._hnsw_results(artifact, [request], allowed)[0]
+        except RuntimeError as exc:
+            # hnswlib cannot fill k under a very selective filter; the allow-set
+            # is small enough to scan exactly.
+            log_event(
+                "hnsw_filter_fallback",
+                artifact_id=artifact.artifact_id,
+                candidates=len(allowed),
+                error=str(exc),
+            )
+            return self.vectors.query_allowed(artifact.artifact_id, request, allowed)
 
     def deterministic_fallback(
         self, artifact_id: str, request: ExecutionRequest
@@ -100,19 +199,15 @@ class HnswAnnRunner(AnnExecutionRequestRunner):
         metric: str,
         nd_settings: object | None = None,
     ) -> dict[str, object]:
-        vectors_list = list(vectors)
-        if not vectors_list:
+        blocks = _blocks(vectors, _BUILD_CHUNK)
+        load_started = time.time()
+        first = next(blocks, None)
+        if first is None:
             return {}
-        dim = vectors_list[0].dimension
-        ids = [vec.vector_id for vec in vectors_list]
+        dim = int(first[1].shape[1])
         settings = nd_settings if isinstance(nd_settings, NDSettings) else None
-        if settings and settings.max_index_memory_mb:
-            estimated_mb = (len(vectors_list) * dim * 8) / (1024 * 1024)
-            if estimated_mb > float(settings.max_index_memory_mb):
-                raise BudgetExceededError(
-                    message="ANN index memory estimate exceeds limit",
-                    dimension="memory",
-                )
+        expected = len(vectors) if isinstance(vectors, Sized) else len(first[0])
+        self._check_build_memory(settings, expected, dim)
         space = resolve_space(metric, settings.space if settings else None)
         m_val = settings.m if settings and settings.m is not None else 16
         ef_construction = (
@@ -125,6 +220,9 @@ class HnswAnnRunner(AnnExecutionRequestRunner):
             and ef_search > int(settings.max_ef_search)
         ):
             raise ValidationError(message="HNSW ef_search exceeds max_ef_search cap")
+        num_threads = resolve_threads(
+            settings.num_threads if settings else None, self.num_threads
+        )
 
         build_started = time.time()
         index = hnswlib.Index(space=space, dim=dim)
@@ -132,14 +230,35 @@ class HnswAnnRunner(AnnExecutionRequestRunner):
         if hasattr(index, "set_seed"):
             index.set_seed(int(seed))
         index.init_index(
-            max_elements=len(vectors_list),
+            max_elements=max(expected, len(first[0])),
             ef_construction=int(ef_construction),
             M=int(m_val),
         )
-        index.add_items([vec.values for vec in vectors_list], list(range(len(ids))))
+        ids: list[str] = []
+        load_s = insert_s = 0.0
+        block: tuple[tuple[str, ...], Any] | None = first
+        while block is not None:
+            block_ids, data = block
+            if data.shape[1] != dim:
+                raise ValidationError(
+                    message="ANN index build requires vectors of one dimension"
+                )
+            needed = len(ids) + len(block_ids)
+            self._check_build_memory(settings, needed, dim)
+            capacity = int(index.get_max_elements())
+            if needed > capacity:
+                index.resize_index(max(needed, capacity * 2))
+            insert_started = time.time()
+            load_s += insert_started - load_started
+            index.add_items(data, np.arange(len(ids), needed), num_threads=num_threads)
+            ids.extend(block_ids)
+            load_started = time.time()
+            insert_s += load_started - insert_started
+            block = next(blocks, None)
+        load_s += time.time() - load_started
+        if int(index.get_max_elements()) > len(ids):
+            index.resize_index(len(ids))
         index.set_ef(int(ef_search))
-        self._index = index
-        self._ids = ids
 
         index_hash = fingerprint(
             {
@@ -158,6 +277,7 @@ class HnswAnnRunner(AnnExecutionRequestRunner):
             }
         )
         info: dict[str, object] = {
+            "artifact_id": artifact_id,
             "index_version": self.INDEX_VERSION,
             "index_kind": "hnswlib",
             "backend": "hnswlib",
@@ -167,6 +287,11 @@ class HnswAnnRunner(AnnExecutionRequestRunner):
                 "ef_search": int(ef_search),
             },
             "build_time_ms": int((time.time() - build_started) * 1000),
+            "build_timings_ms": {
+                "load": int(load_s * 1000),
+                "insert": int(insert_s * 1000),
+            },
+            "build_threads": num_threads,
             "vector_count": len(ids),
             "dimension": dim,
             "metric": metric,
@@ -175,22 +300,137 @@ class HnswAnnRunner(AnnExecutionRequestRunner):
             "backend_version": getattr(hnswlib, "__version__", "unknown"),
             "seed": int(seed),
         }
+        entry = CatalogEntry(
+            index=index,
+            ids=ids,
+            info=info,
+            size_bytes=estimate_index_bytes(len(ids), dim, int(m_val)),
+        )
         self._index_info[artifact_id] = info
-        self._persist_index(artifact_id, info)
+        persist_started = time.time()
+        if self._persist_index(artifact_id, entry):
+            # The file cannot hold its own write time; only memory reports it.
+            timings = as_dict(info["build_timings_ms"])
+            timings["persist"] = int((time.time() - persist_started) * 1000)
+        self._catalog.put(artifact_id, entry, source="build")
         self._adaptive_ef_search[artifact_id] = int(ef_search)
         return info
 
+    def apply_delta(
+        self,
+        artifact_id: str,
+        added: Iterable[Vector],
+        removed: Iterable[str] = (),
+    ) -> dict[str, object]:
+        entry = self._catalog.get(artifact_id)
+        if entry is None:
+            return {}
+        removed_ids = set(removed)
+        to_delete = sorted(
+            {
+                label
+                for label in map(entry.label_of, removed_ids)
+                if label is not None and label not in entry.deleted
+            }
+        )
+        fresh: list[Vector] = []
+        seen: set[str] = set()
+        for vec in added:
+            if vec.vector_id in removed_ids or vec.vector_id in seen:
+                continue
+            seen.add(vec.vector_id)
+            label = entry.label_of(vec.vector_id)
+            # Re-added ids get a new label; the old one stays tombstoned.
+            if label is None or label in entry.deleted:
+                fresh.append(vec)
+        if not fresh and not to_delete:
+            return dict(entry.info)
+        dim = as_int(entry.info.get("dimension"), 0)
+        if any(vec.dimension != dim for vec in fresh):
+            return {}
+        # hnswlib cannot resize or insert while a search runs, and new labels
+        # must not surface before entry.ids can resolve them.
+        with entry.query_lock:
+            start = len(entry.ids)
+            try:
+                if fresh:
+                    needed = start + len(fresh)
+                    capacity = int(entry.index.get_max_elements())
+                    if needed > capacity:
+                        entry.index.resize_index(max(needed, capacity + capacity // 2))
+                    entry.index.add_items(
+                        np.asarray([vec.values for vec in fresh], dtype=np.float32),
+                        np.arange(start, needed),
+                        num_threads=self.num_threads,
+                    )
+                for label in to_delete:
+                    entry.index.mark_deleted(label)
+            except Exception as exc:
+                # A partially applied delta cannot be trusted; drop the resident
+                # copy so the caller rebuilds from the vector store.
+                self._catalog.discard(artifact_id)
+                log_event("hnsw_delta_failed", artifact_id=artifact_id, error=str(exc))
+                return {}
+            entry.ids.extend(vec.vector_id for vec in fresh)
+            entry.deleted.update(to_delete)
+        params = as_dict(entry.info.get("index_params"))
+        entry.size_bytes = estimate_index_bytes(
+            int(entry.index.get_max_elements()), dim, as_int(params.get("M"), 16)
+        )
+        info: dict[str, object] = {
+            **entry.info,
+            "vector_count": entry.live_count,
+            "deleted_count": len(entry.deleted),
+            "incremental_updates": as_int(entry.info.get("incremental_updates"), 0) + 1,
+            "index_hash": fingerprint(
+                {
+                    "previous": entry.info.get("index_hash"),
+                    "added": [vec.vector_id for vec in fresh],
+                    "removed": [entry.ids[label] for label in to_delete],
+                }
+            ),
+        }
+        entry.info = info
+        entry.dirty = True
+        entry.unpersisted += len(fresh) + len(to_delete)
+        self._index_info[artifact_id] = info
+        # Rewriting the files costs O(index); amortize it over many deltas.
+        if entry.unpersisted >= self.persist_every:
+            self._persist_index(artifact_id, entry)
+        log_event(
+            "hnsw_delta_applied",
+            artifact_id=artifact_id,
+            added=len(fresh),
+            removed=len(to_delete),
+        )
+        return info
+
+    def flush(self) -> None:
+        """Write every resident index that has unpersisted deltas."""
+        if self._index_dir is not None:
+            _flush_catalog(self._catalog, self._index_dir)
+
     def index_info(self, artifact_id: str) -> dict[str, object]:
-        return dict(self._index_info.get(artifact_id, {}))
+        info = dict(self._index_info.get(artifact_id, {}))
+        if info:
+            residency = self.catalog_stats()
+            residency["resident"] = artifact_id in self._catalog
+            info["residency"] = residency
+        return info
+
+    def catalog_stats(self) -> dict[str, object]:
+        return {**self._catalog.stats(), **self._coalescer.stats()}
 
     def warmup(self, artifact_id: str, queries: Iterable[Iterable[float]]) -> None:
-        if self._index is None:
+        entry = self._catalog.peek(artifact_id)
+        if entry is None:
             return
         warm_k = 1
         for query in queries:
             try:
                 if query:
-                    self._index.knn_query([tuple(query)], k=warm_k)
+                    with entry.query_lock:
+                        entry.index.knn_query([tuple(query)], k=warm_k)
             except Exception as exc:
                 log_event("nd_warmup_query_failed", error=str(exc))
 
@@ -200,17 +440,22 @@ class HnswAnnRunner(AnnExecutionRequestRunner):
     def query(
         self, vector: Iterable[float], k: int, **params: object
     ) -> tuple[list[str], list[float], dict[str, object]]:
-        if self._index is None:
+        artifact_id = params.get("artifact_id")
+        if not artifact_id:
+            raise ValidationError(message="HNSW query requires an artifact_id")
+        entry = self._catalog.get(str(artifact_id))
+        if entry is None:
             raise AnnIndexBuildError(message="HNSW index not loaded")
         labels: Sequence[Sequence[int]]
         distances: Sequence[Sequence[float]]
-        labels, distances = self._index.knn_query([tuple(vector)], k=k)
+        with entry.query_lock:
+            labels, distances = entry.index.knn_query([tuple(vector)], k=k)
         return (
-            [self._ids[label] for label in labels[0]],
+            [entry.ids[label] for label in labels[0]],
             list(map(float, distances[0])),
             {
                 "algorithm": "hnswlib",
-                "index_params": self._index_info.get("index_params", ()),
+                "index_params": entry.info.get("index_params", ()),
                 "query_params": {"k": k},
                 "n_candidates": len(labels[0]),
                 "random_seed": 0,
@@ -252,40 +497,19 @@ class HnswAnnRunner(AnnExecutionRequestRunner):
     # ---- internals -----------------------------------------------------
 
     def _hnsw_results(
-        self, artifact: ExecutionArtifact, request: ExecutionRequest
-    ) -> Iterable[Result]:
-        if self._index is None:
-            try:
-                self._load_index(artifact, request.nd_settings)
-            except CorruptArtifactError:
-                if request.nd_settings and request.nd_settings.build_on_demand:
-                    vectors = list(self.vectors.list_vectors())
-                    self.build_index(
-                        artifact.artifact_id,
-                        vectors,
-                        artifact.metric,
-                        request.nd_settings,
-                    )
-                else:
-                    raise
-        if (
-            self._index is None
-            and request.nd_settings
-            and request.nd_settings.build_on_demand
-        ):
-            vectors = list(self.vectors.list_vectors())
-            self.build_index(
-                artifact.artifact_id,
-                vectors,
-                artifact.metric,
-                request.nd_settings,
-            )
-        if self._index is None:
-            raise AnnIndexBuildError(message="HNSW index missing; build required")
+        self,
+        artifact: ExecutionArtifact,
+        requests: Sequence[ExecutionRequest],
+        allowed: Set[str] | None = None,
+    ) -> list[tuple[Result, ...]]:
+        # Requests in one batch share settings and budget; the first one speaks
+        # for all of them.
+        request = requests[0]
+        entry = self._resident_entry(artifact, request.nd_settings)
         index_info = as_dict(self._index_info.get(artifact.artifact_id))
         dim = as_int(index_info.get("dimension"), 0)
-        query = request.vector or ()
-        if dim and len(query) != dim:
+        queries = [req.vector or () for req in requests]
+        if dim and any(len(query) != dim for query in queries):
             raise ValidationError(message="query vector dimension mismatch")
         if (
             request.execution_budget is not None
@@ -299,7 +523,7 @@ class HnswAnnRunner(AnnExecutionRequestRunner):
         if (
             request.execution_budget is not None
             and request.execution_budget.max_memory_mb is not None
-            and len(self._ids) > int(request.execution_budget.max_memory_mb)
+            and entry.live_count > int(request.execution_budget.max_memory_mb)
         ):
             raise BudgetExceededError(
                 message="ANN candidate budget exceeded",
@@ -324,18 +548,31 @@ class HnswAnnRunner(AnnExecutionRequestRunner):
             adaptive = self._adaptive_ef_search.get(artifact.artifact_id)
             if adaptive:
                 ef_search = min(ef_search, int(adaptive))
-        if self._active_seed is not None and hasattr(self._index, "set_seed"):
-            self._index.set_seed(int(self._active_seed))
-        self._index.set_ef(int(ef_search))
+        seed = self._active_seed
         self._last_query_metadata = {
             "query_params": {"k": request.top_k or 1, "ef_search": ef_search},
-            "seed": self._active_seed if self._active_seed is not None else 0,
+            "seed": seed if seed is not None else 0,
         }
+        k = min(max(req.top_k for req in requests), entry.live_count)
         start = time.time()
-        labels, distances = self._index.knn_query(
-            [query], k=min(request.top_k, len(self._ids))
-        )
-        elapsed_ms = int((time.time() - start) * 1000)
+        if allowed is None:
+            labels, distances = self._coalescer.search(
+                entry, queries, k, ef_search, seed
+            )
+        else:
+            allowed_labels = entry.labels_for(allowed)
+            k = min(k, len(allowed_labels))
+            if k <= 0:
+                return [() for _ in requests]
+            with entry.query_lock:
+                if seed is not None and hasattr(entry.index, "set_seed"):
+                    entry.index.set_seed(int(seed))
+                entry.index.set_ef(int(ef_search))
+                labels, distances = entry.index.knn_query(
+                    queries, k=k, filter=allowed_labels.__contains__
+                )
+        # Budgets are per query; a batch is charged its mean latency.
+        elapsed_ms = int((time.time() - start) * 1000 / len(queries))
         if request.nd_settings and request.nd_settings.latency_budget_ms is not None:
             budget = float(request.nd_settings.latency_budget_ms)
             current = self._adaptive_ef_search.get(artifact.artifact_id, ef_search)
@@ -361,39 +598,76 @@ class HnswAnnRunner(AnnExecutionRequestRunner):
                 message="ANN latency budget exceeded",
                 dimension="latency",
             )
-        results: list[Result] = []
-        for rank, (label, dist) in enumerate(
-            zip(labels[0], distances[0], strict=True), start=1
+        # Hydrate every label of the batch with one vector and one chunk read.
+        vectors = self.vectors.get_vectors(
+            entry.ids[label]
+            for req, row_labels in zip(requests, labels, strict=True)
+            for label in row_labels[: req.top_k]
+        )
+        chunks = self.vectors.get_chunks(vec.chunk_id for vec in vectors.values())
+        batches: list[tuple[Result, ...]] = []
+        for req, row_labels, row_distances in zip(
+            requests, labels, distances, strict=True
         ):
-            vec_id = self._ids[label]
-            vector = self.vectors.get_vector(vec_id)
-            chunk_id = vector.chunk_id if vector else ""
-            doc_id = ""
-            if vector:
-                ch = self.vectors.get_chunk(vector.chunk_id)
+            results: list[Result] = []
+            for rank, (label, dist) in enumerate(
+                zip(row_labels[: req.top_k], row_distances, strict=False), start=1
+            ):
+                vec_id = entry.ids[label]
+                vector = vectors.get(vec_id)
+                chunk_id = vector.chunk_id if vector else ""
+                ch = chunks.get(chunk_id) if vector else None
                 doc_id = ch.document_id if ch else ""
-            results.append(
-                Result(
-                    request_id=request.request_id,
-                    document_id=doc_id,
-                    chunk_id=chunk_id,
-                    vector_id=vec_id,
-                    artifact_id=artifact.artifact_id,
-                    score=float(dist),
-                    rank=rank,
+                results.append(
+                    Result(
+                        request_id=req.request_id,
+                        document_id=doc_id,
+                        chunk_id=chunk_id,
+                        vector_id=vec_id,
+                        artifact_id=artifact.artifact_id,
+                        score=float(dist),
+                        rank=rank,
+                    )
                 )
+            batches.append(tuple(results))
+        return batches
+
+    def _resident_entry(
+        self, artifact: ExecutionArtifact, settings: NDSettings | None
+    ) -> CatalogEntry:
+        artifact_id = artifact.artifact_id
+        entry = self._catalog.get(artifact_id)
+        if entry is not None:
+            return entry
+        build_on_demand = bool(settings and settings.build_on_demand)
+        try:
+            entry = self._load_index(artifact, settings)
+        except CorruptArtifactError:
+            if not build_on_demand:
+                raise
+            entry = None
+        if entry is None and build_on_demand:
+            self.build_index(
+                artifact_id,
+                StoredVectors(self.vectors),
+                artifact.metric,
+                settings,
             )
-        return tuple(results)
+            entry = self._catalog.peek(artifact_id)
+        if entry is None:
+            raise AnnIndexBuildError(message="HNSW index missing; build required")
+        return entry
 
     def _load_index(
         self, artifact: ExecutionArtifact, settings: NDSettings | None
-    ) -> None:
+    ) -> CatalogEntry | None:
         if self._index_dir is None:
-            return
+            return None
         index_file = self._index_dir / f"{artifact.artifact_id}.hnsw"
         meta_file = self._index_dir / f"{artifact.artifact_id}.json"
+        ids_file = self._index_dir / f"{artifact.artifact_id}.ids"
         if not index_file.exists() or not meta_file.exists():
-            return
+            return None
         try:
             meta = json.loads(meta_file.read_text(encoding="utf-8"))
         except Exception as exc:  # pragma: no cover
@@ -404,43 +678,79 @@ class HnswAnnRunner(AnnExecutionRequestRunner):
             settings,
             index_version=HnswAnnRunner.INDEX_VERSION,
         )
+        recorded_hash = dict(artifact.build_params).get("ann_index_hash")
+        if recorded_hash and meta.get("index_hash") != recorded_hash:
+            # Deltas recorded in the ledger never reached this file.
+            raise CorruptArtifactError(message="HNSW index on disk is stale")
+        dim = int(meta.get("dimension", 0) or 0)
+        count = int(meta.get("vector_count", 0) or 0)
         if settings and settings.max_index_memory_mb:
-            dim = int(meta.get("dimension", 0) or 0)
-            count = int(meta.get("vector_count", 0) or 0)
             estimated_mb = (count * dim * 8) / (1024 * 1024)
             if estimated_mb > float(settings.max_index_memory_mb):
                 raise BudgetExceededError(
                     message="ANN index memory estimate exceeds limit",
                     dimension="memory",
                 )
-        index = hnswlib.Index(space=meta["space"], dim=int(meta["dimension"]))
+        ids: list[str] | IdTable
+        if "ids" in meta:
+            # Indices persisted before the binary id table kept ids inline.
+            ids = [str(vid) for vid in meta.pop("ids", [])]
+            deleted = {int(label) for label in meta.pop("deleted_labels", [])}
+        elif ids_file.exists():
+            ids, deleted = IdTable.open(ids_file, use_mmap=self.use_mmap)
+        else:
+            raise CorruptArtifactError(message="HNSW index id table missing")
+        if len(ids) - len(deleted) != count:
+            raise CorruptArtifactError(message="HNSW index id table incomplete")
+        index = hnswlib.Index(space=meta["space"], dim=dim)
         try:
             index.load_index(str(index_file))
         except Exception as exc:  # pragma: no cover
             raise CorruptArtifactError(message="HNSW index corrupted") from exc
-        self._index = index
-        self._ids = list(meta.get("ids", []))
+        params = as_dict(meta.get("index_params"))
+        entry = CatalogEntry(
+            index=index,
+            ids=ids,
+            info=meta,
+            size_bytes=estimate_index_bytes(len(ids), dim, as_int(params.get("M"), 16)),
+            deleted=deleted,
+        )
         self._index_info[artifact.artifact_id] = meta
-        if meta.get("index_params", {}).get("ef_search"):
-            index.set_ef(int(meta["index_params"]["ef_search"]))
-        if meta.get("index_params", {}).get("ef_search"):
-            self._adaptive_ef_search[artifact.artifact_id] = int(
-                meta["index_params"]["ef_search"]
+        if params.get("ef_search"):
+            index.set_ef(as_int(params.get("ef_search"), 50))
+            self._adaptive_ef_search.setdefault(
+                artifact.artifact_id, as_int(params.get("ef_search"), 50)
             )
+        self._catalog.put(artifact.artifact_id, entry, source="load")
+        log_event("hnsw_index_loaded", artifact_id=artifact.artifact_id)
+        return entry
 
-    def _persist_index(self, artifact_id: str, info: dict[str, object]) -> None:
-        if self._index_dir is None or self._index is None:
-            return
-        index_file = self._index_dir / f"{artifact_id}.hnsw"
-        meta_file = self._index_dir / f"{artifact_id}.json"
-        index_tmp = index_file.with_suffix(".hnsw.tmp")
-        meta_tmp = meta_file.with_suffix(".json.tmp")
-        self._index.save_index(str(index_tmp))
-        meta_tmp.write_text(
-            json.dumps(info, indent=2, sort_keys=True), encoding="utf-8"
+    def _persist_index(self, artifact_id: str, entry: CatalogEntry) -> bool:
+        if self._index_dir is None:
+            return False
+        _write_entry(self._index_dir, artifact_id, entry)
+        return True
+
+    def _evict(self, artifact_id: str, entry: CatalogEntry) -> None:
+        persisted = not entry.dirty
+        if entry.dirty:
+            persisted = self._persist_index(artifact_id, entry)
+        log_event(
+            "hnsw_index_evicted",
+            artifact_id=artifact_id,
+            persisted=persisted and self._index_dir is not None,
         )
-        index_tmp.replace(index_file)
-        meta_tmp.replace(meta_file)
+
+    def _check_build_memory(
+        self, settings: NDSettings | None, count: int, dim: int
+    ) -> None:
+        if settings and settings.max_index_memory_mb:
+            estimated_mb = (count * dim * 8) / (1024 * 1024)
+            if estimated_mb > float(settings.max_index_memory_mb):
+                raise BudgetExceededError(
+                    message="ANN index memory estimate exceeds limit",
+                    dimension="memory",
+                )
 
     def _query_params_metadata(self) -> tuple[tuple[str, str], ...]:
         params = self._last_query_metadata.get("query_params")
@@ -462,4 +772,51 @@ class HnswAnnRunner(AnnExecutionRequestRunner):
         return None
 
 
+def _write_entry(index_dir: Path, artifact_id: str, entry: CatalogEntry) -> None:
+    index_file = index_dir / f"{artifact_id}.hnsw"
+    meta_file = index_dir / f"{artifact_id}.json"
+    ids_file = index_dir / f"{artifact_id}.ids"
+    index_tmp = index_file.with_suffix(".hnsw.tmp")
+    meta_tmp = meta_file.with_suffix(".json.tmp")
+    ids_tmp = ids_file.with_suffix(".ids.tmp")
+    # Deltas and queries hold the query lock; the snapshot must not race them.
+    with entry.query_lock:
+        entry.index.save_index(str(index_tmp))
+        write_id_table(ids_tmp, entry.ids, entry.deleted)
+        meta_tmp.write_text(
+            json.dumps(entry.info, indent=2, sort_keys=True), encoding="utf-8"
+        )
+        entry.dirty = False
+        entry.unpersisted = 0
+    index_tmp.replace(index_file)
+    ids_tmp.replace(ids_file)
+    meta_tmp.replace(meta_file)
+
+
+def _flush_catalog(catalog: HnswIndexCatalog, index_dir: Path) -> None:
+    for artifact_id, entry in catalog.dirty_entries():
+        _write_entry(index_dir, artifact_id, entry)
+        log_event("hnsw_index_flushed", artifact_id=artifact_id)
+
+
+def _blocks(
+    vectors: Iterable[Vector], size: int
+) -> Iterator[tuple[tuple[str, ...], Any]]:
+    """(ids, float32 matrix) blocks; stored vectors skip Vector objects entirely."""
+    if isinstance(vectors, StoredVectors):
+        for ids, rows in vectors.blocks(size):
+            yield ids, np.asarray(rows, dtype=np.float32)
+        return
+    iterator = iter(vectors)
+    while chunk := list(itertools.islice(iterator, size)):
+        if any(vec.dimension != chunk[0].dimension for vec in chunk):
+            raise ValidationError(
+                message="ANN index build requires vectors of one dimension"
+            )
+        yield (
+            tuple(vec.vector_id for vec in chunk),
+            np.asarray([vec.values for vec in chunk], dtype=np.float32),
+        )
+
+
 __all__ = ["HnswAnnRunner"]
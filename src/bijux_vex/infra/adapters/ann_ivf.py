@@ -0,0 +1,662 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence, Set
+from dataclasses import dataclass, field, replace
+import json
+import math
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+from bijux_vex.contracts.resources import VectorSource
+from bijux_vex.core.errors import (
+    AnnIndexBuildError,
+    BudgetExceededError,
+    CorruptArtifactError,
+    ValidationError,
+)
+from bijux_vex.core.execution_result import ApproximationReport
+from bijux_vex.core.identity.ids import fingerprint
+from bijux_vex.core.types import (
+    ExecutionArtifact,
+    ExecutionRequest,
+    NDSettings,
+    Result,
+    Vector,
+)
+from bijux_vex.infra.adapters.ann_base import AnnExecutionRequestRunner
+from bijux_vex.infra.adapters.ann_pq import _prepared
+from bijux_vex.infra.adapters.hnsw.metadata import as_dict, validate_index_meta
+from bijux_vex.infra.adapters.hnsw.params import as_int
+from bijux_vex.infra.adapters.ivf.kmeans import assign, train_kmeans
+from bijux_vex.infra.logging import log_event
+from bijux_vex.infra.optional_deps import np
+
+# Rows sampled to train the coarse quantizer.
+_MAX_TRAIN_ROWS = 65_536
+_ARRAYS = ("centroids", "data", "offsets", "rows")
+
+
+@dataclass
+class IvfFlatIndex:
+    """
+    Coarse centroids plus full-precision vectors grouped by list.
+
+    ``data[i]`` and ``rows[i]`` hold the members of list ``i`` contiguously;
+    a row indexes ``ids``. Rows of removed vectors stay in ``ids`` but are
+    dropped from their list, so row numbers never shift.
+    """
+
+    ids: list[str]
+    centroids: Any
+    data: list[Any]
+    rows: list[Any]
+    info: dict[str, object]
+    deleted: set[int] = field(default_factory=set)
+
+    @property
+    def nlist(self) -> int:
+        return int(len(self.centroids))
+
+    @property
+    def live_count(self) -> int:
+        return sum(len(members) for members in self.rows)
+
+    def offsets(self) -> Any:
+        sizes = [len(members) for members in self.rows]
+        return np.concatenate(([0], np.cumsum(sizes, dtype=np.int64)))
+
+
+class IvfFlatAnnRunner(AnnExecutionRequestRunner):
+    """
+    IVF-Flat ANN runner implemented with NumPy.
+
+    ``build_index`` clusters the corpus into ``nlist`` lists with seeded
+    k-means and stores each list's vectors contiguously. A query scores the
+    ``nprobe`` nearest lists exactly; ``max_ann_probes`` caps ``nprobe`` and
+    ``latency_budget_ms`` adapts it per artifact, halving it when a query
+    overruns the budget. Appended vectors join their nearest list without
+    retraining. Indices persist as ``<artifact>.ivfflat.npz`` plus
+    ``<artifact>.ivfflat.json`` in ``index_dir``.
+    """
+
+    INDEX_VERSION = 1
+
+    def __init__(
+        self,
+        vectors: VectorSource,
+        index_dir: str | Path | None = None,
+        nlist: int | None = None,
+        nprobe: int | None = None,
+    ):
+        if np is None:  # pragma: no cover - optional dependency
+            raise RuntimeError("numpy is required for IvfFlatAnnRunner")
+        self.vectors = vectors
+        self.nlist = nlist
+        if nprobe is None:
+            env_nprobe = os.getenv("BIJUX_VEX_IVF_NPROBE")
+            nprobe = int(env_nprobe) if env_nprobe else 8
+        self.nprobe = nprobe
+        self._index_dir = Path(index_dir) if index_dir else None
+        if self._index_dir:
+            self._index_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Serializes deltas; scans only wait for the final swap under _lock.
+        self._delta_lock = threading.Lock()
+        self._indexes: dict[str, IvfFlatIndex] = {}
+        self._index_info: dict[str, dict[str, object]] = {}
+        self._last_query_metadata: dict[str, object] = {}
+        self._active_seed: int | None = None
+        self._adaptive_nprobe: dict[str, int] = {}
+
+    @property
+    def randomness_sources(self) -> tuple[str, ...]:
+        return ("ivf_training",)
+
+    @property
+    def reproducibility_bounds(self) -> str:
+        return "bounded"
+
+    @property
+    def supports_seed(self) -> bool:
+        return True
+
+    @property
+    def supports_incremental(self) -> bool:
+        return True
+
+    @property
+    def supports_compaction(self) -> bool:
+        return True
+
+    def set_randomness_profile(self, randomness: object | None) -> None:
+        seed = getattr(randomness, "seed", None) if randomness is not None else None
+        if isinstance(seed, bool) or not isinstance(seed, (int, float)):
+            self._active_seed = None
+            return
+        self._active_seed = int(seed)
+
+    def approximate_request(
+        self, artifact: ExecutionArtifact, request: ExecutionRequest
+    ) -> Iterable[Result]:
+        return self._search(artifact, [request])[0]
+
+    def approximate_batch(
+        self, artifact: ExecutionArtifact, requests: Sequence[ExecutionRequest]
+    ) -> list[Iterable[Result]]:
+        if not requests:
+            return []
+        return list(self._search(artifact, requests))
+
+    def approximate_filtered(
+        self, artifact: ExecutionArtifact, request: ExecutionRequest, allowed: Set[str]
+    ) -> Iterable[Result]:
+        return self._search(artifact, [request], allowed)[0]
+
+    def deterministic_fallback(
+        self, artifact_id: str, request: ExecutionRequest
+    ) -> Iterable[Result]:
+        return self.vectors.query(artifact_id, request)
+
+    def build_index(
+        self,
+        artifact_id: str,
+        vectors: Iterable[Vector],
+        metric: str,
+        nd_settings: object | None = None,
+    ) -> dict[str, object]:
+        vectors_list = list(vectors)
+        if not vectors_list:
+            return {}
+        dim = vectors_list[0].dimension
+        selected = [vec for vec in vectors_list if vec.dimension == dim]
+        ids = [vec.vector_id for vec in selected]
+        settings = nd_settings if isinstance(nd_settings, NDSettings) else None
+        nlist = self.nlist or max(1, int(4 * math.sqrt(len(ids))))
+        nlist = min(nlist, len(ids))
+        if settings and settings.max_index_memory_mb:
+            estimated_mb = ((len(ids) + nlist) * dim * 8) / (1024 * 1024)
+            if estimated_mb > float(settings.max_index_memory_mb):
+                raise BudgetExceededError(
+                    message="ANN index memory estimate exceeds limit",
+                    dimension="memory",
+                )
+        build_started = time.time()
+        seed = self._active_seed if self._active_seed is not None else 0
+        rng = np.random.default_rng(seed)
+        data = _prepared(
+            np.array([vec.values for vec in selected], dtype=np.float64), metric
+        )
+        train = data
+        if len(data) > _MAX_TRAIN_ROWS:
+            train = data[np.sort(rng.choice(len(data), _MAX_TRAIN_ROWS, replace=False))]
+        centroids = train_kmeans(train, nlist, rng)
+        labels = assign(data, centroids)
+        order = np.argsort(labels, kind="stable")
+        offsets = np.searchsorted(labels[order], np.arange(len(centroids) + 1))
+        params = {"nlist": int(len(centroids)), "nprobe": int(self.nprobe)}
+        info: dict[str, object] = {
+            "artifact_id": artifact_id,
+            "index_version": self.INDEX_VERSION,
+            "index_kind": "ivfflat",
+            "backend": "numpy",
+            "index_params": params,
+            "build_time_ms": int((time.time() - build_started) * 1000),
+            "vector_count": len(ids),
+            "trained_count": len(ids),
+            "dimension": dim,
+            "metric": metric,
+            "index_hash": fingerprint(
+                {
+                    "artifact_id": artifact_id,
+                    "ids": ids,
+                    "dimension": dim,
+                    "metric": metric,
+                    "params": params,
+                    "seed": int(seed),
+                    "index_version": self.INDEX_VERSION,
+                }
+            ),
+            "seed": int(seed),
+        }
+        index = IvfFlatIndex(
+            ids=ids,
+            centroids=centroids,
+            data=_split(data[order], offsets),
+            rows=_split(order, offsets),
+            info=info,
+        )
+        with self._lock:
+            self._indexes[artifact_id] = index
+            self._index_info[artifact_id] = info
+            self._adaptive_nprobe.pop(artifact_id, None)
+        self._persist_index(artifact_id, index)
+        return info
+
+    def apply_delta(
+        self,
+        artifact_id: str,
+        added: Iterable[Vector],
+        removed: Iterable[str] = (),
+    ) -> dict[str, object]:
+        with self._lock:
+            index = self._indexes.get(artifact_id)
+        if index is None:
+            return {}
+        with self._delta_lock:
+            return self._apply_delta(artifact_id, index, added, removed)
+
+    def _apply_delta(
+        self,
+        artifact_id: str,
+        index: IvfFlatIndex,
+        added: Iterable[Vector],
+        removed: Iterable[str],
+    ) -> dict[str, object]:
+        removed_ids = set(removed)
+        live = {
+            vid: row for row, vid in enumerate(index.ids) if row not in index.deleted
+        }
+        to_delete = sorted(live[vid] for vid in removed_ids if vid in live)
+        fresh: list[Vector] = []
+        seen: set[str] = set()
+        for vec in added:
+            if vec.vector_id in removed_ids or vec.vector_id in seen:
+                continue
+            seen.add(vec.vector_id)
+            if vec.vector_id not in live:
+                fresh.append(vec)
+        if not fresh and not to_delete:
+            return dict(index.info)
+        dim = as_int(index.info.get("dimension"), 0)
+        if any(vec.dimension != dim for vec in fresh):
+            return {}
+        metric = str(index.info.get("metric"))
+        # Build replacement lists first; scans keep reading the current ones.
+        rows_by_list = list(index.rows)
+        data_by_list = list(index.data)
+        if to_delete:
+            dropped = np.asarray(to_delete, dtype=np.int64)
+            for lst, members in enumerate(rows_by_list):
+                keep = ~np.isin(members, dropped)
+                if not keep.all():
+                    rows_by_list[lst] = members[keep]
+                    data_by_list[lst] = data_by_list[lst][keep]
+        if fresh:
+            # Appends join the nearest existing list; centroids are not retrained.
+            data = _prepared(
+                np.array([vec.values for vec in fresh], dtype=np.float64), metric
+            )
+            labels = assign(data, index.centroids)
+            first = len(index.ids)
+            rows: Any = np.arange(first, first + len(fresh), dtype=np.int64)
+            for lst in np.unique(labels).tolist():
+                members = labels == lst
+                rows_by_list[lst] = np.concatenate((rows_by_list[lst], rows[members]))
+                data_by_list[lst] = np.concatenate((data_by_list[lst], data[members]))
+        live_count = sum(len(members) for members in rows_by_list)
+        info: dict[str, object] = {
+            **index.info,
+            "vector_count": live_count,
+            "deleted_count": len(index.deleted) + len(to_delete),
+            "incremental_updates": as_int(index.info.get("incremental_updates"), 0) + 1,
+            "index_hash": fingerprint(
+                {
+                    "previous": index.info.get("index_hash"),
+                    "added": [vec.vector_id for vec in fresh],
+                    "removed": [index.ids[row] for row in to_delete],
+                }
+            ),
+        }
+        with self._lock:
+            # ``ids`` only grows, so rows in published lists always resolve.
+            index.ids.extend(vec.vector_id for vec in fresh)
+            index.rows = rows_by_list
+            index.data = data_by_list
+            index.deleted = index.deleted | set(to_delete)
+            index.info = info
+            self._index_info[artifact_id] = info
+            adaptive = self._adaptive_nprobe.get(artifact_id)
+            if adaptive is not None:
+                self._adaptive_nprobe[artifact_id] = min(adaptive, index.nlist)
+        self._persist_index(artifact_id, index)
+        log_event(
+            "ivf_delta_applied",
+            artifact_id=artifact_id,
+            added=len(fresh),
+            removed=len(to_delete),
+        )
+        return info
+
+    def index_info(self, artifact_id: str) -> dict[str, object]:
+        return dict(self._index_info.get(artifact_id, {}))
+
+    def compact(self, artifact_id: str, vectors: Iterable[Vector], metric: str) -> None:
+        self.build_index(artifact_id, vectors, metric)
+
+    def approximation_report(
+        self,
+        artifact: ExecutionArtifact,
+        request: ExecutionRequest,
+        results: Iterable[Result],
+    ) -> ApproximationReport:
+        materialized = tuple(results)
+        index_info = self._index_info.get(artifact.artifact_id, {})
+        index_hash = index_info.get("index_hash")
+        index_params = as_dict(index_info.get("index_params"))
+        return ApproximationReport(
+            recall_at_k=0.0,
+            rank_displacement=0.0,
+            distance_error=0.0,
+            algorithm="ivfflat",
+            algorithm_version="v1",
+            backend="memory",
+            backend_version=f"numpy-{np.__version__}",
+            randomness_sources=self.randomness_sources,
+            deterministic_fallback_used=False,
+            index_parameters=tuple((str(k), str(v)) for k, v in index_params.items()),
+            query_parameters=self._query_params_metadata(),
+            n_candidates=len(materialized),
+            random_seed=self._seed_value(),
+            candidate_k=getattr(request.nd_settings, "candidate_k", None),
+            index_hash=str(index_hash) if index_hash is not None else None,
+        )
+
+    # ---- internals -----------------------------------------------------
+
+    def _search(
+        self,
+        artifact: ExecutionArtifact,
+        requests: Sequence[ExecutionRequest],
+        allowed: Set[str] | None = None,
+    ) -> list[tuple[Result, ...]]:
+        # Requests in one batch share settings and budget.
+        request = requests[0]
+        index = self._resident_index(artifact, request.nd_settings)
+        with self._lock:
+            # A consistent view of the lists while deltas swap in new ones.
+            index = replace(index)
+        dim = as_int(index.info.get("dimension"), 0)
+        if any(len(req.vector or ()) != dim for req in requests):
+            raise ValidationError(message="query vector dimension mismatch")
+        nprobe = self._nprobe(artifact.artifact_id, index, request)
+        mask: Any = None
+        if allowed is not None:
+            mask = np.fromiter(
+                (vid in allowed for vid in index.ids), dtype=bool, count=len(index.ids)
+            )
+        start = time.time()
+        found = [
+            _scan(index, artifact.metric, req.vector or (), req.top_k, nprobe, mask)
+            for req in requests
+        ]
+        # Budgets are per query; a batch is charged its mean latency.
+        elapsed_ms = int((time.time() - start) * 1000 / len(requests))
+        self._last_query_metadata = {
+            "query_params": {"k": request.top_k or 1, "nprobe": nprobe},
+            "seed": index.info.get("seed", 0),
+        }
+        self._adapt_nprobe(artifact.artifact_id, index, request, nprobe, elapsed_ms)
+        if (
+            request.execution_budget is not None
+            and request.execution_budget.max_latency_ms
+            and elapsed_ms > int(request.execution_budget.max_latency_ms)
+        ):
+            raise BudgetExceededError(
+                message="ANN latency budget exceeded",
+                dimension="latency",
+            )
+        vectors = self.vectors.get_vectors(
+            index.ids[row] for hits in found for _, row in hits
+        )
+        chunks = self.vectors.get_chunks(vec.chunk_id for vec in vectors.values())
+        batches: list[tuple[Result, ...]] = []
+        for req, hits in zip(requests, found, strict=True):
+            results: list[Result] = []
+            for rank, (score, row) in enumerate(hits, start=1):
+                vec_id = index.ids[row]
+                vector = vectors.get(vec_id)
+                chunk_id = vector.chunk_id if vector else ""
+                chunk = chunks.get(chunk_id) if vector else None
+                results.append(
+                    Result(
+                        request_id=req.request_id,
+                        document_id=chunk.document_id if chunk else "",
+                        chunk_id=chunk_id,
+                        vector_id=vec_id,
+                        artifact_id=artifact.artifact_id,
+                        score=score,
+                        rank=rank,
+                    )
+                )
+            batches.append(tuple(results))
+        return batches
+
+    def _nprobe(
+        self, artifact_id: str, index: IvfFlatIndex, request: ExecutionRequest
+    ) -> int:
+        params = as_dict(index.info.get("index_params"))
+        nprobe = as_int(params.get("nprobe"), self.nprobe)
+        budget = request.execution_budget
+        if budget is not None and budget.max_ann_probes is not None:
+            if budget.max_ann_probes <= 0:
+                raise BudgetExceededError(
+                    message="ANN probes budget exhausted before execution",
+                    dimension="ann_probes",
+                )
+            nprobe = min(nprobe, int(budget.max_ann_probes))
+        if request.nd_settings and request.nd_settings.latency_budget_ms is not None:
+            with self._lock:
+                adaptive = self._adaptive_nprobe.get(artifact_id)
+            if adaptive:
+                nprobe = min(nprobe, int(adaptive))
+        return max(1, min(nprobe, index.nlist))
+
+    def _adapt_nprobe(
+        self,
+        artifact_id: str,
+        index: IvfFlatIndex,
+        request: ExecutionRequest,
+        nprobe: int,
+        elapsed_ms: int,
+    ) -> None:
+        settings = request.nd_settings
+        if settings is None or settings.latency_budget_ms is None:
+            return
+        budget = float(settings.latency_budget_ms)
+        with self._lock:
+            current = self._adaptive_nprobe.get(artifact_id, nprobe)
+            if elapsed_ms > budget and current > 1:
+                degraded = self._adaptive_nprobe[artifact_id] = max(1, current // 2)
+            else:
+                degraded = None
+                if elapsed_ms < budget * 0.5 and settings.target_recall:
+                    self._adaptive_nprobe[artifact_id] = min(
+                        max(current, nprobe + 1), index.nlist
+                    )
+        if degraded is not None:
+            log_event(
+                "nd_degraded",
+                reason="latency_budget",
+                previous_nprobe=current,
+                new_nprobe=degraded,
+            )
+
+    def _resident_index(
+        self, artifact: ExecutionArtifact, settings: NDSettings | None
+    ) -> IvfFlatIndex:
+        artifact_id = artifact.artifact_id
+        with self._lock:
+            index = self._indexes.get(artifact_id)
+        if index is not None:
+            return index
+        build_on_demand = bool(settings and settings.build_on_demand)
+        try:
+            index = self._load_index(artifact)
+        except CorruptArtifactError:
+            if not build_on_demand:
+                raise
+            index = None
+        if index is None and build_on_demand:
+            self.build_index(
+                artifact_id,
+                list(self.vectors.list_vectors()),
+                artifact.metric,
+                settings,
+            )
+            with self._lock:
+                index = self._indexes.get(artifact_id)
+        if index is None:
+            raise AnnIndexBuildError(message="IVF-Flat index missing; build required")
+        return index
+
+    def _paths(self, artifact_id: str) -> tuple[Path, Path]:
+        if self._index_dir is None:
+            raise AnnIndexBuildError(message="IVF-Flat index directory not configured")
+        return (
+            self._index_dir / f"{artifact_id}.ivfflat.npz",
+            self._index_dir / f"{artifact_id}.ivfflat.json",
+        )
+
+    def _load_index(self, artifact: ExecutionArtifact) -> IvfFlatIndex | None:
+        if self._index_dir is None:
+            return None
+        data_file, meta_file = self._paths(artifact.artifact_id)
+        if not data_file.exists() or not meta_file.exists():
+            return None
+        try:
+            meta = json.loads(meta_file.read_text(encoding="utf-8"))
+            with np.load(data_file, allow_pickle=False) as stored:
+                arrays = {name: stored[name] for name in _ARRAYS}
+        except Exception as exc:
+            raise CorruptArtifactError(message="IVF-Flat index corrupted") from exc
+        validate_index_meta(
+            artifact, meta, None, index_version=IvfFlatAnnRunner.INDEX_VERSION
+        )
+        ids = [str(vid) for vid in meta.pop("ids", [])]
+        deleted = {int(row) for row in meta.pop("deleted_rows", [])}
+        count = as_int(meta.get("vector_count"), 0)
+        dim = as_int(meta.get("dimension"), 0)
+        data, rows, offsets = arrays["data"], arrays["rows"], arrays["offsets"]
+        if (
+            len(ids) != count + len(deleted)
+            or data.shape != (count, dim)
+            or len(rows) != count
+            or arrays["centroids"].shape[1:] != (dim,)
+            or len(offsets) != len(arrays["centroids"]) + 1
+            or int(offsets[-1]) != count
+        ):
+            raise CorruptArtifactError(message="IVF-Flat index arrays inconsistent")
+        index = IvfFlatIndex(
+            ids=ids,
+            centroids=arrays["centroids"],
+            data=_split(data, offsets),
+            rows=_split(rows, offsets),
+            info=meta,
+            deleted=deleted,
+        )
+        with self._lock:
+            self._indexes[artifact.artifact_id] = index
+            self._index_info[artifact.artifact_id] = meta
+        log_event("ivf_index_loaded", artifact_id=artifact.artifact_id)
+        return index
+
+    def _persist_index(self, artifact_id: str, index: IvfFlatIndex) -> bool:
+        if self._index_dir is None:
+            return False
+        data_file, meta_file = self._paths(artifact_id)
+        data_tmp = data_file.with_name(data_file.name + ".tmp")
+        meta_tmp = meta_file.with_name(meta_file.name + ".tmp")
+        dim = as_int(index.info.get("dimension"), 0)
+        with data_tmp.open("wb") as handle:
+            np.savez(
+                handle,
+                centroids=index.centroids,
+                data=np.concatenate([np.zeros((0, dim)), *index.data]),
+                offsets=index.offsets(),
+                rows=np.concatenate([np.zeros(0, dtype=np.int64), *index.rows]),
+            )
+        meta = {**index.info, "ids": index.ids, "deleted_rows": sorted(index.deleted)}
+        meta_tmp.write_text(
+            json.dumps(meta, indent=2, sort_keys=True),
+            encoding="utf-8",
+        )
+        data_tmp.replace(data_file)
+        meta_tmp.replace(meta_file)
+        return True
+
+    def _query_params_metadata(self) -> tuple[tuple[str, str], ...]:
+        params = self._last_query_metadata.get("query_params")
+        if isinstance(params, dict):
+            return tuple((str(k), str(v)) for k, v in params.items())
+        return ()
+
+    def _seed_value(self) -> int | None:
+        seed = self._last_query_metadata.get("seed")
+        if isinstance(seed, bool) or not isinstance(seed, (int, float)):
+            return None
+        return int(seed)
+
+
+def _split(values: Any, offsets: Any) -> list[Any]:
+    return [
+        np.ascontiguousarray(values[int(lo) : int(hi)])
+        for lo, hi in zip(offsets[:-1], offsets[1:], strict=True)
+    ]
+
+
+def _scan(
+    index: IvfFlatIndex,
+    metric: str,
+    query: Sequence[float],
+    k: int,
+    nprobe: int,
+    mask: Any,
+) -> list[tuple[float, int]]:
+    """``(score, row)`` for the best k rows of the ``nprobe`` nearest lists."""
+    q = _prepared(np.asarray(query, dtype=np.float64), metric)
+    if metric == "dot":
+        # ``scoring.score`` ranks dot products ascending.
+        coarse = index.centroids @ q
+    else:
+        diff = index.centroids - q
+        coarse = np.einsum("ij,ij->i", diff, diff)
+    probed = (
+        np.argpartition(coarse, nprobe - 1)[:nprobe]
+        if nprobe < len(coarse)
+        else np.arange(len(coarse))
+    )
+    rows_parts: list[Any] = []
+    score_parts: list[Any] = []
+    for lst in probed.tolist():
+        members, rows = index.data[lst], index.rows[lst]
+        if mask is not None:
+            keep = mask[rows]
+            members, rows = members[keep], rows[keep]
+        if not len(rows):
+            continue
+        if metric == "l2":
+            diff = members - q
+            scores = np.einsum("ij,ij->i", diff, diff)
+        elif metric == "cosine":
+            scores = -(members @ q)
+        else:
+            scores = members @ q
+        rows_parts.append(rows)
+        score_parts.append(scores)
+    if not rows_parts or k <= 0:
+        return []
+    rows = np.concatenate(rows_parts)
+    scores = np.concatenate(score_parts)
+    if len(rows) > k:
+        keep = np.argpartition(scores, k - 1)[:k]
+        rows, scores = rows[keep], scores[keep]
+    order = np.lexsort((rows, scores))
+    return [(float(scores[idx]), int(rows[idx])) for idx in order.tolist()]
+
+
+__all__ = ["IvfFlatAnnRunner", "IvfFlatIndex"]
@@ -0,0 +1,524 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence, Set
+from dataclasses import dataclass
+import json
+import math
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+from bijux_vex.contracts.resources import VectorSource
+from bijux_vex.core.errors import (
+    AnnIndexBuildError,
+    BudgetExceededError,
+    CorruptArtifactError,
+    ValidationError,
+)
+from bijux_vex.core.execution_result import ApproximationReport
+from bijux_vex.core.identity.ids import fingerprint
+from bijux_vex.core.types import (
+    ExecutionArtifact,
+    ExecutionRequest,
+    NDSettings,
+    Result,
+    Vector,
+)
+from bijux_vex.infra.adapters.ann_base import AnnExecutionRequestRunner
+from bijux_vex.infra.adapters.hnsw.metadata import as_dict, validate_index_meta
+from bijux_vex.infra.adapters.hnsw.params import as_int
+from bijux_vex.infra.adapters.ivf.kmeans import assign, train_kmeans
+from bijux_vex.infra.adapters.ivf.pq import ProductQuantizer, default_subquantizers
+from bijux_vex.infra.logging import log_event
+from bijux_vex.infra.optional_deps import np
+
+# Rows sampled to train the coarse quantizer and the codebooks.
+_MAX_TRAIN_ROWS = 65_536
+_ARRAYS = ("centroids", "codebooks", "offsets", "rows", "codes")
+
+
+@dataclass
+class IvfPqIndex:
+    """Coarse centroids plus PQ codes of residuals, stored list by list."""
+
+    ids: list[str]
+    centroids: Any
+    pq: ProductQuantizer
+    offsets: Any
+    rows: Any
+    codes: Any
+    info: dict[str, object]
+
+    @property
+    def nlist(self) -> int:
+        return int(len(self.centroids))
+
+    @property
+    def code_bytes(self) -> int:
+        return int(self.codes.nbytes)
+
+
+class PQAnnRunner(AnnExecutionRequestRunner):
+    """
+    IVF-PQ ANN runner implemented with NumPy.
+
+    ``build_index`` trains a k-means coarse quantizer (``nlist`` lists) and
+    a product quantizer over the residuals to the list centroids, both
+    seeded from the randomness profile. A query scores the ``nprobe``
+    nearest lists with asymmetric distance tables and returns the best
+    ``top_k`` codes; exact rescoring is left to the plan's
+    ``rescore_exact`` step. Indices persist as ``<artifact>.ivfpq.npz``
+    plus ``<artifact>.ivfpq.json`` in ``index_dir``.
+    """
+
+    INDEX_VERSION = 1
+
+    def __init__(
+        self,
+        vectors: VectorSource,
+        index_dir: str | Path | None = None,
+        nlist: int | None = None,
+        m: int | None = None,
+        nbits: int = 8,
+        nprobe: int | None = None,
+    ):
+        if np is None:  # pragma: no cover - optional dependency
+            raise RuntimeError("numpy is required for PQAnnRunner")
+        self.vectors = vectors
+        self.nlist = nlist
+        self.m = m
+        self.nbits = nbits
+        if nprobe is None:
+            env_nprobe = os.getenv("BIJUX_VEX_PQ_NPROBE")
+            nprobe = int(env_nprobe) if env_nprobe else 8
+        self.nprobe = nprobe
+        self._index_dir = Path(index_dir) if index_dir else None
+        if self._index_dir:
+            self._index_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._indexes: dict[str, IvfPqIndex] = {}
+        self._index_info: dict[str, dict[str, object]] = {}
+        self._last_query_metadata: dict[str, object] = {}
+        self._active_seed: int | None = None
+
+    @property
+    def randomness_sources(self) -> tuple[str, ...]:
+        return ("ivfpq_training",)
+
+    @property
+    def reproducibility_bounds(self) -> str:
+        return "bounded"
+
+    @property
+    def supports_seed(self) -> bool:
+        return True
+
+    def set_randomness_profile(self, randomness: object | None) -> None:
+        seed = getattr(randomness, "seed", None) if randomness is not None else None
+        if isinstance(seed, bool) or not isinstance(seed, (int, float)):
+            self._active_seed = None
+            return
+        self._active_seed = int(seed)
+
+    def approximate_request(
+        self, artifact: ExecutionArtifact, request: ExecutionRequest
+    ) -> Iterable[Result]:
+        return self._search(artifact, [request])[0]
+
+    def approximate_batch(
+        self, artifact: ExecutionArtifact, requests: Sequence[ExecutionRequest]
+    ) -> list[Iterable[Result]]:
+        if not requests:
+            return []
+        return list(self._search(artifact, requests))
+
+    def approximate_filtered(
+        self, artifact: ExecutionArtifact, request: ExecutionRequest, allowed: Set[str]
+    ) -> Iterable[Result]:
+        return self._search(artifact, [request], allowed)[0]
+
+    def deterministic_fallback(
+        self, artifact_id: str, request: ExecutionRequest
+    ) -> Iterable[Result]:
+        return self.vectors.query(artifact_id, request)
+
+    def build_index(
+        self,
+        artifact_id: str,
+        vectors: Iterable[Vector],
+        metric: str,
+        nd_settings: object | None = None,
+    ) -> dict[str, object]:
+        vectors_list = list(vectors)
+        if not vectors_list:
+            return {}
+        dim = vectors_list[0].dimension
+        selected = [vec for vec in vectors_list if vec.dimension == dim]
+        ids = [vec.vector_id for vec in selected]
+        settings = nd_settings if isinstance(nd_settings, NDSettings) else None
+        nlist = self.nlist or max(1, int(4 * math.sqrt(len(ids))))
+        nlist = min(nlist, len(ids))
+        m = self.m or default_subquantizers(dim)
+        if settings and settings.max_index_memory_mb:
+            estimated_mb = (len(ids) * m + nlist * dim * 8) / (1024 * 1024)
+            if estimated_mb > float(settings.max_index_memory_mb):
+                raise BudgetExceededError(
+                    message="ANN index memory estimate exceeds limit",
+                    dimension="memory",
+                )
+        build_started = time.time()
+        seed = self._active_seed if self._active_seed is not None else 0
+        rng = np.random.default_rng(seed)
+        data = _prepared(
+            np.array([vec.values for vec in selected], dtype=np.float64), metric
+        )
+        train = data
+        if len(data) > _MAX_TRAIN_ROWS:
+            train = data[np.sort(rng.choice(len(data), _MAX_TRAIN_ROWS, replace=False))]
+        centroids = train_kmeans(train, nlist, rng)
+        pq = ProductQuantizer.train(
+            train - centroids[assign(train, centroids)], m, self.nbits, rng
+        )
+        labels = assign(data, centroids)
+        order = np.argsort(labels, kind="stable")
+        codes = pq.encode(data[order] - centroids[labels[order]])
+        offsets = np.searchsorted(labels[order], np.arange(len(centroids) + 1))
+        params = {
+            "nlist": int(len(centroids)),
+            "m": int(m),
+            "nbits": int(self.nbits),
+            "nprobe": int(self.nprobe),
+        }
+        info: dict[str, object] = {
+            "artifact_id": artifact_id,
+            "index_version": self.INDEX_VERSION,
+            "index_kind": "ivfpq",
+            "backend": "numpy",
+            "index_params": params,
+            "build_time_ms": int((time.time() - build_started) * 1000),
+            "vector_count": len(ids),
+            "dimension": dim,
+            "metric": metric,
+            "code_bytes": int(codes.nbytes),
+            "index_hash": fingerprint(
+                {
+                    "artifact_id": artifact_id,
+                    "ids": ids,
+                    "dimension": dim,
+                    "metric": metric,
+                    "params": params,
+                    "seed": int(seed),
+                    "index_version": self.INDEX_VERSION,
+                }
+            ),
+            "seed": int(seed),
+        }
+        index = IvfPqIndex(
+            ids=ids,
+            centroids=centroids,
+            pq=pq,
+            offsets=offsets,
+            rows=order,
+            codes=codes,
+            info=info,
+        )
+        with self._lock:
+            self._indexes[artifact_id] = index
+            self._index_info[artifact_id] = info
+        self._persist_index(artifact_id, index)
+        return info
+
+    def index_info(self, artifact_id: str) -> dict[str, object]:
+        return dict(self._index_info.get(artifact_id, {}))
+
+    def compact(self, artifact_id: str, vectors: Iterable[Vector], metric: str) -> None:
+        self.build_index(artifact_id, vectors, metric)
+
+    def approximation_report(
+        self,
+        artifact: ExecutionArtifact,
+        request: ExecutionRequest,
+        results: Iterable[Result],
+    ) -> ApproximationReport:
+        materialized = tuple(results)
+        index_info = self._index_info.get(artifact.artifact_id, {})
+        index_hash = index_info.get("index_hash")
+        index_params = as_dict(index_info.get("index_params"))
+        return ApproximationReport(
+            recall_at_k=0.0,
+            rank_displacement=0.0,
+            distance_error=0.0,
+            algorithm="ivfpq",
+            algorithm_version="v1",
+            backend="memory",
+            backend_version=f"numpy-{np.__version__}",
+            randomness_sources=self.randomness_sources,
+            deterministic_fallback_used=False,
+            index_parameters=tuple((str(k), str(v)) for k, v in index_params.items()),
+            query_parameters=self._query_params_metadata(),
+            n_candidates=len(materialized),
+            random_seed=self._seed_value(),
+            candidate_k=getattr(request.nd_settings, "candidate_k", None),
+            index_hash=str(index_hash) if index_hash is not None else None,
+            quantization="pq",
+        )
+
+    # ---- internals -----------------------------------------------------
+
+    def _search(
+        self,
+        artifact: ExecutionArtifact,
+        requests: Sequence[ExecutionRequest],
+        allowed: Set[str] | None = None,
+    ) -> list[tuple[Result, ...]]:
+        # Requests in one batch share settings and budget.
+        request = requests[0]
+        index = self._resident_index(artifact, request.nd_settings)
+        dim = as_int(index.info.get("dimension"), 0)
+        if any(len(req.vector or ()) != dim for req in requests):
+            raise ValidationError(message="query vector dimension mismatch")
+        nprobe = self._nprobe(index, request)
+        mask: Any = None
+        if allowed is not None:
+            mask = np.fromiter(
+                (vid in allowed for vid in index.ids), dtype=bool, count=len(index.ids)
+            )
+        start = time.time()
+        found = [
+            _probe(index, artifact.metric, req.vector or (), req.top_k, nprobe, mask)
+            for req in requests
+        ]
+        elapsed_ms = int((time.time() - start) * 1000 / len(requests))
+        self._last_query_metadata = {
+            "query_params": {"k": request.top_k or 1, "nprobe": nprobe},
+            "seed": index.info.get("seed", 0),
+        }
+        if (
+            request.execution_budget is not None
+            and request.execution_budget.max_latency_ms
+            and elapsed_ms > int(request.execution_budget.max_latency_ms)
+        ):
+            raise BudgetExceededError(
+                message="ANN latency budget exceeded",
+                dimension="latency",
+            )
+        vectors = self.vectors.get_vectors(
+            index.ids[row] for hits in found for _, row in hits
+        )
+        chunks = self.vectors.get_chunks(vec.chunk_id for vec in vectors.values())
+        batches: list[tuple[Result, ...]] = []
+        for req, hits in zip(requests, found, strict=True):
+            results: list[Result] = []
+            for rank, (score, row) in enumerate(hits, start=1):
+                vec_id = index.ids[row]
+                vector = vectors.get(vec_id)
+                chunk_id = vector.chunk_id if vector else ""
+                chunk = chunks.get(chunk_id) if vector else None
+                results.append(
+                    Result(
+                        request_id=req.request_id,
+                        document_id=chunk.document_id if chunk else "",
+                        chunk_id=chunk_id,
+                        vector_id=vec_id,
+                        artifact_id=artifact.artifact_id,
+                        score=score,
+                        rank=rank,
+                    )
+                )
+            batches.append(tuple(results))
+        return batches
+
+    def _nprobe(self, index: IvfPqIndex, request: ExecutionRequest) -> int:
+        params = as_dict(index.info.get("index_params"))
+        nprobe = as_int(params.get("nprobe"), self.nprobe)
+        budget = request.execution_budget
+        if budget is not None and budget.max_ann_probes is not None:
+            if budget.max_ann_probes <= 0:
+                raise BudgetExceededError(
+                    message="ANN probes budget exhausted before execution",
+                    dimension="ann_probes",
+                )
+            nprobe = min(nprobe, int(budget.max_ann_probes))
+        return max(1, min(nprobe, index.nlist))
+
+    def _resident_index(
+        self, artifact: ExecutionArtifact, settings: NDSettings | None
+    ) -> IvfPqIndex:
+        artifact_id = artifact.artifact_id
+        with self._lock:
+            index = self._indexes.get(artifact_id)
+        if index is not None:
+            return index
+        build_on_demand = bool(settings and settings.build_on_demand)
+        try:
+            index = self._load_index(artifact)
+        except CorruptArtifactError:
+            if not build_on_demand:
+                raise
+            index = None
+        if index is None and build_on_demand:
+            self.build_index(
+                artifact_id,
+                list(self.vectors.list_vectors()),
+                artifact.metric,
+                settings,
+            )
+            with self._lock:
+                index = self._indexes.get(artifact_id)
+        if index is None:
+            raise AnnIndexBuildError(message="IVF-PQ index missing; build required")
+        return index
+
+    def _paths(self, artifact_id: str) -> tuple[Path, Path]:
+        if self._index_dir is None:
+            raise AnnIndexBuildError(message="IVF-PQ index directory not configured")
+        return (
+            self._index_dir / f"{artifact_id}.ivfpq.npz",
+            self._index_dir / f"{artifact_id}.ivfpq.json",
+        )
+
+    def _load_index(self, artifact: ExecutionArtifact) -> IvfPqIndex | None:
+        if self._index_dir is None:
+            return None
+        data_file, meta_file = self._paths(artifact.artifact_id)
+        if not data_file.exists() or not meta_file.exists():
+            return None
+        try:
+            meta = json.loads(meta_file.read_text(encoding="utf-8"))
+            with np.load(data_file, allow_pickle=False) as stored:
+                arrays = {name: stored[name] for name in _ARRAYS}
+        except Exception as exc:
+            raise CorruptArtifactError(message="IVF-PQ index corrupted") from exc
+        validate_index_meta(
+            artifact, meta, None, index_version=PQAnnRunner.INDEX_VERSION
+        )
+        ids = [str(vid) for vid in meta.pop("ids", [])]
+        count = as_int(meta.get("vector_count"), 0)
+        params = as_dict(meta.get("index_params"))
+        codebooks = arrays["codebooks"]
+        if (
+            len(ids) != count
+            or arrays["codes"].shape != (count, as_int(params.get("m"), 0))
+            or len(arrays["rows"]) != count
+            or len(arrays["offsets"]) != len(arrays["centroids"]) + 1
+            or codebooks.shape[0] * codebooks.shape[2]
+            != as_int(meta.get("dimension"), 0)
+        ):
+            raise CorruptArtifactError(message="IVF-PQ index arrays inconsistent")
+        index = IvfPqIndex(
+            ids=ids,
+            centroids=arrays["centroids"],
+            pq=ProductQuantizer(codebooks=codebooks),
+            offsets=arrays["offsets"],
+            rows=arrays["rows"],
+            codes=arrays["codes"],
+            info=meta,
+        )
+        with self._lock:
+            self._indexes[artifact.artifact_id] = index
+            self._index_info[artifact.artifact_id] = meta
+        log_event("ivfpq_index_loaded", artifact_id=artifact.artifact_id)
+        return index
+
+    def _persist_index(self, artifact_id: str, index: IvfPqIndex) -> bool:
+        if self._index_dir is None:
+            return False
+        data_file, meta_file = self._paths(artifact_id)
+        data_tmp = data_file.with_name(data_file.name + ".tmp")
+        meta_tmp = meta_file.with_name(meta_file.name + ".tmp")
+        with data_tmp.open("wb") as handle:
+            np.savez(
+                handle,
+                centroids=index.centroids,
+                codebooks=index.pq.codebooks,
+                offsets=index.offsets,
+                rows=index.rows,
+                codes=index.codes,
+            )
+        meta_tmp.write_text(
+            json.dumps({**index.info, "ids": index.ids}, indent=2, sort_keys=True),
+            encoding="utf-8",
+        )
+        data_tmp.replace(data_file)
+        meta_tmp.replace(meta_file)
+        return True
+
+    def _query_params_metadata(self) -> tuple[tuple[str, str], ...]:
+        params = self._last_query_metadata.get("query_params")
+        if isinstance(params, dict):
+            return tuple((str(k), str(v)) for k, v in params.items())
+        return ()
+
+    def _seed_value(self) -> int | None:
+        seed = self._last_query_metadata.get("seed")
+        if isinstance(seed, bool) or not isinstance(seed, (int, float)):
+            return None
+        return int(seed)
+
+
+def _prepared(data: Any, metric: str) -> Any:
+    # Cosine ranks like l2 over unit vectors: |a - b|^2 = 2 - 2 cos(a, b).
+    if metric != "cosine":
+        return data
+    norms = np.linalg.norm(data, axis=-1, keepdims=True)
+    return data / np.where(norms > 0.0, norms, 1.0)
+
+
+def _probe(
+    index: IvfPqIndex,
+    metric: str,
+    query: Sequence[float],
+    k: int,
+    nprobe: int,
+    mask: Any,
+) -> list[tuple[float, int]]:
+    """``(approximate score, row)`` for the best k rows of the probed lists."""
+    q = _prepared(np.asarray(query, dtype=np.float64), metric)
+    if metric == "dot":
+        # ``scoring.score`` ranks dot products ascending.
+        coarse = index.centroids @ q
+        table = index.pq.inner_table(q)
+    else:
+        diff = index.centroids - q
+        coarse = np.einsum("ij,ij->i", diff, diff)
+    probed = (
+        np.argpartition(coarse, nprobe - 1)[:nprobe]
+        if nprobe < len(coarse)
+        else (np.arange(len(coarse)))
+    )
+    rows_parts: list[Any] = []
+    score_parts: list[Any] = []
+    for lst in probed.tolist():
+        lo, hi = int(index.offsets[lst]), int(index.offsets[lst + 1])
+        if hi <= lo:
+            continue
+        codes = index.codes[lo:hi]
+        rows = index.rows[lo:hi]
+        if mask is not None:
+            keep = mask[rows]
+            codes, rows = codes[keep], rows[keep]
+        if metric == "dot":
+            scores = coarse[lst] + index.pq.lookup(table, codes)
+        else:
+            residual = q - index.centroids[lst]
+            scores = index.pq.lookup(index.pq.distance_table(residual), codes)
+        rows_parts.append(rows)
+        score_parts.append(scores)
+    if not rows_parts or k <= 0:
+        return []
+    rows = np.concatenate(rows_parts)
+    scores = np.concatenate(score_parts)
+    if metric == "cosine":
+        scores = scores / 2.0 - 1.0
+    if len(rows) > k:
+        keep = np.argpartition(scores, k - 1)[:k]
+        rows, scores = rows[keep], scores[keep]
+    order = np.lexsort((rows, scores))
+    return [(float(scores[idx]), int(rows[idx])) for idx in order.tolist()]
+
+
+__all__ = ["IvfPqIndex", "PQAnnRunner"]
@@ -0,0 +1,261 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence, Set
+from statistics import mean
+import time
+from typing import Any
+
+from bijux_vex.contracts.resources import VectorSource
+from bijux_vex.core.errors import ValidationError
+from bijux_vex.core.execution_result import ApproximationReport
+from bijux_vex.core.identity.ids import fingerprint
+from bijux_vex.core.types import (
+    ExecutionArtifact,
+    ExecutionRequest,
+    Result,
+    Vector,
+)
+from bijux_vex.domain.execution_algorithms.exact_matrix import (
+    MATRIX_CACHE,
+    VectorMatrix,
+    build_vector_matrix,
+    matrix_supported,
+)
+from bijux_vex.domain.execution_algorithms.quantized import (
+    QUANTIZED_CACHE,
+    quantize_matrix,
+    quantized_scores,
+    quantized_shortlist,
+    quantized_top_k,
+)
+from bijux_vex.infra.adapters.ann_base import AnnExecutionRequestRunner
+from bijux_vex.infra.optional_deps import np
+from bijux_vex.infra.vector_segment import segment_store_for
+
+
+class QuantizedAnnRunner(AnnExecutionRequestRunner):
+    """
+    ANN runner that shortlists over int8 scalar-quantized codes.
+
+    Each request's ``top_k`` (already raised to ``candidate_k`` by the
+    algorithm) rows are picked by quantized score; the plan's
+    ``rescore_exact`` step then rescores them at full precision.
+    Calibration is returned from ``build_index`` so it is recorded in the
+    artifact's build parameters.
+    """
+
+    def __init__(self, vectors: VectorSource):
+        if np is None:  # pragma: no cover - optional dependency
+            raise RuntimeError("numpy is required for QuantizedAnnRunner")
+        self.vectors = vectors
+        self._index_info: dict[str, dict[str, object]] = {}
+        self._last_query_metadata: dict[str, object] = {}
+
+    @property
+    def randomness_sources(self) -> tuple[str, ...]:
+        return ("int8_quantization",)
+
+    @property
+    def reproducibility_bounds(self) -> str:
+        return "bounded"
+
+    def approximate_request(
+        self, artifact: ExecutionArtifact, request: ExecutionRequest
+    ) -> Iterable[Result]:
+        return self._shortlist(artifact, request)
+
+    def approximate_batch(
+        self, artifact: ExecutionArtifact, requests: Sequence[ExecutionRequest]
+    ) -> list[Iterable[Result]]:
+        return [self._shortlist(artifact, request) for request in requests]
+
+    def approximate_filtered(
+        self, artifact: ExecutionArtifact, request: ExecutionRequest, allowed: Set[str]
+    ) -> Iterable[Result]:
+        return self._shortlist(artifact, request, allowed)
+
+    def deterministic_fallback(
+        self, artifact_id: str, request: ExecutionRequest
+    ) -> Iterable[Result]:
+        return self.vectors.query(artifact_id, request)
+
+    def build_index(
+        self,
+        artifact_id: str,
+        vectors: Iterable[Vector],
+        metric: str,
+        nd_settings: object | None = None,
+    ) -> dict[str, object]:
+        vectors_list = list(vectors)
+        if not vectors_list:
+            return {}
+        started = time.perf_counter()
+        dim = vectors_list[0].dimension
+        vm = build_vector_matrix(vectors_list, dim)
+        quantized = quantize_matrix(vm)
+        calibration = quantized.calibration()
+        info: dict[str, object] = {
+            "index_kind": "sq8",
+            "index_params": {"bits": 8, "calibration": "per_dimension_minmax"},
+            "calibration": calibration,
+            "quantization_error": quantized.max_error,
+            "code_bytes": quantized.nbytes,
+            "build_time_ms": int((time.perf_counter() - started) * 1000),
+            "vector_count": len(vm),
+            "index_hash": fingerprint(
+                {
+                    "artifact_id": artifact_id,
+                    "ids": list(vm.vector_ids),
+                    "dimension": dim,
+                    "metric": metric,
+                    "calibration": calibration,
+                }
+            ),
+            "dimension": dim,
+            "metric": metric,
+        }
+        self._index_info[artifact_id] = info
+        return info
+
+    def index_info(self, artifact_id: str) -> dict[str, object]:
+        return dict(self._index_info.get(artifact_id, {}))
+
+    def approximation_report(
+        self,
+        artifact: ExecutionArtifact,
+        request: ExecutionRequest,
+        results: Iterable[Result],
+    ) -> ApproximationReport:
+        materialized = tuple(results)
+        recall, displacement, distance_error = 0.0, 0.0, 0.0
+        quantization_error: float | None = None
+        vm = self._matrix(artifact, request)
+        if vm is not None and request.vector is not None:
+            quantized = QUANTIZED_CACHE.get(vm)
+            quantization_error = quantized.max_error
+            exact = quantized_top_k(
+                artifact.metric, request.vector, vm, quantized, request.top_k
+            )
+            exact_rank = {vid: rank for rank, (_, vid, _) in enumerate(exact, 1)}
+            matched = [res for res in materialized if res.vector_id in exact_rank]
+            recall = min(1.0, len(matched) / float(request.top_k or 1))
+            if matched:
+                displacement = mean(
+                    abs(exact_rank[res.vector_id] - res.rank) for res in matched
+                )
+            row_of = {vid: row for row, vid in enumerate(vm.vector_ids)}
+            rows = [
+                row_of[res.vector_id] for res in materialized if res.vector_id in row_of
+            ]
+            if rows:
+                approx = quantized_scores(
+                    artifact.metric,
+                    request.vector,
+                    quantized,
+                    vm.norms,
+                    np.asarray(rows),
+                )
+                exact_scores = [
+                    res.score for res in materialized if res.vector_id in row_of
+                ]
+                distance_error = float(np.mean(np.abs(approx - exact_scores)))
+        index_info = self._index_info.get(artifact.artifact_id, {})
+        index_hash = index_info.get("index_hash")
+        return ApproximationReport(
+            recall_at_k=recall,
+            rank_displacement=displacement,
+            distance_error=distance_error,
+            algorithm="sq8_shortlist",
+            algorithm_version="v1",
+            backend="memory",
+            backend_version="int8",
+            randomness_sources=self.randomness_sources,
+            deterministic_fallback_used=False,
+            index_parameters=(("bits", 8), ("calibration", "per_dimension_minmax")),
+            query_parameters=self._query_params_metadata(),
+            n_candidates=len(materialized),
+            candidate_k=getattr(request.nd_settings, "candidate_k", None),
+            index_hash=str(index_hash) if index_hash is not None else None,
+            quantization="int8",
+            quantization_error=quantization_error,
+        )
+
+    # ---- internals -----------------------------------------------------
+
+    def _matrix(
+        self, artifact: ExecutionArtifact, request: ExecutionRequest
+    ) -> VectorMatrix | None:
+        query = request.vector
+        if query is None:
+            return None
+        dimension = len(query)
+        segments = segment_store_for(self.vectors)
+        vm = segments.matrix(artifact, dimension) if segments is not None else None
+        if vm is None:
+            vm = MATRIX_CACHE.get(self.vectors, artifact.artifact_id, dimension)
+        if not matrix_supported(artifact.metric, query, vm):
+            return None
+        return vm
+
+    def _shortlist(
+        self,
+        artifact: ExecutionArtifact,
+        request: ExecutionRequest,
+        allowed: Set[str] | None = None,
+    ) -> list[Result]:
+        if request.vector is None:
+            raise ValidationError(
+                message="execution vector required", invariant_id="INV-020"
+            )
+        vm = self._matrix(artifact, request)
+        if vm is None:
+            # Empty corpus, zero vectors under cosine, or unsafe magnitudes.
+            if allowed is not None:
+                return list(
+                    self.vectors.query_allowed(artifact.artifact_id, request, allowed)
+                )
+            return list(self.vectors.query(artifact.artifact_id, request))
+        rows: Any = None
+        if allowed is not None:
+            rows = np.asarray(
+                [row for row in vm.rows().tolist() if vm.vector_ids[row] in allowed],
+                dtype=np.int64,
+            )
+        shortlist = quantized_shortlist(
+            artifact.metric,
+            request.vector,
+            vm,
+            QUANTIZED_CACHE.get(vm),
+            request.top_k,
+            rows,
+        )
+        self._last_query_metadata = {
+            "query_params": {"candidate_k": request.top_k, "scanned": len(vm)}
+        }
+        chunks = self.vectors.get_chunks(vm.chunk_ids[row] for _, row in shortlist)
+        results: list[Result] = []
+        for rank, (score, row) in enumerate(shortlist, start=1):
+            chunk = chunks.get(vm.chunk_ids[row])
+            results.append(
+                Result(
+                    request_id=request.request_id,
+                    document_id=chunk.document_id if chunk else "",
+                    chunk_id=vm.chunk_ids[row],
+                    vector_id=vm.vector_ids[row],
+                    artifact_id=artifact.artifact_id,
+                    score=score,
+                    rank=rank,
+                )
+            )
+        return results
+
+    def _query_params_metadata(self) -> tuple[tuple[str, str], ...]:
+        params = self._last_query_metadata.get("query_params")
+        if isinstance(params, dict):
+            return tuple((str(k), str(v)) for k, v in params.items())
+        return ()
+
+
+__all__ = ["QuantizedAnnRunner"]
@@ -2,10 +2,16 @@
 # pyright: reportMissingModuleSource=false, reportMissingImports=false
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+import math
 from pathlib import Path
+import random
 from statistics import mean
+import threading
 import time
+from typing import Any
 
 from bijux_vex.contracts.resources import VectorSource
 from bijux_vex.core.contracts.execution_contract import ExecutionContract
@@ -19,21 +25,64 @@ from bijux_vex.core.types import (
     Result,
     Vector,
 )
+from bijux_vex.domain.execution_requests.scoring import score
 from bijux_vex.infra.adapters.ann_base import AnnExecutionRequestRunner
+from bijux_vex.infra.logging import log_event
+from bijux_vex.infra.optional_deps import np
+
+# Hash tables probed per query; more tables raise recall and candidate count.
+_TABLES = 8
+# Buckets are sized for about this many vectors each.
+_BUCKET_TARGET = 8
+_MAX_BITS = 16
+# Exact baselines kept for approximation reports.
+_BASELINE_ENTRIES = 256
+
+
+@dataclass
+class LshIndex:
+    """Sign random-projection tables over one artifact's vectors."""
+
+    ids: list[str]
+    metric: str
+    planes: list[list[tuple[float, ...]]]
+    offsets: list[list[float]]
+    buckets: list[dict[int, list[int]]]
+    info: dict[str, object]
+
+    @property
+    def bits(self) -> int:
+        return len(self.planes[0]) if self.planes else 0
 
 
 class ReferenceAnnRunner(AnnExecutionRequestRunner):
-    """Reference ANN runner that truncates deterministic results."""
+    """
+    Dependency-free ANN runner using random-projection LSH.
+
+    ``build_index`` hashes every vector into ``_TABLES`` tables keyed by the
+    signs of seeded random projections (centred on the corpus mean for l2).
+    A query collects the members of its bucket and of the buckets one bit
+    away in every table, then scores only those candidates exactly. When the
+    probe finds fewer than ``top_k`` candidates it falls back to an exact
+    scan. NumPy speeds up hashing when installed but is not required.
+    """
 
     def __init__(self, vectors: VectorSource, index_dir: str | Path | None = None):
         self.vectors = vectors
         self._index_info: dict[str, dict[str, object]] = {}
         self._last_query_metadata: dict[str, object] = {}
         self._index_dir = Path(index_dir) if index_dir else None
+        self._lock = threading.Lock()
+        self._indexes: dict[str, LshIndex] = {}
+        self._last_artifact_id: str | None = None
+        self._active_seed: int | None = None
+        self._baselines: OrderedDict[tuple[str, ...], tuple[Result, ...]] = (
+            OrderedDict()
+        )
 
     @property
     def randomness_sources(self) -> tuple[str, ...]:
-        return ("reference_ann_truncation",)
+        return ("reference_lsh_projections",)
 
     @property
     def reproducibility_bounds(self) -> str:
@@ -43,10 +92,17 @@ class ReferenceAnnRunner(AnnExecutionRequestRunner):
     def supports_seed(self) -> bool:
         return True
 
+    def set_randomness_profile(self, randomness: object | None) -> None:
+        seed = getattr(randomness, "seed", None) if randomness is not None else None
+        if isinstance(seed, bool) or not isinstance(seed, (int, float)):
+            self._active_seed = None
+            return
+        self._active_seed = int(seed)
+
     def approximate_request(
         self, artifact: ExecutionArtifact, request: ExecutionRequest
     ) -> Iterable[Result]:
-        return self._truncate_results(artifact, request)
+        return self._search(artifact, request)
 
     def deterministic_fallback(
         self, artifact_id: str, request: ExecutionRequest
@@ -63,26 +119,62 @@ class ReferenceAnnRunner(AnnExecutionRequestRunner):
         vectors_list = list(vectors)
         if not vectors_list:
             return {}
+        build_started = time.time()
         dim = vectors_list[0].dimension
-        ids = [vec.vector_id for vec in vectors_list]
-        index_hash = fingerprint(
-            {
-                "artifact_id": artifact_id,
-                "ids": ids,
-                "dimension": dim,
-                "metric": metric,
-            }
-        )
+        selected = [vec for vec in vectors_list if vec.dimension == dim]
+        ids = [vec.vector_id for vec in selected]
+        seed = self._active_seed if self._active_seed is not None else 0
+        bits = _bits_for(len(ids))
+        rng = random.Random(seed)  # noqa: S311  # nosec B311 - seeded projections
+        planes = [
+            [tuple(rng.gauss(0.0, 1.0) for _ in range(dim)) for _ in range(bits)]
+            for _ in range(_TABLES)
+        ]
+        rows = [vec.values for vec in selected]
+        if metric in {"cosine", "dot"}:
+            offsets = [[0.0] * bits for _ in planes]
+        else:
+            # Centre on the corpus mean so hyperplanes split the data itself.
+            center = [sum(column) / len(rows) for column in zip(*rows, strict=True)]
+            offsets = [[_dot(plane, center) for plane in table] for table in planes]
+        buckets: list[dict[int, list[int]]] = []
+        for table, table_offsets in zip(planes, offsets, strict=True):
+            members: dict[int, list[int]] = {}
+            for row, key in enumerate(_hash_rows(rows, table, table_offsets)):
+                members.setdefault(key, []).append(row)
+            buckets.append(members)
+        params = {"tables": _TABLES, "bits": bits}
         info: dict[str, object] = {
-            "index_kind": "reference",
-            "index_params": {},
-            "build_time_ms": int((time.time() - time.time()) * 1000),
+            "index_kind": "lsh",
+            "index_params": params,
+            "build_time_ms": int((time.time() - build_started) * 1000),
             "vector_count": len(ids),
-            "index_hash": index_hash,
+            "index_hash": fingerprint(
+                {
+                    "artifact_id": artifact_id,
+                    "ids": ids,
+                    "dimension": dim,
+                    "metric": metric,
+                    "params": params,
+                    "seed": seed,
+                }
+            ),
             "dimension": dim,
             "metric": metric,
+            "seed": seed,
         }
-        self._index_info[artifact_id] = info
+        index = LshIndex(
+            ids=ids,
+            metric=metric,
+            planes=planes,
+            offsets=offsets,
+            buckets=buckets,
+            info=info,
+        )
+        with self._lock:
+            self._indexes[artifact_id] = index
+            self._index_info[artifact_id] = info
+            self._last_artifact_id = artifact_id
         return info
 
     def index_info(self, artifact_id: str) -> dict[str, object]:
@@ -100,24 +192,27 @@ class ReferenceAnnRunner(AnnExecutionRequestRunner):
             execution_intent=ExecutionIntent.EXPLORATORY_SEARCH,
             execution_mode=ExecutionMode.BOUNDED,
         )
+        artifact_id = self._last_artifact_id or "ann-stub"
         stub_artifact = ExecutionArtifact(
-            artifact_id="ann-stub",
+            artifact_id=artifact_id,
             corpus_fingerprint="ann-corpus",
             vector_fingerprint="ann-vectors",
-            metric="l2",
+            metric=str(self._index_info.get(artifact_id, {}).get("metric", "l2")),
             scoring_version="v1",
             execution_contract=ExecutionContract.NON_DETERMINISTIC,
         )
-        results = list(self._truncate_results(stub_artifact, request))
+        results = list(self._search(stub_artifact, request))
         return (
             [r.vector_id for r in results],
             [r.score for r in results],
             {
-                "algorithm": "reference_ann_truncation",
-                "index_params": (),
-                "query_params": {"k": k},
+                "algorithm": "reference_lsh",
+                "index_params": tuple(
+                    sorted(_index_params(self._index_info.get(artifact_id)).items())
+                ),
+                "query_params": self._last_query_metadata.get("query_params", {}),
                 "n_candidates": len(results),
-                "random_seed": 0,
+                "random_seed": self._seed_value() or 0,
                 "randomness_source": self.randomness_sources,
             },
         )
@@ -129,7 +224,7 @@ class ReferenceAnnRunner(AnnExecutionRequestRunner):
         results: Iterable[Result],
     ) -> ApproximationReport:
         materialized = tuple(results)
-        exact = tuple(self.deterministic_fallback(artifact.artifact_id, request))
+        exact = self._exact_baseline(artifact, request)
         exact_ids = {res.vector_id: res.rank for res in exact}
         matched = [res for res in materialized if res.vector_id in exact_ids]
         recall = min(1.0, len(matched) / float(request.top_k or 1))
@@ -156,14 +251,15 @@ class ReferenceAnnRunner(AnnExecutionRequestRunner):
             recall_at_k=recall,
             rank_displacement=displacement,
             distance_error=distance_error,
-            algorithm="reference_ann_truncation",
-            algorithm_version="v1",
+            algorithm="reference_lsh",
+            algorithm_version="v2",
             backend="memory",
             backend_version="reference",
             randomness_sources=self.randomness_sources,
             deterministic_fallback_used=False,
             truncation_ratio=truncation_ratio,
-            index_parameters=(("backend", "reference"),),
+            index_parameters=(("backend", "reference"),)
+            + tuple((k, str(v)) for k, v in _index_params(index_info).items()),
             query_parameters=self._query_params_metadata(),
             n_candidates=len(materialized),
             random_seed=self._seed_value(),
@@ -173,14 +269,88 @@ class ReferenceAnnRunner(AnnExecutionRequestRunner):
 
     # ---- internals -----------------------------------------------------
 
-    def _truncate_results(
+    def _resident_index(self, artifact: ExecutionArtifact) -> LshIndex | None:
+        with self._lock:
+            index = self._indexes.get(artifact.artifact_id)
+        if index is not None:
+            return index
+        vectors = list(self.vectors.list_vectors())
+        if not self.build_index(artifact.artifact_id, vectors, artifact.metric):
+            return None
+        with self._lock:
+            return self._indexes.get(artifact.artifact_id)
+
+    def _search(
         self, artifact: ExecutionArtifact, request: ExecutionRequest
-    ) -> Iterable[Result]:
-        results = list(self.vectors.query(artifact.artifact_id, request))
-        if not results:
+    ) -> tuple[Result, ...]:
+        index = self._resident_index(artifact)
+        query = tuple(request.vector or ())
+        if index is None or request.top_k <= 0:
             return ()
-        truncated = results[: max(1, len(results) // 2)]
-        return truncated
+        candidates = _probe(index, query)
+        self._last_query_metadata = {
+            "query_params": {
+                "k": request.top_k,
+                "tables": len(index.planes),
+                "bits": index.bits,
+                "candidates": len(candidates),
+            },
+            "seed": index.info.get("seed", 0),
+        }
+        if len(candidates) < request.top_k:
+            log_event(
+                "reference_ann_exact_fallback",
+                artifact_id=artifact.artifact_id,
+                candidates=len(candidates),
+                top_k=request.top_k,
+            )
+            return tuple(self.vectors.query(artifact.artifact_id, request))
+        vectors = self.vectors.get_vectors(index.ids[row] for row in candidates)
+        scored = sorted(
+            (score(artifact.metric, query, vec.values), vec.vector_id, vec)
+            for vec in vectors.values()
+            if len(vec.values) == len(query)
+        )[: request.top_k]
+        chunks = self.vectors.get_chunks(vec.chunk_id for _, _, vec in scored)
+        results: list[Result] = []
+        for rank, (value, vec_id, vec) in enumerate(scored, start=1):
+            chunk = chunks.get(vec.chunk_id)
+            results.append(
+                Result(
+                    request_id=request.request_id,
+                    document_id=chunk.document_id if chunk else "",
+                    chunk_id=vec.chunk_id,
+                    vector_id=vec_id,
+                    artifact_id=artifact.artifact_id,
+                    score=value,
+                    rank=rank,
+                )
+            )
+        return tuple(results)
+
+    def _exact_baseline(
+        self, artifact: ExecutionArtifact, request: ExecutionRequest
+    ) -> tuple[Result, ...]:
+        """Exact results for the report, cached per artifact and query."""
+        index_hash = self._index_info.get(artifact.artifact_id, {}).get("index_hash")
+        key = (
+            artifact.artifact_id,
+            str(index_hash),
+            artifact.metric,
+            str(request.top_k),
+            fingerprint(tuple(request.vector or ())),
+        )
+        with self._lock:
+            cached = self._baselines.get(key)
+            if cached is not None:
+                self._baselines.move_to_end(key)
+                return cached
+        exact = tuple(self.deterministic_fallback(artifact.artifact_id, request))
+        with self._lock:
+            self._baselines[key] = exact
+            while len(self._baselines) > _BASELINE_ENTRIES:
+                self._baselines.popitem(last=False)
+        return exact
 
     def _query_params_metadata(self) -> tuple[tuple[str, str], ...]:
         params = self._last_query_metadata.get("query_params")
@@ -202,4 +372,58 @@ class ReferenceAnnRunner(AnnExecutionRequestRunner):
         return None
 
 
-__all__ = ["ReferenceAnnRunner"]
+def _bits_for(count: int) -> int:
+    return max(0, min(_MAX_BITS, round(math.log2(max(1, count) / _BUCKET_TARGET))))
+
+
+def _dot(left: Sequence[float], right: Sequence[float]) -> float:
+    return math.fsum(a * b for a, b in zip(left, right, strict=True))
+
+
+def _hash_rows(
+    rows: Sequence[Sequence[float]],
+    planes: Sequence[Sequence[float]],
+    offsets: Sequence[float],
+) -> list[int]:
+    """Bucket key per row: bit i is set when the row lies above plane i."""
+    if not planes:
+        return [0] * len(rows)
+    if np is not None:
+        above: Any = np.asarray(rows, dtype=np.float64) @ np.asarray(
+            planes, dtype=np.float64
+        ).T > np.asarray(offsets, dtype=np.float64)
+        weights = 1 << np.arange(len(planes), dtype=np.int64)
+        return [int(key) for key in above.astype(np.int64) @ weights]
+    return [
+        sum(
+            1 << bit
+            for bit, (plane, offset) in enumerate(zip(planes, offsets, strict=True))
+            if _dot(row, plane) > offset
+        )
+        for row in rows
+    ]
+
+
+def _probe(index: LshIndex, query: Sequence[float]) -> list[int]:
+    """Rows sharing a bucket with ``query``, or one bit away, in any table."""
+    if index.metric == "dot":
+        # ``scoring.score`` ranks dot products ascending, so the best rows
+        # point away from the query.
+        query = tuple(-value for value in query)
+    found: set[int] = set()
+    flips = [0] + [1 << bit for bit in range(index.bits)]
+    for table, offsets, members in zip(
+        index.planes, index.offsets, index.buckets, strict=True
+    ):
+        key = _hash_rows([query], table, offsets)[0]
+        for flip in flips:
+            found.update(members.get(key ^ flip, ()))
+    return sorted(found)
+
+
+def _index_params(info: dict[str, object] | None) -> dict[str, object]:
+    params = (info or {}).get("index_params")
+    return dict(params) if isinstance(params, dict) else {}
+
+
+__all__ = ["LshIndex", "ReferenceAnnRunner"]
@@ -25,12 +25,17 @@ from bijux_vex.core.errors import (
     DeterminismViolationError,
     ValidationError,
 )
+from bijux_vex.infra.adapters.faiss import records_log
 from bijux_vex.infra.adapters.vectorstore import VectorStoreAdapter
 
 INDEX_VERSION = 1
 EXACT_INDEX_TYPE = "IndexFlatL2"
 ANN_INDEX_TYPE = "IndexHNSWFlat"
 DEFAULT_METRIC = "l2"
+# Lower bounds on the work that triggers an index checkpoint or a compaction;
+# above them both scale with the corpus so their cost amortizes per insert.
+_MIN_CHECKPOINT_OPS = 4096
+_MIN_COMPACT_ROWS = 1024
 
 
 @dataclass(frozen=True)
@@ -74,6 +79,19 @@ class FaissIndexLock:
 
 
 class FaissVectorStoreAdapter(VectorStoreAdapter):
+    """
+    FAISS-backed vector store persisted as an index checkpoint plus a records log.
+
+    Records live in a binary append-only log (``.records.log``) and the
+    index is wrapped in ``IndexIDMap2`` keyed by a monotonically assigned
+    row, so inserts and deletes append a frame instead of rewriting the
+    store. The index file is a checkpoint: it is rewritten once the log has
+    grown by a quarter of the corpus, and frames written after it are
+    replayed on load. Flat indices drop deleted rows with ``remove_ids``;
+    HNSW cannot, so its deleted rows are excluded at search time until
+    enough accumulate to compact the index.
+    """
+
     backend = "faiss"
     is_noop = False
 
@@ -85,11 +103,20 @@ class FaissVectorStoreAdapter(VectorStoreAdapter):
         self._options = dict(options or {})
         self._index: Any | None = None
         self._dimension: int | None = None
-        self._records: list[FaissRecord] = []
+        self._records: dict[int, FaissRecord] = {}
+        self._rows: dict[str, int] = {}
+        self._next_row = 0
+        self._tombstones: set[int] = set()
+        self._search_state: tuple[Any, Any, Any] | None = None
+        self._uncheckpointed = 0
+        self._dead_frames = 0
         self._index_path = Path(uri) if uri else None
         self._meta_path = (
             self._index_path.with_suffix(".meta.json") if self._index_path else None
         )
+        self._log_path = (
+            self._index_path.with_suffix(".records.log") if self._index_path else None
+        )
         self._records_path = (
             self._index_path.with_suffix(".records.json") if self._index_path else None
         )
@@ -161,21 +188,15 @@ class FaissVectorStoreAdapter(VectorStoreAdapter):
             raise ValidationError(message="Vector dimensionality mismatch for FAISS")
         if len(set(vector_ids)) != len(vector_ids):
             raise ConflictError(message="Duplicate vector_id detected in insert batch")
-        existing_ids = {record.vector_id for record in self._records}
-        overlap = existing_ids.intersection(vector_ids)
-        if overlap:
+        if any(vector_id in self._rows for vector_id in vector_ids):
             raise ConflictError(
                 message="Vector store already contains one or more vector_id values"
             )
         if self._lock_path:
             with FaissIndexLock(self._lock_path):
-                self._append_records(records)
-                self._add_to_index(vectors_list)
-                self._persist()
+                self._insert_records(records, vectors_list)
         else:
-            self._append_records(records)
-            self._add_to_index(vectors_list)
-            self._persist()
+            self._insert_records(records, vectors_list)
         return vector_ids
 
     def query(
@@ -189,17 +210,21 @@ class FaissVectorStoreAdapter(VectorStoreAdapter):
             )
         self._enforce_mode(mode)
         array = np.asarray([vector], dtype="float32")
-        distances, indices = self._index.search(array, int(k))
+        params = self._search_params()
+        if params is None:
+            distances, indices = self._index.search(array, int(k))
+        else:
+            distances, indices = self._index.search(array, int(k), params=params)
         results: list[tuple[str, float]] = []
         for idx, dist in zip(indices[0], distances[0], strict=False):
             if idx < 0:
                 continue
-            if idx >= len(self._records):
+            record = self._records.get(int(idx))
+            if record is None:
                 raise CorruptArtifactError(
                     message="FAISS index references out-of-range vector id"
                 )
-            vector_id = self._records[idx].vector_id
-            results.append((vector_id, float(dist)))
+            results.append((record.vector_id, float(dist)))
         return results
 
     def delete(self, ids: Iterable[str]) -> int:
@@ -228,7 +253,7 @@ class FaissVectorStoreAdapter(VectorStoreAdapter):
             "version": self.backend_version,
             "index": {
                 "vector_count": len(self._records),
-                "deleted_count": 0,
+                "deleted_count": len(self._tombstones),
                 "dimension": self._dimension,
                 "metric": DEFAULT_METRIC,
                 "index_type": self._index_type_name(),
@@ -237,26 +262,82 @@ class FaissVectorStoreAdapter(VectorStoreAdapter):
         }
 
     def _load_state(self) -> None:
-        if not self._index_path or not self._meta_path or not self._records_path:
+        if not self._index_path or not self._meta_path or not self._log_path:
             return
         if not self._meta_path.exists():
             raise CorruptArtifactError(message="Missing FAISS metadata file")
-        if not self._records_path.exists():
+        legacy = self._records_path is not None and self._records_path.exists()
+        if not legacy and not self._log_path.exists():
             raise CorruptArtifactError(message="Missing FAISS records file")
         meta = json.loads(self._meta_path.read_text(encoding="utf-8"))
         self._validate_meta(meta)
         try:
-            self._index = faiss.read_index(str(self._index_path))
+            index = faiss.read_index(str(self._index_path))
         except Exception as exc:  # pragma: no cover - faiss error path
             raise CorruptArtifactError(message="FAISS index failed to load") from exc
-        self._dimension = int(self._index.d)
+        self._index = index
+        self._dimension = int(index.d)
         if meta.get("dimension") != self._dimension:
             raise CorruptArtifactError(message="FAISS index dimensionality mismatch")
         if meta.get("index_type") != self._index_type_name():
             raise CorruptArtifactError(message="FAISS index type mismatch")
-        records_payload = json.loads(self._records_path.read_text(encoding="utf-8"))
-        self._records = [
-            FaissRecord(
+        if legacy and not self._log_path.exists():
+            self._migrate_records_json(index)
+            return
+        if not isinstance(index, faiss.IndexIDMap2):
+            raise CorruptArtifactError(message="FAISS index is not id-mapped")
+        self._replay_log(int(meta.get("checkpoint_offset") or 0))
+
+    def _replay_log(self, checkpoint_offset: int) -> None:
+        if self._log_path is None or self._index is None:
+            return
+        self._records = {}
+        self._rows = {}
+        self._dead_frames = 0
+        self._uncheckpointed = 0
+        indexed = {int(row) for row in faiss.vector_to_array(self._index.id_map)}
+        tail_adds: dict[int, FaissRecord] = {}
+        for offset, op, payload in records_log.read_frames(self._log_path):
+            if offset >= checkpoint_offset:
+                self._uncheckpointed += 1
+            if op == records_log.OP_ADD:
+                row, vector_id, vector, metadata = records_log.decode_add(payload)
+                record = FaissRecord(vector_id, vector, metadata)
+                self._records[row] = record
+                self._rows[vector_id] = row
+                if row not in indexed:
+                    tail_adds[row] = record
+                continue
+            for row in records_log.decode_delete(payload):
+                removed = self._records.pop(row, None)
+                if removed is not None:
+                    self._rows.pop(removed.vector_id, None)
+                    tail_adds.pop(row, None)
+                    self._dead_frames += 1
+        if tail_adds:
+            self._add_to_index(
+                list(tail_adds), [rec.vector for rec in tail_adds.values()]
+            )
+        # Rows still in the index but deleted in the log; rows are never
+        # reused, so the next one follows everything the index has seen.
+        self._tombstones = (indexed | set(tail_adds)) - set(self._records)
+        self._next_row = max(indexed | set(self._records), default=-1) + 1
+        if self._index_kind == "exact" and self._tombstones:
+            self._index.remove_ids(np.asarray(sorted(self._tombstones), dtype="int64"))
+            self._tombstones = set()
+        if len(self._records) + len(self._tombstones) != int(self._index.ntotal):
+            raise CorruptArtifactError(message="FAISS index/record count mismatch")
+
+    def _migrate_records_json(self, index: Any) -> None:
+        # Stores written before the records log kept every record in one JSON
+        # file, labelled by position; rewrite them in the current layout.
+        if self._records_path is None:
+            return
+        payload = json.loads(self._records_path.read_text(encoding="utf-8"))
+        if len(payload) != int(index.ntotal):
+            raise CorruptArtifactError(message="FAISS index/record count mismatch")
+        self._records = {
+            row: FaissRecord(
                 vector_id=str(entry["vector_id"]),
                 vector=tuple(float(v) for v in entry["vector"]),
                 metadata={
@@ -265,56 +346,134 @@ class FaissVectorStoreAdapter(VectorStoreAdapter):
                     if v is not None
                 },
             )
-            for entry in records_payload
-        ]
-        if len(self._records) != int(self._index.ntotal):
-            raise CorruptArtifactError(message="FAISS index/record count mismatch")
+            for row, entry in enumerate(payload)
+        }
+        self._rows = {rec.vector_id: row for row, rec in self._records.items()}
+        self._next_row = len(self._records)
+        self._rebuild_index_from_records()
+        self._compact_log()
+        self._checkpoint()
+        self._records_path.unlink(missing_ok=True)
 
-    def _append_records(self, records: list[FaissRecord]) -> None:
-        self._records.extend(records)
+    def _insert_records(
+        self, records: list[FaissRecord], vectors_list: list[list[float]]
+    ) -> None:
+        rows = list(range(self._next_row, self._next_row + len(records)))
+        self._add_to_index(rows, vectors_list)
+        self._next_row += len(records)
+        for row, record in zip(rows, records, strict=True):
+            self._records[row] = record
+            self._rows[record.vector_id] = row
+        self._append_log(
+            records_log.encode_add(row, rec.vector_id, rec.vector, rec.metadata)
+            for row, rec in zip(rows, records, strict=True)
+        )
+        self._uncheckpointed += len(records)
+        self._maintain()
 
-    def _add_to_index(self, vectors_list: list[list[float]]) -> None:
+    def _add_to_index(
+        self, rows: list[int], vectors_list: Sequence[Sequence[float]]
+    ) -> None:
         if self._index is None:
             raise CorruptArtifactError(message="FAISS index missing during insert")
         array = np.asarray(vectors_list, dtype="float32")
-        self._index.add(array)
+        self._index.add_with_ids(array, np.asarray(rows, dtype="int64"))
+
+    def _drop_from_index(self, rows: list[int]) -> None:
+        if self._index is None:
+            return
+        if self._index_kind == "exact":
+            self._index.remove_ids(np.asarray(rows, dtype="int64"))
+            return
+        # HNSW cannot remove vectors; searches skip them until compaction.
+        self._tombstones.update(rows)
+        self._search_state = None
 
     def _delete_records(self, ids_set: set[str]) -> int:
         if not ids_set:
             return 0
-        remaining = [rec for rec in self._records if rec.vector_id not in ids_set]
-        removed = len(self._records) - len(remaining)
-        if removed == 0:
+        rows = [self._rows.pop(vid) for vid in ids_set if vid in self._rows]
+        if not rows:
             return 0
-        self._records = remaining
-        self._rebuild_index_from_records()
-        self._persist()
-        return removed
+        for row in rows:
+            del self._records[row]
+        if not self._records:
+            self._reset_store()
+            return len(rows)
+        self._drop_from_index(rows)
+        self._append_log([records_log.encode_delete(rows)])
+        self._dead_frames += len(rows)
+        self._uncheckpointed += 1
+        self._maintain()
+        return len(rows)
 
     def _rebuild(self, *, index_type: str | None = None) -> dict[str, object]:
         if index_type:
             self._index_kind = self._resolve_index_kind(index_type)
         self._rebuild_index_from_records()
-        self._persist()
+        if self._records:
+            self._compact_log()
+            self._checkpoint()
+        else:
+            self._reset_store()
         return self.status()
 
     def _rebuild_index_from_records(self) -> None:
+        self._tombstones = set()
+        self._search_state = None
         if not self._records:
             self._index = None
             self._dimension = None
             return
-        vectors = [list(rec.vector) for rec in self._records]
+        vectors = [list(rec.vector) for rec in self._records.values()]
         self._dimension = len(vectors[0])
         self._index = self._build_index(self._dimension, self._index_kind)
-        self._index.add(np.asarray(vectors, dtype="float32"))
+        self._add_to_index(list(self._records), vectors)
 
-    def _persist(self) -> None:
-        if not self._index_path or not self._meta_path or not self._records_path:
+    def _maintain(self) -> None:
+        """Compact or checkpoint once enough work has piled up since the last one."""
+        if self._index_path is None:
             return
-        if not self._records or self._index is None:
-            for path in (self._index_path, self._meta_path, self._records_path):
-                if path.exists():
-                    path.unlink(missing_ok=True)
+        live = len(self._records)
+        if self._tombstones and len(self._tombstones) > max(
+            _MIN_COMPACT_ROWS, live // 4
+        ):
+            self._rebuild_index_from_records()
+            self._compact_log()
+            self._checkpoint()
+            return
+        if self._dead_frames > max(_MIN_COMPACT_ROWS, live):
+            self._compact_log()
+            self._checkpoint()
+            return
+        if not self._index_path.exists() or self._uncheckpointed > max(
+            _MIN_CHECKPOINT_OPS, live // 4
+        ):
+            self._checkpoint()
+
+    def _append_log(self, frames: Iterable[bytes]) -> None:
+        if self._log_path is None:
+            return
+        self._log_path.parent.mkdir(parents=True, exist_ok=True)
+        records_log.append_frames(self._log_path, frames)
+
+    def _compact_log(self) -> None:
+        if self._log_path is None:
+            return
+        self._log_path.parent.mkdir(parents=True, exist_ok=True)
+        records_log.write_log(
+            self._log_path,
+            (
+                records_log.encode_add(row, rec.vector_id, rec.vector, rec.metadata)
+                for row, rec in self._records.items()
+            ),
+        )
+        self._dead_frames = 0
+
+    def _checkpoint(self) -> None:
+        if not self._index_path or not self._meta_path or not self._log_path:
+            return
+        if self._index is None:
             return
         self._index_path.parent.mkdir(parents=True, exist_ok=True)
         meta = {
@@ -324,15 +483,10 @@ class FaissVectorStoreAdapter(VectorStoreAdapter):
             "dimension": self._dimension,
             "index_type": self._index_type_name(),
             "index_kind": self._index_kind,
+            "checkpoint_offset": (
+                self._log_path.stat().st_size if self._log_path.exists() else 0
+            ),
         }
-        records_payload = [
-            {
-                "vector_id": rec.vector_id,
-                "vector": list(rec.vector),
-                "metadata": rec.metadata,
-            }
-            for rec in self._records
-        ]
         with tempfile.NamedTemporaryFile(
             mode="wb", delete=False, dir=self._index_path.parent
         ) as tmp_index:
@@ -342,38 +496,71 @@ class FaissVectorStoreAdapter(VectorStoreAdapter):
         ) as tmp_meta:
             tmp_meta_path = Path(tmp_meta.name)
             tmp_meta.write(json.dumps(meta, indent=2))
-        with tempfile.NamedTemporaryFile(
-            mode="w", delete=False, dir=self._index_path.parent, encoding="utf-8"
-        ) as tmp_records:
-            tmp_records_path = Path(tmp_records.name)
-            tmp_records.write(json.dumps(records_payload, indent=2))
         try:
             faiss.write_index(self._index, str(tmp_index_path))
             tmp_index_path.replace(self._index_path)
             tmp_meta_path.replace(self._meta_path)
-            tmp_records_path.replace(self._records_path)
         finally:
-            for path in (tmp_index_path, tmp_meta_path, tmp_records_path):
+            for path in (tmp_index_path, tmp_meta_path):
                 if path.exists():
                     path.unlink(missing_ok=True)
+        self._uncheckpointed = 0
+
+    def _reset_store(self) -> None:
+        self._records = {}
+        self._rows = {}
+        self._index = None
+        self._dimension = None
+        self._tombstones = set()
+        self._search_state = None
+        self._uncheckpointed = 0
+        self._dead_frames = 0
+        for path in (
+            self._index_path,
+            self._meta_path,
+            self._log_path,
+            self._records_path,
+        ):
+            if path is not None and path.exists():
+                path.unlink(missing_ok=True)
+
+    def _search_params(self) -> Any | None:
+        if not self._tombstones:
+            return None
+        if self._search_state is None:
+            excluded = faiss.IDSelectorBatch(
+                np.asarray(sorted(self._tombstones), dtype="int64")
+            )
+            selector = faiss.IDSelectorNot(excluded)
+            # Only HNSW keeps tombstones; flat indices remove rows outright.
+            params = faiss.SearchParametersHNSW(sel=selector)  # type: ignore[attr-defined]
+            # Search parameters do not own their selectors; keep all alive.
+            self._search_state = (excluded, selector, params)
+        return self._search_state[2]
 
     def _ensure_index(self, dimension: int) -> None:
         if self._index is not None:
             return
-        if self._records_path and self._records_path.exists():
+        if (self._log_path and self._log_path.exists()) or (
+            self._records_path and self._records_path.exists()
+        ):
             self._load_state()
-            return
+            if self._index is not None:
+                return
         self._dimension = dimension
         self._index = self._build_index(dimension, self._index_kind)
 
     def _build_index(self, dimension: int, index_kind: str) -> Any:
         if index_kind == "ann":
-            return faiss.IndexHNSWFlat(dimension, 32)
-        return faiss.IndexFlatL2(dimension)
+            return faiss.IndexIDMap2(faiss.IndexHNSWFlat(dimension, 32))
+        return faiss.IndexIDMap2(faiss.IndexFlatL2(dimension))
 
     def _index_type_name(self) -> str:
         if self._index is None:
             return EXACT_INDEX_TYPE if self._index_kind == "exact" else ANN_INDEX_TYPE
+        inner = getattr(self._index, "index", None)
+        if isinstance(self._index, faiss.IndexIDMap2) and inner is not None:
+            return type(faiss.downcast_index(inner)).__name__
         return type(self._index).__name__
 
     def _resolve_index_kind(self, raw: str | None) -> str:
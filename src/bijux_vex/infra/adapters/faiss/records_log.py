@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+import json
+from pathlib import Path
+import struct
+
+from bijux_vex.core.errors import CorruptArtifactError
+
+# Append-only log of FAISS records. After the magic, every frame is
+# ``op:1 length:uint32 payload``; integers are little-endian.
+#   add:    row:int64 dim:uint32 float32[dim] id_len:uint32 id meta_len:uint32 meta
+#   delete: count:uint32 int64[count]
+LOG_MAGIC = b"BVXFLOG1"
+OP_ADD = b"A"
+OP_DELETE = b"D"
+_FRAME = struct.Struct("<cI")
+_ROW_DIM = struct.Struct("<qI")
+_LEN = struct.Struct("<I")
+
+
+def encode_add(
+    row: int,
+    vector_id: str,
+    vector: Sequence[float],
+    metadata: Mapping[str, str],
+) -> bytes:
+    encoded_id = vector_id.encode("utf-8")
+    encoded_meta = json.dumps(dict(metadata), sort_keys=True).encode("utf-8")
+    payload = b"".join(
+        (
+            _ROW_DIM.pack(row, len(vector)),
+            struct.pack(f"<{len(vector)}f", *vector),
+            _LEN.pack(len(encoded_id)),
+            encoded_id,
+            _LEN.pack(len(encoded_meta)),
+            encoded_meta,
+        )
+    )
+    return _FRAME.pack(OP_ADD, len(payload)) + payload
+
+
+def encode_delete(rows: Sequence[int]) -> bytes:
+    payload = _LEN.pack(len(rows)) + struct.pack(f"<{len(rows)}q", *rows)
+    return _FRAME.pack(OP_DELETE, len(payload)) + payload
+
+
+def decode_add(
+    payload: bytes,
+) -> tuple[int, str, tuple[float, ...], dict[str, str]]:
+    row, dim = _ROW_DIM.unpack_from(payload, 0)
+    offset = _ROW_DIM.size
+    vector = struct.unpack_from(f"<{dim}f", payload, offset)
+    offset += 4 * dim
+    (id_len,) = _LEN.unpack_from(payload, offset)
+    offset += _LEN.size
+    vector_id = payload[offset : offset + id_len].decode("utf-8")
+    offset += id_len
+    (meta_len,) = _LEN.unpack_from(payload, offset)
+    offset += _LEN.size
+    metadata = json.loads(payload[offset : offset + meta_len].decode("utf-8"))
+    return row, vector_id, tuple(vector), metadata
+
+
+def decode_delete(payload: bytes) -> tuple[int, ...]:
+    (count,) = _LEN.unpack_from(payload, 0)
+    return struct.unpack_from(f"<{count}q", payload, _LEN.size)
+
+
+def append_frames(path: Path, frames: Iterable[bytes]) -> int:
+    """Append frames, creating the log if needed; returns the new log size."""
+    with path.open("ab") as handle:
+        if handle.tell() == 0:
+            handle.write(LOG_MAGIC)
+        handle.write(b"".join(frames))
+        return handle.tell()
+
+
+def write_log(path: Path, frames: Iterable[bytes]) -> int:
+    """Write a fresh log holding only ``frames``; returns its size."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(LOG_MAGIC)
+        for frame in frames:
+            handle.write(frame)
+        size = handle.tell()
+    tmp_path.replace(path)
+    return size
+
+
+def read_frames(path: Path) -> Iterator[tuple[int, bytes, bytes]]:
+    """Yield ``(frame_offset, op, payload)`` for every frame of the log."""
+    data = path.read_bytes()
+    if not data.startswith(LOG_MAGIC):
+        raise CorruptArtifactError(message="FAISS records log has an unknown format")
+    offset = len(LOG_MAGIC)
+    while offset < len(data):
+        if offset + _FRAME.size > len(data):
+            raise CorruptArtifactError(message="FAISS records log truncated")
+        op, length = _FRAME.unpack_from(data, offset)
+        end = offset + _FRAME.size + length
+        if end > len(data) or op not in (OP_ADD, OP_DELETE):
+            raise CorruptArtifactError(message="FAISS records log truncated")
+        yield offset, op, data[offset + _FRAME.size : end]
+        offset = end
+
+
+__all__ = [
+    "LOG_MAGIC",
+    "OP_ADD",
+    "OP_DELETE",
+    "append_frames",
+    "decode_add",
+    "decode_delete",
+    "encode_add",
+    "encode_delete",
+    "read_frames",
+    "write_log",
+]
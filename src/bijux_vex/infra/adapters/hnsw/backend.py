@@ -23,6 +23,7 @@ class HnswFixture(NamedTuple):
     name: str
     ann: AnnExecutionRequestRunner
     diagnostics: dict[str, Callable[[], object]] | None = None
+    close: Callable[[], None] | None = None
 
 
 def hnsw_backend(
@@ -73,6 +74,7 @@ def hnsw_backend(
         name="hnsw",
         ann=runner,
         diagnostics=diagnostics,
+        close=base.close,
     )
 
 
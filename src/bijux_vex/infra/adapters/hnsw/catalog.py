@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+import threading
+from typing import Any
+
+from bijux_vex.infra.adapters.hnsw.id_table import IdTable
+
+_MB = 1024 * 1024
+
+
+def estimate_index_bytes(count: int, dimension: int, m: int) -> int:
+    """Rough hnswlib footprint: float32 data, level-0 links, labels, upper levels."""
+    per_element = dimension * 4 + (2 * m + 1) * 4 + 8
+    return int(count * per_element * 1.1)
+
+
+@dataclass
+class CatalogEntry:
+    index: Any
+    ids: list[str] | IdTable
+    info: dict[str, object]
+    size_bytes: int
+    dirty: bool = False
+    # Labels added or tombstoned since the entry was last written to disk.
+    unpersisted: int = 0
+    deleted: set[int] = field(default_factory=set)
+    query_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _labels: dict[str, int] = field(default_factory=dict, repr=False)
+    _labelled: int = field(default=0, repr=False)
+
+    @property
+    def live_count(self) -> int:
+        return len(self.ids) - len(self.deleted)
+
+    def label_of(self, vector_id: str) -> int | None:
+        """Newest label of ``vector_id``, tombstoned or not; None when absent."""
+        if isinstance(self.ids, IdTable):
+            return self.ids.label_of(vector_id)
+        # In-memory ids: extend the reverse map with labels added since the
+        # last lookup instead of rebuilding it.
+        if self._labelled != len(self.ids):
+            for label in range(self._labelled, len(self.ids)):
+                self._labels[self.ids[label]] = label
+            self._labelled = len(self.ids)
+        return self._labels.get(vector_id)
+
+    def labels_for(self, vector_ids: Iterable[str]) -> frozenset[int]:
+        """Live labels of the given ids; ids re-added by a delta map to their newest label."""
+        found = (self.label_of(vector_id) for vector_id in vector_ids)
+        return frozenset(
+            label for label in found if label is not None and label not in self.deleted
+        )
+
+
+class HnswIndexCatalog:
+    """
+    Resident HNSW indices keyed by artifact_id with LRU eviction.
+
+    ``max_resident_mb`` bounds the estimated footprint of resident indices;
+    the most recently used entry is never evicted, even when it alone
+    exceeds the ceiling. ``on_evict`` lets the owner persist dirty entries;
+    ``dirty_entries`` lists resident ones to flush.
+    """
+
+    def __init__(
+        self,
+        max_resident_mb: float | None = None,
+        on_evict: Callable[[str, CatalogEntry], None] | None = None,
+    ) -> None:
+        self.max_resident_mb = max_resident_mb
+        self._on_evict = on_evict
+        self._entries: OrderedDict[str, CatalogEntry] = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.loads = 0
+        self.builds = 0
+
+    def __contains__(self, artifact_id: object) -> bool:
+        with self._lock:
+            return artifact_id in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, artifact_id: str) -> CatalogEntry | None:
+        with self._lock:
+            entry = self._entries.get(artifact_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(artifact_id)
+            return entry
+
+    def peek(self, artifact_id: str) -> CatalogEntry | None:
+        with self._lock:
+            return self._entries.get(artifact_id)
+
+    def put(
+        self, artifact_id: str, entry: CatalogEntry, *, source: str = "build"
+    ) -> None:
+        with self._lock:
+            if source == "load":
+                self.loads += 1
+            else:
+                self.builds += 1
+            self._entries[artifact_id] = entry
+            self._entries.move_to_end(artifact_id)
+            self._enforce_ceiling()
+
+    def discard(self, artifact_id: str) -> CatalogEntry | None:
+        with self._lock:
+            return self._entries.pop(artifact_id, None)
+
+    def dirty_entries(self) -> list[tuple[str, CatalogEntry]]:
+        with self._lock:
+            return [(key, entry) for key, entry in self._entries.items() if entry.dirty]
+
+    def resident_bytes(self) -> int:
+        with self._lock:
+            return sum(entry.size_bytes for entry in self._entries.values())
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "resident": list(self._entries.keys()),
+                "resident_mb": round(self.resident_bytes() / _MB, 3),
+                "max_resident_mb": self.max_resident_mb,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "loads": self.loads,
+                "builds": self.builds,
+            }
+
+    def _enforce_ceiling(self) -> None:
+        if self.max_resident_mb is None:
+            return
+        ceiling = float(self.max_resident_mb) * _MB
+        while len(self._entries) > 1 and self.resident_bytes() > ceiling:
+            victim_id, victim = self._entries.popitem(last=False)
+            self.evictions += 1
+            if self._on_evict is not None:
+                self._on_evict(victim_id, victim)
+
+
+__all__ = ["CatalogEntry", "HnswIndexCatalog", "estimate_index_bytes"]
@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+import threading
+from typing import Any
+
+from bijux_vex.infra.adapters.hnsw.catalog import CatalogEntry
+
+
+@dataclass
+class _PendingSearch:
+    queries: Sequence[Sequence[float]]
+    k: int
+    done: threading.Event = field(default_factory=threading.Event)
+    labels: Any = None
+    distances: Any = None
+    error: BaseException | None = None
+    lead: list[_PendingSearch] | None = None
+
+
+class KnnCoalescer:
+    """
+    Merge concurrent knn_query calls on one index into multi-row searches.
+
+    Searches are grouped by index, ``ef``, seed and, when ``k`` exceeds
+    ``ef``, by ``k`` (hnswlib searches with ``max(ef, k)``), so every row
+    gets the same results it would get alone. The first caller of a group
+    leads: it sets ``ef`` under the entry's query lock and answers everyone
+    queued behind it with one ``knn_query`` using ``num_threads``. hnswlib
+    drops the GIL while searching, so callers arriving meanwhile form the
+    next batch, which the leader hands to one of them to run.
+    """
+
+    def __init__(self, num_threads: int = -1, max_batch: int = 1024) -> None:
+        self.num_threads = num_threads
+        self.max_batch = max_batch
+        self._lock = threading.Lock()
+        self._queues: dict[tuple[int, int, int | None, int], list[_PendingSearch]] = {}
+        self.batches = 0
+        self.coalesced = 0
+
+    def search(
+        self,
+        entry: CatalogEntry,
+        queries: Sequence[Sequence[float]],
+        k: int,
+        ef: int,
+        seed: int | None = None,
+    ) -> tuple[Any, Any]:
+        key = (id(entry), ef, seed, k if k > ef else 0)
+        pending = _PendingSearch(queries, k)
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue is None:
+                self._queues[key] = []
+            else:
+                queue.append(pending)
+        if queue is None:
+            self._lead(key, entry, [pending], ef, seed)
+        else:
+            pending.done.wait()
+            if pending.lead is not None:
+                batch, pending.lead = pending.lead, None
+                pending.done.clear()
+                self._lead(key, entry, batch, ef, seed)
+        if pending.error is not None:
+            raise pending.error
+        return pending.labels, pending.distances
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            return {"query_batches": self.batches, "coalesced_queries": self.coalesced}
+
+    def _lead(
+        self,
+        key: tuple[int, int, int | None, int],
+        entry: CatalogEntry,
+        batch: list[_PendingSearch],
+        ef: int,
+        seed: int | None,
+    ) -> None:
+        rows = [query for pending in batch for query in pending.queries]
+        try:
+            with entry.query_lock:
+                if seed is not None and hasattr(entry.index, "set_seed"):
+                    entry.index.set_seed(int(seed))
+                entry.index.set_ef(int(ef))
+                labels, distances = entry.index.knn_query(
+                    rows,
+                    k=max(pending.k for pending in batch),
+                    num_threads=self.num_threads,
+                )
+            offset = 0
+            for pending in batch:
+                end = offset + len(pending.queries)
+                pending.labels = labels[offset:end]
+                pending.distances = distances[offset:end]
+                offset = end
+        except Exception as exc:
+            for pending in batch:
+                pending.error = exc
+        with self._lock:
+            self.batches += 1
+            if len(batch) > 1:
+                self.coalesced += len(batch)
+            queue = self._queues[key]
+            handoff = queue[: self.max_batch]
+            del queue[: self.max_batch]
+            if not handoff:
+                del self._queues[key]
+        for pending in batch:
+            pending.done.set()
+        if handoff:
+            handoff[0].lead = handoff
+            handoff[0].done.set()
+
+
+__all__ = ["KnnCoalescer"]
@@ -0,0 +1,162 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+import mmap
+from pathlib import Path
+import struct
+import sys
+
+from bijux_vex.core.errors import CorruptArtifactError
+
+# Layout: header, uint64 offsets[count + 1], uint64 deleted[deleted_count],
+# uint64 order[count], then the UTF-8 ids back to back. ``order`` lists the
+# labels sorted by (id bytes, label) so lookups binary-search it. Version 1
+# files have no order section. Integers are little-endian.
+_MAGIC = b"BVXIDS02"
+_MAGIC_V1 = b"BVXIDS01"
+_HEADER = struct.Struct("<8sQQ")
+
+
+def _little_endian(values: array[int]) -> bytes:
+    if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+        values = array("Q", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def write_id_table(path: Path, ids: Iterable[str], deleted: Iterable[int]) -> None:
+    """Write the label -> vector_id table of an index to ``path``."""
+    encoded = [vector_id.encode("utf-8") for vector_id in ids]
+    offsets = array("Q", [0])
+    total = 0
+    for item in encoded:
+        total += len(item)
+        offsets.append(total)
+    tombstones = array("Q", sorted(deleted))
+    order = array("Q", sorted(range(len(encoded)), key=lambda label: encoded[label]))
+    with path.open("wb") as handle:
+        handle.write(_HEADER.pack(_MAGIC, len(encoded), len(tombstones)))
+        handle.write(_little_endian(offsets))
+        handle.write(_little_endian(tombstones))
+        handle.write(_little_endian(order))
+        handle.write(b"".join(encoded))
+
+
+class IdTable:
+    """
+    Label -> vector_id lookup over a binary id table.
+
+    Ids are decoded on access, so opening a table costs one header read
+    whatever its size. With ``use_mmap`` the file is mapped read-only and
+    processes serving the same index share its pages. ``label_of`` binary
+    searches the file's sorted order section, touching O(log n) ids. Labels
+    appended by incremental updates live in memory until the table is
+    rewritten.
+    """
+
+    def __init__(
+        self,
+        buffer: bytes | mmap.mmap,
+        count: int,
+        offsets: Sequence[int],
+        base: int,
+        order: Sequence[int] | None = None,
+    ) -> None:
+        self._buffer = buffer
+        self._count = count
+        self._offsets = offsets
+        self._base = base
+        self._order = order
+        self._appended: list[str] = []
+        self._appended_labels: dict[str, int] = {}
+        self._v1_labels: dict[str, int] | None = None
+
+    @classmethod
+    def open(cls, path: Path, *, use_mmap: bool = True) -> tuple[IdTable, set[int]]:
+        """Open ``path``; returns the table and its tombstoned labels."""
+        try:
+            with path.open("rb") as handle:
+                buffer: bytes | mmap.mmap
+                if use_mmap and path.stat().st_size:
+                    buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    buffer = handle.read()
+            magic, count, deleted_count = _HEADER.unpack_from(buffer, 0)
+        except (OSError, ValueError, struct.error) as exc:
+            raise CorruptArtifactError(message="HNSW id table unreadable") from exc
+        if magic not in {_MAGIC, _MAGIC_V1}:
+            raise CorruptArtifactError(message="HNSW id table has an unknown format")
+        offsets_end = _HEADER.size + 8 * (count + 1)
+        deleted_end = offsets_end + 8 * deleted_count
+        base = deleted_end + (8 * count if magic == _MAGIC else 0)
+        if len(buffer) < base:
+            raise CorruptArtifactError(message="HNSW id table truncated")
+        view = memoryview(buffer)
+        offsets: Sequence[int] = view[_HEADER.size : offsets_end].cast("Q")
+        order: Sequence[int] | None = None
+        if magic == _MAGIC:
+            order = view[deleted_end:base].cast("Q")
+        deleted = array("Q", buffer[offsets_end:deleted_end])
+        if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+            offsets = array("Q", offsets)
+            offsets.byteswap()
+            deleted.byteswap()
+            if order is not None:
+                order = array("Q", order)
+                order.byteswap()
+        if len(buffer) != base + offsets[count]:
+            raise CorruptArtifactError(message="HNSW id table truncated")
+        return cls(buffer, count, offsets, base, order), set(deleted)
+
+    def __len__(self) -> int:
+        return self._count + len(self._appended)
+
+    def __getitem__(self, label: int) -> str:
+        if 0 <= label < self._count:
+            return self._raw(label).decode("utf-8")
+        if self._count <= label < len(self):
+            return self._appended[label - self._count]
+        raise IndexError(label)
+
+    def __iter__(self) -> Iterator[str]:
+        return (self[label] for label in range(len(self)))
+
+    def extend(self, vector_ids: Iterable[str]) -> None:
+        for vector_id in vector_ids:
+            self._appended_labels[vector_id] = len(self)
+            self._appended.append(vector_id)
+
+    def label_of(self, vector_id: str) -> int | None:
+        """Newest label of ``vector_id``, tombstoned or not; None when absent."""
+        label = self._appended_labels.get(vector_id)
+        if label is not None:
+            return label
+        order = self._order
+        if order is None:
+            if self._v1_labels is None:
+                self._v1_labels = {self[label]: label for label in range(self._count)}
+            return self._v1_labels.get(vector_id)
+        key = vector_id.encode("utf-8")
+        # Rightmost entry whose id sorts at or before ``key``; equal ids are
+        # ordered by label, so that entry is the newest label of the id.
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._raw(order[mid]) <= key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo and self._raw(order[lo - 1]) == key:
+            return int(order[lo - 1])
+        return None
+
+    def _raw(self, label: int) -> bytes:
+        start = self._base + self._offsets[label]
+        end = self._base + self._offsets[label + 1]
+        return self._buffer[start:end]
+
+
+__all__ = ["IdTable", "write_id_table"]
@@ -15,6 +15,12 @@ def resolve_space(metric: str, override: str | None) -> str:
     return "l2"
 
 
+def resolve_threads(override: int | None, configured: int) -> int:
+    """Threads for hnswlib inserts; -1 lets the library use every core."""
+    threads = override if override is not None else configured
+    return threads if threads > 0 else -1
+
+
 def as_int(value: object, default: int) -> int:
     if isinstance(value, bool):
         return default
@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+"""
+Seeded Lloyd k-means shared by the inverted-file ANN runners.
+
+Everything is driven by the caller's ``numpy.random.Generator`` so the
+same seed and input always train the same centroids. Assignment uses the
+expanded ``|c|^2 / 2 - x.c`` form, computed in row blocks to keep the
+(rows, centroids) matrix bounded.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from bijux_vex.infra.optional_deps import np
+
+# Upper bound on (rows x centroids) distance cells computed at once.
+_BLOCK_CELLS = 1 << 22
+DEFAULT_ITERATIONS = 20
+
+
+def assign(data: Any, centroids: Any) -> Any:
+    """Index of the nearest centroid for every row of ``data``."""
+    labels: Any = np.empty(len(data), dtype=np.int64)
+    # |x|^2 is the same for every centroid, so it cannot change the argmin.
+    half_norms = 0.5 * np.einsum("ij,ij->i", centroids, centroids)
+    block = max(1, _BLOCK_CELLS // max(1, len(centroids)))
+    for start in range(0, len(data), block):
+        scores = data[start : start + block] @ centroids.T
+        np.subtract(half_norms, scores, out=scores)
+        labels[start : start + block] = np.argmin(scores, axis=1)
+    return labels
+
+
+def train_kmeans(
+    data: Any,
+    k: int,
+    rng: Any,
+    iterations: int = DEFAULT_ITERATIONS,
+) -> Any:
+    """
+    ``k`` centroids for ``data`` (float64, one row per point).
+
+    Initial centroids are distinct rows drawn from ``rng``; a centroid that
+    loses all its points is re-seeded from a random row so every list can
+    be populated.
+    """
+    if np is None:
+        raise RuntimeError("numpy is required for k-means training")
+    rows = len(data)
+    k = max(1, min(int(k), rows))
+    centroids = np.array(
+        data[rng.choice(rows, size=k, replace=False)], dtype=np.float64
+    )
+    for _ in range(max(1, iterations)):
+        labels = assign(data, centroids)
+        counts = np.bincount(labels, minlength=k)
+        filled = counts > 0
+        order = np.argsort(labels, kind="stable")
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[filled]
+        updated = centroids.copy()
+        updated[filled] = (
+            np.add.reduceat(data[order], starts, axis=0) / counts[filled, None]
+        )
+        empty = np.flatnonzero(~filled)
+        if len(empty):
+            updated[empty] = data[rng.choice(rows, size=len(empty), replace=False)]
+        if np.array_equal(updated, centroids):
+            break
+        centroids = updated
+    return centroids
+
+
+__all__ = ["DEFAULT_ITERATIONS", "assign", "train_kmeans"]
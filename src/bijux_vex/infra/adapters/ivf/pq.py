@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+"""
+Product quantizer: ``m`` sub-vector codebooks of up to 256 centroids each.
+
+A vector is split into ``m`` contiguous sub-vectors of ``dimension // m``
+components and each is replaced by the index of its nearest codebook
+entry, so a code is ``m`` bytes. Queries are never quantized: asymmetric
+distance computation builds one (m, ksub) table per query (or per query
+residual) and a code's distance is the sum of ``m`` table lookups.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from bijux_vex.core.errors import ValidationError
+from bijux_vex.infra.adapters.ivf.kmeans import (
+    DEFAULT_ITERATIONS,
+    assign,
+    train_kmeans,
+)
+from bijux_vex.infra.optional_deps import np
+
+MAX_BITS = 8
+
+
+def default_subquantizers(dimension: int) -> int:
+    """Largest divisor of ``dimension`` giving sub-vectors of at least 4 components."""
+    target = max(1, dimension // 4)
+    return max(m for m in range(1, target + 1) if dimension % m == 0)
+
+
+@dataclass(frozen=True)
+class ProductQuantizer:
+    codebooks: Any  # (m, ksub, dsub)
+
+    @property
+    def m(self) -> int:
+        return int(self.codebooks.shape[0])
+
+    @property
+    def ksub(self) -> int:
+        return int(self.codebooks.shape[1])
+
+    @property
+    def dsub(self) -> int:
+        return int(self.codebooks.shape[2])
+
+    @classmethod
+    def train(
+        cls,
+        data: Any,
+        m: int,
+        nbits: int,
+        rng: Any,
+        iterations: int = DEFAULT_ITERATIONS,
+    ) -> ProductQuantizer:
+        rows, dimension = data.shape
+        if m <= 0 or dimension % m:
+            raise ValidationError(
+                message=f"PQ subquantizers ({m}) must divide the dimension ({dimension})"
+            )
+        if not 1 <= nbits <= MAX_BITS:
+            raise ValidationError(message=f"PQ nbits must be in 1..{MAX_BITS}")
+        dsub = dimension // m
+        ksub = min(1 << nbits, rows)
+        codebooks = np.zeros((m, ksub, dsub), dtype=np.float64)
+        for sub in range(m):
+            part = np.ascontiguousarray(data[:, sub * dsub : (sub + 1) * dsub])
+            codebooks[sub] = train_kmeans(part, ksub, rng, iterations)
+        return cls(codebooks=codebooks)
+
+    def encode(self, data: Any) -> Any:
+        codes: Any = np.empty((len(data), self.m), dtype=np.uint8)
+        for sub in range(self.m):
+            part = data[:, sub * self.dsub : (sub + 1) * self.dsub]
+            codes[:, sub] = assign(np.ascontiguousarray(part), self.codebooks[sub])
+        return codes
+
+    def decode(self, codes: Any) -> Any:
+        parts = [self.codebooks[sub][codes[:, sub]] for sub in range(self.m)]
+        return np.concatenate(parts, axis=1)
+
+    def distance_table(self, query: Any) -> Any:
+        """(m, ksub) squared l2 distances from each query sub-vector."""
+        sub_queries = query.reshape(self.m, 1, self.dsub)
+        diff = self.codebooks - sub_queries
+        return np.einsum("mkd,mkd->mk", diff, diff)
+
+    def inner_table(self, query: Any) -> Any:
+        """(m, ksub) inner products with each query sub-vector."""
+        return np.einsum("mkd,md->mk", self.codebooks, query.reshape(self.m, self.dsub))
+
+    def lookup(self, table: Any, codes: Any) -> Any:
+        """Sum of table entries selected by ``codes``, one value per code row."""
+        if not len(codes):
+            return np.zeros(0, dtype=np.float64)
+        return table[np.arange(self.m), codes].sum(axis=1)
+
+
+__all__ = ["MAX_BITS", "ProductQuantizer", "default_subquantizers"]
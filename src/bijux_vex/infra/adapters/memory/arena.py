@@ -0,0 +1,310 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+"""Columnar vector arena backing the in-memory vector source."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable, Iterator
+import heapq
+import threading
+from typing import Any
+
+from bijux_vex.core.types import Vector
+from bijux_vex.domain.execution_algorithms.exact_matrix import (
+    VectorMatrix,
+    build_vector_matrix,
+    max_abs,
+)
+from bijux_vex.infra.optional_deps import np
+from bijux_vex.infra.vector_codec import (
+    DEFAULT_VECTOR_DTYPE,
+    NUMPY_DTYPES,
+    VECTOR_DTYPES,
+    resolve_dtype,
+)
+
+_INITIAL_CAPACITY = 64
+# Compact once tombstones outnumber live rows (and there are enough to matter).
+_COMPACT_MIN_TOMBSTONES = 256
+
+
+class _DimensionBlock:
+    """Rows of a single dimension; written rows are never mutated in place."""
+
+    def __init__(self, dimension: int, dtype: str) -> None:
+        self.dimension = dimension
+        self.dtype = dtype
+        self.size = 0
+        self.live = 0
+        self.row_ids: list[str | None] = []
+        self.chunk_ids: list[str] = []
+        self.models: list[str | None] = []
+        self.metadata: list[tuple[tuple[str, str], ...] | None] = []
+        self.max_abs = 0.0
+        self._view: VectorMatrix | None = None
+        if np is not None:
+            self.values: Any = np.empty(
+                (_INITIAL_CAPACITY, dimension), dtype=NUMPY_DTYPES[dtype]
+            )
+            self.norms: Any = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        else:
+            self.values = array(VECTOR_DTYPES[dtype])
+            self.norms = None
+
+    def append(self, vector: Vector) -> int:
+        row = self.size
+        if np is not None:
+            if row == len(self.values):
+                capacity = max(_INITIAL_CAPACITY, 2 * len(self.values))
+                grown = np.empty((capacity, self.dimension), dtype=self.values.dtype)
+                grown[:row] = self.values[:row]
+                norms: Any = np.empty(capacity, dtype=np.float64)
+                norms[:row] = self.norms[:row]
+                self.values, self.norms = grown, norms
+            self.values[row] = vector.values
+            stored = self.values[row].astype(np.float64)
+            self.norms[row] = float(np.sqrt(stored @ stored))
+            row_max = max_abs(stored)
+            # NaN is sticky so matrix scans refuse and fall back to scoring.
+            if row_max != row_max or row_max > self.max_abs:
+                self.max_abs = row_max
+        else:
+            self.values.extend(vector.values)
+        self.row_ids.append(vector.vector_id)
+        self.chunk_ids.append(vector.chunk_id)
+        self.models.append(vector.model)
+        self.metadata.append(vector.metadata)  # type: ignore[arg-type]
+        self.size += 1
+        self.live += 1
+        self._view = None
+        return row
+
+    def tombstone(self, row: int) -> None:
+        self.row_ids[row] = None
+        self.live -= 1
+        self._view = None
+
+    def row_values(self, row: int) -> tuple[float, ...]:
+        if np is not None:
+            return tuple(self.values[row].tolist())
+        start = row * self.dimension
+        return tuple(self.values[start : start + self.dimension])
+
+    def vector(self, row: int) -> Vector:
+        vector_id = self.row_ids[row]
+        if vector_id is None:
+            raise KeyError(row)
+        return Vector(
+            vector_id=vector_id,
+            chunk_id=self.chunk_ids[row],
+            values=self.row_values(row),
+            dimension=self.dimension,
+            model=self.models[row],
+            metadata=self.metadata[row],
+        )
+
+    def live_rows(self) -> Iterator[int]:
+        return (row for row, vid in enumerate(self.row_ids) if vid is not None)
+
+    def view(self) -> VectorMatrix | None:
+        if np is None:
+            return None
+        if self._view is None:
+            live_rows = None
+            if self.live != self.size:
+                live_rows = np.fromiter(self.live_rows(), dtype=np.int64)
+            self._view = VectorMatrix(
+                vector_ids=tuple(vid or "" for vid in self.row_ids),
+                chunk_ids=tuple(self.chunk_ids),
+                matrix=self.values[: self.size],
+                norms=self.norms[: self.size],
+                dimension=self.dimension,
+                live_rows=live_rows,
+                max_abs=self.max_abs,
+            )
+        return self._view
+
+    def compacted(self) -> tuple[_DimensionBlock, dict[str, int]]:
+        fresh = _DimensionBlock(self.dimension, self.dtype)
+        rows: dict[str, int] = {}
+        for row in self.live_rows():
+            vector = self.vector(row)
+            rows[vector.vector_id] = fresh.append(vector)
+        return fresh, rows
+
+
+class VectorArena:
+    """
+    Columnar vector storage: one growable matrix per dimension.
+
+    Deletes and overwrites leave tombstones that are compacted lazily; the
+    vector_id ordering is maintained incrementally instead of re-sorting.
+    ``apply`` and every reader hold ``lock``, so readers never see a write
+    half applied. Matrix views stay valid after the lock is released:
+    written rows are never mutated and growth or compaction allocates anew.
+    """
+
+    def __init__(
+        self,
+        dtype: str = DEFAULT_VECTOR_DTYPE,
+        lock: threading.RLock | None = None,
+    ) -> None:
+        self.dtype = resolve_dtype(dtype)
+        self._lock = lock or threading.RLock()
+        self._blocks: dict[int, _DimensionBlock] = {}
+        self._rows: dict[str, tuple[int, int]] = {}
+        self._sorted_ids: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, vector_id: object) -> bool:
+        return vector_id in self._rows
+
+    def get(self, vector_id: str) -> Vector | None:
+        with self._lock:
+            location = self._rows.get(vector_id)
+            if location is None:
+                return None
+            dimension, row = location
+            return self._blocks[dimension].vector(row)
+
+    def apply(self, writes: Iterable[Vector], deletes: Iterable[str]) -> None:
+        with self._lock:
+            self._apply(writes, deletes)
+
+    def _apply(self, writes: Iterable[Vector], deletes: Iterable[str]) -> None:
+        removed = [vid for vid in deletes if self._drop(vid)]
+        for vector_id in removed:
+            idx = bisect_left(self._sorted_ids, vector_id)
+            del self._sorted_ids[idx]
+        added: list[str] = []
+        for vector in writes:
+            if not self._drop(vector.vector_id):
+                added.append(vector.vector_id)
+            block = self._blocks.get(vector.dimension)
+            if block is None:
+                block = self._blocks[vector.dimension] = _DimensionBlock(
+                    vector.dimension, self.dtype
+                )
+            self._rows[vector.vector_id] = (vector.dimension, block.append(vector))
+        self._merge_sorted(added)
+        for dimension in list(self._blocks):
+            self._maybe_compact(dimension)
+
+    def sorted_ids(self) -> tuple[str, ...]:
+        with self._lock:
+            return tuple(self._sorted_ids)
+
+    def vectors(self, chunk_id: str | None = None) -> list[Vector]:
+        out: list[Vector] = []
+        with self._lock:
+            for vector_id in self._sorted_ids:
+                dimension, row = self._rows[vector_id]
+                block = self._blocks[dimension]
+                if chunk_id and block.chunk_ids[row] != chunk_id:
+                    continue
+                out.append(block.vector(row))
+        return out
+
+    def blocks(self, size: int) -> Iterator[tuple[tuple[str, ...], Any]]:
+        """Vectors in id order as (ids, rows) blocks of one dimension."""
+        last: str | None = None
+        while True:
+            page: list[tuple[tuple[str, ...], Any]] = []
+            with self._lock:
+                start = 0 if last is None else bisect_right(self._sorted_ids, last)
+                ids = self._sorted_ids[start : start + size]
+                if not ids:
+                    return
+                run: list[str] = []
+                for vector_id in ids:
+                    if run and self._rows[vector_id][0] != self._rows[run[0]][0]:
+                        page.append(self._block_rows(run))
+                        run = []
+                    run.append(vector_id)
+                page.append(self._block_rows(run))
+            last = ids[-1]
+            yield from page
+
+    def _block_rows(self, vector_ids: list[str]) -> tuple[tuple[str, ...], Any]:
+        block = self._blocks[self._rows[vector_ids[0]][0]]
+        rows = [self._rows[vector_id][1] for vector_id in vector_ids]
+        if np is not None:
+            # Fancy indexing copies, so the page stays valid after the lock.
+            return tuple(vector_ids), block.values[rows]
+        return tuple(vector_ids), [block.row_values(row) for row in rows]
+
+    def matrix(self, dimension: int) -> VectorMatrix | None:
+        if np is None:
+            return None
+        with self._lock:
+            block = self._blocks.get(dimension)
+            if block is None:
+                return build_vector_matrix((), dimension)
+            return block.view()
+
+    def matrix_rows(
+        self, dimension: int, vector_ids: Iterable[str] | None
+    ) -> tuple[VectorMatrix | None, list[int] | None]:
+        """The dimension's matrix and, when ids are given, their rows in it."""
+        with self._lock:
+            vm = self.matrix(dimension)
+            if vm is None or vector_ids is None:
+                return vm, None
+            return vm, self.rows_for(dimension, vector_ids)
+
+    def rows_for(self, dimension: int, vector_ids: Iterable[str]) -> list[int]:
+        """Sorted matrix rows of the given ids that live in ``dimension``."""
+        rows: list[int] = []
+        with self._lock:
+            for vector_id in vector_ids:
+                location = self._rows.get(vector_id)
+                if location is not None and location[0] == dimension:
+                    rows.append(location[1])
+        return sorted(rows)
+
+    def live_entries(self, dimension: int) -> list[tuple[str, str, tuple[float, ...]]]:
+        with self._lock:
+            block = self._blocks.get(dimension)
+            if block is None:
+                return []
+            return [
+                (block.row_ids[row] or "", block.chunk_ids[row], block.row_values(row))
+                for row in block.live_rows()
+            ]
+
+    def _drop(self, vector_id: str) -> bool:
+        location = self._rows.pop(vector_id, None)
+        if location is None:
+            return False
+        dimension, row = location
+        self._blocks[dimension].tombstone(row)
+        return True
+
+    def _merge_sorted(self, added: list[str]) -> None:
+        if not added:
+            return
+        if len(added) <= 32:
+            for vector_id in added:
+                insort(self._sorted_ids, vector_id)
+            return
+        self._sorted_ids = list(heapq.merge(self._sorted_ids, sorted(added)))
+
+    def _maybe_compact(self, dimension: int) -> None:
+        block = self._blocks[dimension]
+        if block.live == 0:
+            del self._blocks[dimension]
+            return
+        tombstones = block.size - block.live
+        if tombstones < _COMPACT_MIN_TOMBSTONES or tombstones < block.live:
+            return
+        fresh, rows = block.compacted()
+        self._blocks[dimension] = fresh
+        for vector_id, row in rows.items():
+            self._rows[vector_id] = (dimension, row)
+
+
+__all__ = ["VectorArena"]
@@ -3,8 +3,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
-from typing import NamedTuple
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Set
+import os
+import threading
+from typing import Any, NamedTuple
 
 from bijux_vex.contracts.authz import AllowAllAuthz, Authz
 from bijux_vex.contracts.resources import (
@@ -22,6 +25,7 @@ from bijux_vex.core.errors import (
     ValidationError,
 )
 from bijux_vex.core.execution_result import ExecutionResult
+from bijux_vex.core.metadata_filter import MetadataFilter, vector_tags
 from bijux_vex.core.types import (
     Chunk,
     Document,
@@ -30,23 +34,74 @@ from bijux_vex.core.types import (
     Result,
     Vector,
 )
+from bijux_vex.domain.execution_algorithms.exact_matrix import (
+    VectorMatrix,
+    exact_top_k,
+    matrix_supported,
+)
 from bijux_vex.domain.execution_requests import scoring
 from bijux_vex.domain.provenance.audit import AuditRecord
 from bijux_vex.infra.adapters.ann_base import AnnExecutionRequestRunner
+from bijux_vex.infra.adapters.memory.arena import VectorArena
+from bijux_vex.infra.metadata_index import MetadataIndex
+from bijux_vex.infra.vector_codec import DEFAULT_VECTOR_DTYPE
 
 
 class MemoryState:
-    def __init__(self) -> None:
+    def __init__(self, vector_dtype: str = DEFAULT_VECTOR_DTYPE) -> None:
         self.documents: dict[str, Document] = {}
         self.chunks: dict[str, Chunk] = {}
-        self.vectors: dict[str, Vector] = {}
+        # Held while a commit applies its changes and while readers walk the
+        # committed state, so shared-lease readers never see a half commit.
+        self.data_lock = threading.RLock()
+        self.vectors = VectorArena(vector_dtype, lock=self.data_lock)
         self.artifacts: dict[str, ExecutionArtifact] = {}
         self.execution_results: dict[str, ExecutionResult] = {}
         self.last_result_by_artifact: dict[str, ExecutionResult] = {}
         self.results_by_artifact: dict[str, list[str]] = {}
         self.audit_log: list[AuditRecord] = []
+        self.vector_revision = 0
+        self.metadata_index = MetadataIndex()
         self._tx_counter = 0
         self.in_tx = False
+        # Held for the whole transaction, like the SQLite connection lock.
+        self.tx_lock = threading.RLock()
+
+    def reindex_metadata(
+        self,
+        written: Iterable[Vector],
+        deleted: Iterable[str],
+        chunk_ids: Iterable[str],
+        document_ids: Iterable[str],
+    ) -> None:
+        """Apply a commit's changes to the metadata index in place."""
+        index = self.metadata_index
+        for vector_id in deleted:
+            index.remove(vector_id)
+        rewritten: set[str] = set()
+        for vector in written:
+            rewritten.add(vector.vector_id)
+            index.upsert(
+                vector.vector_id,
+                vector.chunk_id,
+                *self._placement(vector.chunk_id),
+                vector_tags(vector.metadata),
+            )
+        moved: set[str] = set()
+        for chunk_id in chunk_ids:
+            moved |= index.vectors_of_chunk(chunk_id)
+        for document_id in document_ids:
+            moved |= index.vectors_of_document(document_id)
+        for vector_id in moved - rewritten:
+            owner = index.chunk_of(vector_id)
+            if owner is not None:
+                index.relink(vector_id, *self._placement(owner))
+
+    def _placement(self, chunk_id: str) -> tuple[str, str | None]:
+        chunk = self.chunks.get(chunk_id)
+        document_id = chunk.document_id if chunk else ""
+        document = self.documents.get(document_id)
+        return document_id, document.source if document else None
 
     def next_tx_id(self) -> str:
         self._tx_counter += 1
@@ -93,7 +148,9 @@ class MemoryTx(Tx):
         return self._tx_id
 
     def __enter__(self) -> Tx:
+        self._state.tx_lock.acquire()
         if self._state.in_tx:
+            self._state.tx_lock.release()
             raise AtomicityViolationError(message="Nested Tx is not allowed")
         self._state.in_tx = True
         self._entered = True
@@ -138,16 +195,26 @@ class MemoryTx(Tx):
             raise AtomicityViolationError(message="Tx must be entered before commit")
         if not self._active:
             raise AtomicityViolationError(message="Tx already finished")
-        self._apply_document_changes()
-        self._apply_chunk_changes()
-        self._apply_vector_changes()
-        self._apply_artifact_changes()
-        self._apply_result_changes()
-        actions = self._changes_summary()
-        record = self._audit_builder(self.tx_id, self._state.last_hash, actions)
-        self._state.append_audit(record)
-        self._state.in_tx = False
-        self._active = False
+        try:
+            with self._state.data_lock:
+                self._apply_document_changes()
+                self._apply_chunk_changes()
+                self._apply_vector_changes()
+                self._apply_artifact_changes()
+                self._apply_result_changes()
+                self._state.reindex_metadata(
+                    self._vector_writes.values(),
+                    self._vector_deletes,
+                    self._chunk_writes.keys() | self._chunk_deletes,
+                    self._doc_writes.keys() | self._doc_deletes,
+                )
+            actions = self._changes_summary()
+            record = self._audit_builder(self.tx_id, self._state.last_hash, actions)
+            self._state.append_audit(record)
+        finally:
+            self._state.in_tx = False
+            self._active = False
+            self._state.tx_lock.release()
 
     def _apply_document_changes(self) -> None:
         for document_id in self._doc_deletes:
@@ -160,9 +227,11 @@ class MemoryTx(Tx):
         self._state.chunks.update(self._chunk_writes)
 
     def _apply_vector_changes(self) -> None:
-        for vector_id in self._vector_deletes:
-            self._state.vectors.pop(vector_id, None)
-        self._state.vectors.update(self._vector_writes)
+        if self._vector_deletes or self._vector_writes:
+            self._state.vector_revision += 1
+        self._state.vectors.apply(
+            self._vector_writes.values(), tuple(self._vector_deletes)
+        )
 
     def _apply_artifact_changes(self) -> None:
         for artifact_id in self._artifact_deletes:
@@ -181,11 +250,13 @@ class MemoryTx(Tx):
         for execution_id in self._result_deletes:
             self._state.execution_results.pop(execution_id, None)
         self._state.execution_results.update(self._result_writes)
+        written = Counter(res.artifact_id for res in self._result_writes.values())
         for res in self._result_writes.values():
             art_id = res.artifact_id
             history = self._state.results_by_artifact.setdefault(art_id, [])
             history.append(res.execution_id)
-            max_keep = 5
+            # Results committed together (a batch) are retained together.
+            max_keep = max(5, written[art_id])
             while len(history) > max_keep:
                 oldest = history.pop(0)
                 self._state.execution_results.pop(oldest, None)
@@ -213,6 +284,7 @@ class MemoryTx(Tx):
             raise AtomicityViolationError(message="Tx already finished")
         self._active = False
         self._state.in_tx = False
+        self._state.tx_lock.release()
 
 
 def _as_memory_tx(tx: Tx) -> MemoryTx:
@@ -234,7 +306,9 @@ class MemoryVectorSource(VectorSource):
         return self._state.documents.get(document_id)
 
     def list_documents(self) -> Iterable[Document]:
-        return sorted(self._state.documents.values(), key=lambda d: d.document_id)
+        with self._state.data_lock:
+            documents = list(self._state.documents.values())
+        return sorted(documents, key=lambda d: d.document_id)
 
     def delete_document(self, tx: Tx, document_id: str) -> None:
         memory_tx = _as_memory_tx(tx)
@@ -249,11 +323,17 @@ class MemoryVectorSource(VectorSource):
         return self._state.chunks.get(chunk_id)
 
     def list_chunks(self, document_id: str | None = None) -> Iterable[Chunk]:
-        chunks: list[Chunk] = list(self._state.chunks.values())
+        with self._state.data_lock:
+            chunks: list[Chunk] = list(self._state.chunks.values())
         if document_id:
             chunks = [c for c in chunks if c.document_id == document_id]
         return sorted(chunks, key=lambda c: c.chunk_id)
 
+    def get_chunks(self, chunk_ids: Iterable[str]) -> dict[str, Chunk]:
+        chunks = self._state.chunks
+        with self._state.data_lock:
+            return {cid: chunks[cid] for cid in chunk_ids if cid in chunks}
+
     def delete_chunk(self, tx: Tx, chunk_id: str) -> None:
         memory_tx = _as_memory_tx(tx)
         memory_tx.delete_chunk(chunk_id)
@@ -265,13 +345,55 @@ class MemoryVectorSource(VectorSource):
     def get_vector(self, vector_id: str) -> Vector | None:
         return self._state.vectors.get(vector_id)
 
+    def get_vectors(self, vector_ids: Iterable[str]) -> dict[str, Vector]:
+        arena = self._state.vectors
+        found: dict[str, Vector] = {}
+        with self._state.data_lock:
+            for vector_id in vector_ids:
+                if vector_id not in found:
+                    vector = arena.get(vector_id)
+                    if vector is not None:
+                        found[vector_id] = vector
+        return found
+
     def list_vectors(self, chunk_id: str | None = None) -> Iterable[Vector]:
-        vectors: list[Vector] = list(self._state.vectors.values())
-        if chunk_id:
-            vectors = [v for v in vectors if v.chunk_id == chunk_id]
-        return sorted(vectors, key=lambda v: v.vector_id)
+        if not chunk_id:
+            return self._state.vectors.vectors()
+        with self._state.data_lock:
+            ids = sorted(self._state.metadata_index.vectors_of_chunk(chunk_id))
+            found = self.get_vectors(ids)
+        return [found[vector_id] for vector_id in ids if vector_id in found]
+
+    def vector_revision(self) -> object | None:
+        return self._state.vector_revision
+
+    def vector_count(self) -> int:
+        return len(self._state.vectors)
+
+    def vector_blocks(self, size: int) -> Iterator[tuple[tuple[str, ...], Any]]:
+        return self._state.vectors.blocks(size)
+
+    def vector_matrix(self, dimension: int) -> VectorMatrix | None:
+        return self._state.vectors.matrix(dimension)
 
     def query(self, artifact_id: str, request: ExecutionRequest) -> Iterable[Result]:
+        return self._ranked(artifact_id, request, None)
+
+    def filter_vector_ids(self, metadata_filter: MetadataFilter) -> frozenset[str]:
+        with self._state.data_lock:
+            return self._state.metadata_index.candidates(metadata_filter)
+
+    def query_allowed(
+        self, artifact_id: str, request: ExecutionRequest, allowed: Set[str]
+    ) -> Iterable[Result]:
+        return self._ranked(artifact_id, request, allowed)
+
+    def _ranked(
+        self,
+        artifact_id: str,
+        request: ExecutionRequest,
+        allowed: Set[str] | None,
+    ) -> list[Result]:
         if request.vector is None:
             raise ValidationError(message="execution vector required")
         artifact = self._state.artifacts.get(artifact_id)
@@ -282,19 +404,41 @@ class MemoryVectorSource(VectorSource):
                 message="Execution contract does not match artifact execution contract"
             )
         query_vec = request.vector
+        vm, rows = self._state.vectors.matrix_rows(len(query_vec), allowed)
+        if vm is not None and matrix_supported(artifact.metric, query_vec, vm):
+            winners = exact_top_k(
+                artifact.metric, query_vec, vm, request.top_k, rows=rows
+            )
+            ranked: list[Result] = []
+            for rank, (score, vector_id, row) in enumerate(winners, start=1):
+                chunk = self._state.chunks.get(vm.chunk_ids[row])
+                ranked.append(
+                    Result(
+                        request_id=request.request_id,
+                        document_id=chunk.document_id if chunk else "",
+                        chunk_id=vm.chunk_ids[row],
+                        vector_id=vector_id,
+                        artifact_id=artifact_id,
+                        score=score,
+                        rank=rank,
+                    )
+                )
+            return ranked
         scored: list[Result] = []
-        for vector in self._state.vectors.values():
-            if len(query_vec) != vector.dimension:
+        for vector_id, chunk_id, values in self._state.vectors.live_entries(
+            len(query_vec)
+        ):
+            if allowed is not None and vector_id not in allowed:
                 continue
-            score = scoring.score(artifact.metric, query_vec, vector.values)
-            chunk = self._state.chunks.get(vector.chunk_id)
+            score = scoring.score(artifact.metric, query_vec, values)
+            chunk = self._state.chunks.get(chunk_id)
             document_id = chunk.document_id if chunk else ""
             scored.append(
                 Result(
                     request_id=request.request_id,
                     document_id=document_id,
-                    chunk_id=vector.chunk_id,
-                    vector_id=vector.vector_id,
+                    chunk_id=chunk_id,
+                    vector_id=vector_id,
                     artifact_id=artifact_id,
                     score=score,
                     rank=0,
@@ -343,7 +487,9 @@ class MemoryExecutionLedger(ExecutionLedger):
         return self._state.artifacts.get(artifact_id)
 
     def list_artifacts(self) -> Iterable[ExecutionArtifact]:
-        return sorted(self._state.artifacts.values(), key=lambda a: a.artifact_id)
+        with self._state.data_lock:
+            artifacts = list(self._state.artifacts.values())
+        return sorted(artifacts, key=lambda a: a.artifact_id)
 
     def delete_artifact(self, tx: Tx, artifact_id: str) -> None:
         memory_tx = _as_memory_tx(tx)
@@ -393,8 +539,10 @@ def _build_audit(
     )
 
 
-def memory_backend() -> MemoryFixture:
-    state = MemoryState()
+def memory_backend(vector_dtype: str | None = None) -> MemoryFixture:
+    state = MemoryState(
+        vector_dtype or os.getenv("BIJUX_VEX_VECTOR_DTYPE") or DEFAULT_VECTOR_DTYPE
+    )
 
     def tx_factory() -> MemoryTx:
         return MemoryTx(state, _build_audit)
@@ -45,6 +45,7 @@ def pgvector_backend(path: str | None = None) -> SQLiteFixture:
         name="pgvector",
         ann=base.ann,
         diagnostics=base.diagnostics,
+        close=base.close,
     )
 
 
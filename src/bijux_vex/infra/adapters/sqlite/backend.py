@@ -2,11 +2,15 @@
 # Copyright © 2025 Bijan Mousavi
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Sequence, Set
+import heapq
 import json
+import os
 import sqlite3
+import sys
 import threading
-from typing import NamedTuple
+from typing import Any, NamedTuple
 
 from bijux_vex.contracts.authz import AllowAllAuthz, Authz
 from bijux_vex.contracts.resources import (
@@ -30,6 +34,7 @@ from bijux_vex.core.execution_result import (
     ExecutionResult,
     ExecutionStatus,
 )
+from bijux_vex.core.metadata_filter import MetadataFilter, vector_tags
 from bijux_vex.core.runtime.execution_plan import ExecutionPlan, RandomnessSource
 from bijux_vex.core.types import (
     Chunk,
@@ -40,11 +45,46 @@ from bijux_vex.core.types import (
     Vector,
 )
 from bijux_vex.infra.adapters.ann_base import AnnExecutionRequestRunner
+from bijux_vex.infra.migrations.sqlite_vectors import migrate_vector_storage
+from bijux_vex.infra.optional_deps import np
+from bijux_vex.infra.vector_codec import (
+    DEFAULT_VECTOR_DTYPE,
+    pack_vector,
+    resolve_dtype,
+    unpack_matrix,
+    unpack_vector,
+)
 
 ACTIVE_CONNECTIONS: set[int] = set()
+# Rows pulled per fetchmany block during exact scans; bounds scan memory.
+QUERY_FETCH_ROWS = 1024
+
+# Ids bound per IN (...) clause; SQLite caps parameters per statement.
+_ID_CHUNK = 500
+_VECTOR_SELECT = (
+    "SELECT id, chunk_id, dim, vec_blob, vec_dtype, vec_values, model, metadata "
+    "FROM vectors "
+)
+_CHUNK_SELECT = "SELECT id, document_id, text, ordinal FROM chunks "
+_BLOCK_SELECT = "SELECT id, dim, vec_blob, vec_dtype, vec_values FROM vectors "
+_SCAN_SELECT = (
+    "SELECT v.id, v.chunk_id, v.vec_blob, v.vec_dtype, v.vec_values, c.document_id "
+    "FROM vectors v LEFT JOIN chunks c ON v.chunk_id = c.id "
+)
+_FILTER_SELECT = (
+    "SELECT v.id FROM vectors v LEFT JOIN chunks c ON v.chunk_id = c.id "
+    "LEFT JOIN documents d ON c.document_id = d.id WHERE "
+)
+# A vector matches when it carries every requested tag.
+_TAGS_IN = "v.id IN (SELECT vector_id FROM vector_tags WHERE tag IN "
+_TAGS_ALL = " GROUP BY vector_id HAVING COUNT(*) = ?)"
+
+_ScanKey = tuple[float, str, str, str]
 
 
-def _init_schema(conn: sqlite3.Connection) -> None:
+def _init_schema(
+    conn: sqlite3.Connection, vector_dtype: str = DEFAULT_VECTOR_DTYPE
+) -> None:
     conn.execute(
         "CREATE TABLE IF NOT EXISTS documents(id TEXT PRIMARY KEY, text TEXT, source TEXT, version TEXT)"
     )
@@ -52,7 +92,7 @@ def _init_schema(conn: sqlite3.Connection) -> None:
         "CREATE TABLE IF NOT EXISTS chunks(id TEXT PRIMARY KEY, document_id TEXT, text TEXT, ordinal INTEGER)"
     )
     conn.execute(
-        "CREATE TABLE IF NOT EXISTS vectors(id TEXT PRIMARY KEY, chunk_id TEXT, dim INTEGER, vec_values TEXT, model TEXT, metadata TEXT)"
+        "CREATE TABLE IF NOT EXISTS vectors(id TEXT PRIMARY KEY, chunk_id TEXT, dim INTEGER, vec_values TEXT, model TEXT, metadata TEXT, vec_blob BLOB, vec_dtype TEXT)"
     )
     conn.execute(
         """
@@ -80,7 +120,9 @@ def _init_schema(conn: sqlite3.Connection) -> None:
         """
     )
     _ensure_vector_columns(conn)
+    _ensure_metadata_index(conn)
     conn.commit()
+    migrate_vector_storage(conn, vector_dtype)
 
 
 def _ensure_vector_columns(conn: sqlite3.Connection) -> None:
@@ -91,6 +133,49 @@ def _ensure_vector_columns(conn: sqlite3.Connection) -> None:
         conn.execute("ALTER TABLE vectors ADD COLUMN metadata TEXT")
 
 
+def _ensure_metadata_index(conn: sqlite3.Connection) -> None:
+    """Tag postings plus lookup indexes used to pre-filter queries."""
+    created = not conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='vector_tags'"
+    ).fetchone()
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS vector_tags(tag TEXT, vector_id TEXT, PRIMARY KEY(tag, vector_id)) WITHOUT ROWID"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS vector_tags_vector ON vector_tags(vector_id)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS vectors_chunk ON vectors(chunk_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS chunks_document ON chunks(document_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS documents_source ON documents(source)")
+    if created:
+        rows = conn.execute(
+            "SELECT id, metadata FROM vectors WHERE metadata IS NOT NULL"
+        ).fetchall()
+        conn.executemany(
+            "INSERT OR IGNORE INTO vector_tags(tag, vector_id) VALUES(?,?)",
+            [
+                (tag, vector_id)
+                for vector_id, raw in rows
+                for tag in vector_tags(json_loads_meta(raw))
+            ],
+        )
+
+
+def _write_tags(conn: sqlite3.Connection, vectors: Sequence[Vector]) -> None:
+    conn.executemany(
+        "DELETE FROM vector_tags WHERE vector_id=?",
+        [(vector.vector_id,) for vector in vectors],
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO vector_tags(tag, vector_id) VALUES(?,?)",
+        [
+            (tag, vector.vector_id)
+            for vector in vectors
+            for tag in vector_tags(vector.metadata)
+        ],
+    )
+
+
 class SQLiteTx(Tx):
     def __init__(self, conn: sqlite3.Connection, lock: threading.RLock):
         self._conn = conn
@@ -139,12 +224,19 @@ class SQLiteTx(Tx):
 
 
 class SQLiteVectorSource(VectorSource):
-    def __init__(self, conn: sqlite3.Connection, lock: threading.RLock):
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        lock: threading.RLock,
+        vector_dtype: str = DEFAULT_VECTOR_DTYPE,
+    ):
         self._conn = conn
         self._lock = lock
+        self._vector_dtype = resolve_dtype(vector_dtype)
         self._metric_cache: dict[str, str] = {}
         self._artifact_cache: dict[str, ExecutionArtifact] = {}
         self._vector_cache: list[Vector] | None = None
+        self._revision = 0
 
     # Documents
     def put_document(self, tx: Tx, document: Document) -> None:
@@ -201,6 +293,22 @@ class SQLiteVectorSource(VectorSource):
             return None
         return Chunk(chunk_id=row[0], document_id=row[1], text=row[2], ordinal=row[3])
 
+    def get_chunks(self, chunk_ids: Iterable[str]) -> dict[str, Chunk]:
+        ids = sorted(set(chunk_ids))
+        found: dict[str, Chunk] = {}
+        with self._lock:
+            for start in range(0, len(ids), _ID_CHUNK):
+                chunk = ids[start : start + _ID_CHUNK]
+                rows = self._conn.execute(
+                    _CHUNK_SELECT + "WHERE id IN " + _placeholders(len(chunk)),
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    found[row[0]] = Chunk(
+                        chunk_id=row[0], document_id=row[1], text=row[2], ordinal=row[3]
+                    )
+        return found
+
     def list_chunks(self, document_id: str | None = None) -> Iterable[Chunk]:
         with self._lock:
             if document_id:
@@ -252,35 +360,80 @@ class SQLiteVectorSource(VectorSource):
     def put_vector(self, tx: Tx, vector: Vector) -> None:
         with self._lock:
             self._conn.execute(
-                "REPLACE INTO vectors(id, chunk_id, dim, vec_values, model, metadata) VALUES(?,?,?,?,?,?)",
+                "REPLACE INTO vectors(id, chunk_id, dim, vec_blob, vec_dtype, model, metadata) VALUES(?,?,?,?,?,?,?)",
                 (
                     vector.vector_id,
                     vector.chunk_id,
                     vector.dimension,
-                    json_dumps(vector.values),
+                    pack_vector(vector.values, self._vector_dtype),
+                    self._vector_dtype,
                     vector.model,
                     json_dumps_meta(vector.metadata),
                 ),
             )
+            _write_tags(self._conn, [vector])
         self._vector_cache = None
+        self._revision += 1
+
+    def put_batch(
+        self,
+        tx: Tx,
+        documents: Sequence[Document],
+        chunks: Sequence[Chunk],
+        vectors: Sequence[Vector],
+    ) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "REPLACE INTO documents(id, text, source, version) VALUES(?,?,?,?)",
+                [(d.document_id, d.text, d.source, d.version) for d in documents],
+            )
+            self._conn.executemany(
+                "REPLACE INTO chunks(id, document_id, text, ordinal) VALUES(?,?,?,?)",
+                [(c.chunk_id, c.document_id, c.text, c.ordinal) for c in chunks],
+            )
+            self._conn.executemany(
+                "REPLACE INTO vectors(id, chunk_id, dim, vec_blob, vec_dtype, model, metadata) VALUES(?,?,?,?,?,?,?)",
+                [
+                    (
+                        v.vector_id,
+                        v.chunk_id,
+                        v.dimension,
+                        pack_vector(v.values, self._vector_dtype),
+                        self._vector_dtype,
+                        v.model,
+                        json_dumps_meta(v.metadata),
+                    )
+                    for v in vectors
+                ],
+            )
+            _write_tags(self._conn, vectors)
+        if vectors:
+            self._vector_cache = None
+            self._revision += 1
 
     def get_vector(self, vector_id: str) -> Vector | None:
         with self._lock:
             row = self._conn.execute(
-                "SELECT id, chunk_id, dim, vec_values, model, metadata FROM vectors WHERE id=?",
+                "SELECT id, chunk_id, dim, vec_blob, vec_dtype, vec_values, model, metadata FROM vectors WHERE id=?",
                 (vector_id,),
             ).fetchone()
         if not row:
             return None
-        values = tuple(json_loads(row[3]))
-        return Vector(
-            vector_id=row[0],
-            chunk_id=row[1],
-            dimension=row[2],
-            values=values,
-            model=row[4],
-            metadata=json_loads_meta(row[5]),
-        )
+        return _vector_from_row(row)
+
+    def get_vectors(self, vector_ids: Iterable[str]) -> dict[str, Vector]:
+        ids = sorted(set(vector_ids))
+        found: dict[str, Vector] = {}
+        with self._lock:
+            for start in range(0, len(ids), _ID_CHUNK):
+                chunk = ids[start : start + _ID_CHUNK]
+                rows = self._conn.execute(
+                    _VECTOR_SELECT + "WHERE id IN " + _placeholders(len(chunk)),
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    found[row[0]] = _vector_from_row(row)
+        return found
 
     def list_vectors(self, chunk_id: str | None = None) -> Iterable[Vector]:
         if chunk_id is None and self._vector_cache is not None:
@@ -288,29 +441,84 @@ class SQLiteVectorSource(VectorSource):
         with self._lock:
             if chunk_id:
                 rows = self._conn.execute(
-                    "SELECT id, chunk_id, dim, vec_values, model, metadata FROM vectors WHERE chunk_id=? ORDER BY id",
+                    "SELECT id, chunk_id, dim, vec_blob, vec_dtype, vec_values, model, metadata FROM vectors WHERE chunk_id=? ORDER BY id",
                     (chunk_id,),
                 ).fetchall()
             else:
                 rows = self._conn.execute(
-                    "SELECT id, chunk_id, dim, vec_values, model, metadata FROM vectors ORDER BY id"
+                    "SELECT id, chunk_id, dim, vec_blob, vec_dtype, vec_values, model, metadata FROM vectors ORDER BY id"
                 ).fetchall()
-        vectors = [
-            Vector(
-                vector_id=r[0],
-                chunk_id=r[1],
-                dimension=r[2],
-                values=tuple(json_loads(r[3])),
-                model=r[4],
-                metadata=json_loads_meta(r[5]),
-            )
-            for r in rows
-        ]
+        vectors = [_vector_from_row(r) for r in rows]
         if chunk_id is None:
             self._vector_cache = list(vectors)
         return vectors
 
+    def vector_count(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM vectors").fetchone()
+        return int(row[0])
+
+    def vector_blocks(self, size: int) -> Iterator[tuple[tuple[str, ...], Any]]:
+        if np is None:
+            yield from super().vector_blocks(size)
+            return
+        last: str | None = None
+        while True:
+            # Keyset pages: each holds the lock for one bounded read only.
+            with self._lock:
+                if last is None:
+                    rows = self._conn.execute(
+                        _BLOCK_SELECT + "ORDER BY id LIMIT ?", (size,)
+                    ).fetchall()
+                else:
+                    rows = self._conn.execute(
+                        _BLOCK_SELECT + "WHERE id > ? ORDER BY id LIMIT ?",
+                        (last, size),
+                    ).fetchall()
+            if not rows:
+                return
+            last = rows[-1][0]
+            yield from _page_blocks(rows)
+            if len(rows) < size:
+                return
+
     def query(self, artifact_id: str, request: ExecutionRequest) -> Iterable[Result]:
+        return self._ranked(artifact_id, request, None)
+
+    def filter_vector_ids(self, metadata_filter: MetadataFilter) -> frozenset[str]:
+        clauses: list[str] = []
+        params: list[object] = []
+        for column, values in (
+            ("c.document_id", metadata_filter.document_ids),
+            ("v.chunk_id", metadata_filter.chunk_ids),
+            ("d.source", metadata_filter.source_uris),
+        ):
+            if values is not None:
+                clauses.append(f"{column} IN " + _placeholders(len(values)))
+                params.extend(sorted(values))
+        if metadata_filter.tags:
+            tags = sorted(metadata_filter.tags)
+            clauses.append(_TAGS_IN + _placeholders(len(tags)) + _TAGS_ALL)
+            params.extend([*tags, len(tags)])
+        where = " AND ".join(clauses) or "1"
+        with self._lock:
+            rows = self._conn.execute(
+                _FILTER_SELECT + where,
+                params,
+            ).fetchall()
+        return frozenset(row[0] for row in rows)
+
+    def query_allowed(
+        self, artifact_id: str, request: ExecutionRequest, allowed: Set[str]
+    ) -> Iterable[Result]:
+        return self._ranked(artifact_id, request, allowed)
+
+    def _ranked(
+        self,
+        artifact_id: str,
+        request: ExecutionRequest,
+        allowed: Set[str] | None,
+    ) -> list[Result]:
         # Basic deterministic L2 similar to memory
         if request.vector is None:
             raise ValidationError(message="execution vector required")
@@ -319,48 +527,72 @@ class SQLiteVectorSource(VectorSource):
             raise InvariantError(
                 message="Execution contract does not match artifact execution contract"
             )
+        if request.top_k <= 0:
+            return []
+        req_vec = tuple(request.vector)
+        best = _TopK(request.top_k)
         with self._lock:
-            rows = self._conn.execute(
-                "SELECT v.id, v.chunk_id, v.dim, v.vec_values, c.document_id "
-                "FROM vectors v LEFT JOIN chunks c ON v.chunk_id = c.id ORDER BY v.id"
-            ).fetchall()
-        scored: list[Result] = []
-        req_vec = request.vector
-        for row in rows:
-            vec_dim = row[2]
-            if len(req_vec) != vec_dim:
-                continue
-            values = tuple(json_loads(row[3]))
-            score = sum((q - v) * (q - v) for q, v in zip(req_vec, values, strict=True))
-            doc_id = row[4] or ""
-            scored.append(
-                Result(
-                    request_id=request.request_id,
-                    document_id=doc_id,
-                    chunk_id=row[1],
-                    vector_id=row[0],
-                    artifact_id=artifact_id,
-                    score=score,
-                    rank=0,
+            if allowed is None:
+                self._scan(
+                    _SCAN_SELECT + "WHERE v.dim = ?", (len(req_vec),), req_vec, best
                 )
+            else:
+                ids = sorted(allowed)
+                for start in range(0, len(ids), _ID_CHUNK):
+                    chunk = ids[start : start + _ID_CHUNK]
+                    self._scan(
+                        _SCAN_SELECT
+                        + "WHERE v.dim = ? AND v.id IN "
+                        + _placeholders(len(chunk)),
+                        (len(req_vec), *chunk),
+                        req_vec,
+                        best,
+                    )
+        return [
+            Result(
+                request_id=request.request_id,
+                document_id=document_id,
+                chunk_id=chunk_id,
+                vector_id=vector_id,
+                artifact_id=artifact_id,
+                score=score,
+                rank=rank,
             )
-        scored.sort(key=lambda r: (r.score, r.vector_id, r.chunk_id, r.document_id))
-        for idx, res in enumerate(scored[: request.top_k], start=1):
-            scored[idx - 1] = Result(
-                request_id=res.request_id,
-                document_id=res.document_id,
-                chunk_id=res.chunk_id,
-                vector_id=res.vector_id,
-                artifact_id=res.artifact_id,
-                score=res.score,
-                rank=idx,
+            for rank, (score, vector_id, chunk_id, document_id) in enumerate(
+                best.ranked(), start=1
             )
-        return scored[: request.top_k]
+        ]
+
+    def _scan(
+        self,
+        sql: str,
+        params: Sequence[object],
+        req_vec: tuple[float, ...],
+        best: _TopK,
+    ) -> None:
+        cursor = self._conn.execute(sql, params)
+        while rows := cursor.fetchmany(QUERY_FETCH_ROWS):
+            for row in _prefilter(rows, req_vec, best.threshold()):
+                values = _decode_values(row[2], row[3], row[4])
+                score = sum(
+                    (q - v) * (q - v) for q, v in zip(req_vec, values, strict=True)
+                )
+                best.push((score, row[0], row[1], row[5] or ""))
 
     def delete_vector(self, tx: Tx, vector_id: str) -> None:
         with self._lock:
             self._conn.execute("DELETE FROM vectors WHERE id=?", (vector_id,))
+            self._conn.execute(
+                "DELETE FROM vector_tags WHERE vector_id=?", (vector_id,)
+            )
         self._vector_cache = None
+        self._revision += 1
+
+    def vector_revision(self) -> object | None:
+        # data_version changes when another connection commits to the file.
+        with self._lock:
+            data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        return (self._revision, data_version)
 
 
 class SQLiteExecutionLedger(ExecutionLedger):
@@ -451,15 +683,28 @@ class SQLiteExecutionLedger(ExecutionLedger):
             self._conn.execute("DELETE FROM artifacts WHERE id=?", (artifact_id,))
 
     def put_execution_result(self, tx: Tx, result: ExecutionResult) -> None:
-        payload = json.dumps(result.to_primitive())
+        self.put_execution_results(tx, (result,))
+
+    def put_execution_results(self, tx: Tx, results: Sequence[ExecutionResult]) -> None:
         with self._lock:
-            self._conn.execute(
+            self._conn.executemany(
                 "REPLACE INTO execution_results(execution_id, artifact_id, payload) VALUES(?,?,?)",
-                (result.execution_id, result.artifact_id, payload),
+                [
+                    (
+                        result.execution_id,
+                        result.artifact_id,
+                        json.dumps(result.to_primitive()),
+                    )
+                    for result in results
+                ],
             )
-            max_keep = 5
-            self._conn.execute(
-                """
+            written = Counter(result.artifact_id for result in results)
+            for artifact_id, count in written.items():
+                self._prune_results(artifact_id, max(5, count))
+
+    def _prune_results(self, artifact_id: str, max_keep: int) -> None:
+        self._conn.execute(
+            """
                 DELETE FROM execution_results
                 WHERE artifact_id=?
                   AND rowid NOT IN (
@@ -469,8 +714,8 @@ class SQLiteExecutionLedger(ExecutionLedger):
                     LIMIT ?
                   )
                 """,
-                (result.artifact_id, result.artifact_id, max_keep),
-            )
+            (artifact_id, artifact_id, max_keep),
+        )
 
     def get_execution_result(self, execution_id: str) -> ExecutionResult | None:
         with self._lock:
@@ -573,6 +818,108 @@ class SQLiteExecutionLedger(ExecutionLedger):
         return self.get_execution_result(payload["execution_id"])
 
 
+class _Worst:
+    """Heap item ordered in reverse so ``heap[0]`` is the worst survivor."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: _ScanKey) -> None:
+        self.key = key
+
+    def __lt__(self, other: _Worst) -> bool:
+        return self.key > other.key
+
+
+class _TopK:
+    """Bounded selection of the k smallest (score, vector_id, chunk_id, document_id)."""
+
+    def __init__(self, k: int) -> None:
+        self.k = k
+        self._heap: list[_Worst] = []
+
+    def threshold(self) -> float | None:
+        return self._heap[0].key[0] if len(self._heap) >= self.k else None
+
+    def push(self, key: _ScanKey) -> None:
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, _Worst(key))
+        elif key < self._heap[0].key:
+            heapq.heapreplace(self._heap, _Worst(key))
+
+    def ranked(self) -> list[_ScanKey]:
+        return sorted(item.key for item in self._heap)
+
+
+def _prefilter(
+    rows: list[tuple[Any, ...]], query: tuple[float, ...], threshold: float | None
+) -> list[tuple[Any, ...]]:
+    """
+    Drop rows that provably cannot beat ``threshold``.
+
+    A block of packed rows is decoded into one matrix and scored with numpy;
+    only rows whose score, widened by a rounding bound, could still tie or
+    beat the current k-th best are rescored exactly by the caller.
+    """
+    if threshold is None or np is None or len(rows) < 2 or not query:
+        return rows
+    dtype = rows[0][3]
+    if any(row[2] is None or row[3] != dtype for row in rows):
+        return rows
+    matrix = unpack_matrix([row[2] for row in rows], len(query), dtype)
+    with np.errstate(all="ignore"):
+        approx = np.square(matrix - np.asarray(query, dtype=np.float64)).sum(axis=1)
+    slack = 4.0 * (len(query) + 8) * sys.float_info.epsilon
+    keep = ~(approx * (1.0 - slack) > threshold)
+    return [row for row, flag in zip(rows, keep.tolist(), strict=True) if flag]
+
+
+def _page_blocks(
+    rows: list[tuple[Any, ...]],
+) -> Iterator[tuple[tuple[str, ...], Any]]:
+    """Split (id, dim, blob, dtype, legacy) rows into runs of one dimension and dtype."""
+    start = 0
+    for end in range(1, len(rows) + 1):
+        if end < len(rows) and (rows[end][1], rows[end][3]) == (
+            rows[start][1],
+            rows[start][3],
+        ):
+            continue
+        run = rows[start:end]
+        ids = tuple(row[0] for row in run)
+        if all(row[2] is not None for row in run):
+            # One contiguous decode per run instead of a tuple per vector.
+            dim, dtype = run[0][1], run[0][3] or DEFAULT_VECTOR_DTYPE
+            yield ids, unpack_matrix([row[2] for row in run], dim, dtype)
+        else:
+            yield ids, [_decode_values(row[2], row[3], row[4]) for row in run]
+        start = end
+
+
+def _vector_from_row(row: Sequence[Any]) -> Vector:
+    return Vector(
+        vector_id=row[0],
+        chunk_id=row[1],
+        dimension=row[2],
+        values=_decode_values(row[3], row[4], row[5]),
+        model=row[6],
+        metadata=json_loads_meta(row[7]),
+    )
+
+
+def _placeholders(count: int) -> str:
+    return "(" + ",".join("?" * count) + ")"
+
+
+def _decode_values(
+    blob: bytes | None, dtype: str | None, legacy: str | None
+) -> tuple[float, ...]:
+    if blob is not None:
+        return unpack_vector(blob, dtype or DEFAULT_VECTOR_DTYPE)
+    if legacy is None:
+        raise InvariantError(message="Vector row has no stored values")
+    return tuple(json_loads(legacy))
+
+
 def json_dumps(vals: Iterable[float]) -> str:
     return json.dumps(list(vals))
 
@@ -605,18 +952,28 @@ class SQLiteFixture(NamedTuple):
     name: str
     ann: AnnExecutionRequestRunner | None = None
     diagnostics: dict[str, Callable[[], object]] | None = None
+    close: Callable[[], None] | None = None
 
 
-def sqlite_backend(db_path: str = ":memory:") -> SQLiteFixture:
+def sqlite_backend(
+    db_path: str = ":memory:", vector_dtype: str | None = None
+) -> SQLiteFixture:
+    vector_dtype = resolve_dtype(
+        vector_dtype or os.getenv("BIJUX_VEX_VECTOR_DTYPE") or DEFAULT_VECTOR_DTYPE
+    )
     conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA busy_timeout=5000")
-    _init_schema(conn)
+    _init_schema(conn, vector_dtype)
     lock = threading.RLock()
 
     def tx_factory() -> SQLiteTx:
         return SQLiteTx(conn, lock)
 
+    def close() -> None:
+        with lock:
+            conn.close()
+
     capabilities = BackendCapabilities(
         contracts={
             ExecutionContract.DETERMINISTIC,
@@ -632,7 +989,7 @@ def sqlite_backend(db_path: str = ":memory:") -> SQLiteFixture:
     )
     stores = ExecutionResources(
         name="sqlite",
-        vectors=SQLiteVectorSource(conn, lock),
+        vectors=SQLiteVectorSource(conn, lock, vector_dtype),
         ledger=SQLiteExecutionLedger(conn, lock),
         capabilities=capabilities,
     )
@@ -652,6 +1009,7 @@ def sqlite_backend(db_path: str = ":memory:") -> SQLiteFixture:
         name="sqlite",
         ann=None,
         diagnostics=diagnostics,
+        close=close,
     )
     try:
         from bijux_vex.infra.adapters.ann_hnsw import HnswAnnRunner
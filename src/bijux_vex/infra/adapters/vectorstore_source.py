@@ -2,13 +2,14 @@
 # Copyright © 2025 Bijan Mousavi
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Sequence, Set
 import json
 from typing import Any
 
 from bijux_vex.contracts.resources import VectorSource
 from bijux_vex.core.determinism import classify_execution
 from bijux_vex.core.errors import BackendCapabilityError, ValidationError
+from bijux_vex.core.metadata_filter import FILTER_KEYS, MetadataFilter, parse_filter
 from bijux_vex.core.types import Chunk, Document, ExecutionRequest, Result, Vector
 from bijux_vex.domain.execution_requests import scoring
 from bijux_vex.infra.adapters.vectorstore_metadata import build_vectorstore_metadata
@@ -58,6 +59,9 @@ class VectorStoreVectorSource(VectorSource):
     def get_chunk(self, chunk_id: str) -> Chunk | None:
         return self._base.get_chunk(chunk_id)
 
+    def get_chunks(self, chunk_ids: Iterable[str]) -> dict[str, Chunk]:
+        return self._base.get_chunks(chunk_ids)
+
     def list_chunks(self, document_id: str | None = None) -> Iterable[Chunk]:
         return self._base.list_chunks(document_id=document_id)
 
@@ -80,12 +84,63 @@ class VectorStoreVectorSource(VectorSource):
         metadata["vector_id"] = vector.vector_id
         self._adapter.insert([list(vector.values)], metadata=[metadata])
 
+    def put_batch(
+        self,
+        tx: Any,
+        documents: Sequence[Document],
+        chunks: Sequence[Chunk],
+        vectors: Sequence[Vector],
+    ) -> None:
+        self._base.put_batch(tx, documents, chunks, vectors)
+        if getattr(self._adapter, "is_noop", False) or not vectors:
+            return
+        document_ids = {chunk.chunk_id: chunk.document_id for chunk in chunks}
+        stored = self._base.get_chunks(
+            {v.chunk_id for v in vectors if v.chunk_id not in document_ids}
+        )
+        document_ids.update({cid: ch.document_id for cid, ch in stored.items()})
+        metadata: list[dict[str, Any]] = []
+        for vector in vectors:
+            document_id = document_ids.get(vector.chunk_id, "")
+            entry = build_vectorstore_metadata(
+                vector=vector,
+                document_id=document_id,
+                source_uri=None,
+                tags=None,
+            )
+            entry["vector_id"] = vector.vector_id
+            metadata.append(entry)
+        self._adapter.insert([list(v.values) for v in vectors], metadata=metadata)
+
     def get_vector(self, vector_id: str) -> Vector | None:
         return self._base.get_vector(vector_id)
 
+    def get_vectors(self, vector_ids: Iterable[str]) -> dict[str, Vector]:
+        return self._base.get_vectors(vector_ids)
+
     def list_vectors(self, chunk_id: str | None = None) -> Iterable[Vector]:
         return self._base.list_vectors(chunk_id=chunk_id)
 
+    def vector_revision(self) -> object | None:
+        return self._base.vector_revision()
+
+    def vector_matrix(self, dimension: int) -> object | None:
+        return self._base.vector_matrix(dimension)
+
+    def vector_count(self) -> int:
+        return self._base.vector_count()
+
+    def vector_blocks(self, size: int) -> Iterator[tuple[tuple[str, ...], Any]]:
+        return self._base.vector_blocks(size)
+
+    def filter_vector_ids(self, metadata_filter: MetadataFilter) -> frozenset[str]:
+        return self._base.filter_vector_ids(metadata_filter)
+
+    def query_allowed(
+        self, artifact_id: str, request: ExecutionRequest, allowed: Set[str]
+    ) -> Iterable[Result]:
+        return self._base.query_allowed(artifact_id, request, allowed)
+
     def query(self, artifact_id: str, request: ExecutionRequest) -> Iterable[Result]:
         if request.vector is None:
             raise ValidationError(message="execution vector required")
@@ -115,14 +170,36 @@ class VectorStoreVectorSource(VectorSource):
             vector_store=self._resolved.descriptor,
             require_randomness=False,
         )
+        if filter_spec and not self._resolved.descriptor.filtering_supported:
+            unknown = set(filter_spec) - FILTER_KEYS
+            if unknown:
+                raise BackendCapabilityError(
+                    message="Vector store filtering requested but backend does not support filters"
+                )
+            # Resolve the filter to an allow-set first so the scan only scores
+            # matching vectors and still fills top_k.
+            allowed = self._base.filter_vector_ids(parse_filter(filter_spec))
+            log_event(
+                "filter_prefilter",
+                backend=self._resolved.descriptor.name,
+                candidates=len(allowed),
+            )
+            return self._base.query_allowed(artifact_id, request, allowed)
+        hits = list(
+            self._adapter.query(
+                list(request.vector),
+                request.top_k,
+                mode=request.execution_contract.value,
+            )
+        )
+        found = self._base.get_vectors(vector_id for vector_id, _ in hits)
+        chunks = self._base.get_chunks(vec.chunk_id for vec in found.values())
         results: list[Result] = []
-        for vector_id, score in self._adapter.query(
-            list(request.vector), request.top_k, mode=request.execution_contract.value
-        ):
-            vec = self._base.get_vector(vector_id)
+        for vector_id, score in hits:
+            vec = found.get(vector_id)
             if vec is None:
                 continue
-            chunk = self._base.get_chunk(vec.chunk_id)
+            chunk = chunks.get(vec.chunk_id)
             document_id = chunk.document_id if chunk else ""
             results.append(
                 Result(
@@ -135,24 +212,6 @@ class VectorStoreVectorSource(VectorSource):
                     rank=0,
                 )
             )
-        if filter_spec and not self._resolved.descriptor.filtering_supported:
-            supported_keys = {"doc_id", "chunk_id", "source_uri", "tags"}
-            unknown = set(filter_spec) - supported_keys
-            if unknown:
-                raise BackendCapabilityError(
-                    message="Vector store filtering requested but backend does not support filters"
-                )
-            log_event(
-                "filter_postprocess",
-                backend=self._resolved.descriptor.name,
-                warning="post-filter applied in-memory; performance may degrade",
-            )
-            filtered: list[Result] = []
-            for res in results:
-                if not self._matches_filter(res, filter_spec):
-                    continue
-                filtered.append(res)
-            results = filtered
         results.sort(key=scoring.tie_break_key)
         limited = results[: request.top_k]
         for idx, res in enumerate(limited, start=1):
@@ -177,41 +236,5 @@ class VectorStoreVectorSource(VectorSource):
             )
         self._adapter.delete([vector_id])
 
-    def _matches_filter(self, result: Result, filter_spec: dict[str, Any]) -> bool:
-        doc_id = result.document_id
-        chunk_id = result.chunk_id
-        document = self._base.get_document(doc_id) if doc_id else None
-        source_uri = document.source if document else None
-        tags = filter_spec.get("tags")
-        if "doc_id" in filter_spec:
-            expected = filter_spec["doc_id"]
-            if isinstance(expected, (list, tuple, set)):
-                if doc_id not in expected:
-                    return False
-            elif doc_id != expected:
-                return False
-        if "chunk_id" in filter_spec:
-            expected = filter_spec["chunk_id"]
-            if isinstance(expected, (list, tuple, set)):
-                if chunk_id not in expected:
-                    return False
-            elif chunk_id != expected:
-                return False
-        if "source_uri" in filter_spec:
-            expected = filter_spec["source_uri"]
-            if source_uri != expected:
-                return False
-        if tags is not None:
-            if not isinstance(tags, (list, tuple, set)):
-                tags = [tags]
-            vector = self._base.get_vector(result.vector_id)
-            vector_tags = set()
-            if vector and vector.metadata:
-                meta_dict = dict(vector.metadata)
-                vector_tags = set(meta_dict.get("tags", ()))
-            if not set(tags).issubset(vector_tags):
-                return False
-        return True
-
 
 __all__ = ["VectorStoreVectorSource"]
@@ -2,14 +2,32 @@
 # Copyright © 2025 Bijan Mousavi
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 import json
+import os
 from pathlib import Path
 import sqlite3
+import threading
+import time
 from typing import Any
 
 from bijux_vex.core.identity.ids import fingerprint
+from bijux_vex.infra.metrics import METRICS
+from bijux_vex.infra.vector_codec import (
+    DEFAULT_VECTOR_DTYPE,
+    pack_vector,
+    unpack_vector,
+)
+
+DEFAULT_MEMORY_ENTRIES = 10_000
+# SQLite caps bound parameters per statement (999 on older builds).
+_IN_CHUNK = 500
+_SELECT_MANY = (
+    "SELECT key, vec_blob, vector, metadata, created_at "
+    "FROM embeddings_cache WHERE key IN "
+)
 
 
 @dataclass(frozen=True)
@@ -25,45 +43,257 @@ class EmbeddingCache:
     def set(self, key: str, entry: EmbeddingCacheEntry) -> None:
         raise NotImplementedError
 
+    def get_many(self, keys: Iterable[str]) -> dict[str, EmbeddingCacheEntry]:
+        found: dict[str, EmbeddingCacheEntry] = {}
+        for key in keys:
+            entry = self.get(key)
+            if entry is not None:
+                found[key] = entry
+        return found
+
+    def set_many(self, entries: Mapping[str, EmbeddingCacheEntry]) -> None:
+        for key, entry in entries.items():
+            self.set(key, entry)
+
+
+def _env_number(name: str) -> float | None:
+    raw = os.getenv(name)
+    return float(raw) if raw else None
+
 
 class SQLiteEmbeddingCache(EmbeddingCache):
-    def __init__(self, path: str | Path) -> None:
+    """
+    SQLite-backed cache with a bounded in-process LRU in front.
+
+    Vectors are stored as packed float64 blobs (legacy JSON rows are still
+    readable). ``max_entries`` and ``ttl_seconds`` bound the file: expired
+    rows are ignored on read and pruned, oldest first, on write.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        memory_entries: int | None = None,
+        max_entries: int | None = None,
+        ttl_seconds: float | None = None,
+    ) -> None:
         self._path = Path(path)
-        self._conn = sqlite3.connect(self._path)
-        self._conn.execute(
-            "CREATE TABLE IF NOT EXISTS embeddings_cache(key TEXT PRIMARY KEY, vector TEXT, metadata TEXT)"
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        self._lock = threading.RLock()
+        if memory_entries is None:
+            memory_entries = int(
+                _env_number("BIJUX_VEX_EMBED_CACHE_MEMORY_ENTRIES")
+                or DEFAULT_MEMORY_ENTRIES
+            )
+        if max_entries is None:
+            env_max = _env_number("BIJUX_VEX_EMBED_CACHE_MAX_ENTRIES")
+            max_entries = int(env_max) if env_max else None
+        if ttl_seconds is None:
+            ttl_seconds = _env_number("BIJUX_VEX_EMBED_CACHE_TTL_S")
+        self.memory_entries = max(0, memory_entries)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._memory: OrderedDict[str, tuple[float, EmbeddingCacheEntry]] = (
+            OrderedDict()
         )
-        self._conn.commit()
+        self.hits = 0
+        self.memory_hits = 0
+        self.misses = 0
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings_cache(key TEXT PRIMARY KEY, vector TEXT, metadata TEXT)"
+            )
+            existing = {
+                row[1]
+                for row in self._conn.execute(
+                    "PRAGMA table_info(embeddings_cache)"
+                ).fetchall()
+            }
+            if "vec_blob" not in existing:
+                self._conn.execute(
+                    "ALTER TABLE embeddings_cache ADD COLUMN vec_blob BLOB"
+                )
+            if "created_at" not in existing:
+                self._conn.execute(
+                    "ALTER TABLE embeddings_cache ADD COLUMN created_at REAL"
+                )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS embeddings_cache_created ON embeddings_cache(created_at)"
+            )
+            self._conn.commit()
 
     def get(self, key: str) -> EmbeddingCacheEntry | None:
-        row = self._conn.execute(
-            "SELECT vector, metadata FROM embeddings_cache WHERE key=?", (key,)
-        ).fetchone()
-        if not row:
-            return None
-        vector = tuple(float(v) for v in json.loads(row[0]))
-        metadata = json.loads(row[1]) if row[1] else {}
-        return EmbeddingCacheEntry(vector=vector, metadata=metadata)
+        return self.get_many([key]).get(key)
 
     def set(self, key: str, entry: EmbeddingCacheEntry) -> None:
-        self._conn.execute(
-            "REPLACE INTO embeddings_cache(key, vector, metadata) VALUES(?,?,?)",
-            (key, json.dumps(list(entry.vector)), json.dumps(entry.metadata)),
+        self.set_many({key: entry})
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, EmbeddingCacheEntry]:
+        wanted = list(dict.fromkeys(keys))
+        cutoff = self._cutoff()
+        found: dict[str, EmbeddingCacheEntry] = {}
+        with self._lock:
+            pending: list[str] = []
+            for key in wanted:
+                cached = self._memory.get(key)
+                if cached is not None and (cutoff is None or cached[0] >= cutoff):
+                    self._memory.move_to_end(key)
+                    found[key] = cached[1]
+                else:
+                    pending.append(key)
+            memory_hits = len(found)
+            for start in range(0, len(pending), _IN_CHUNK):
+                chunk = pending[start : start + _IN_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                query = _SELECT_MANY + f"({placeholders})"
+                rows = self._conn.execute(query, chunk).fetchall()
+                for key, blob, legacy, metadata, created_at in rows:
+                    if cutoff is not None and (created_at or 0.0) < cutoff:
+                        continue
+                    vector = (
+                        unpack_vector(blob, DEFAULT_VECTOR_DTYPE)
+                        if blob is not None
+                        else tuple(float(v) for v in json.loads(legacy))
+                    )
+                    entry = EmbeddingCacheEntry(
+                        vector=vector, metadata=json.loads(metadata) if metadata else {}
+                    )
+                    found[key] = entry
+                    self._remember(key, created_at or time.time(), entry)
+            self.memory_hits += memory_hits
+            self.hits += len(found)
+            self.misses += len(wanted) - len(found)
+        METRICS.increment("embedding_cache_hits", value=len(found))
+        METRICS.increment("embedding_cache_memory_hits", value=memory_hits)
+        METRICS.increment("embedding_cache_misses", value=len(wanted) - len(found))
+        return found
+
+    def set_many(self, entries: Mapping[str, EmbeddingCacheEntry]) -> None:
+        if not entries:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "REPLACE INTO embeddings_cache(key, vector, vec_blob, metadata, created_at) VALUES(?,?,?,?,?)",
+                [
+                    (
+                        key,
+                        None,
+                        pack_vector(entry.vector, DEFAULT_VECTOR_DTYPE),
+                        json.dumps(entry.metadata),
+                        now,
+                    )
+                    for key, entry in entries.items()
+                ],
+            )
+            for key, entry in entries.items():
+                self._remember(key, now, entry)
+            self._prune()
+            self._conn.commit()
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "memory_hits": self.memory_hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _cutoff(self) -> float | None:
+        if not self.ttl_seconds:
+            return None
+        return time.time() - self.ttl_seconds
+
+    def _remember(
+        self, key: str, created_at: float, entry: EmbeddingCacheEntry
+    ) -> None:
+        if not self.memory_entries:
+            return
+        self._memory[key] = (created_at, entry)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _prune(self) -> None:
+        cutoff = self._cutoff()
+        if cutoff is not None:
+            expired = self._conn.execute(
+                "DELETE FROM embeddings_cache WHERE COALESCE(created_at, 0) < ?",
+                (cutoff,),
+            ).rowcount
+            for key in [k for k, (ts, _) in self._memory.items() if ts < cutoff]:
+                del self._memory[key]
+            if expired > 0:
+                METRICS.increment("embedding_cache_expired", value=expired)
+        if self.max_entries is None:
+            return
+        (count,) = self._conn.execute(
+            "SELECT COUNT(*) FROM embeddings_cache"
+        ).fetchone()
+        excess = count - self.max_entries
+        if excess <= 0:
+            return
+        oldest = [
+            row[0]
+            for row in self._conn.execute(
+                "SELECT key FROM embeddings_cache "
+                "ORDER BY COALESCE(created_at, 0), key LIMIT ?",
+                (excess,),
+            ).fetchall()
+        ]
+        self._conn.executemany(
+            "DELETE FROM embeddings_cache WHERE key = ?", [(key,) for key in oldest]
         )
-        self._conn.commit()
+        for key in oldest:
+            self._memory.pop(key, None)
+        METRICS.increment("embedding_cache_evictions", value=len(oldest))
+
+
+_CACHES: dict[str, SQLiteEmbeddingCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def _sqlite_cache(path: str | Path) -> SQLiteEmbeddingCache:
+    # One instance per file so the in-memory LRU survives across ingests.
+    resolved = str(Path(path).resolve())
+    with _CACHES_LOCK:
+        cache = _CACHES.get(resolved)
+        if cache is None:
+            cache = _CACHES[resolved] = SQLiteEmbeddingCache(resolved)
+        return cache
+
+
+def close_caches() -> None:
+    """Close the shared SQLite caches; the next build_cache reopens them."""
+    with _CACHES_LOCK:
+        caches = list(_CACHES.values())
+        _CACHES.clear()
+    for cache in caches:
+        cache.close()
 
 
 def build_cache(cache_spec: str | None) -> EmbeddingCache | None:
     if not cache_spec:
         return None
     if cache_spec.lower() == "sqlite":
-        return SQLiteEmbeddingCache(Path.cwd() / "embeddings-cache.sqlite")
+        return _sqlite_cache(Path.cwd() / "embeddings-cache.sqlite")
     if cache_spec.lower().startswith("sqlite:"):
         path = cache_spec.split(":", 1)[1]
-        return SQLiteEmbeddingCache(path)
+        return _sqlite_cache(path)
     if cache_spec.lower().startswith("vdb"):
         raise ValueError("VDB embedding cache is not supported yet")
-    return SQLiteEmbeddingCache(cache_spec)
+    return _sqlite_cache(cache_spec)
 
 
 def cache_key(model_id: str, text: str, config_hash: str) -> str:
@@ -92,10 +322,12 @@ def metadata_as_dict(meta: Mapping[str, Any]) -> dict[str, str | None]:
 
 
 __all__ = [
+    "DEFAULT_MEMORY_ENTRIES",
     "EmbeddingCacheEntry",
     "EmbeddingCache",
     "SQLiteEmbeddingCache",
     "build_cache",
+    "close_caches",
     "cache_key",
     "metadata_as_dict",
     "embedding_config_hash",
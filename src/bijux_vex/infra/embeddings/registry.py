@@ -5,6 +5,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+import importlib.util
+import os
 from typing import Any
 
 from bijux_vex.core.errors import PluginLoadError
@@ -45,6 +47,10 @@ class EmbeddingProvider(ABC):
     ) -> EmbeddingBatch:
         raise NotImplementedError
 
+    def warm_up(self, model: str, options: Mapping[str, str] | None = None) -> None:
+        """Load ``model`` ahead of the first embed call; no-op by default."""
+        return None
+
 
 EmbeddingProviderFactory = Callable[[], EmbeddingProvider]
 
@@ -146,17 +152,41 @@ class EmbeddingProviderRegistry:
 EMBEDDING_PROVIDERS = EmbeddingProviderRegistry()
 
 
+def preload_embedding_models(spec: str | None = None) -> list[str]:
+    """
+    Warm up the models listed in ``spec`` (default ``BIJUX_VEX_EMBED_PRELOAD``).
+
+    Entries are comma-separated ``model`` or ``provider:model``; returns the
+    models that were warmed up.
+    """
+    raw = spec if spec is not None else os.getenv("BIJUX_VEX_EMBED_PRELOAD", "")
+    warmed: list[str] = []
+    for entry in (item.strip() for item in raw.split(",")):
+        if not entry:
+            continue
+        provider_name, _, model = entry.rpartition(":")
+        EMBEDDING_PROVIDERS.resolve(provider_name or None).warm_up(model)
+        warmed.append(model)
+    return warmed
+
+
+def _sentence_transformers_provider() -> EmbeddingProvider:
+    # Imported lazily: the provider module imports this registry, so an
+    # eager import here fails whenever the provider module is loaded first.
+    from bijux_vex.infra.embeddings.sentence_transformers import (
+        SentenceTransformersProvider,
+    )
+
+    return SentenceTransformersProvider()
+
+
 def _register_sentence_transformers() -> None:
-    try:
-        from bijux_vex.infra.embeddings.sentence_transformers import (
-            SentenceTransformersProvider,
-        )
-    except Exception:
+    if importlib.util.find_spec("numpy") is None:
         return
 
     EMBEDDING_PROVIDERS.register(
         "sentence_transformers",
-        factory=SentenceTransformersProvider,
+        factory=_sentence_transformers_provider,
         contract=PluginContract(
             determinism="model_dependent",
             randomness_sources=("model_init", "runtime_device"),
@@ -193,4 +223,5 @@ __all__ = [
     "EmbeddingProvider",
     "EmbeddingProviderRegistry",
     "EMBEDDING_PROVIDERS",
+    "preload_embedding_models",
 ]
@@ -2,7 +2,12 @@
 # Copyright © 2025 Bijan Mousavi
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Mapping
+from dataclasses import dataclass, field
+import os
+import threading
+from typing import Any
 
 try:  # pragma: no cover - optional dependency
     import sentence_transformers
@@ -19,6 +24,141 @@ from bijux_vex.infra.embeddings.registry import (
     EmbeddingMetadata,
     EmbeddingProvider,
 )
+from bijux_vex.infra.logging import log_event
+from bijux_vex.infra.metrics import METRICS, timed
+
+# Options that only change how encoding runs, never the resulting vectors.
+RUNTIME_OPTIONS = frozenset({"batch_size", "processes"})
+# Options consumed at encode time; everything else is passed to the loader.
+_ENCODE_OPTIONS = RUNTIME_OPTIONS | {"normalize", "device"}
+DEFAULT_MAX_MODELS = 2
+
+ModelKey = tuple[str, str | None, tuple[tuple[str, str], ...]]
+
+
+@dataclass
+class _LoadedModel:
+    encoder: Any
+    pool: Any = None
+    pool_size: int = 0
+    pool_lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class SentenceTransformerCache:
+    """
+    Process-wide LRU of loaded models keyed by (model, device, load options).
+
+    Loads run outside the cache lock so a slow model does not block hits
+    on other models; concurrent misses on the same key load once.
+    """
+
+    def __init__(self, max_models: int | None = None) -> None:
+        if max_models is None:
+            raw = os.getenv("BIJUX_VEX_EMBED_MAX_MODELS")
+            max_models = int(raw) if raw else DEFAULT_MAX_MODELS
+        self.max_models = max(1, max_models)
+        self._entries: OrderedDict[ModelKey, _LoadedModel] = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading: dict[ModelKey, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def get(
+        self, model: str, device: str | None, options: Mapping[str, str]
+    ) -> _LoadedModel:
+        key = model_key(model, device, options)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                METRICS.increment("embedding_model_cache_hits")
+                return entry
+            load_lock = self._loading.setdefault(key, threading.Lock())
+        with load_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    METRICS.increment("embedding_model_cache_hits")
+                    return entry
+            entry = self._load(model, device, key)
+            with self._lock:
+                self.misses += 1
+                METRICS.increment("embedding_model_cache_misses")
+                self._entries[key] = entry
+                evicted = []
+                while len(self._entries) > self.max_models:
+                    evicted.append(self._entries.popitem(last=False))
+                    self.evictions += 1
+                self._loading.pop(key, None)
+        for evicted_key, evicted_entry in evicted:
+            _stop_pool(evicted_entry)
+            log_event("embedding_model_evicted", model=evicted_key[0])
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            _stop_pool(entry)
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "resident": [key[0] for key in self._entries],
+                "max_models": self.max_models,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    @staticmethod
+    def _load(model: str, device: str | None, key: ModelKey) -> _LoadedModel:
+        if SentenceTransformer is None:  # pragma: no cover - optional dependency
+            raise ImportError("sentence-transformers is not available")
+        load_kwargs: dict[str, Any] = dict(key[2])
+        if "trust_remote_code" in load_kwargs:
+            load_kwargs["trust_remote_code"] = (
+                str(load_kwargs["trust_remote_code"]).lower() == "true"
+            )
+        with timed("embedding_model_load_ms") as elapsed:
+            encoder = SentenceTransformer(model, device=device, **load_kwargs)
+        log_event("embedding_model_loaded", model=model, elapsed_ms=elapsed())
+        return _LoadedModel(encoder=encoder)
+
+
+def model_key(model: str, device: str | None, options: Mapping[str, str]) -> ModelKey:
+    load_options = tuple(
+        sorted((k, str(v)) for k, v in options.items() if k not in _ENCODE_OPTIONS)
+    )
+    return (model, device, load_options)
+
+
+def _stop_pool(entry: _LoadedModel) -> None:
+    if entry.pool is not None:
+        entry.encoder.stop_multi_process_pool(entry.pool)
+        entry.pool = None
+        entry.pool_size = 0
+
+
+MODEL_CACHE = SentenceTransformerCache()
+
+
+def preload_model(
+    model: str, options: Mapping[str, str] | None = None
+) -> dict[str, object]:
+    """Load a model into the process-wide cache ahead of the first embed call."""
+    options = dict(options or {})
+    MODEL_CACHE.get(model, options.get("device"), options)
+    return MODEL_CACHE.stats()
 
 
 class SentenceTransformersProvider(EmbeddingProvider):
@@ -28,6 +168,9 @@ class SentenceTransformersProvider(EmbeddingProvider):
     def provider_version(self) -> str | None:
         return getattr(sentence_transformers, "__version__", None)
 
+    def warm_up(self, model: str, options: Mapping[str, str] | None = None) -> None:
+        preload_model(model, options)
+
     def embed(
         self, texts: list[str], model: str, options: Mapping[str, str] | None = None
     ) -> EmbeddingBatch:
@@ -40,14 +183,41 @@ class SentenceTransformersProvider(EmbeddingProvider):
         options = dict(options or {})
         options.setdefault("normalize", "false")
         device = options.get("device")
-        encoder = SentenceTransformer(model, device=device)
-        vectors = encoder.encode(
-            texts,
-            convert_to_numpy=True,
-            normalize_embeddings=options.get("normalize", "false").lower() == "true",
-            show_progress_bar=False,
+        batch_size = int(
+            options.get("batch_size") or os.getenv("BIJUX_VEX_EMBED_BATCH_SIZE") or 32
+        )
+        processes = int(
+            options.get("processes") or os.getenv("BIJUX_VEX_EMBED_PROCESSES") or 1
         )
+        normalize = options.get("normalize", "false").lower() == "true"
+        loaded = MODEL_CACHE.get(model, device, options)
+        encoder = loaded.encoder
+        with timed("embedding_encode_ms"):
+            if processes > 1 and device in {None, "cpu"} and len(texts) > batch_size:
+                with loaded.pool_lock:
+                    if loaded.pool_size != processes:
+                        _stop_pool(loaded)
+                        loaded.pool = encoder.start_multi_process_pool(
+                            target_devices=["cpu"] * processes
+                        )
+                        loaded.pool_size = processes
+                    vectors = encoder.encode_multi_process(
+                        texts,
+                        loaded.pool,
+                        batch_size=batch_size,
+                        normalize_embeddings=normalize,
+                    )
+            else:
+                vectors = encoder.encode(
+                    texts,
+                    batch_size=batch_size,
+                    convert_to_numpy=True,
+                    normalize_embeddings=normalize,
+                    show_progress_bar=False,
+                )
+        METRICS.increment("embedding_texts_encoded", value=len(texts))
         vectors = np.asarray(vectors, dtype="float32")
+        hashed_options = {k: v for k, v in options.items() if k not in RUNTIME_OPTIONS}
         metadata = EmbeddingMetadata(
             provider=self.name,
             provider_version=self.provider_version,
@@ -59,7 +229,10 @@ class SentenceTransformersProvider(EmbeddingProvider):
             embedding_dtype=str(vectors.dtype),
             embedding_normalization=options.get("normalize"),
             config_hash=embedding_config_hash(
-                self.name, model, options, provider_version=self.provider_version
+                self.name,
+                model,
+                hashed_options,
+                provider_version=self.provider_version,
             ),
         )
         return EmbeddingBatch(
@@ -68,4 +241,11 @@ class SentenceTransformersProvider(EmbeddingProvider):
         )
 
 
-__all__ = ["SentenceTransformersProvider"]
+__all__ = [
+    "MODEL_CACHE",
+    "RUNTIME_OPTIONS",
+    "SentenceTransformerCache",
+    "SentenceTransformersProvider",
+    "model_key",
+    "preload_model",
+]
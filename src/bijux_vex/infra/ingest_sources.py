@@ -0,0 +1,155 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+"""
+Lazy readers and checkpoints for streaming bulk ingest.
+
+Sources are read row by row (JSONL) or through a memory map (NPY), so
+memory stays bounded by the batch size rather than the corpus size.
+Checkpoints record how many source rows have been committed; a resumed
+run skips exactly those rows.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass
+from itertools import islice
+import json
+import os
+from pathlib import Path
+
+from bijux_vex.core.errors import ValidationError
+
+DEFAULT_INGEST_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class IngestRecord:
+    text: str
+    vector: tuple[float, ...] | None = None
+
+
+def iter_jsonl_records(path: str | Path, start: int = 0) -> Iterator[IngestRecord]:
+    """
+    Yield one record per non-empty line.
+
+    Lines are objects with ``text`` (or ``document``) and an optional
+    ``vector``; a bare string is a document without a vector.
+    """
+    with Path(path).open(encoding="utf-8") as handle:
+        rows = (line for line in handle if line.strip())
+        for lineno, line in enumerate(islice(rows, start, None), start=start + 1):
+            try:
+                raw = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValidationError(
+                    message=f"{path}: record {lineno} is not valid JSON"
+                ) from exc
+            if isinstance(raw, str):
+                yield IngestRecord(text=raw)
+                continue
+            if not isinstance(raw, dict):
+                raise ValidationError(
+                    message=f"{path}: record {lineno} must be an object"
+                )
+            text = raw.get("text", raw.get("document"))
+            if not isinstance(text, str):
+                raise ValidationError(message=f"{path}: record {lineno} has no text")
+            vector = raw.get("vector")
+            yield IngestRecord(
+                text=text,
+                vector=tuple(float(v) for v in vector) if vector is not None else None,
+            )
+
+
+def iter_npy_records(
+    path: str | Path, texts: str | Path | None = None, start: int = 0
+) -> Iterator[IngestRecord]:
+    """
+    Yield rows of a 2-D ``.npy`` matrix through a read-only memory map.
+
+    ``texts`` is an optional file with one document per line; without it
+    each row is labelled ``<file name>:<row>``.
+    """
+    import numpy as np
+
+    matrix = np.load(Path(path), mmap_mode="r", allow_pickle=False)
+    if matrix.ndim != 2:
+        raise ValidationError(message=f"{path}: expected a 2-D array of vectors")
+    name = Path(path).name
+    with ExitStack() as stack:
+        labels: Iterator[str] | None = None
+        if texts is not None:
+            handle = stack.enter_context(Path(texts).open(encoding="utf-8"))
+            labels = islice((line.rstrip("\n") for line in handle), start, None)
+        for row in range(start, matrix.shape[0]):
+            text = next(labels, None) if labels is not None else f"{name}:{row}"
+            if text is None:
+                raise ValidationError(
+                    message=f"{texts}: fewer lines than vectors in {path}"
+                )
+            yield IngestRecord(text=text, vector=tuple(matrix[row].tolist()))
+
+
+def open_ingest_source(
+    path: str | Path, texts: str | Path | None = None, start: int = 0
+) -> Iterator[IngestRecord]:
+    suffix = Path(path).suffix.lower()
+    if suffix == ".npy":
+        return iter_npy_records(path, texts=texts, start=start)
+    if texts is not None:
+        raise ValidationError(message="texts file is only supported for .npy sources")
+    if suffix in {".jsonl", ".ndjson"}:
+        return iter_jsonl_records(path, start=start)
+    raise ValidationError(
+        message=f"Unsupported ingest source {path}; use .jsonl or .npy"
+    )
+
+
+def batched(records: Iterable[IngestRecord], size: int) -> Iterator[list[IngestRecord]]:
+    if size <= 0:
+        raise ValidationError(message="batch size must be positive")
+    iterator = iter(records)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+@dataclass
+class IngestCheckpoint:
+    """Progress of one streaming ingest; fingerprints are chained per batch."""
+
+    source: str
+    rows: int = 0
+    batches: int = 0
+    corpus_fingerprint: str | None = None
+    vector_fingerprint: str | None = None
+
+    @classmethod
+    def load(cls, path: str | Path, source: str) -> IngestCheckpoint:
+        checkpoint_path = Path(path)
+        if not checkpoint_path.exists():
+            return cls(source=source)
+        data = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+        if data.get("source") != source:
+            raise ValidationError(
+                message=f"Checkpoint {path} belongs to {data.get('source')!r}, not {source!r}"
+            )
+        return cls(**data)
+
+    def save(self, path: str | Path) -> None:
+        checkpoint_path = Path(path)
+        tmp = checkpoint_path.with_name(checkpoint_path.name + ".tmp")
+        tmp.write_text(json.dumps(asdict(self), sort_keys=True), encoding="utf-8")
+        os.replace(tmp, checkpoint_path)
+
+
+__all__ = [
+    "DEFAULT_INGEST_BATCH_SIZE",
+    "IngestCheckpoint",
+    "IngestRecord",
+    "batched",
+    "iter_jsonl_records",
+    "iter_npy_records",
+    "open_ingest_source",
+]
@@ -0,0 +1,136 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+"""
+In-memory inverted index from metadata values to vector ids.
+
+Posting lists are sets of vector ids, so memory grows with the number of
+vectors rather than with ids times positions, and filters intersect the
+smallest lists first. The index is updated in place as vectors, chunks and
+documents change instead of being rebuilt per write.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Set
+from typing import NamedTuple
+
+from bijux_vex.core.metadata_filter import MetadataFilter
+
+_NO_IDS: frozenset[str] = frozenset()
+
+
+class _Row(NamedTuple):
+    chunk_id: str
+    document_id: str
+    source: str | None
+    tags: frozenset[str]
+
+
+class MetadataIndex:
+    def __init__(
+        self,
+        rows: Iterable[tuple[str, str, str, str | None, Iterable[str]]] = (),
+    ) -> None:
+        """``rows`` are (vector_id, chunk_id, document_id, source_uri, tags)."""
+        self._rows: dict[str, _Row] = {}
+        self._chunks: dict[str, set[str]] = {}
+        self._documents: dict[str, set[str]] = {}
+        self._sources: dict[str, set[str]] = {}
+        self._tags: dict[str, set[str]] = {}
+        for row in rows:
+            self.upsert(*row)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def upsert(
+        self,
+        vector_id: str,
+        chunk_id: str,
+        document_id: str,
+        source: str | None,
+        tags: Iterable[str],
+    ) -> None:
+        self.remove(vector_id)
+        row = _Row(chunk_id, document_id, source, frozenset(tags))
+        self._rows[vector_id] = row
+        _add(self._chunks, chunk_id, vector_id)
+        self._link(vector_id, row)
+        for tag in row.tags:
+            _add(self._tags, tag, vector_id)
+
+    def relink(self, vector_id: str, document_id: str, source: str | None) -> None:
+        """Move an indexed vector to a new document/source, keeping its tags."""
+        row = self._rows.get(vector_id)
+        if row is None or (row.document_id, row.source) == (document_id, source):
+            return
+        self._unlink(vector_id, row)
+        row = row._replace(document_id=document_id, source=source)
+        self._rows[vector_id] = row
+        self._link(vector_id, row)
+
+    def remove(self, vector_id: str) -> None:
+        row = self._rows.pop(vector_id, None)
+        if row is None:
+            return
+        _discard(self._chunks, row.chunk_id, vector_id)
+        self._unlink(vector_id, row)
+        for tag in row.tags:
+            _discard(self._tags, tag, vector_id)
+
+    def chunk_of(self, vector_id: str) -> str | None:
+        row = self._rows.get(vector_id)
+        return row.chunk_id if row else None
+
+    def vectors_of_chunk(self, chunk_id: str) -> frozenset[str]:
+        return frozenset(self._chunks.get(chunk_id, _NO_IDS))
+
+    def vectors_of_document(self, document_id: str) -> frozenset[str]:
+        return frozenset(self._documents.get(document_id, _NO_IDS))
+
+    def candidates(self, metadata_filter: MetadataFilter) -> frozenset[str]:
+        postings: list[Set[str]] = []
+        if metadata_filter.document_ids is not None:
+            postings.append(_union(self._documents, metadata_filter.document_ids))
+        if metadata_filter.chunk_ids is not None:
+            postings.append(_union(self._chunks, metadata_filter.chunk_ids))
+        if metadata_filter.source_uris is not None:
+            postings.append(_union(self._sources, metadata_filter.source_uris))
+        postings.extend(self._tags.get(tag, _NO_IDS) for tag in metadata_filter.tags)
+        if not postings:
+            return frozenset(self._rows)
+        postings.sort(key=len)
+        return frozenset(postings[0]).intersection(*postings[1:])
+
+    def _link(self, vector_id: str, row: _Row) -> None:
+        _add(self._documents, row.document_id, vector_id)
+        if row.source is not None:
+            _add(self._sources, row.source, vector_id)
+
+    def _unlink(self, vector_id: str, row: _Row) -> None:
+        _discard(self._documents, row.document_id, vector_id)
+        if row.source is not None:
+            _discard(self._sources, row.source, vector_id)
+
+
+def _add(postings: dict[str, set[str]], key: str, vector_id: str) -> None:
+    postings.setdefault(key, set()).add(vector_id)
+
+
+def _discard(postings: dict[str, set[str]], key: str, vector_id: str) -> None:
+    ids = postings.get(key)
+    if ids is None:
+        return
+    ids.discard(vector_id)
+    if not ids:
+        del postings[key]
+
+
+def _union(postings: dict[str, set[str]], keys: Iterable[str]) -> Set[str]:
+    found = [postings[key] for key in keys if key in postings]
+    if len(found) == 1:
+        return found[0]
+    return set().union(*found)
+
+
+__all__ = ["MetadataIndex"]
@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+"""
+SQLite vector storage migration.
+
+Older databases stored vectors as JSON text in ``vectors.vec_values``.
+Vectors now live in a packed little-endian ``vec_blob`` column with a
+declared ``vec_dtype``. Migration runs in place, in bounded batches, and
+is idempotent: rows that already carry a blob are left untouched.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+
+from bijux_vex.infra.vector_codec import (
+    DEFAULT_VECTOR_DTYPE,
+    pack_vector,
+    resolve_dtype,
+)
+
+MIGRATION_BATCH_SIZE = 1000
+
+
+def ensure_vector_blob_columns(conn: sqlite3.Connection) -> None:
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(vectors)").fetchall()}
+    if "vec_blob" not in existing:
+        conn.execute("ALTER TABLE vectors ADD COLUMN vec_blob BLOB")
+    if "vec_dtype" not in existing:
+        conn.execute("ALTER TABLE vectors ADD COLUMN vec_dtype TEXT")
+
+
+def migrate_vector_storage(
+    conn: sqlite3.Connection,
+    dtype: str = DEFAULT_VECTOR_DTYPE,
+    batch_size: int = MIGRATION_BATCH_SIZE,
+) -> int:
+    """Convert JSON vector rows to packed blobs; returns the number of rows migrated."""
+    name = resolve_dtype(dtype)
+    ensure_vector_blob_columns(conn)
+    migrated = 0
+    while True:
+        rows = conn.execute(
+            "SELECT rowid, vec_values FROM vectors "
+            "WHERE vec_blob IS NULL AND vec_values IS NOT NULL LIMIT ?",
+            (batch_size,),
+        ).fetchall()
+        if not rows:
+            break
+        conn.executemany(
+            "UPDATE vectors SET vec_blob=?, vec_dtype=?, vec_values=NULL WHERE rowid=?",
+            [
+                (pack_vector((float(v) for v in json.loads(raw)), name), name, rowid)
+                for rowid, raw in rows
+            ],
+        )
+        conn.commit()
+        migrated += len(rows)
+    return migrated
+
+
+__all__ = [
+    "MIGRATION_BATCH_SIZE",
+    "ensure_vector_blob_columns",
+    "migrate_vector_storage",
+]
@@ -0,0 +1,23 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+"""
+Optional numeric dependencies.
+
+Type checkers always see the real module; at runtime the name is ``None``
+when the dependency is not installed, so callers guard with
+``np is None`` before using it.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    try:  # pragma: no cover - optional dependency
+        import numpy as np
+    except Exception:  # pragma: no cover - optional dependency
+        np = None
+
+__all__ = ["np"]
@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+"""Packed little-endian vector encoding shared by storage backends."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+import sys
+from typing import Any
+
+from bijux_vex.core.errors import ValidationError
+from bijux_vex.infra.optional_deps import np
+
+VECTOR_DTYPES: dict[str, str] = {"float32": "f", "float64": "d"}
+NUMPY_DTYPES: dict[str, str] = {"float32": "<f4", "float64": "<f8"}
+# float64 round-trips Python floats exactly, which keeps scores bit-identical.
+DEFAULT_VECTOR_DTYPE = "float64"
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+def resolve_dtype(dtype: str | None) -> str:
+    name = (dtype or DEFAULT_VECTOR_DTYPE).lower()
+    if name not in VECTOR_DTYPES:
+        raise ValidationError(
+            message=f"Unsupported vector dtype {dtype!r}; expected one of {sorted(VECTOR_DTYPES)}"
+        )
+    return name
+
+
+def itemsize(dtype: str) -> int:
+    return array(VECTOR_DTYPES[resolve_dtype(dtype)]).itemsize
+
+
+def pack_vector(values: Iterable[float], dtype: str = DEFAULT_VECTOR_DTYPE) -> bytes:
+    buf = array(VECTOR_DTYPES[resolve_dtype(dtype)], values)
+    if _BIG_ENDIAN:  # pragma: no cover - platform specific
+        buf.byteswap()
+    return buf.tobytes()
+
+
+def unpack_vector(blob: bytes, dtype: str = DEFAULT_VECTOR_DTYPE) -> tuple[float, ...]:
+    buf = array(VECTOR_DTYPES[resolve_dtype(dtype)])
+    if len(blob) % buf.itemsize:
+        raise ValidationError(message="Packed vector length does not match dtype")
+    buf.frombytes(blob)
+    if _BIG_ENDIAN:  # pragma: no cover - platform specific
+        buf.byteswap()
+    return tuple(buf)
+
+
+def unpack_matrix(
+    blobs: Sequence[bytes], dimension: int, dtype: str = DEFAULT_VECTOR_DTYPE
+) -> Any:
+    """Decode equally sized packed vectors into one (n, dimension) float64 matrix."""
+    if np is None:
+        raise ValidationError(message="numpy is required for matrix decoding")
+    name = resolve_dtype(dtype)
+    raw = b"".join(blobs)
+    matrix = np.frombuffer(raw, dtype=NUMPY_DTYPES[name])
+    if matrix.size != len(blobs) * dimension:
+        raise ValidationError(message="Packed vector length does not match dimension")
+    return matrix.reshape(len(blobs), dimension).astype(np.float64, copy=False)
+
+
+__all__ = [
+    "DEFAULT_VECTOR_DTYPE",
+    "NUMPY_DTYPES",
+    "VECTOR_DTYPES",
+    "itemsize",
+    "pack_vector",
+    "resolve_dtype",
+    "unpack_matrix",
+    "unpack_vector",
+]
@@ -0,0 +1,397 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+"""
+Immutable on-disk vector segments shared across processes.
+
+One segment holds the vectors of one artifact and dimension::
+
+    magic (8) | version (u32) | header length (u32) | JSON header | pad
+    payload: matrix | norms (f64) | vector id table | chunk id table
+
+Payload sections start on 64-byte boundaries and are little-endian. An id
+table is ``rows + 1`` u64 offsets followed by the UTF-8 ids. The header
+records the artifact's ``vector_fingerprint`` and a SHA-256 of the payload,
+so a segment can be checked against its artifact by hashing bytes, without
+decoding floats.
+
+The matrix is float32 when every value round-trips through float32 exactly
+(the usual case for model embeddings) and float64 otherwise, so scores
+computed from a segment match those computed from the store bit for bit.
+Segments are opened with ``numpy.memmap``: every process mapping the same
+file shares one page-cache copy. Files are written to a temporary name and
+renamed into place, so readers never see a partial segment and existing
+mappings stay valid after a rewrite.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import struct
+import threading
+from typing import Any
+import weakref
+
+from bijux_vex.contracts.resources import VectorSource
+from bijux_vex.core.errors import CorruptArtifactError
+from bijux_vex.core.types import ExecutionArtifact, Vector
+from bijux_vex.domain.execution_algorithms.exact_matrix import (
+    VectorMatrix,
+    build_vector_matrix,
+)
+from bijux_vex.infra.optional_deps import np
+
+SEGMENT_MAGIC = b"BVXSEGMT"
+SEGMENT_VERSION = 1
+_PREFIX = struct.Struct("<8sII")
+_ALIGN = 64
+_HASH_BLOCK = 1 << 22
+
+
+@dataclass(frozen=True)
+class SegmentHeader:
+    artifact_id: str
+    vector_fingerprint: str
+    dimension: int
+    rows: int
+    dtype: str
+    max_abs: float
+    checksum: str
+    payload_offset: int
+    payload_length: int
+    sections: dict[str, tuple[int, int]]
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def _id_table(ids: Iterable[str]) -> bytes:
+    encoded = [value.encode("utf-8") for value in ids]
+    offsets: Any = np.zeros(len(encoded) + 1, dtype="<u8")
+    offsets[1:] = np.cumsum([len(item) for item in encoded], dtype=np.uint64)
+    table: bytes = offsets.tobytes()
+    return table + b"".join(encoded)
+
+
+def _read_ids(raw: memoryview, rows: int) -> tuple[str, ...]:
+    offsets = np.frombuffer(raw, dtype="<u8", count=rows + 1).tolist()
+    blob = bytes(raw[(rows + 1) * 8 :])
+    return tuple(
+        blob[start:stop].decode("utf-8")
+        for start, stop in zip(offsets[:-1], offsets[1:], strict=True)
+    )
+
+
+def _storage_dtype(matrix: Any) -> str:
+    narrowed = matrix.astype("<f4")
+    return "float32" if np.array_equal(narrowed.astype("<f8"), matrix) else "float64"
+
+
+def write_segment(
+    path: str | Path,
+    artifact: ExecutionArtifact,
+    vectors: Iterable[Vector],
+    dimension: int,
+) -> SegmentHeader:
+    """Write the artifact's vectors of one dimension, replacing any old segment."""
+    if np is None:
+        raise RuntimeError("numpy is required for vector segments")
+    vm = build_vector_matrix(vectors, dimension)
+    dtype = _storage_dtype(vm.matrix)
+    numpy_dtype = "<f4" if dtype == "float32" else "<f8"
+    parts = {
+        "matrix": np.ascontiguousarray(vm.matrix, dtype=numpy_dtype).tobytes(),
+        "norms": np.ascontiguousarray(vm.norms, dtype="<f8").tobytes(),
+        "vector_ids": _id_table(vm.vector_ids),
+        "chunk_ids": _id_table(vm.chunk_ids),
+    }
+    payload = bytearray()
+    sections: dict[str, tuple[int, int]] = {}
+    for name, data in parts.items():
+        payload.extend(b"\0" * (_aligned(len(payload)) - len(payload)))
+        sections[name] = (len(payload), len(data))
+        payload.extend(data)
+    header_fields: dict[str, Any] = {
+        "artifact_id": artifact.artifact_id,
+        "vector_fingerprint": artifact.vector_fingerprint,
+        "dimension": dimension,
+        "rows": len(vm),
+        "dtype": dtype,
+        "max_abs": vm.max_abs,
+        "checksum": "sha256:" + hashlib.sha256(payload).hexdigest(),
+        "sections": {name: list(span) for name, span in sections.items()},
+    }
+    encoded = json.dumps(header_fields, sort_keys=True).encode("utf-8")
+    payload_offset = _aligned(_PREFIX.size + len(encoded))
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(target.name + ".tmp")
+    with tmp.open("wb") as handle:
+        handle.write(_PREFIX.pack(SEGMENT_MAGIC, SEGMENT_VERSION, len(encoded)))
+        handle.write(encoded)
+        handle.write(b"\0" * (payload_offset - _PREFIX.size - len(encoded)))
+        handle.write(payload)
+        handle.flush()
+        os.fsync(handle.fileno())
+    tmp.replace(target)
+    return _header(header_fields, payload_offset, len(payload))
+
+
+def _header(
+    fields: dict[str, Any], payload_offset: int, payload_length: int
+) -> SegmentHeader:
+    return SegmentHeader(
+        artifact_id=str(fields["artifact_id"]),
+        vector_fingerprint=str(fields["vector_fingerprint"]),
+        dimension=int(fields["dimension"]),
+        rows=int(fields["rows"]),
+        dtype=str(fields["dtype"]),
+        max_abs=float(fields["max_abs"]),
+        checksum=str(fields["checksum"]),
+        payload_offset=payload_offset,
+        payload_length=payload_length,
+        sections={
+            name: (int(span[0]), int(span[1]))
+            for name, span in fields["sections"].items()
+        },
+    )
+
+
+def read_segment_header(path: str | Path) -> SegmentHeader:
+    target = Path(path)
+    with target.open("rb") as handle:
+        prefix = handle.read(_PREFIX.size)
+        if len(prefix) != _PREFIX.size:
+            raise CorruptArtifactError(message=f"Truncated vector segment {target}")
+        magic, version, length = _PREFIX.unpack(prefix)
+        if magic != SEGMENT_MAGIC:
+            raise CorruptArtifactError(message=f"Not a vector segment: {target}")
+        if version != SEGMENT_VERSION:
+            raise CorruptArtifactError(
+                message=f"Unsupported vector segment version {version} in {target}"
+            )
+        try:
+            fields = json.loads(handle.read(length).decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise CorruptArtifactError(
+                message=f"Unreadable vector segment header in {target}"
+            ) from exc
+    payload_offset = _aligned(_PREFIX.size + length)
+    payload_length = target.stat().st_size - payload_offset
+    return _header(fields, payload_offset, payload_length)
+
+
+class VectorSegment:
+    """A memory-mapped segment; ``matrix`` and ``norms`` are views over the file."""
+
+    def __init__(self, path: str | Path) -> None:
+        if np is None:
+            raise RuntimeError("numpy is required for vector segments")
+        self.path = Path(path)
+        self.header = header = read_segment_header(self.path)
+        self._map: Any = np.memmap(self.path, dtype=np.uint8, mode="r")
+        payload = header.payload_offset
+        expected = max(start + size for start, size in header.sections.values())
+        if header.payload_length < expected:
+            raise CorruptArtifactError(message=f"Truncated vector segment {self.path}")
+        self.matrix = (
+            self._section("matrix")
+            .view("<f4" if header.dtype == "float32" else "<f8")
+            .reshape(header.rows, header.dimension)
+        )
+        self.norms = self._section("norms").view("<f8")
+        raw = self._map.data
+        ids = header.sections["vector_ids"]
+        chunks = header.sections["chunk_ids"]
+        self.vector_ids = _read_ids(
+            raw[payload + ids[0] : payload + ids[0] + ids[1]], header.rows
+        )
+        self.chunk_ids = _read_ids(
+            raw[payload + chunks[0] : payload + chunks[0] + chunks[1]], header.rows
+        )
+        self._matrix_view: VectorMatrix | None = None
+
+    def _section(self, name: str) -> Any:
+        start, size = self.header.sections[name]
+        offset = self.header.payload_offset + start
+        return self._map[offset : offset + size]
+
+    def vector_matrix(self) -> VectorMatrix:
+        if self._matrix_view is None:
+            self._matrix_view = VectorMatrix(
+                vector_ids=self.vector_ids,
+                chunk_ids=self.chunk_ids,
+                matrix=self.matrix,
+                norms=self.norms,
+                dimension=self.header.dimension,
+                max_abs=self.header.max_abs,
+            )
+        return self._matrix_view
+
+    def verify(self, artifact: ExecutionArtifact | None = None) -> None:
+        """Check the payload checksum and, if given, the artifact's fingerprint."""
+        header = self.header
+        if artifact is not None and (
+            header.artifact_id != artifact.artifact_id
+            or header.vector_fingerprint != artifact.vector_fingerprint
+        ):
+            raise CorruptArtifactError(
+                message=f"Vector segment {self.path} does not match artifact {artifact.artifact_id}"
+            )
+        digest = hashlib.sha256()
+        raw = self._map.data
+        end = header.payload_offset + header.payload_length
+        for start in range(header.payload_offset, end, _HASH_BLOCK):
+            digest.update(raw[start : min(start + _HASH_BLOCK, end)])
+        if "sha256:" + digest.hexdigest() != header.checksum:
+            raise CorruptArtifactError(
+                message=f"Vector segment {self.path} failed checksum verification"
+            )
+
+
+def open_segment(path: str | Path) -> VectorSegment:
+    return VectorSegment(path)
+
+
+class SegmentStore:
+    """
+    Segment files under one directory, one per (artifact, dimension).
+
+    Readers keep a segment mapped while the file on disk is unchanged and
+    its header still names the artifact's current vector fingerprint.
+    Segments are dropped once the attached source's vector revision moves,
+    whichever path added, rewrote or deleted the vectors.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._open: dict[Path, tuple[tuple[int, int, int], VectorSegment]] = {}
+        self._revision: object | None = None
+
+    def observe(self, revision: object | None) -> None:
+        """Invalidate every segment when ``revision`` differs from the last seen."""
+        if revision is None:
+            return
+        with self._lock:
+            previous, self._revision = self._revision, revision
+        if previous is not None and previous != revision:
+            self.invalidate()
+
+    def path_for(self, artifact_id: str, dimension: int) -> Path:
+        return self.root / f"{artifact_id}.d{dimension}.seg"
+
+    def write(
+        self, artifact: ExecutionArtifact, vectors: Iterable[Vector]
+    ) -> list[SegmentHeader]:
+        materialized = list(vectors)
+        self.invalidate(artifact.artifact_id)
+        return [
+            write_segment(
+                self.path_for(artifact.artifact_id, dimension),
+                artifact,
+                materialized,
+                dimension,
+            )
+            for dimension in sorted({v.dimension for v in materialized})
+        ]
+
+    def segment(
+        self, artifact: ExecutionArtifact, dimension: int
+    ) -> VectorSegment | None:
+        path = self.path_for(artifact.artifact_id, dimension)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            with self._lock:
+                self._open.pop(path, None)
+            return None
+        identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._open.get(path)
+            if cached is None or cached[0] != identity:
+                try:
+                    cached = (identity, VectorSegment(path))
+                except (CorruptArtifactError, FileNotFoundError, ValueError):
+                    self._open.pop(path, None)
+                    return None
+                self._open[path] = cached
+        segment = cached[1]
+        if segment.header.vector_fingerprint != artifact.vector_fingerprint:
+            return None
+        return segment
+
+    def matrix(
+        self, artifact: ExecutionArtifact, dimension: int
+    ) -> VectorMatrix | None:
+        segment = self.segment(artifact, dimension)
+        return segment.vector_matrix() if segment is not None else None
+
+    def verify(self, artifact: ExecutionArtifact) -> list[SegmentHeader]:
+        verified: list[SegmentHeader] = []
+        for path in sorted(self.root.glob(f"{artifact.artifact_id}.d*.seg")):
+            segment = VectorSegment(path)
+            segment.verify(artifact)
+            verified.append(segment.header)
+        return verified
+
+    def invalidate(self, artifact_id: str | None = None) -> None:
+        """
+        Remove one artifact's segments, or all of them when ``artifact_id`` is None.
+
+        Processes that already mapped a removed file keep their copy until
+        their next lookup notices it is gone.
+        """
+        pattern = f"{artifact_id}.d*.seg" if artifact_id is not None else "*.seg"
+        with self._lock:
+            for path in list(self._open):
+                if path.match(pattern):
+                    del self._open[path]
+        if not self.root.exists():
+            return
+        for path in self.root.glob(pattern):
+            path.unlink(missing_ok=True)
+
+
+_STORES: weakref.WeakKeyDictionary[VectorSource, SegmentStore] = (
+    weakref.WeakKeyDictionary()
+)
+_STORES_LOCK = threading.Lock()
+
+
+def attach_segment_store(vectors: VectorSource, store: SegmentStore | None) -> None:
+    """Serve exact scans over ``vectors`` from ``store`` (None detaches)."""
+    with _STORES_LOCK:
+        if store is None:
+            _STORES.pop(vectors, None)
+        else:
+            _STORES[vectors] = store
+    if store is not None:
+        store.observe(vectors.vector_revision())
+
+
+def segment_store_for(vectors: VectorSource) -> SegmentStore | None:
+    with _STORES_LOCK:
+        store = _STORES.get(vectors)
+    if store is not None:
+        store.observe(vectors.vector_revision())
+    return store
+
+
+__all__ = [
+    "SEGMENT_MAGIC",
+    "SEGMENT_VERSION",
+    "SegmentHeader",
+    "SegmentStore",
+    "VectorSegment",
+    "attach_segment_store",
+    "open_segment",
+    "read_segment_header",
+    "segment_store_for",
+    "write_segment",
+]
@@ -2,6 +2,7 @@
 # Copyright © 2025 Bijan Mousavi
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import replace
 import json
 import os
@@ -14,11 +15,13 @@ import uuid
 from bijux_vex.boundaries.pydantic_edges.models import (
     CreateRequest,
     ExecutionArtifactRequest,
+    ExecutionBatchRequestPayload,
     ExecutionRequestPayload,
     ExplainRequest,
     IngestRequest,
 )
 from bijux_vex.contracts.authz import AllowAllAuthz, Authz, DenyAllAuthz
+from bijux_vex.contracts.resources import StoredVectors
 from bijux_vex.contracts.tx import Tx
 from bijux_vex.core.config import ExecutionConfig, VectorStoreConfig
 from bijux_vex.core.contracts.execution_contract import ExecutionContract
@@ -56,9 +59,12 @@ from bijux_vex.core.types import (
     NDSettings,
     Vector,
 )
+from bijux_vex.domain.execution_algorithms.exact_matrix import matrix_available
+from bijux_vex.domain.execution_algorithms.sharded_exact import shutdown_sharding
 from bijux_vex.domain.execution_requests.compare import compare_executions
 from bijux_vex.domain.execution_requests.execute import (
     execute_request,
+    execute_request_batch,
     start_execution_session,
 )
 from bijux_vex.domain.nd.model import NDExecutionModel
@@ -68,53 +74,117 @@ from bijux_vex.infra.adapters.sqlite.backend import sqlite_backend
 from bijux_vex.infra.adapters.vectorstore_registry import VECTOR_STORES
 from bijux_vex.infra.adapters.vectorstore_source import VectorStoreVectorSource
 from bijux_vex.infra.embeddings.cache import (
+    EmbeddingCacheEntry,
     build_cache,
     cache_key,
+    close_caches,
     embedding_config_hash,
     metadata_as_dict,
 )
 from bijux_vex.infra.embeddings.registry import EMBEDDING_PROVIDERS
+from bijux_vex.infra.ingest_sources import (
+    DEFAULT_INGEST_BATCH_SIZE,
+    IngestCheckpoint,
+    batched,
+    open_ingest_source,
+)
 from bijux_vex.infra.logging import log_event
 from bijux_vex.infra.metrics import METRICS, timed
 from bijux_vex.infra.run_store import RunStore
 from bijux_vex.infra.runners.registry import RUNNERS
+from bijux_vex.infra.vector_segment import SegmentStore, attach_segment_store
+from bijux_vex.services.index_builder import BackgroundIndexBuilder
 from bijux_vex.services.policies.id_policy import (
     ContentAddressedIdPolicy,
     IdGenerationStrategy,
 )
 
 _BACKEND_POOL: dict[tuple[str, str], Any] = {}
+_BACKEND_USERS: dict[tuple[str, str], int] = {}
 _BACKEND_LOCK = threading.Lock()
 
 
-def _resolve_backend(backend_env: str, chosen_path: Path) -> Any:
+def _backend_key(backend_env: str, chosen_path: Path) -> tuple[str, str] | None:
+    """Pool key of a shared backend; memory backends are never shared."""
     if backend_env == "memory":
+        return None
+    return (backend_env or "", str(chosen_path))
+
+
+def _resolve_backend(backend_env: str, chosen_path: Path) -> Any:
+    key = _backend_key(backend_env, chosen_path)
+    if key is None:
         from bijux_vex.infra.adapters.memory.backend import memory_backend
 
         return memory_backend()
-    key = (backend_env or "", str(chosen_path))
     with _BACKEND_LOCK:
-        cached = _BACKEND_POOL.get(key)
-        if cached is not None:
-            return cached
-        backend: Any
-        if backend_env == "hnsw":
-            from bijux_vex.infra.adapters.hnsw.backend import hnsw_backend
-
-            backend = hnsw_backend(
-                db_path=str(chosen_path),
-                index_dir=os.getenv("BIJUX_VEX_HNSW_PATH"),
-            )
-        else:
-            backend = sqlite_backend(str(chosen_path))
-        _BACKEND_POOL[key] = backend
+        backend = _BACKEND_POOL.get(key)
+        if backend is None:
+            if backend_env == "hnsw":
+                from bijux_vex.infra.adapters.hnsw.backend import hnsw_backend
+
+                backend = hnsw_backend(
+                    db_path=str(chosen_path),
+                    index_dir=os.getenv("BIJUX_VEX_HNSW_PATH"),
+                )
+            else:
+                backend = sqlite_backend(str(chosen_path))
+            _BACKEND_POOL[key] = backend
+        _BACKEND_USERS[key] = _BACKEND_USERS.get(key, 0) + 1
         return backend
 
 
+def _release_backend(key: tuple[str, str]) -> None:
+    """Drop one user of a pooled backend; the last one closes its connection."""
+    with _BACKEND_LOCK:
+        users = _BACKEND_USERS.get(key, 0) - 1
+        if users > 0:
+            _BACKEND_USERS[key] = users
+            return
+        _BACKEND_USERS.pop(key, None)
+        backend = _BACKEND_POOL.pop(key, None)
+    close = getattr(backend, "close", None)
+    if callable(close):
+        close()
+
+
+def close_shared_resources() -> None:
+    """Shut down process-wide helpers: sharded scan workers and embedding caches."""
+    shutdown_sharding()
+    close_caches()
+
+
+def _ann_runner_override(vectors: Any) -> Any | None:
+    """ANN runner selected through the environment; None keeps the backend's."""
+    kind = (os.getenv("BIJUX_VEX_ANN_RUNNER") or "").lower()
+    if kind not in {"", "default", "ivfflat", "ivfpq", "sq8"}:
+        raise ValidationError(message=f"Unsupported BIJUX_VEX_ANN_RUNNER: {kind}")
+    if not matrix_available():
+        return None
+    if kind == "ivfflat":
+        from bijux_vex.infra.adapters.ann_ivf import IvfFlatAnnRunner
+
+        return IvfFlatAnnRunner(vectors, index_dir=os.getenv("BIJUX_VEX_HNSW_PATH"))
+    if kind == "ivfpq":
+        from bijux_vex.infra.adapters.ann_pq import PQAnnRunner
+
+        return PQAnnRunner(vectors, index_dir=os.getenv("BIJUX_VEX_HNSW_PATH"))
+    if kind == "sq8":
+        from bijux_vex.infra.adapters.ann_quantized import QuantizedAnnRunner
+
+        return QuantizedAnnRunner(vectors)
+    return None
+
+
 def _resolve_correlation_id(raw: str | None) -> str:
     return raw or "req-1"
 
 
+def _chain_fingerprint(previous: str | None, batch: str) -> str:
+    # A single-batch stream fingerprints exactly like a one-shot ingest.
+    return batch if previous is None else fingerprint((previous, batch))
+
+
 class Orchestrator:
     # This module is allowed to be “ugly but bounded”: wiring/glue only.
     # Domain rules belong in domain/core; do not reintroduce policy here.
@@ -124,8 +194,11 @@ class Orchestrator:
         authz: Authz | None = None,
         state_path: str | Path | None = None,
         config: ExecutionConfig | None = None,
+        background_rebuild: bool = False,
     ) -> None:
         self.config = config or ExecutionConfig()
+        self._backend_key: tuple[str, str] | None = None
+        self._closed = False
         if backend is not None:
             self.backend = backend
         else:
@@ -135,6 +208,7 @@ class Orchestrator:
             )
             chosen_path = Path(chosen_raw)
             self.backend = _resolve_backend(backend_env, chosen_path)
+            self._backend_key = _backend_key(backend_env, chosen_path)
         self.vector_store_enabled = self.config.vector_store is not None
         vector_store_cfg = self.config.vector_store or VectorStoreConfig(
             backend="memory"
@@ -156,6 +230,24 @@ class Orchestrator:
                     self.backend.stores.vectors, self.vector_store_resolution
                 )
             )
+        segment_root = os.getenv("BIJUX_VEX_SEGMENT_PATH")
+        self.segments = SegmentStore(segment_root) if segment_root else None
+        if self.segments is not None:
+            attach_segment_store(self.stores.vectors, self.segments)
+        if getattr(self.backend, "ann", None) is not None:
+            ann_override = _ann_runner_override(self.stores.vectors)
+            if ann_override is not None:
+                self.backend = self.backend._replace(ann=ann_override)
+        self.index_builder: BackgroundIndexBuilder | None = None
+        # Off unless the owner closes the engine (the API pool does); the env
+        # var overrides either way.
+        rebuild_env = (os.getenv("BIJUX_VEX_ND_BACKGROUND_REBUILD") or "").lower()
+        if rebuild_env:
+            background_rebuild = rebuild_env not in {"0", "false", "no"}
+        if getattr(self.backend, "ann", None) is not None and background_rebuild:
+            self.index_builder = BackgroundIndexBuilder(
+                self.stores.vectors, self.backend.ann, self._on_index_rebuilt
+            )
         if authz is not None:
             self.authz = authz
         else:
@@ -186,6 +278,32 @@ class Orchestrator:
             os.getenv("BIJUX_VEX_ND_CIRCUIT_COOLDOWN_S") or "30"
         )
         self._nd_circuit_open_until = 0.0
+        # Guards the ND rate window and circuit counters across request threads.
+        self._nd_guard_lock = threading.Lock()
+
+    @property
+    def holds_state_in_memory(self) -> bool:
+        """True when ingested data lives only in this engine's process memory."""
+        if getattr(self.backend, "name", None) == "memory":
+            return True
+        return (
+            self.vector_store_enabled
+            and self.vector_store_resolution.descriptor.name == "memory"
+        )
+
+    def close(self) -> None:
+        """Stop background rebuilds, flush ANN indices and release the backend; idempotent."""
+        if self._closed:
+            return
+        self._closed = True
+        if self.index_builder is not None:
+            self.index_builder.close()
+        ann_runner = getattr(self.backend, "ann", None)
+        if ann_runner is not None:
+            ann_runner.flush()
+        if self._backend_key is not None:
+            _release_backend(self._backend_key)
+        log_event("engine_closed", backend=getattr(self.backend, "name", "unknown"))
 
     def _tx(self) -> Tx:
         return cast(Tx, self.backend.tx_factory())
@@ -274,19 +392,20 @@ class Orchestrator:
         if req.execution_contract is not ExecutionContract.NON_DETERMINISTIC:
             return
         now = time.time()
-        if now < self._nd_circuit_open_until:
-            raise BackendUnavailableError(
-                message="ND backend temporarily unavailable (circuit open)"
-            )
-        if self._nd_rate_limit > 0:
-            if now - self._nd_rate_window_start > self._nd_rate_window_seconds:
-                self._nd_rate_window_start = now
-                self._nd_rate_count = 0
-            self._nd_rate_count += 1
-            if self._nd_rate_count > self._nd_rate_limit:
-                raise BudgetExceededError(
-                    message="ND rate limit exceeded for this node"
+        with self._nd_guard_lock:
+            if now < self._nd_circuit_open_until:
+                raise BackendUnavailableError(
+                    message="ND backend temporarily unavailable (circuit open)"
                 )
+            if self._nd_rate_limit > 0:
+                if now - self._nd_rate_window_start > self._nd_rate_window_seconds:
+                    self._nd_rate_window_start = now
+                    self._nd_rate_count = 0
+                self._nd_rate_count += 1
+                if self._nd_rate_count > self._nd_rate_limit:
+                    raise BudgetExceededError(
+                        message="ND rate limit exceeded for this node"
+                    )
 
     def _build_randomness_profile(
         self, req: ExecutionRequestPayload
@@ -385,6 +504,7 @@ class Orchestrator:
                 "nd_ef_search": req.nd_ef_search,
                 "nd_max_ef_search": req.nd_max_ef_search,
                 "nd_space": req.nd_space,
+                "nd_num_threads": req.nd_num_threads,
             },
             "backend": getattr(self.backend, "name", "unknown"),
             "vector_store": {
@@ -410,13 +530,21 @@ class Orchestrator:
         default_runner = None
         nd_notes: list[str] = []
         if ann_runner is not None:
-            default_runner = (
-                "hnsw"
-                if ann_runner.__class__.__name__ == "HnswAnnRunner"
-                else "reference"
-            )
+            default_runner = {
+                "HnswAnnRunner": "hnsw",
+                "IvfFlatAnnRunner": "ivfflat",
+                "PQAnnRunner": "ivfpq",
+                "QuantizedAnnRunner": "sq8",
+            }.get(ann_runner.__class__.__name__, "reference")
             if default_runner == "reference":
                 nd_notes.append("hnswlib not installed; using reference ANN runner")
+        nd_report: dict[str, Any] = {}
+        catalog_stats = ann_runner.catalog_stats() if ann_runner is not None else {}
+        if catalog_stats:
+            nd_report["index_catalog"] = catalog_stats
+        index_builds = self.index_builder.status() if self.index_builder else {}
+        if index_builds:
+            nd_report["index_builds"] = index_builds
         nd_health = {
             "status": "open" if time.time() < self._nd_circuit_open_until else "closed",
             "failures": self._nd_circuit_failures,
@@ -489,6 +617,7 @@ class Orchestrator:
                     "default_runner": default_runner,
                     "health": nd_health,
                     "notes": tuple(nd_notes),
+                    **nd_report,
                 },
                 "storage_backends": storage_backends,
                 "vector_stores": vector_stores,
@@ -512,6 +641,7 @@ class Orchestrator:
                 "default_runner": default_runner,
                 "health": nd_health,
                 "notes": tuple(nd_notes),
+                **nd_report,
             },
             "storage_backends": storage_backends,
             "vector_stores": vector_stores,
@@ -542,165 +672,391 @@ class Orchestrator:
         log_event(
             "ingest_start", correlation_id=correlation_id, count=len(req.documents)
         )
-        vectors_input = list(req.vectors or [])
-        vectors: list[list[float]] = []
-        embedding_meta_by_index: dict[int, dict[str, str | None]] = {}
-        embedding_model: str | None = None
-        if vectors_input:
-            vectors = vectors_input
+        if req.vectors:
+            vectors = [list(vec) for vec in req.vectors]
+            embedding_meta_by_index: dict[int, dict[str, str | None]] = {}
+            embedding_model: str | None = None
         else:
-            embed_provider = None
-            embed_model = None
-            cache_spec = None
-            if self.config.embeddings is not None:
-                embed_provider = self.config.embeddings.provider
-                embed_model = self.config.embeddings.model
-                if self.config.embeddings.cache is not None:
-                    cache_spec = (
-                        self.config.embeddings.cache.uri
-                        or self.config.embeddings.cache.backend
-                    )
-            embed_provider = embed_provider or req.embed_provider
-            embed_model = embed_model or req.embed_model
-            cache_spec = cache_spec or req.cache_embeddings
-            if not embed_model:
-                raise ValidationError(
-                    message="embed_model required when vectors are omitted"
-                )
-            embedding_model = embed_model
-            try:
-                provider = EMBEDDING_PROVIDERS.resolve(embed_provider)
-            except ValueError as exc:
-                raise ValidationError(message=str(exc)) from exc
-            options: dict[str, str] = {"normalize": "false"}
-            config_hash = embedding_config_hash(
-                provider.name,
-                embed_model,
-                options,
-                provider_version=provider.provider_version,
+            vectors, embedding_meta_by_index, embedding_model = self._embed_documents(
+                req.documents,
+                embed_provider=req.embed_provider,
+                embed_model=req.embed_model,
+                cache_embeddings=req.cache_embeddings,
             )
-            try:
-                cache = build_cache(cache_spec)
-            except ValueError as exc:
-                raise ValidationError(message=str(exc)) from exc
-            pending_texts: list[str] = []
-            pending_idx: list[int] = []
-            vectors = [[0.0] for _ in req.documents]
-            if cache is not None:
-                for idx, doc_text in enumerate(req.documents):
-                    key = cache_key(embed_model, doc_text, config_hash)
-                    entry = cache.get(key)
-                    if entry:
-                        expected = {
-                            "embedding_provider": provider.name,
-                            "embedding_provider_version": provider.provider_version,
-                            "embedding_normalization": options.get("normalize"),
-                        }
-                        if any(
-                            entry.metadata.get(k) != ("" if v is None else str(v))
-                            for k, v in expected.items()
-                        ):
-                            entry = None
-                    if entry:
-                        vectors[idx] = list(entry.vector)
-                        embedding_meta_by_index[idx] = entry.metadata
-                    else:
-                        pending_texts.append(doc_text)
-                        pending_idx.append(idx)
-            else:
-                pending_texts = list(req.documents)
-                pending_idx = list(range(len(req.documents)))
-            if pending_texts:
-                batch = provider.embed(pending_texts, embed_model, options=options)
-                if len(batch.vectors) != len(pending_idx):
+        with timed("ingest_latency_ms") as elapsed, self._tx() as tx:
+            written, replaced = self._write_ingest_batch(
+                tx, req.documents, vectors, embedding_model, embedding_meta_by_index
+            )
+        METRICS.increment("vectors_indexed_total", value=len(req.documents))
+        log_event("ingest_end", correlation_id=correlation_id, elapsed_ms=elapsed())
+        self._latest_corpus_fingerprint = corpus_fingerprint(req.documents)
+        self._latest_vector_fingerprint = vectors_fingerprint(vectors)
+        self._sync_ann_index(written, replaced)
+        result = {"ingested": len(req.documents), "correlation_id": correlation_id}
+        if req.idempotency_key:
+            with self._idempotency_lock:
+                self._idempotency_cache[req.idempotency_key] = dict(result)
+        return result
+
+    def ingest_stream(
+        self,
+        source: str | Path,
+        *,
+        texts: str | Path | None = None,
+        batch_size: int = DEFAULT_INGEST_BATCH_SIZE,
+        checkpoint: str | Path | None = None,
+        embed_provider: str | None = None,
+        embed_model: str | None = None,
+        cache_embeddings: str | None = None,
+        correlation_id: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Ingest a JSONL or NPY source in bounded batches.
+
+        Each batch is written with one bulk call and committed in its own
+        transaction. With ``checkpoint`` the committed row count is saved
+        after every batch and a rerun resumes after it; a batch committed
+        just before a crash is rewritten on resume, which is harmless since
+        ids are content-addressed. Corpus and vector fingerprints are
+        chained across batches.
+        """
+        self._guard_mutation("ingest")
+        limits = self.config.resource_limits
+        if (
+            limits
+            and limits.max_vectors_per_ingest is not None
+            and batch_size > int(limits.max_vectors_per_ingest)
+        ):
+            raise BudgetExceededError(
+                message="ingest batch exceeds max_vectors_per_ingest limit"
+            )
+        resolved_correlation_id = _resolve_correlation_id(correlation_id)
+        source_id = str(Path(source).resolve())
+        state = (
+            IngestCheckpoint.load(checkpoint, source_id)
+            if checkpoint is not None
+            else IngestCheckpoint(source=source_id)
+        )
+        resumed_from = state.rows
+        log_event(
+            "ingest_stream_start",
+            correlation_id=resolved_correlation_id,
+            source=str(source),
+            resumed_from=resumed_from,
+            batch_size=batch_size,
+        )
+        ingested = 0
+        records = open_ingest_source(source, texts=texts, start=resumed_from)
+        with timed("ingest_stream_latency_ms") as elapsed:
+            for batch in batched(records, batch_size):
+                documents = [record.text for record in batch]
+                embedding_meta_by_index: dict[int, dict[str, str | None]] = {}
+                embedding_model: str | None = None
+                if all(record.vector is not None for record in batch):
+                    vectors = [list(record.vector or ()) for record in batch]
+                elif any(record.vector is not None for record in batch):
                     raise ValidationError(
-                        message="embedding provider returned mismatched vector count"
+                        message="ingest source mixes records with and without vectors"
                     )
-                if not batch.metadata.embedding_determinism:
-                    raise ValidationError(
-                        message="embedding provider did not declare determinism"
+                else:
+                    vectors, embedding_meta_by_index, embedding_model = (
+                        self._embed_documents(
+                            documents,
+                            embed_provider=embed_provider,
+                            embed_model=embed_model,
+                            cache_embeddings=cache_embeddings,
+                        )
                     )
-                for idx, embed_vec in zip(pending_idx, batch.vectors, strict=False):
-                    vectors[idx] = list(embed_vec)
-                    meta_dict = metadata_as_dict(
-                        {
-                            "embedding_provider": batch.metadata.provider,
-                            "embedding_provider_version": batch.metadata.provider_version,
-                            "embedding_model_version": batch.metadata.model_version,
-                            "embedding_determinism": batch.metadata.embedding_determinism,
-                            "embedding_seed": batch.metadata.embedding_seed,
-                            "embedding_device": batch.metadata.embedding_device,
-                            "embedding_dtype": batch.metadata.embedding_dtype,
-                            "embedding_normalization": batch.metadata.embedding_normalization,
-                        }
+                with self._tx() as tx:
+                    written, replaced = self._write_ingest_batch(
+                        tx, documents, vectors, embedding_model, embedding_meta_by_index
                     )
-                    embedding_meta_by_index[idx] = meta_dict
-                    if cache is not None:
-                        key = cache_key(
-                            batch.metadata.model,
-                            req.documents[idx],
-                            batch.metadata.config_hash,
-                        )
-                        from bijux_vex.infra.embeddings.cache import EmbeddingCacheEntry
-
-                        cache.set(
-                            key,
-                            entry=EmbeddingCacheEntry(
-                                vector=tuple(embed_vec),
-                                metadata=meta_dict,
-                            ),
-                        )
-        with timed("ingest_latency_ms") as elapsed, self._tx() as tx:
-            for idx, doc_text in enumerate(req.documents):
-                doc_id = self.id_policy.document_id(doc_text)
-                doc = Document(document_id=doc_id, text=doc_text)
-                self.authz.check(tx, action="put_document", resource="document")
-                self.stores.vectors.put_document(tx, doc)
-                chunk = Chunk(
-                    chunk_id=self.id_policy.chunk_id(doc.document_id, 0),
-                    document_id=doc.document_id,
-                    text=doc_text,
-                    ordinal=0,
+                state.rows += len(batch)
+                state.batches += 1
+                state.corpus_fingerprint = _chain_fingerprint(
+                    state.corpus_fingerprint, corpus_fingerprint(documents)
                 )
-                self.authz.check(tx, action="put_chunk", resource="chunk")
-                self.stores.vectors.put_chunk(tx, chunk)
-                vec = Vector(
-                    vector_id=self.id_policy.vector_id(
-                        chunk.chunk_id, tuple(vectors[idx])
-                    ),
-                    chunk_id=chunk.chunk_id,
-                    values=tuple(vectors[idx]),
-                    dimension=len(vectors[idx]),
-                    model=embedding_model,
-                    metadata=self._metadata_tuple(embedding_meta_by_index.get(idx, {}))
-                    if embedding_meta_by_index
-                    else None,
+                state.vector_fingerprint = _chain_fingerprint(
+                    state.vector_fingerprint, vectors_fingerprint(vectors)
                 )
-                self.authz.check(tx, action="put_vector", resource="vector")
-                self.stores.vectors.put_vector(tx, vec)
-        METRICS.increment("vectors_indexed_total", value=len(req.documents))
-        log_event("ingest_end", correlation_id=correlation_id, elapsed_ms=elapsed())
-        self._latest_corpus_fingerprint = corpus_fingerprint(req.documents)
-        self._latest_vector_fingerprint = vectors_fingerprint(vectors)
+                if checkpoint is not None:
+                    state.save(checkpoint)
+                ingested += len(batch)
+                METRICS.increment("vectors_indexed_total", value=len(batch))
+                self._latest_corpus_fingerprint = state.corpus_fingerprint
+                self._latest_vector_fingerprint = state.vector_fingerprint
+                self._sync_ann_index(written, replaced)
+        log_event(
+            "ingest_stream_end",
+            correlation_id=resolved_correlation_id,
+            ingested=ingested,
+            batches=state.batches,
+            elapsed_ms=elapsed(),
+        )
+        return {
+            "ingested": ingested,
+            "rows": state.rows,
+            "batches": state.batches,
+            "resumed_from": resumed_from,
+            "corpus_fingerprint": state.corpus_fingerprint,
+            "vector_fingerprint": state.vector_fingerprint,
+            "correlation_id": resolved_correlation_id,
+        }
+
+    def _sync_ann_index(self, written: list[Vector], replaced: list[str]) -> None:
         existing_artifact = self.stores.ledger.get_artifact(self.default_artifact_id)
         if (
             existing_artifact
             and existing_artifact.execution_contract
             is ExecutionContract.NON_DETERMINISTIC
-            and existing_artifact.index_state == "ready"
         ):
-            updated = replace(existing_artifact, index_state="invalidated")
+            if existing_artifact.index_state == "ready":
+                self._apply_ann_delta(existing_artifact, written, replaced)
+            elif (
+                existing_artifact.index_state == "invalidated"
+                and self.index_builder is not None
+            ):
+                self.index_builder.schedule(existing_artifact)
+
+    def _embed_documents(
+        self,
+        documents: Sequence[str],
+        *,
+        embed_provider: str | None,
+        embed_model: str | None,
+        cache_embeddings: str | None,
+    ) -> tuple[list[list[float]], dict[int, dict[str, str | None]], str]:
+        embedding_meta_by_index: dict[int, dict[str, str | None]] = {}
+        cache_spec = None
+        if self.config.embeddings is not None:
+            embed_provider = self.config.embeddings.provider or embed_provider
+            embed_model = self.config.embeddings.model or embed_model
+            if self.config.embeddings.cache is not None:
+                cache_spec = (
+                    self.config.embeddings.cache.uri
+                    or self.config.embeddings.cache.backend
+                )
+        cache_spec = cache_spec or cache_embeddings
+        if not embed_model:
+            raise ValidationError(
+                message="embed_model required when vectors are omitted"
+            )
+        embedding_model = embed_model
+        try:
+            provider = EMBEDDING_PROVIDERS.resolve(embed_provider)
+        except ValueError as exc:
+            raise ValidationError(message=str(exc)) from exc
+        options: dict[str, str] = {"normalize": "false"}
+        config_hash = embedding_config_hash(
+            provider.name,
+            embed_model,
+            options,
+            provider_version=provider.provider_version,
+        )
+        try:
+            cache = build_cache(cache_spec)
+        except ValueError as exc:
+            raise ValidationError(message=str(exc)) from exc
+        pending_texts: list[str] = []
+        pending_idx: list[int] = []
+        vectors = [[0.0] for _ in documents]
+        if cache is not None:
+            keys = [
+                cache_key(embed_model, doc_text, config_hash) for doc_text in documents
+            ]
+            cached = cache.get_many(keys)
+            for idx, doc_text in enumerate(documents):
+                entry = cached.get(keys[idx])
+                if entry:
+                    expected = {
+                        "embedding_provider": provider.name,
+                        "embedding_provider_version": provider.provider_version,
+                        "embedding_normalization": options.get("normalize"),
+                    }
+                    if any(
+                        entry.metadata.get(k) != ("" if v is None else str(v))
+                        for k, v in expected.items()
+                    ):
+                        entry = None
+                if entry:
+                    vectors[idx] = list(entry.vector)
+                    embedding_meta_by_index[idx] = entry.metadata
+                else:
+                    pending_texts.append(doc_text)
+                    pending_idx.append(idx)
+        else:
+            pending_texts = list(documents)
+            pending_idx = list(range(len(documents)))
+        if pending_texts:
+            batch = provider.embed(pending_texts, embed_model, options=options)
+            if len(batch.vectors) != len(pending_idx):
+                raise ValidationError(
+                    message="embedding provider returned mismatched vector count"
+                )
+            if not batch.metadata.embedding_determinism:
+                raise ValidationError(
+                    message="embedding provider did not declare determinism"
+                )
+            fresh: dict[str, EmbeddingCacheEntry] = {}
+            for idx, embed_vec in zip(pending_idx, batch.vectors, strict=False):
+                vectors[idx] = list(embed_vec)
+                meta_dict = metadata_as_dict(
+                    {
+                        "embedding_provider": batch.metadata.provider,
+                        "embedding_provider_version": batch.metadata.provider_version,
+                        "embedding_model_version": batch.metadata.model_version,
+                        "embedding_determinism": batch.metadata.embedding_determinism,
+                        "embedding_seed": batch.metadata.embedding_seed,
+                        "embedding_device": batch.metadata.embedding_device,
+                        "embedding_dtype": batch.metadata.embedding_dtype,
+                        "embedding_normalization": batch.metadata.embedding_normalization,
+                    }
+                )
+                embedding_meta_by_index[idx] = meta_dict
+                if cache is not None:
+                    key = cache_key(
+                        batch.metadata.model,
+                        documents[idx],
+                        batch.metadata.config_hash,
+                    )
+                    fresh[key] = EmbeddingCacheEntry(
+                        vector=tuple(embed_vec), metadata=meta_dict
+                    )
+            if cache is not None:
+                cache.set_many(fresh)
+        return vectors, embedding_meta_by_index, embedding_model
+
+    def _write_ingest_batch(
+        self,
+        tx: Tx,
+        documents: Sequence[str],
+        vectors: Sequence[Sequence[float]],
+        embedding_model: str | None,
+        embedding_meta_by_index: dict[int, dict[str, str | None]],
+    ) -> tuple[list[Vector], list[str]]:
+        """Stage one ingest batch; returns the vectors written and the ids replaced."""
+        docs: list[Document] = []
+        chunks: list[Chunk] = []
+        written: list[Vector] = []
+        for idx, doc_text in enumerate(documents):
+            doc = Document(
+                document_id=self.id_policy.document_id(doc_text), text=doc_text
+            )
+            chunk = Chunk(
+                chunk_id=self.id_policy.chunk_id(doc.document_id, 0),
+                document_id=doc.document_id,
+                text=doc_text,
+                ordinal=0,
+            )
+            values = tuple(vectors[idx])
+            docs.append(doc)
+            chunks.append(chunk)
+            written.append(
+                Vector(
+                    vector_id=self.id_policy.vector_id(chunk.chunk_id, values),
+                    chunk_id=chunk.chunk_id,
+                    values=values,
+                    dimension=len(values),
+                    model=embedding_model,
+                    metadata=self._metadata_tuple(embedding_meta_by_index.get(idx, {}))
+                    if embedding_meta_by_index
+                    else None,
+                )
+            )
+        # One authorization decision per record type and batch.
+        self.authz.check(tx, action="put_document", resource="document")
+        self.authz.check(tx, action="put_chunk", resource="chunk")
+        self.authz.check(tx, action="put_vector", resource="vector")
+        replaced = self._replaced_vector_ids(chunks, written)
+        if replaced:
+            self.authz.check(tx, action="delete_vector", resource="vector")
+            for vector_id in replaced:
+                self.stores.vectors.delete_vector(tx, vector_id)
+        self.stores.vectors.put_batch(tx, docs, chunks, written)
+        if self.segments is not None:
+            # Segments snapshot the corpus; new vectors make every one stale.
+            self.segments.invalidate()
+        return written, replaced
+
+    def _replaced_vector_ids(
+        self, chunks: Sequence[Chunk], written: Sequence[Vector]
+    ) -> list[str]:
+        """Stored vectors of re-ingested chunks that the new vectors supersede."""
+        known = self.stores.vectors.get_chunks(chunk.chunk_id for chunk in chunks)
+        if not known:
+            return []
+        fresh = {vector.vector_id for vector in written}
+        return sorted(
+            {
+                vector.vector_id
+                for chunk_id in known
+                for vector in self.stores.vectors.list_vectors(chunk_id)
+                if vector.vector_id not in fresh
+            }
+        )
+
+    def _apply_ann_delta(
+        self, artifact: ExecutionArtifact, written: list[Vector], replaced: list[str]
+    ) -> None:
+        ann_runner = getattr(self.backend, "ann", None)
+        index_info: dict[str, object] = {}
+        if ann_runner is not None and ann_runner.supports_incremental:
+            index_info = ann_runner.apply_delta(artifact.artifact_id, written, replaced)
+        if not index_info:
+            updated = replace(artifact, index_state="invalidated")
             with self._tx() as tx:
                 self.stores.ledger.put_artifact(tx, updated)
-            log_event(
-                "ann_index_invalidated",
-                artifact_id=existing_artifact.artifact_id,
-            )
-        result = {"ingested": len(req.documents), "correlation_id": correlation_id}
-        if req.idempotency_key:
-            with self._idempotency_lock:
-                self._idempotency_cache[req.idempotency_key] = dict(result)
-        return result
+            log_event("ann_index_invalidated", artifact_id=artifact.artifact_id)
+            if self.index_builder is not None:
+                self.index_builder.schedule(updated)
+            return
+        index_hash = self._record_ann_index(artifact, index_info)
+        log_event(
+            "ann_index_updated",
+            artifact_id=artifact.artifact_id,
+            added=len(written),
+            removed=len(replaced),
+            index_hash=str(index_hash) if index_hash else None,
+        )
+
+    def _on_index_rebuilt(
+        self, artifact_id: str, index_info: dict[str, object]
+    ) -> None:
+        artifact = self.stores.ledger.get_artifact(artifact_id)
+        if artifact is None:
+            return
+        self._record_ann_index(replace(artifact, index_state="ready"), index_info)
+
+    def _record_ann_index(
+        self, artifact: ExecutionArtifact, index_info: dict[str, object]
+    ) -> object:
+        extra: tuple[tuple[str, str], ...] = (
+            ("ann_index_info", json.dumps(index_info, sort_keys=True)),
+        )
+        index_hash = index_info.get("index_hash")
+        if index_hash:
+            extra = extra + (("ann_index_hash", str(index_hash)),)
+        build_params = tuple(
+            (key, value)
+            for key, value in artifact.build_params
+            if key not in {"ann_index_info", "ann_index_hash"}
+        )
+        corpus_fp = self._latest_corpus_fingerprint or artifact.corpus_fingerprint
+        vector_fp = self._latest_vector_fingerprint or artifact.vector_fingerprint
+        updated = replace(
+            artifact,
+            corpus_fingerprint=corpus_fp,
+            vector_fingerprint=vector_fp,
+            build_params=build_params + extra,
+            execution_signature=(
+                execution_signature(artifact.execution_plan, corpus_fp, vector_fp, None)
+                if artifact.execution_plan is not None
+                else artifact.execution_signature
+            ),
+        )
+        with self._tx() as tx:
+            self.stores.ledger.put_artifact(tx, updated)
+        return index_hash
 
     def materialize(self, req: ExecutionArtifactRequest) -> dict[str, Any]:
         self._guard_mutation("materialize")
@@ -779,9 +1135,11 @@ class Orchestrator:
                 raise NDExecutionUnavailableError(
                     message="ANN runner required to build ANN index"
                 )
-            vectors = list(self.stores.vectors.list_vectors())
             index_info = ann_runner.build_index(
-                artifact.artifact_id, vectors, artifact.metric, None
+                artifact.artifact_id,
+                StoredVectors(self.stores.vectors),
+                artifact.metric,
+                None,
             )
             if index_info:
                 index_hash = index_info.get("index_hash")
@@ -799,6 +1157,7 @@ class Orchestrator:
             self.authz.check(tx, action="put_artifact", resource="artifact")
             self.stores.ledger.put_artifact(tx, artifact)
         log_event("artifact_write", artifact_id=artifact.artifact_id)
+        self._write_segments(artifact)
         return {
             "artifact_id": artifact.artifact_id,
             "execution_contract": artifact.execution_contract.value,
@@ -810,6 +1169,19 @@ class Orchestrator:
             "replayable": artifact.replayable,
         }
 
+    def _write_segments(self, artifact: ExecutionArtifact) -> None:
+        if self.segments is None or not matrix_available():
+            return
+        self.segments.observe(self.stores.vectors.vector_revision())
+        with timed("vector_segment_write_ms"):
+            headers = self.segments.write(artifact, self.stores.vectors.list_vectors())
+        log_event(
+            "vector_segment_write",
+            artifact_id=artifact.artifact_id,
+            segments=len(headers),
+            rows=sum(header.rows for header in headers),
+        )
+
     def execute(self, req: ExecutionRequestPayload) -> dict[str, Any]:
         (
             correlation_id,
@@ -819,6 +1191,101 @@ class Orchestrator:
             nd_model,
             request,
         ) = self._normalize_execute_request(req)
+        run_metadata = self._execution_run_metadata(req, artifact, correlation_id)
+        self._run_store.start(run_id, run_metadata)
+        log_event("query_start", correlation_id=correlation_id, top_k=req.top_k)
+        try:
+            with timed("query_latency_ms") as elapsed:
+                execution_result, results = self._dispatch_execution(
+                    req,
+                    artifact,
+                    request,
+                    randomness_profile,
+                    nd_model,
+                )
+            log_event("query_end", correlation_id=correlation_id, elapsed_ms=elapsed())
+            self._check_execution_time(elapsed())
+            if req.execution_contract is ExecutionContract.NON_DETERMINISTIC:
+                self._nd_circuit_failures = 0
+            return self._finalize_execution(
+                artifact,
+                execution_result,
+                results,
+                run_id,
+                correlation_id,
+            )
+        except Exception as exc:
+            self._record_execution_failure(req, run_id, exc)
+            raise
+
+    def execute_batch(self, req: ExecutionBatchRequestPayload) -> dict[str, Any]:
+        """
+        Execute many query vectors against one artifact.
+
+        Session, plan, fingerprints and run directory are shared; the corpus
+        is scored once for the whole batch and all execution results are
+        written in a single ledger transaction.
+        """
+        first = req.single_request(tuple(req.vectors[0]))
+        (
+            correlation_id,
+            run_id,
+            artifact,
+            randomness_profile,
+            nd_model,
+            request,
+        ) = self._normalize_execute_request(first)
+        requests = [request] + [
+            replace(request, request_id=f"{correlation_id}-{idx}", vector=tuple(vec))
+            for idx, vec in enumerate(req.vectors[1:], start=1)
+        ]
+        run_metadata = self._execution_run_metadata(first, artifact, correlation_id)
+        run_metadata["batch_size"] = len(requests)
+        self._run_store.start(run_id, run_metadata)
+        log_event(
+            "batch_query_start",
+            correlation_id=correlation_id,
+            top_k=req.top_k,
+            batch_size=len(requests),
+        )
+        try:
+            with timed("batch_query_latency_ms") as elapsed:
+                if req.execution_contract is ExecutionContract.NON_DETERMINISTIC:
+                    outcomes = nd_model.execute_batch(
+                        artifact,
+                        requests,
+                        randomness_profile,
+                        build_on_demand=req.nd_build_on_demand,
+                    )
+                else:
+                    ann_runner = getattr(self.backend, "ann", None)
+                    session = start_execution_session(
+                        artifact,
+                        request,
+                        self.stores,
+                        randomness=randomness_profile,
+                        ann_runner=ann_runner,
+                    )
+                    outcomes = execute_request_batch(
+                        session, requests, self.stores, ann_runner=ann_runner
+                    )
+            log_event(
+                "batch_query_end", correlation_id=correlation_id, elapsed_ms=elapsed()
+            )
+            self._check_execution_time(elapsed() / len(requests))
+            if req.execution_contract is ExecutionContract.NON_DETERMINISTIC:
+                self._nd_circuit_failures = 0
+            return self._finalize_batch(artifact, outcomes, run_id, correlation_id)
+        except Exception as exc:
+            self._record_execution_failure(first, run_id, exc)
+            raise
+
+    def _execution_run_metadata(
+        self,
+        req: ExecutionRequestPayload,
+        artifact: ExecutionArtifact,
+        correlation_id: str,
+    ) -> dict[str, object]:
         vector_store_meta = getattr(self.stores.vectors, "vector_store_metadata", None)
         vector_store_index_params = None
         vector_store_consistency = None
@@ -849,7 +1316,7 @@ class Orchestrator:
             artifact.index_config_fingerprint,
             artifact.execution_plan.algorithm if artifact.execution_plan else None,
         )
-        run_metadata = self._build_run_metadata(
+        return self._build_run_metadata(
             req,
             artifact,
             ann_index_info,
@@ -859,51 +1326,37 @@ class Orchestrator:
             determinism_fp,
             correlation_id,
         )
-        self._run_store.start(run_id, run_metadata)
-        log_event("query_start", correlation_id=correlation_id, top_k=req.top_k)
-        try:
-            with timed("query_latency_ms") as elapsed:
-                execution_result, results = self._dispatch_execution(
-                    req,
-                    artifact,
-                    request,
-                    randomness_profile,
-                    nd_model,
-                )
-            log_event("query_end", correlation_id=correlation_id, elapsed_ms=elapsed())
-            limits = self.config.resource_limits
-            if (
-                limits
-                and limits.max_execution_time_ms is not None
-                and elapsed() > float(limits.max_execution_time_ms)
-            ):
-                raise BudgetExceededError(
-                    message="Execution exceeded max_execution_time_ms limit"
-                )
-            if req.execution_contract is ExecutionContract.NON_DETERMINISTIC:
-                self._nd_circuit_failures = 0
-            return self._finalize_execution(
-                artifact,
-                execution_result,
-                results,
-                run_id,
-                correlation_id,
+
+    def _check_execution_time(self, elapsed_ms: float) -> None:
+        limits = self.config.resource_limits
+        if (
+            limits
+            and limits.max_execution_time_ms is not None
+            and elapsed_ms > float(limits.max_execution_time_ms)
+        ):
+            raise BudgetExceededError(
+                message="Execution exceeded max_execution_time_ms limit"
             )
-        except Exception as exc:
-            if req.execution_contract is ExecutionContract.NON_DETERMINISTIC:
+
+    def _record_execution_failure(
+        self, req: ExecutionRequestPayload, run_id: str, exc: Exception
+    ) -> None:
+        if req.execution_contract is ExecutionContract.NON_DETERMINISTIC:
+            with self._nd_guard_lock:
                 self._nd_circuit_failures += 1
-                if self._nd_circuit_failures >= self._nd_circuit_max_failures:
+                failures = self._nd_circuit_failures
+                if failures >= self._nd_circuit_max_failures:
                     self._nd_circuit_open_until = (
                         time.time() + self._nd_circuit_cooldown_s
                     )
-                    log_event(
-                        "nd_circuit_open",
-                        failures=self._nd_circuit_failures,
-                        cooldown_s=self._nd_circuit_cooldown_s,
-                    )
-            details = refusal_payload(exc) if is_refusal(exc) else None
-            self._run_store.mark_failed(run_id, str(exc), details=details)
-            raise
+            if failures >= self._nd_circuit_max_failures:
+                log_event(
+                    "nd_circuit_open",
+                    failures=failures,
+                    cooldown_s=self._nd_circuit_cooldown_s,
+                )
+        details = refusal_payload(exc) if is_refusal(exc) else None
+        self._run_store.mark_failed(run_id, str(exc), details=details)
 
     def _normalize_execute_request(
         self, req: ExecutionRequestPayload
@@ -925,6 +1378,9 @@ class Orchestrator:
             ann_runner=getattr(self.backend, "ann", None),
             latest_vector_fingerprint=self._latest_vector_fingerprint,
             tx_factory=self._tx,
+            schedule_rebuild=(
+                self.index_builder.schedule if self.index_builder else None
+            ),
         )
         nd_settings = nd_model.build_settings(req)
         request = self._build_execution_request(req, correlation_id, nd_settings)
@@ -1013,6 +1469,52 @@ class Orchestrator:
             "execution_id": execution_result.execution_id,
         }
 
+    def _finalize_batch(
+        self,
+        artifact: ExecutionArtifact,
+        outcomes: list[tuple[Any, Any]],
+        run_id: str,
+        correlation_id: str,
+    ) -> dict[str, Any]:
+        with self._tx() as tx:
+            self.stores.ledger.put_execution_results(
+                tx, [execution_result for execution_result, _ in outcomes]
+            )
+            last = outcomes[-1][0]
+            updated_artifact = replace(
+                artifact,
+                execution_plan=last.plan,
+                execution_signature=last.signature,
+                execution_id=last.execution_id,
+            )
+            self.stores.ledger.put_artifact(tx, updated_artifact)
+            artifact = updated_artifact
+        result_ids = [[r.vector_id for r in results] for _, results in outcomes]
+        execution_ids = [
+            execution_result.execution_id for execution_result, _ in outcomes
+        ]
+        self._run_store.finalize(
+            run_id,
+            {
+                "execution_results": [
+                    execution_result.to_primitive() for execution_result, _ in outcomes
+                ],
+                "results": result_ids,
+            },
+        )
+        return {
+            "results": result_ids,
+            "correlation_id": correlation_id,
+            "execution_contract": artifact.execution_contract.value,
+            "execution_contract_status": (
+                "stable"
+                if artifact.execution_contract is ExecutionContract.DETERMINISTIC
+                else "experimental"
+            ),
+            "replayable": artifact.replayable,
+            "execution_ids": execution_ids,
+        }
+
     def explain(self, req: ExplainRequest) -> dict[str, Any]:
         art_id = req.artifact_id
         if art_id is None:
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from bijux_vex.core.contracts.execution_abi import assert_execution_abi
-from bijux_vex.services._orchestrator import Orchestrator
+from bijux_vex.services._orchestrator import Orchestrator, close_shared_resources
 
 
 class VectorExecutionEngine(Orchestrator):
@@ -21,4 +21,4 @@ class VectorExecutionEngine(Orchestrator):
 
 assert_execution_abi()
 
-__all__ = ["VectorExecutionEngine"]
+__all__ = ["VectorExecutionEngine", "close_shared_resources"]
@@ -0,0 +1,193 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+import threading
+import time
+from typing import Any
+
+from bijux_vex.contracts.resources import StoredVectors, VectorSource
+from bijux_vex.core.types import ExecutionArtifact, NDSettings, Vector
+from bijux_vex.infra.adapters.ann_base import AnnExecutionRequestRunner
+from bijux_vex.infra.logging import log_event
+
+
+@dataclass
+class IndexBuildStatus:
+    state: str = "queued"
+    builds: int = 0
+    vectors_total: int = 0
+    vectors_loaded: int = 0
+    started_at: float | None = None
+    finished_at: float | None = None
+    index_hash: str | None = None
+    error: str | None = None
+
+    def as_dict(self) -> dict[str, object]:
+        return asdict(self)
+
+
+class BackgroundIndexBuilder:
+    """
+    Rebuild invalidated ANN indices on a worker thread.
+
+    The runner swaps the finished index in atomically; ``on_built`` then
+    records it in the ledger, outside the builder's lock. A rebuild requested
+    while one is running for the same artifact is queued and re-run against
+    the newer corpus. Workers are not daemons: owners call ``close`` so a
+    build is never killed halfway through at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        vectors: VectorSource,
+        ann_runner: AnnExecutionRequestRunner,
+        on_built: Callable[[str, dict[str, object]], None],
+    ) -> None:
+        self._vectors = vectors
+        self._ann_runner = ann_runner
+        self._on_built = on_built
+        self._lock = threading.Lock()
+        self._threads: dict[str, threading.Thread] = {}
+        self._active: set[str] = set()
+        self._pending: dict[str, tuple[ExecutionArtifact, NDSettings | None]] = {}
+        self._status: dict[str, IndexBuildStatus] = {}
+        self._closed = False
+
+    def schedule(
+        self, artifact: ExecutionArtifact, nd_settings: NDSettings | None = None
+    ) -> bool:
+        """Start a rebuild; returns False when one is already running or closed."""
+        artifact_id = artifact.artifact_id
+        with self._lock:
+            if self._closed:
+                return False
+            if artifact_id in self._active:
+                self._pending[artifact_id] = (artifact, nd_settings)
+                return False
+            self._active.add(artifact_id)
+            status = self._status.get(artifact_id) or IndexBuildStatus()
+            status.state = "queued"
+            status.error = None
+            self._status[artifact_id] = status
+            thread = threading.Thread(
+                target=self._run,
+                args=(artifact, nd_settings),
+                name=f"bijux-vex-index-build-{artifact_id}",
+            )
+            self._threads[artifact_id] = thread
+        log_event("ann_index_rebuild_scheduled", artifact_id=artifact_id)
+        thread.start()
+        return True
+
+    def is_building(self, artifact_id: str) -> bool:
+        with self._lock:
+            return artifact_id in self._active
+
+    def wait(self, artifact_id: str, timeout: float | None = None) -> bool:
+        """Block until the artifact's rebuild finishes; False on timeout."""
+        with self._lock:
+            thread = self._threads.get(artifact_id)
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def close(self, timeout: float | None = None) -> None:
+        """Refuse new rebuilds, drop queued ones and wait for running builds."""
+        with self._lock:
+            self._closed = True
+            self._pending.clear()
+            threads = list(self._threads.values())
+        for thread in threads:
+            thread.join(timeout)
+
+    def status(self) -> dict[str, dict[str, object]]:
+        with self._lock:
+            return {
+                artifact_id: status.as_dict()
+                for artifact_id, status in sorted(self._status.items())
+            }
+
+    def _run(self, artifact: ExecutionArtifact, nd_settings: NDSettings | None) -> None:
+        artifact_id = artifact.artifact_id
+        status = self._status[artifact_id]
+        while True:
+            # The store is read in pages, each under its lock. An ingest that
+            # lands mid-read reschedules this artifact, and the queued rerun
+            # replaces any index built from a torn read.
+            stored = _Progress(self._vectors, status)
+            total = len(stored)
+            with self._lock:
+                status.state = "building"
+                status.builds += 1
+                status.vectors_total = total
+                status.vectors_loaded = 0
+                status.started_at = time.time()
+                status.finished_at = None
+            try:
+                index_info = self._ann_runner.build_index(
+                    artifact_id,
+                    stored,
+                    artifact.metric,
+                    nd_settings,
+                )
+                with self._lock:
+                    queued = self._pending.pop(artifact_id, None)
+                if queued is None:
+                    self._on_built(artifact_id, index_info)
+            except Exception as exc:
+                with self._lock:
+                    status.state = "failed"
+                    status.error = str(exc)
+                    status.finished_at = time.time()
+                    self._pending.pop(artifact_id, None)
+                    self._active.discard(artifact_id)
+                log_event(
+                    "ann_index_rebuild_failed", artifact_id=artifact_id, error=str(exc)
+                )
+                return
+            recorded = queued is None
+            with self._lock:
+                if recorded:
+                    index_hash = index_info.get("index_hash")
+                    status.state = "ready"
+                    status.index_hash = str(index_hash) if index_hash else None
+                    status.finished_at = time.time()
+                    # Scheduled while on_built ran: rebuild against that corpus.
+                    queued = self._pending.pop(artifact_id, None)
+                if queued is None:
+                    self._active.discard(artifact_id)
+            if recorded:
+                log_event(
+                    "ann_index_rebuilt",
+                    artifact_id=artifact_id,
+                    vectors=status.vectors_total,
+                    index_hash=status.index_hash,
+                )
+            if queued is None:
+                return
+            artifact, nd_settings = queued
+
+
+class _Progress(StoredVectors):
+    """Stored vectors that count what the build has read into ``status``."""
+
+    def __init__(self, source: VectorSource, status: IndexBuildStatus) -> None:
+        super().__init__(source)
+        self._status = status
+
+    def __iter__(self) -> Iterator[Vector]:
+        for vector in super().__iter__():
+            self._status.vectors_loaded += 1
+            yield vector
+
+    def blocks(self, size: int) -> Iterator[tuple[tuple[str, ...], Any]]:
+        for ids, rows in super().blocks(size):
+            self._status.vectors_loaded += len(ids)
+            yield ids, rows
+
+
+__all__ = ["BackgroundIndexBuilder", "IndexBuildStatus"]
@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+from pathlib import Path
+import sqlite3
+import threading
+
+import pytest
+from starlette.testclient import TestClient
+
+from bijux_vex.boundaries.api.app import build_app
+from bijux_vex.boundaries.api.engine_pool import EnginePool
+from bijux_vex.core.config import ExecutionConfig, VectorStoreConfig
+from bijux_vex.core.errors import BackendUnavailableError
+from bijux_vex.services._orchestrator import Orchestrator
+
+
+def test_pool_reuses_engine_per_config(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("BIJUX_VEX_STATE_PATH", str(tmp_path / "state.sqlite"))
+    monkeypatch.setenv("BIJUX_VEX_RUN_DIR", str(tmp_path / "runs"))
+    pool = EnginePool(max_engines=2)
+    with pool.lease() as first:
+        pass
+    with pool.lease(ExecutionConfig()) as again:
+        assert again is first
+    memory_store = ExecutionConfig(vector_store=VectorStoreConfig(backend="memory"))
+    with pool.lease(memory_store) as other:
+        assert other is not first
+        assert other.holds_state_in_memory
+    with pool.lease() as busy:
+        monkeypatch.setenv("BIJUX_VEX_READ_ONLY", "1")
+        with pool.lease() as read_only:
+            assert read_only.read_only
+        # The evicted engine stays open until its lease ends.
+        assert not busy._closed
+    assert busy._closed
+    assert len(pool) == 2
+    assert pool.created == 3
+    assert pool.evictions == 1
+
+    pool.close()
+    assert read_only._closed
+    assert other._closed
+    with pytest.raises(RuntimeError), pool.lease():
+        pass
+
+
+def test_memory_engines_are_never_evicted(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("BIJUX_VEX_BACKEND", "memory")
+    monkeypatch.setenv("BIJUX_VEX_RUN_DIR", str(tmp_path / "runs"))
+    pool = EnginePool(max_engines=1)
+    with pool.lease() as engine:
+        assert engine.holds_state_in_memory
+    monkeypatch.setenv("BIJUX_VEX_READ_ONLY", "1")
+    with pytest.raises(BackendUnavailableError), pool.lease():
+        pass
+    monkeypatch.delenv("BIJUX_VEX_READ_ONLY")
+    with pool.lease() as again:
+        assert again is engine
+    assert pool.evictions == 0
+
+
+def test_shared_leases_overlap_and_exclusive_waits(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("BIJUX_VEX_BACKEND", "memory")
+    monkeypatch.setenv("BIJUX_VEX_RUN_DIR", str(tmp_path / "runs"))
+    pool = EnginePool()
+    both_inside = threading.Barrier(3, timeout=10)
+    release = threading.Event()
+    written = threading.Event()
+
+    def read() -> None:
+        with pool.lease():
+            both_inside.wait()
+            release.wait(10)
+
+    def write() -> None:
+        with pool.lease(exclusive=True):
+            written.set()
+
+    readers = [threading.Thread(target=read) for _ in range(2)]
+    for thread in readers:
+        thread.start()
+    both_inside.wait()
+    writer = threading.Thread(target=write)
+    writer.start()
+    assert not written.wait(0.1)
+    release.set()
+    for thread in [*readers, writer]:
+        thread.join(10)
+    assert written.is_set()
+    pool.close()
+
+
+def test_closing_engines_releases_pooled_backend(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("BIJUX_VEX_STATE_PATH", str(tmp_path / "shared.sqlite"))
+    monkeypatch.setenv("BIJUX_VEX_RUN_DIR", str(tmp_path / "runs"))
+    first = Orchestrator()
+    second = Orchestrator()
+    assert first.backend.stores is second.backend.stores
+    first.close()
+    first.close()
+    assert second.backend.diagnostics["capacity"]()["vectors"] == 0
+    second.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        second.backend.diagnostics["capacity"]()
+    third = Orchestrator()
+    assert third.backend.diagnostics["capacity"]()["vectors"] == 0
+    third.close()
+
+
+def test_memory_backend_state_survives_between_requests(
+    tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.setenv("BIJUX_VEX_BACKEND", "memory")
+    monkeypatch.setenv("BIJUX_VEX_RUN_DIR", str(tmp_path / "runs"))
+    app = build_app()
+    with TestClient(app) as client:
+        pool = app.state.engine_pool
+        assert client.post(
+            "/ingest", json={"documents": ["hi"], "vectors": [[0.0, 1.0]]}
+        ).is_success
+        assert client.post(
+            "/artifact", json={"execution_contract": "deterministic"}
+        ).is_success
+        response = client.post(
+            "/execute",
+            json={
+                "vector": [0.0, 1.0],
+                "top_k": 1,
+                "execution_contract": "deterministic",
+                "execution_intent": "exact_validation",
+                "execution_mode": "strict",
+            },
+        )
+        assert response.status_code == 200
+        assert len(response.json()["results"]) == 1
+        assert pool.created == 1
+    assert app.state.engine_pool is None
+    assert len(pool) == 0
@@ -12,6 +12,7 @@ from bijux_vex.boundaries.pydantic_edges.validators import (
 from bijux_vex.core.contracts.execution_contract import ExecutionContract
 from bijux_vex.core.execution_intent import ExecutionIntent
 from bijux_vex.core.execution_mode import ExecutionMode
+from bijux_vex.domain.nd.model import NDExecutionModel
 
 
 def _payload(**overrides):
@@ -47,6 +48,7 @@ def _payload(**overrides):
         nd_ef_search=None,
         nd_max_ef_search=None,
         nd_space=None,
+        nd_num_threads=None,
     )
     base.update(overrides)
     return SimpleNamespace(**base)
@@ -78,3 +80,22 @@ def test_validator_accepts_minimal_nd():
         ),
     )
     validate_execution_request_payload(payload)
+
+
+def test_nd_num_threads_reaches_nd_settings():
+    nd = {
+        "execution_contract": ExecutionContract.NON_DETERMINISTIC,
+        "execution_mode": ExecutionMode.BOUNDED,
+        "execution_budget": SimpleNamespace(max_latency_ms=1),
+        "randomness_profile": SimpleNamespace(
+            seed=1, sources=("seed",), non_replayable=False
+        ),
+    }
+    with pytest.raises(ValueError, match="nd_num_threads"):
+        validate_execution_request_payload(_payload(nd_num_threads=0, **nd))
+    with pytest.raises(ValueError, match="nd_\\* settings require non_deterministic"):
+        validate_execution_request_payload(_payload(nd_num_threads=2))
+    payload = _payload(nd_num_threads=1, **nd)
+    validate_execution_request_payload(payload)
+    model = NDExecutionModel(stores=None, ann_runner=None)
+    assert model.build_settings(payload).num_threads == 1
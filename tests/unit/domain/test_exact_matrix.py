@@ -0,0 +1,62 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from bijux_vex.core.types import Vector
+from bijux_vex.domain.execution_algorithms.exact_matrix import (
+    build_vector_matrix,
+    exact_top_k,
+    matrix_supported,
+)
+from bijux_vex.domain.execution_requests import scoring
+
+pytest.importorskip("numpy")
+
+
+def _python_top_k(metric, query, vectors, k):
+    scored = sorted(
+        (scoring.score(metric, query, v.values), v.vector_id) for v in vectors
+    )
+    return scored[:k]
+
+
+@pytest.mark.parametrize("metric", ["l2", "cosine", "dot"])
+def test_matrix_top_k_is_bit_identical_to_python_loop(metric: str) -> None:
+    rng = random.Random(7)  # noqa: S311 - deterministic fixture data
+    dim = 16
+    vectors = [
+        Vector(
+            vector_id=f"v{i:03d}",
+            chunk_id=f"c{i:03d}",
+            values=tuple(rng.uniform(-1.0, 1.0) for _ in range(dim)),
+            dimension=dim,
+        )
+        for i in range(300)
+    ]
+    # duplicates force ties that must break on vector_id
+    vectors += [
+        Vector(
+            vector_id=f"dup{i}",
+            chunk_id="c-dup",
+            values=vectors[i].values,
+            dimension=dim,
+        )
+        for i in range(0, 300, 25)
+    ]
+    vm = build_vector_matrix(vectors, dim)
+    for _ in range(5):
+        query = tuple(rng.uniform(-1.0, 1.0) for _ in range(dim))
+        assert matrix_supported(metric, query, vm)
+        got = [(score, vid) for score, vid, _row in exact_top_k(metric, query, vm, 10)]
+        assert got == _python_top_k(metric, query, vectors, 10)
+
+
+def test_matrix_refuses_zero_vectors_for_cosine() -> None:
+    vectors = [Vector(vector_id="v0", chunk_id="c0", values=(0.0, 0.0), dimension=2)]
+    vm = build_vector_matrix(vectors, 2)
+    assert not matrix_supported("cosine", (1.0, 0.0), vm)
+    assert matrix_supported("l2", (1.0, 0.0), vm)
@@ -0,0 +1,40 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from bijux_vex.domain.execution_algorithms.mmr import (
+    mmr_order,
+    mmr_order_matrix,
+    mmr_order_reference,
+)
+
+
+def test_mmr_prefers_diverse_candidates_over_near_duplicates() -> None:
+    query = (1.0, 0.3)
+    rows = [(1.0, 0.25), (1.0, 0.28), (0.3, 1.0), (-1.0, 0.0)]
+    # lambda=1 is plain relevance ordering.
+    assert mmr_order(query, rows, 1.0, 3) == [1, 0, 2]
+    # With diversity weighted in, the near-duplicate of the first pick drops.
+    assert mmr_order(query, rows, 0.5, 3) == [1, 2, 0]
+    assert mmr_order(query, rows, 0.3, 10) == [1, 2, 3, 0]
+    # Rows without a stored vector have zero similarity to everything.
+    assert mmr_order(query, [(0.0, 1.0), None, (1.0, 0.0)], 0.5, 3) == [2, 0, 1]
+    assert mmr_order(query, [], 0.5, 3) == []
+
+
+@pytest.mark.parametrize("diversity_lambda", [0.0, 0.3, 0.7, 1.0])
+def test_matrix_path_matches_reference(diversity_lambda: float) -> None:
+    pytest.importorskip("numpy")
+    rng = random.Random(7)  # noqa: S311 - deterministic fixture data
+    query = tuple(rng.uniform(-1, 1) for _ in range(8))
+    rows: list[tuple[float, ...] | None] = [
+        tuple(rng.uniform(-1, 1) for _ in range(8)) for _ in range(60)
+    ]
+    rows[5] = None
+    rows[9] = (0.0,) * 8
+    expected = mmr_order_reference(query, rows, diversity_lambda, 15)
+    assert mmr_order_matrix(query, rows, diversity_lambda, 15) == expected
@@ -0,0 +1,181 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from bijux_vex.core.contracts.execution_contract import ExecutionContract
+from bijux_vex.core.execution_intent import ExecutionIntent
+from bijux_vex.core.execution_mode import ExecutionMode
+from bijux_vex.core.runtime.vector_execution import RandomnessProfile
+from bijux_vex.core.types import (
+    Chunk,
+    Document,
+    ExecutionArtifact,
+    ExecutionBudget,
+    ExecutionRequest,
+    NDSettings,
+    Vector,
+)
+from bijux_vex.domain.execution_algorithms.exact_matrix import (
+    build_vector_matrix,
+    exact_top_k,
+    exact_top_k_batch,
+)
+from bijux_vex.domain.execution_algorithms.quantized import (
+    configure_quantization,
+    quantize_matrix,
+)
+from bijux_vex.domain.execution_requests import scoring
+from bijux_vex.domain.execution_requests.execute import (
+    execute_request,
+    start_execution_session,
+)
+from bijux_vex.infra.adapters.ann_quantized import QuantizedAnnRunner
+from bijux_vex.infra.adapters.memory.backend import memory_backend
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def quantization():
+    configure_quantization("none")
+    yield configure_quantization
+    configure_quantization(None)
+
+
+def _vectors(count: int, dim: int) -> list[Vector]:
+    rng = random.Random(13)  # noqa: S311 - deterministic fixture data
+    vectors = [
+        Vector(
+            vector_id=f"v{i:04d}",
+            chunk_id=f"c{i}",
+            values=tuple(rng.gauss(0.0, 1.0) for _ in range(dim - 1)) + (0.5,),
+            dimension=dim,
+        )
+        for i in range(count)
+    ]
+    # Exact duplicates quantize to the same codes and must tie-break on id.
+    vectors += [
+        Vector(
+            vector_id=f"dup{i}", chunk_id="c", values=vectors[i].values, dimension=dim
+        )
+        for i in range(0, count, 41)
+    ]
+    return vectors
+
+
+def test_calibration_bounds_reconstruction_error() -> None:
+    vm = build_vector_matrix(_vectors(300, 6), 6)
+    quantized = quantize_matrix(vm)
+    assert quantized.codes.dtype == np.int8
+    assert quantized.nbytes * 8 == vm.matrix.nbytes
+    decoded = quantized.decode(range(len(vm)))
+    assert np.all(np.abs(decoded - vm.matrix) <= quantized.error)
+    # The constant last column decodes exactly.
+    assert quantized.error[-1] == pytest.approx(0.0, abs=1e-15)
+    assert quantized.calibration()["low"] == vm.matrix.min(axis=0).tolist()
+
+
+def test_quantized_exact_scan_matches_full_precision(quantization) -> None:
+    dim = 12
+    vm = build_vector_matrix(_vectors(500, dim), dim)
+    rng = random.Random(3)  # noqa: S311 - deterministic fixture data
+    queries = [tuple(rng.gauss(0.0, 1.0) for _ in range(dim)) for _ in range(4)]
+    queries.append(tuple(vm.matrix[41].tolist()))
+    subset = list(range(0, len(vm), 3))
+    expected = {
+        metric: (
+            exact_top_k_batch(metric, queries, vm, 9),
+            exact_top_k(metric, queries[0], vm, 9, subset),
+        )
+        for metric in ("l2", "cosine", "dot")
+    }
+    assert quantization("int8") == "int8"
+    for metric, (batch, filtered) in expected.items():
+        assert exact_top_k_batch(metric, queries, vm, 9) == batch
+        assert exact_top_k(metric, queries[0], vm, 9, subset) == filtered
+
+
+def test_int8_runner_shortlists_then_rescores_exactly() -> None:
+    backend = memory_backend()
+    runner = QuantizedAnnRunner(backend.stores.vectors)
+    vectors = _vectors(200, 8)
+    with backend.tx_factory() as tx:
+        doc = Document(document_id="doc", text="corpus")
+        backend.stores.vectors.put_document(tx, doc)
+        for chunk_id in sorted({vec.chunk_id for vec in vectors}):
+            backend.stores.vectors.put_chunk(
+                tx,
+                Chunk(chunk_id=chunk_id, document_id="doc", text=chunk_id, ordinal=0),
+            )
+        for vec in vectors:
+            backend.stores.vectors.put_vector(tx, vec)
+        info = runner.build_index("art-sq8", vectors, "l2")
+        backend.stores.ledger.put_artifact(
+            tx,
+            ExecutionArtifact(
+                artifact_id="art-sq8",
+                corpus_fingerprint="corp",
+                vector_fingerprint="vec",
+                metric="l2",
+                scoring_version="v1",
+                execution_contract=ExecutionContract.NON_DETERMINISTIC,
+                index_state="ready",
+            ),
+        )
+    assert info["index_kind"] == "sq8"
+    calibration = info["calibration"]
+    assert isinstance(calibration, dict)
+    assert len(calibration["low"]) == 8
+    query = vectors[17].values
+    request = ExecutionRequest(
+        request_id="req-sq8",
+        text=None,
+        vector=query,
+        top_k=5,
+        execution_contract=ExecutionContract.NON_DETERMINISTIC,
+        execution_intent=ExecutionIntent.EXPLORATORY_SEARCH,
+        execution_mode=ExecutionMode.BOUNDED,
+        execution_budget=ExecutionBudget(),
+        nd_settings=NDSettings(candidate_k=40),
+    )
+    artifact = backend.stores.ledger.get_artifact("art-sq8")
+    session = start_execution_session(
+        artifact,
+        request,
+        backend.stores,
+        RandomnessProfile(seed=0, sources=("test",), bounded=True),
+        runner,
+    )
+    assert session.plan.steps[-1] == "rescore_exact"
+    result, _ = execute_request(session, backend.stores, ann_runner=runner)
+    by_id = {vec.vector_id: vec.values for vec in vectors}
+    # Shortlisted on codes, returned with full-precision scores.
+    assert [res.score for res in result.results] == [
+        scoring.score("l2", query, by_id[res.vector_id]) for res in result.results
+    ]
+    assert result.results[0].vector_id == "v0017"
+    assert result.results[0].document_id == "doc"
+    report = result.approximation
+    assert report is not None
+    assert report.quantization == "int8"
+    assert report.quantization_error == pytest.approx(info["quantization_error"])
+    assert report.recall_at_k == 1.0
+    assert report.distance_error > 0.0
+    assert report.candidate_k == 40
+
+
+def test_int8_quantization_does_not_pick_the_sq8_runner(
+    quantization, monkeypatch
+) -> None:
+    from bijux_vex.services._orchestrator import _ann_runner_override
+
+    vectors = memory_backend().stores.vectors
+    quantization("int8")
+    monkeypatch.delenv("BIJUX_VEX_ANN_RUNNER", raising=False)
+    assert _ann_runner_override(vectors) is None
+    monkeypatch.setenv("BIJUX_VEX_ANN_RUNNER", "sq8")
+    assert isinstance(_ann_runner_override(vectors), QuantizedAnnRunner)
@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from bijux_vex.core.types import Vector
+from bijux_vex.domain.execution_algorithms.exact_matrix import (
+    build_vector_matrix,
+    exact_top_k,
+    exact_top_k_batch,
+)
+from bijux_vex.domain.execution_algorithms.sharded_exact import configure_sharding
+
+pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def sharding():
+    configure_sharding(None)
+    yield configure_sharding
+    configure_sharding(None)
+
+
+def _vectors(count: int, dim: int) -> list[Vector]:
+    rng = random.Random(11)  # noqa: S311 - deterministic fixture data
+    vectors = [
+        Vector(
+            vector_id=f"v{i:04d}",
+            chunk_id=f"c{i}",
+            values=tuple(rng.uniform(-1.0, 1.0) for _ in range(dim)),
+            dimension=dim,
+        )
+        for i in range(count)
+    ]
+    # Duplicates land in different shards and must still tie-break on id.
+    vectors += [
+        Vector(
+            vector_id=f"dup{i}",
+            chunk_id="c-dup",
+            values=vectors[i].values,
+            dimension=dim,
+        )
+        for i in range(0, count, 37)
+    ]
+    return vectors
+
+
+def test_sharded_scan_is_bit_identical_to_single_process(sharding) -> None:
+    dim = 8
+    vm = build_vector_matrix(_vectors(400, dim), dim)
+    rng = random.Random(5)  # noqa: S311 - deterministic fixture data
+    queries = [tuple(rng.uniform(-1.0, 1.0) for _ in range(dim)) for _ in range(4)]
+    queries.append(vm.matrix[37].tolist())
+    subset = list(range(0, len(vm), 3))
+    expected = {
+        metric: (
+            exact_top_k_batch(metric, queries, vm, 7),
+            exact_top_k(metric, queries[0], vm, 7, subset),
+        )
+        for metric in ("l2", "cosine", "dot")
+    }
+    scanner = sharding(3, min_rows=0)
+    assert scanner is not None
+    assert scanner.applies(vm)
+    for metric, (batch, filtered) in expected.items():
+        assert exact_top_k_batch(metric, queries, vm, 7) == batch
+        assert exact_top_k(metric, queries[0], vm, 7, subset) == filtered
+
+
+def test_small_matrices_stay_in_process(sharding) -> None:
+    vm = build_vector_matrix(_vectors(10, 2), 2)
+    scanner = sharding(4)
+    assert scanner is not None
+    assert not scanner.applies(vm)
+    assert sharding(1) is None
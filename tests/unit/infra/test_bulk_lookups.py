@@ -0,0 +1,94 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+import pytest
+
+from bijux_vex.core.contracts.execution_contract import ExecutionContract
+from bijux_vex.core.execution_intent import ExecutionIntent
+from bijux_vex.core.execution_mode import ExecutionMode
+from bijux_vex.core.types import (
+    Chunk,
+    Document,
+    ExecutionArtifact,
+    ExecutionBudget,
+    ExecutionRequest,
+    Vector,
+)
+from bijux_vex.infra.adapters.memory.backend import memory_backend
+from bijux_vex.infra.adapters.sqlite.backend import sqlite_backend
+
+_ARTIFACT = ExecutionArtifact(
+    artifact_id="art",
+    corpus_fingerprint="corp",
+    vector_fingerprint="vec",
+    metric="l2",
+    scoring_version="v1",
+    execution_contract=ExecutionContract.NON_DETERMINISTIC,
+)
+
+
+def _populate(backend, count: int = 12) -> None:
+    with backend.tx_factory() as tx:
+        stores = backend.stores
+        stores.vectors.put_document(tx, Document(document_id="d", text="d"))
+        for i in range(count):
+            stores.vectors.put_chunk(
+                tx, Chunk(chunk_id=f"c{i}", document_id="d", text="t", ordinal=i)
+            )
+            stores.vectors.put_vector(
+                tx,
+                Vector(
+                    vector_id=f"v{i:02d}",
+                    chunk_id=f"c{i}",
+                    values=(float(i), 1.0),
+                    dimension=2,
+                ),
+            )
+        stores.ledger.put_artifact(tx, _ARTIFACT)
+        tx.commit()
+
+
+@pytest.mark.parametrize("factory", [memory_backend, sqlite_backend])
+def test_bulk_lookups_omit_missing_ids(factory) -> None:
+    backend = factory()
+    _populate(backend)
+    vectors = backend.stores.vectors
+    found = vectors.get_vectors(["v03", "missing", "v07", "v03"])
+    assert sorted(found) == ["v03", "v07"]
+    assert found["v07"].values == (7.0, 1.0)
+    assert found["v07"].chunk_id == "c7"
+    chunks = vectors.get_chunks(["c1", "nope", "c11"])
+    assert sorted(chunks) == ["c1", "c11"]
+    assert chunks["c11"].document_id == "d"
+    assert vectors.get_vectors([]) == {}
+
+
+def test_hnsw_hydration_does_not_fetch_per_label(monkeypatch) -> None:
+    pytest.importorskip("hnswlib")
+    from bijux_vex.infra.adapters.ann_hnsw import HnswAnnRunner
+
+    backend = sqlite_backend()
+    _populate(backend)
+    vectors = backend.stores.vectors
+    runner = HnswAnnRunner(vectors)
+    runner.build_index("art", list(vectors.list_vectors()), "l2")
+
+    def _single(_id):
+        raise AssertionError("candidates must be hydrated in bulk")
+
+    monkeypatch.setattr(vectors, "get_vector", _single)
+    monkeypatch.setattr(vectors, "get_chunk", _single)
+    request = ExecutionRequest(
+        request_id="q",
+        text=None,
+        vector=(0.0, 1.0),
+        top_k=3,
+        execution_contract=ExecutionContract.NON_DETERMINISTIC,
+        execution_intent=ExecutionIntent.EXPLORATORY_SEARCH,
+        execution_mode=ExecutionMode.BOUNDED,
+        execution_budget=ExecutionBudget(),
+    )
+    results = list(runner.approximate_request(_ARTIFACT, request))
+    assert [r.vector_id for r in results] == ["v00", "v01", "v02"]
+    assert {r.document_id for r in results} == {"d"}
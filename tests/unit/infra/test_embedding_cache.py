@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sqlite3
+
+from bijux_vex.infra.embeddings.cache import (
+    EmbeddingCacheEntry,
+    SQLiteEmbeddingCache,
+    build_cache,
+)
+
+
+def _entry(value: float) -> EmbeddingCacheEntry:
+    return EmbeddingCacheEntry(vector=(value, 0.1), metadata={"m": "x"})
+
+
+def test_bulk_roundtrip_with_memory_front(tmp_path: Path) -> None:
+    path = tmp_path / "cache.sqlite"
+    cache = SQLiteEmbeddingCache(path, memory_entries=2)
+    cache.set_many({f"k{i}": _entry(float(i)) for i in range(3)})
+    assert cache.get_many(["k2", "k1", "missing"]) == {
+        "k2": _entry(2.0),
+        "k1": _entry(1.0),
+    }
+    stats = cache.stats()
+    assert (stats["hits"], stats["memory_hits"], stats["misses"]) == (2, 2, 1)
+    # k0 fell out of the two-entry LRU and is served from SQLite.
+    assert cache.get("k0") == _entry(0.0)
+    assert cache.stats()["memory_hits"] == 2
+    blob = sqlite3.connect(path).execute(
+        "SELECT vec_blob FROM embeddings_cache WHERE key='k1'"
+    )
+    assert isinstance(blob.fetchone()[0], bytes)
+
+
+def test_max_entries_and_ttl_evict(tmp_path: Path) -> None:
+    cache = SQLiteEmbeddingCache(tmp_path / "c.sqlite", max_entries=2)
+    for i in range(4):
+        cache.set(f"k{i}", _entry(float(i)))
+    assert sorted(cache.get_many([f"k{i}" for i in range(4)])) == ["k2", "k3"]
+
+    expiring = SQLiteEmbeddingCache(tmp_path / "t.sqlite", ttl_seconds=60)
+    expiring.set("old", _entry(1.0))
+    expiring._conn.execute("UPDATE embeddings_cache SET created_at = 0")
+    expiring._memory.clear()
+    assert expiring.get("old") is None
+    expiring.set("new", _entry(2.0))
+    (count,) = expiring._conn.execute(
+        "SELECT COUNT(*) FROM embeddings_cache"
+    ).fetchone()
+    assert count == 1
+
+
+def test_reads_legacy_json_rows_and_shares_instances(tmp_path: Path) -> None:
+    path = tmp_path / "legacy.sqlite"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE embeddings_cache(key TEXT PRIMARY KEY, vector TEXT, metadata TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO embeddings_cache VALUES(?,?,?)",
+        ("k", json.dumps([1.0, 2.0]), json.dumps({"m": "x"})),
+    )
+    conn.commit()
+    cache = build_cache(f"sqlite:{path}")
+    assert cache is build_cache(str(path))
+    assert cache is not None
+    assert cache.get("k") == EmbeddingCacheEntry(vector=(1.0, 2.0), metadata={"m": "x"})
@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from bijux_vex.core.errors import ConflictError, CorruptArtifactError
+from bijux_vex.infra.adapters.faiss import adapter as faiss_adapter
+from bijux_vex.infra.adapters.faiss.adapter import FaissVectorStoreAdapter
+
+faiss = pytest.importorskip("faiss")
+np = pytest.importorskip("numpy")
+
+
+def _open(path: Path, index_type: str = "exact") -> FaissVectorStoreAdapter:
+    adapter = FaissVectorStoreAdapter(uri=str(path), options={"index_type": index_type})
+    adapter.connect()
+    return adapter
+
+
+def _insert(adapter: FaissVectorStoreAdapter, start: int, count: int) -> None:
+    adapter.insert(
+        [[float(i), float(i % 3)] for i in range(start, start + count)],
+        metadata=[
+            {"vector_id": f"vec-{i}", "chunk_id": f"c{i}"}
+            for i in range(start, start + count)
+        ],
+    )
+
+
+def test_inserts_append_to_the_log_and_replay_after_checkpoint(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "index.faiss"
+    adapter = _open(path)
+    _insert(adapter, 0, 10)
+    checkpoint = path.stat().st_mtime_ns, path.stat().st_size
+    log_size = path.with_suffix(".records.log").stat().st_size
+    _insert(adapter, 10, 5)
+    assert (path.stat().st_mtime_ns, path.stat().st_size) == checkpoint
+    assert path.with_suffix(".records.log").stat().st_size > log_size
+    assert not path.with_suffix(".records.json").exists()
+
+    reloaded = _open(path)
+    assert reloaded.status()["index"]["vector_count"] == 15
+    assert reloaded.query([12.0, 0.0], 1, mode="deterministic")[0][0] == "vec-12"
+    with pytest.raises(ConflictError):
+        _insert(reloaded, 14, 1)
+
+
+def test_exact_deletes_remove_rows_without_rebuild(tmp_path: Path) -> None:
+    path = tmp_path / "index.faiss"
+    adapter = _open(path)
+    _insert(adapter, 0, 6)
+    assert adapter.delete(["vec-2", "vec-3", "missing"]) == 2
+    assert adapter.status()["index"]["deleted_count"] == 0
+    hits = {vid for vid, _ in adapter.query([2.0, 2.0], 6, mode="deterministic")}
+    assert hits == {"vec-0", "vec-1", "vec-4", "vec-5"}
+    reloaded = _open(path)
+    assert reloaded.index_params["ntotal"] == 4
+    assert {
+        vid for vid, _ in reloaded.query([2.0, 2.0], 6, mode="deterministic")
+    } == hits
+    _insert(reloaded, 2, 1)
+    assert reloaded.query([2.0, 2.0], 1, mode="deterministic")[0][0] == "vec-2"
+
+
+def test_hnsw_deletes_are_tombstoned_until_compaction(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(faiss_adapter, "_MIN_COMPACT_ROWS", 3)
+    path = tmp_path / "index.faiss"
+    adapter = _open(path, "ann")
+    _insert(adapter, 0, 20)
+    adapter.delete(["vec-5", "vec-6"])
+    assert adapter.status()["index"]["deleted_count"] == 2
+    assert adapter.index_params["ntotal"] == 20
+    hits = [vid for vid, _ in adapter.query([5.0, 2.0], 4, mode="non_deterministic")]
+    assert len(hits) == 4
+    assert {"vec-5", "vec-6"}.isdisjoint(hits)
+    reloaded = _open(path, "ann")
+    assert reloaded.status()["index"]["deleted_count"] == 2
+    assert "vec-5" not in {
+        vid for vid, _ in reloaded.query([5.0, 2.0], 4, mode="non_deterministic")
+    }
+    reloaded.delete(["vec-7", "vec-8", "vec-9"])
+    assert reloaded.status()["index"]["deleted_count"] == 0
+    assert reloaded.index_params["ntotal"] == 15
+    assert _open(path, "ann").status()["index"]["vector_count"] == 15
+
+
+def test_legacy_json_records_are_migrated(tmp_path: Path) -> None:
+    path = tmp_path / "index.faiss"
+    index = faiss.IndexFlatL2(2)
+    index.add(np.asarray([[0.0, 0.0], [5.0, 5.0]], dtype="float32"))
+    faiss.write_index(index, str(path))
+    path.with_suffix(".meta.json").write_text(
+        json.dumps(
+            {
+                "index_version": faiss_adapter.INDEX_VERSION,
+                "faiss_version": faiss.__version__,
+                "metric": "l2",
+                "dimension": 2,
+                "index_type": "IndexFlatL2",
+                "index_kind": "exact",
+            }
+        )
+    )
+    path.with_suffix(".records.json").write_text(
+        json.dumps(
+            [
+                {"vector_id": "a", "vector": [0.0, 0.0], "metadata": {}},
+                {"vector_id": "b", "vector": [5.0, 5.0], "metadata": {"k": "v"}},
+            ]
+        )
+    )
+    adapter = _open(path)
+    assert adapter.query([4.0, 4.0], 1, mode="deterministic")[0][0] == "b"
+    assert not path.with_suffix(".records.json").exists()
+    assert path.with_suffix(".records.log").exists()
+    assert _open(path).status()["index"]["index_type"] == "IndexFlatL2"
+
+
+def test_truncated_log_refuses_load(tmp_path: Path) -> None:
+    path = tmp_path / "index.faiss"
+    _insert(_open(path), 0, 3)
+    log_path = path.with_suffix(".records.log")
+    log_path.write_bytes(log_path.read_bytes()[:-2])
+    with pytest.raises(CorruptArtifactError):
+        _open(path)
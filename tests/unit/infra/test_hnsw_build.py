@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from bijux_vex.contracts.resources import StoredVectors
+from bijux_vex.core.errors import BudgetExceededError, ValidationError
+from bijux_vex.core.types import NDSettings, Vector
+from bijux_vex.infra.adapters import ann_hnsw
+from bijux_vex.infra.adapters.ann_hnsw import HnswAnnRunner
+from bijux_vex.infra.adapters.memory.backend import memory_backend
+from bijux_vex.infra.adapters.sqlite.backend import sqlite_backend
+
+pytest.importorskip("hnswlib")
+
+
+def _vectors(count: int) -> list[Vector]:
+    return [
+        Vector(
+            vector_id=f"v{i:04d}",
+            chunk_id=f"c{i}",
+            values=(float(i), float(i % 5), 1.0),
+            dimension=3,
+        )
+        for i in range(count)
+    ]
+
+
+def test_streamed_build_matches_list_build(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = sqlite_backend().stores.vectors
+    listed = HnswAnnRunner(source).build_index("art", _vectors(250), "l2")
+    monkeypatch.setattr(ann_hnsw, "_BUILD_CHUNK", 64)
+    runner = HnswAnnRunner(source, index_dir=tmp_path, num_threads=2)
+    streamed = runner.build_index("art", iter(_vectors(250)), "l2")
+    assert streamed["index_hash"] == listed["index_hash"]
+    assert streamed["vector_count"] == 250
+    assert streamed["build_threads"] == 2
+    timings = streamed["build_timings_ms"]
+    assert isinstance(timings, dict)
+    assert set(timings) == {"load", "insert", "persist"}
+    ids, _, _ = runner.query((120.0, 0.0, 1.0), 1, artifact_id="art")
+    assert ids == ["v0120"]
+
+
+def test_nd_settings_threads_override_runner_default() -> None:
+    runner = HnswAnnRunner(sqlite_backend().stores.vectors, num_threads=4)
+    info = runner.build_index("art", _vectors(10), "l2", NDSettings(num_threads=1))
+    assert info["build_threads"] == 1
+    assert "persist" not in info["build_timings_ms"]  # type: ignore[operator]
+
+
+def test_build_threads_default_from_environment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("BIJUX_VEX_HNSW_BUILD_THREADS", "3")
+    assert HnswAnnRunner(sqlite_backend().stores.vectors).num_threads == 3
+    monkeypatch.delenv("BIJUX_VEX_HNSW_BUILD_THREADS")
+    assert HnswAnnRunner(sqlite_backend().stores.vectors).num_threads == -1
+
+
+def test_streamed_build_enforces_memory_and_dimension(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(ann_hnsw, "_BUILD_CHUNK", 8)
+    runner = HnswAnnRunner(sqlite_backend().stores.vectors)
+    big = (
+        Vector(vector_id=f"b{i}", chunk_id="c", values=(0.0,) * 4096, dimension=4096)
+        for i in range(64)
+    )
+    with pytest.raises(BudgetExceededError):
+        runner.build_index("art", big, "l2", NDSettings(max_index_memory_mb=1))
+    mixed = [
+        *_vectors(10),
+        Vector(vector_id="x", chunk_id="c", values=(1.0,), dimension=1),
+    ]
+    with pytest.raises(ValidationError):
+        runner.build_index("art", mixed, "l2")
+
+
+@pytest.mark.parametrize("make_backend", [memory_backend, sqlite_backend])
+def test_stored_build_reads_float32_pages_without_listing(
+    make_backend, monkeypatch: pytest.MonkeyPatch
+) -> None:  # type: ignore[no-untyped-def]
+    backend = make_backend()
+    vectors = backend.stores.vectors
+    with backend.tx_factory() as tx:
+        for vector in reversed(_vectors(250)):
+            vectors.put_vector(tx, vector)
+        tx.commit()
+    listed = HnswAnnRunner(vectors).build_index("art", _vectors(250), "l2")
+
+    def refuse(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("build materialized the corpus")
+
+    monkeypatch.setattr(vectors, "list_vectors", refuse)
+    monkeypatch.setattr(ann_hnsw, "_BUILD_CHUNK", 64)
+    stored = StoredVectors(vectors)
+    assert len(stored) == 250
+    pages = list(stored.blocks(64))
+    assert [len(ids) for ids, _ in pages] == [64, 64, 64, 58]
+    assert pages[1][0][0] == "v0064"
+    streamed = HnswAnnRunner(vectors).build_index("art", stored, "l2")
+    assert streamed["index_hash"] == listed["index_hash"]
+    assert streamed["vector_count"] == 250
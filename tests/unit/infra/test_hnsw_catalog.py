@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+import pytest
+
+from bijux_vex.core.contracts.execution_contract import ExecutionContract
+from bijux_vex.core.errors import ValidationError
+from bijux_vex.core.execution_intent import ExecutionIntent
+from bijux_vex.core.execution_mode import ExecutionMode
+from bijux_vex.core.types import (
+    ExecutionArtifact,
+    ExecutionBudget,
+    ExecutionRequest,
+    Vector,
+)
+from bijux_vex.infra.adapters.hnsw.catalog import CatalogEntry, HnswIndexCatalog
+from bijux_vex.infra.adapters.sqlite.backend import sqlite_backend
+
+
+def _artifact(artifact_id: str) -> ExecutionArtifact:
+    return ExecutionArtifact(
+        artifact_id=artifact_id,
+        corpus_fingerprint="corp",
+        vector_fingerprint="vec",
+        metric="l2",
+        scoring_version="v1",
+        execution_contract=ExecutionContract.NON_DETERMINISTIC,
+    )
+
+
+def _request() -> ExecutionRequest:
+    return ExecutionRequest(
+        request_id="req",
+        text=None,
+        vector=(0.0, 0.1),
+        top_k=2,
+        execution_contract=ExecutionContract.NON_DETERMINISTIC,
+        execution_intent=ExecutionIntent.EXPLORATORY_SEARCH,
+        execution_mode=ExecutionMode.BOUNDED,
+        execution_budget=ExecutionBudget(
+            max_latency_ms=1000, max_memory_mb=100, max_error=1.0
+        ),
+    )
+
+
+def test_catalog_evicts_least_recently_used() -> None:
+    evicted: list[str] = []
+    catalog = HnswIndexCatalog(
+        max_resident_mb=1.5, on_evict=lambda aid, _entry: evicted.append(aid)
+    )
+    for name in ("a", "b", "c"):
+        catalog.put(name, CatalogEntry(None, [], {}, size_bytes=600 * 1024))
+        catalog.get("a")
+    assert evicted == ["b"]
+    assert catalog.get("b") is None
+    stats = catalog.stats()
+    assert stats["evictions"] == 1
+    assert stats["misses"] == 1
+    assert stats["resident"] == ["c", "a"]
+
+
+def test_runner_serves_many_artifacts_and_reloads_evicted(tmp_path) -> None:
+    pytest.importorskip("hnswlib")
+    from bijux_vex.infra.adapters.ann_hnsw import HnswAnnRunner
+
+    backend = sqlite_backend()
+    vectors = [
+        Vector(vector_id=f"v{i}", chunk_id=f"c{i}", values=(float(i), 0.0), dimension=2)
+        for i in range(8)
+    ]
+    runner = HnswAnnRunner(
+        backend.stores.vectors, index_dir=tmp_path, max_resident_mb=0.0001
+    )
+    runner.build_index("art-a", vectors, "l2")
+    runner.build_index("art-b", vectors[:4], "l2")
+    assert runner.catalog_stats()["resident"] == ["art-b"]
+
+    results = list(runner.approximate_request(_artifact("art-a"), _request()))
+    assert [r.vector_id for r in results] == ["v0", "v1"]
+    stats = runner.catalog_stats()
+    assert stats["loads"] == 1
+    assert stats["evictions"] == 2
+    assert runner.index_info("art-a")["residency"]["resident"] is True
+    with pytest.raises(ValidationError):
+        runner.query((0.0, 0.0), 1)
+    ids, _, _ = runner.query((3.0, 0.0), 1, artifact_id="art-a")
+    assert ids == ["v3"]
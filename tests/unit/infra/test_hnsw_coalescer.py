@@ -0,0 +1,139 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+import pytest
+
+from bijux_vex.core.contracts.execution_contract import ExecutionContract
+from bijux_vex.core.execution_intent import ExecutionIntent
+from bijux_vex.core.execution_mode import ExecutionMode
+from bijux_vex.core.types import (
+    ExecutionArtifact,
+    ExecutionBudget,
+    ExecutionRequest,
+    NDSettings,
+    Vector,
+)
+from bijux_vex.infra.adapters.hnsw.catalog import CatalogEntry
+from bijux_vex.infra.adapters.hnsw.coalescer import KnnCoalescer
+from bijux_vex.infra.adapters.sqlite.backend import sqlite_backend
+
+
+class _GatedIndex:
+    """Fake hnswlib index whose first search blocks until released."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.calls: list[tuple[int, int, int]] = []
+        self.ef = 0
+
+    def set_ef(self, ef: int) -> None:
+        self.ef = ef
+
+    def knn_query(self, rows, k, num_threads=-1):  # type: ignore[no-untyped-def]
+        self.calls.append((len(rows), k, self.ef))
+        if len(self.calls) == 1:
+            assert self.release.wait(10)
+        labels = [[int(row[0])] * k for row in rows]
+        distances = [[float(self.ef)] * k for _ in rows]
+        return labels, distances
+
+
+def _wait_for(condition) -> None:  # type: ignore[no-untyped-def]
+    deadline = time.time() + 10
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.001)
+
+
+def test_queued_searches_share_one_knn_query() -> None:
+    index = _GatedIndex()
+    entry = CatalogEntry(index, [], {}, size_bytes=0)
+    coalescer = KnnCoalescer(num_threads=2)
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        leader = pool.submit(coalescer.search, entry, [(0.0,)], 1, 32)
+        _wait_for(lambda: len(index.calls) == 1)
+        followers = [
+            pool.submit(coalescer.search, entry, [(float(i),)], 2, 32)
+            for i in (1, 2, 3)
+        ]
+        _wait_for(lambda: sum(len(q) for q in coalescer._queues.values()) == 3)
+        other_ef = pool.submit(coalescer.search, entry, [(9.0,)], 1, 64)
+        _wait_for(lambda: len(coalescer._queues) == 2)
+        index.release.set()
+        assert leader.result()[0] == [[0]]
+        for i, future in enumerate(followers, start=1):
+            labels, distances = future.result()
+            assert labels == [[i, i]]
+            assert distances == [[32.0, 32.0]]
+        assert other_ef.result()[1] == [[64.0]]
+    assert sorted(index.calls) == [(1, 1, 32), (1, 1, 64), (3, 2, 32)]
+    assert coalescer.stats() == {"query_batches": 3, "coalesced_queries": 3}
+    assert coalescer._queues == {}
+
+
+def test_search_errors_reach_every_caller_in_the_batch() -> None:
+    class _Broken(_GatedIndex):
+        def knn_query(self, rows, k, num_threads=-1):  # type: ignore[no-untyped-def]
+            raise RuntimeError("boom")
+
+    coalescer = KnnCoalescer()
+    entry = CatalogEntry(_Broken(), [], {}, size_bytes=0)
+    with pytest.raises(RuntimeError, match="boom"):
+        coalescer.search(entry, [(0.0,)], 1, 10)
+    assert coalescer._queues == {}
+
+
+def test_concurrent_requests_with_mixed_ef_match_serial_results() -> None:
+    pytest.importorskip("hnswlib")
+    from bijux_vex.infra.adapters.ann_hnsw import HnswAnnRunner
+
+    runner = HnswAnnRunner(sqlite_backend().stores.vectors, query_threads=2)
+    vectors = [
+        Vector(
+            vector_id=f"v{i:04d}",
+            chunk_id=f"c{i}",
+            values=(float(i % 37), float(i % 11), float(i % 5)),
+            dimension=3,
+        )
+        for i in range(400)
+    ]
+    runner.build_index("art", vectors, "l2")
+    artifact = ExecutionArtifact(
+        artifact_id="art",
+        corpus_fingerprint="corp",
+        vector_fingerprint="vec",
+        metric="l2",
+        scoring_version="v1",
+        execution_contract=ExecutionContract.NON_DETERMINISTIC,
+    )
+
+    def request(i: int) -> ExecutionRequest:
+        return ExecutionRequest(
+            request_id=f"req-{i}",
+            text=None,
+            vector=(i % 30 + 0.25, i % 9 + 0.5, 1.0),
+            top_k=5,
+            execution_contract=ExecutionContract.NON_DETERMINISTIC,
+            execution_intent=ExecutionIntent.EXPLORATORY_SEARCH,
+            execution_mode=ExecutionMode.BOUNDED,
+            execution_budget=ExecutionBudget(),
+            nd_settings=NDSettings(ef_search=5 if i % 2 else 200),
+        )
+
+    def run(i: int) -> tuple[tuple[str, ...], str]:
+        found = runner.approximate_request(artifact, request(i))
+        ef = dict(runner._query_params_metadata())["ef_search"]
+        return tuple(res.vector_id for res in found), ef
+
+    serial = [run(i) for i in range(64)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        concurrent = list(pool.map(run, range(64)))
+    assert concurrent == serial
+    assert [ef for _, ef in serial[:2]] == ["200", "5"]
+    stats = runner.catalog_stats()
+    assert stats["query_batches"] <= 128  # type: ignore[operator]
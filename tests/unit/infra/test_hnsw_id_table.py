@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from bijux_vex.core.contracts.execution_contract import ExecutionContract
+from bijux_vex.core.errors import CorruptArtifactError
+from bijux_vex.core.execution_intent import ExecutionIntent
+from bijux_vex.core.execution_mode import ExecutionMode
+from bijux_vex.core.types import (
+    ExecutionArtifact,
+    ExecutionBudget,
+    ExecutionRequest,
+    Vector,
+)
+from bijux_vex.infra.adapters.hnsw.id_table import IdTable, write_id_table
+from bijux_vex.infra.adapters.sqlite.backend import sqlite_backend
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_id_table_round_trip(tmp_path: Path, use_mmap: bool) -> None:
+    path = tmp_path / "art.ids"
+    ids = ["v0", "vecteur-é", "", "向量", "v4"]
+    write_id_table(path, ids, {3, 1})
+    table, deleted = IdTable.open(path, use_mmap=use_mmap)
+    assert list(table) == ids
+    assert deleted == {1, 3}
+    table.extend(["late"])
+    assert len(table) == 6
+    assert table[5] == "late"
+    with pytest.raises(IndexError):
+        table[6]
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_id_table_label_lookup_decodes_only_probed_ids(
+    tmp_path: Path, use_mmap: bool
+) -> None:
+    path = tmp_path / "art.ids"
+    ids = [f"v{i:04d}" for i in range(1000)] + ["v0007", "向量"]
+    write_id_table(path, ids, {7})
+    table, _ = IdTable.open(path, use_mmap=use_mmap)
+    decoded: list[int] = []
+    raw = table._raw
+
+    def counting(label: int) -> bytes:
+        decoded.append(label)
+        return raw(label)
+
+    table._raw = counting  # type: ignore[method-assign]
+    assert table.label_of("v0500") == 500
+    assert len(decoded) <= 12
+    assert table.label_of("v0007") == 1000
+    assert table.label_of("向量") == 1001
+    assert table.label_of("missing") is None
+    table.extend(["v0500"])
+    assert table.label_of("v0500") == 1002
+
+
+def test_id_table_reads_version_one_files(tmp_path: Path) -> None:
+    path = tmp_path / "art.ids"
+    write_id_table(path, ["a", "b", "a"], {0})
+    data = path.read_bytes()
+    header = 24 + 8 * 4 + 8 * 1
+    # Version 1: same header and offsets, no order section.
+    path.write_bytes(b"BVXIDS01" + data[8:header] + data[header + 8 * 3 :])
+    table, deleted = IdTable.open(path)
+    assert list(table) == ["a", "b", "a"]
+    assert deleted == {0}
+    assert table.label_of("a") == 2
+    assert table.label_of("b") == 1
+
+
+def test_id_table_rejects_damaged_files(tmp_path: Path) -> None:
+    path = tmp_path / "art.ids"
+    write_id_table(path, ["a", "b"], ())
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(CorruptArtifactError):
+        IdTable.open(path)
+    path.write_bytes(b"not an id table at all!!")
+    with pytest.raises(CorruptArtifactError):
+        IdTable.open(path)
+
+
+def _artifact() -> ExecutionArtifact:
+    return ExecutionArtifact(
+        artifact_id="art",
+        corpus_fingerprint="corp",
+        vector_fingerprint="vec",
+        metric="l2",
+        scoring_version="v1",
+        execution_contract=ExecutionContract.NON_DETERMINISTIC,
+    )
+
+
+def _request(query: tuple[float, float]) -> ExecutionRequest:
+    return ExecutionRequest(
+        request_id="req",
+        text=None,
+        vector=query,
+        top_k=3,
+        execution_contract=ExecutionContract.NON_DETERMINISTIC,
+        execution_intent=ExecutionIntent.EXPLORATORY_SEARCH,
+        execution_mode=ExecutionMode.BOUNDED,
+        execution_budget=ExecutionBudget(),
+    )
+
+
+def _vectors(start: int, count: int) -> list[Vector]:
+    return [
+        Vector(
+            vector_id=f"v{i:03d}",
+            chunk_id=f"c{i}",
+            values=(float(i), float(i % 4)),
+            dimension=2,
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def test_runner_persists_binary_ids_and_reads_legacy_metadata(tmp_path: Path) -> None:
+    pytest.importorskip("hnswlib")
+    from bijux_vex.infra.adapters.ann_hnsw import HnswAnnRunner
+
+    source = sqlite_backend().stores.vectors
+    HnswAnnRunner(source, index_dir=tmp_path).build_index("art", _vectors(0, 50), "l2")
+    meta = json.loads((tmp_path / "art.json").read_text())
+    assert "ids" not in meta
+    assert (tmp_path / "art.ids").exists()
+
+    mapped = HnswAnnRunner(source, index_dir=tmp_path, use_mmap=True)
+    found = [
+        r.vector_id
+        for r in mapped.approximate_request(_artifact(), _request((7.0, 3.0)))
+    ]
+    assert found[0] == "v007"
+    mapped.apply_delta("art", _vectors(50, 5), ["v007"])
+    mapped.flush()
+    reloaded = HnswAnnRunner(source, index_dir=tmp_path, use_mmap=False)
+    hits = [
+        r.vector_id
+        for r in reloaded.approximate_request(_artifact(), _request((52.0, 0.0)))
+    ]
+    assert hits[0] == "v052"
+    assert "v007" not in {
+        r.vector_id
+        for r in reloaded.approximate_request(_artifact(), _request((7.0, 3.0)))
+    }
+
+    table, deleted = IdTable.open(tmp_path / "art.ids")
+    legacy = {**meta, "ids": list(table), "deleted_labels": sorted(deleted)}
+    legacy["vector_count"] = len(table) - len(deleted)
+    (tmp_path / "art.json").write_text(json.dumps(legacy))
+    (tmp_path / "art.ids").unlink()
+    old_format = HnswAnnRunner(source, index_dir=tmp_path)
+    assert [
+        r.vector_id
+        for r in old_format.approximate_request(_artifact(), _request((52.0, 0.0)))
+    ] == hits
@@ -0,0 +1,196 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from bijux_vex.boundaries.pydantic_edges.models import (
+    ExecutionArtifactRequest,
+    IngestRequest,
+)
+from bijux_vex.core.contracts.execution_contract import ExecutionContract
+from bijux_vex.core.errors import CorruptArtifactError
+from bijux_vex.core.types import ExecutionArtifact, Vector
+from bijux_vex.infra.adapters.ann_hnsw import HnswAnnRunner
+from bijux_vex.infra.adapters.memory.backend import memory_backend
+from bijux_vex.infra.adapters.sqlite.backend import sqlite_backend
+from bijux_vex.services._orchestrator import Orchestrator
+
+pytest.importorskip("hnswlib")
+
+
+def _vectors(start: int, stop: int) -> list[Vector]:
+    return [
+        Vector(
+            vector_id=f"v{i:03d}", chunk_id=f"c{i}", values=(float(i), 1.0), dimension=2
+        )
+        for i in range(start, stop)
+    ]
+
+
+def _artifact(artifact_id: str) -> ExecutionArtifact:
+    return ExecutionArtifact(
+        artifact_id=artifact_id,
+        corpus_fingerprint="corp",
+        vector_fingerprint="vec",
+        metric="l2",
+        scoring_version="v1",
+        execution_contract=ExecutionContract.NON_DETERMINISTIC,
+    )
+
+
+def test_apply_delta_adds_and_deletes_without_rebuild(tmp_path) -> None:
+    backend = sqlite_backend()
+    runner = HnswAnnRunner(backend.stores.vectors, index_dir=tmp_path)
+    base = runner.build_index("art", _vectors(0, 4), "l2")
+    assert runner.supports_incremental
+
+    info = runner.apply_delta("art", _vectors(4, 10), removed=("v001",))
+    assert info["vector_count"] == 9
+    assert info["deleted_count"] == 1
+    assert info["index_hash"] != base["index_hash"]
+    assert runner.catalog_stats()["builds"] == 1
+    ids, _, _ = runner.query((9.0, 1.0), 9, artifact_id="art")
+    assert ids[0] == "v009"
+    assert "v001" not in ids
+
+    # Already indexed ids are a no-op; the hash only moves on real changes.
+    assert runner.apply_delta("art", _vectors(4, 6))["index_hash"] == info["index_hash"]
+
+    # Deltas stay in memory until flushed (or the persist threshold is hit).
+    unflushed = HnswAnnRunner(backend.stores.vectors, index_dir=tmp_path)
+    stale = unflushed._load_index(_artifact("art"), None)
+    assert stale is not None
+    assert stale.live_count == 4
+    runner.flush()
+    reloaded = HnswAnnRunner(backend.stores.vectors, index_dir=tmp_path)
+    entry = reloaded._load_index(_artifact("art"), None)
+    assert entry is not None
+    assert entry.live_count == 9
+    assert entry.deleted == {1}
+
+
+def test_deltas_persist_at_the_threshold_and_stale_files_are_refused(
+    tmp_path,
+) -> None:
+    source = sqlite_backend().stores.vectors
+    runner = HnswAnnRunner(source, index_dir=tmp_path, persist_every=3)
+    runner.build_index("art", _vectors(0, 4), "l2")
+    entry = runner._catalog.peek("art")
+    assert entry is not None
+    runner.apply_delta("art", _vectors(4, 6))
+    assert entry.dirty
+    assert entry.unpersisted == 2
+    info = runner.apply_delta("art", _vectors(6, 7))
+    assert not entry.dirty
+
+    def recorded(index_hash: object) -> ExecutionArtifact:
+        return replace(
+            _artifact("art"), build_params=(("ann_index_hash", str(index_hash)),)
+        )
+
+    loaded = HnswAnnRunner(source, index_dir=tmp_path)._load_index(
+        recorded(info["index_hash"]), None
+    )
+    assert loaded is not None
+    assert loaded.live_count == 7
+    newer = runner.apply_delta("art", _vectors(7, 8))
+    with pytest.raises(CorruptArtifactError, match="stale"):
+        HnswAnnRunner(source, index_dir=tmp_path)._load_index(
+            recorded(newer["index_hash"]), None
+        )
+
+
+class _LockCheckingIndex:
+    """Wraps an hnswlib index and records whether mutations hold the query lock."""
+
+    def __init__(self, index, lock) -> None:  # type: ignore[no-untyped-def]
+        self._index = index
+        self._lock = lock
+        self.unlocked: list[str] = []
+
+    def __getattr__(self, name: str):  # type: ignore[no-untyped-def]
+        attr = getattr(self._index, name)
+        if name not in {"resize_index", "add_items", "mark_deleted"}:
+            return attr
+
+        def checked(*args, **kwargs):  # type: ignore[no-untyped-def]
+            if not self._lock.locked():
+                self.unlocked.append(name)
+            return attr(*args, **kwargs)
+
+        return checked
+
+
+def test_apply_delta_mutates_under_the_query_lock() -> None:
+    runner = HnswAnnRunner(sqlite_backend().stores.vectors)
+    runner.build_index("art", _vectors(0, 4), "l2")
+    entry = runner._catalog.get("art")
+    assert entry is not None
+    checking = _LockCheckingIndex(entry.index, entry.query_lock)
+    entry.index = checking
+    runner.apply_delta("art", _vectors(4, 200), removed=("v002",))
+    assert checking.unlocked == []
+    assert len(entry.ids) == 200
+    ids, _, _ = runner.query((150.0, 1.0), 1, artifact_id="art")
+    assert ids == ["v150"]
+
+
+def test_apply_delta_refuses_dimension_change() -> None:
+    runner = HnswAnnRunner(sqlite_backend().stores.vectors)
+    runner.build_index("art", _vectors(0, 4), "l2")
+    odd = Vector(vector_id="x", chunk_id="cx", values=(1.0, 2.0, 3.0), dimension=3)
+    assert runner.apply_delta("art", [odd]) == {}
+    assert runner.index_info("art")["vector_count"] == 4
+
+
+def test_ingest_keeps_ann_artifact_ready() -> None:
+    orchestrator = Orchestrator(backend=memory_backend())
+    orchestrator.ingest(
+        IngestRequest(
+            documents=["a", "b", "c"], vectors=[[0.0, 1.0], [1.0, 1.0], [2.0, 1.0]]
+        )
+    )
+    orchestrator.materialize(
+        ExecutionArtifactRequest(
+            execution_contract=ExecutionContract.NON_DETERMINISTIC, index_mode="ann"
+        )
+    )
+    artifact_id = orchestrator.default_artifact_id
+    before = orchestrator.stores.ledger.get_artifact(artifact_id)
+    orchestrator.ingest(IngestRequest(documents=["d"], vectors=[[3.0, 1.0]]))
+    after = orchestrator.stores.ledger.get_artifact(artifact_id)
+    assert after.index_state == "ready"
+    params = dict(after.build_params)
+    assert params["ann_index_hash"] != dict(before.build_params)["ann_index_hash"]
+    assert after.vector_fingerprint == orchestrator._latest_vector_fingerprint
+    assert orchestrator.backend.ann.index_info(artifact_id)["vector_count"] == 4
+
+
+def test_reingested_document_replaces_its_indexed_vector() -> None:
+    orchestrator = Orchestrator(backend=memory_backend())
+    orchestrator.ingest(
+        IngestRequest(
+            documents=["a", "b", "c"], vectors=[[0.0, 1.0], [1.0, 1.0], [2.0, 1.0]]
+        )
+    )
+    orchestrator.materialize(
+        ExecutionArtifactRequest(
+            execution_contract=ExecutionContract.NON_DETERMINISTIC, index_mode="ann"
+        )
+    )
+    artifact_id = orchestrator.default_artifact_id
+    vectors = orchestrator.stores.vectors
+    (stale,) = [v.vector_id for v in vectors.list_vectors() if v.values == (1.0, 1.0)]
+    orchestrator.ingest(IngestRequest(documents=["b"], vectors=[[9.0, 1.0]]))
+
+    assert vectors.get_vector(stale) is None
+    assert orchestrator.stores.ledger.get_artifact(artifact_id).index_state == "ready"
+    info = orchestrator.backend.ann.index_info(artifact_id)
+    assert info["vector_count"] == 3
+    assert info["deleted_count"] == 1
+    ids, _, _ = orchestrator.backend.ann.query((1.0, 1.0), 3, artifact_id=artifact_id)
+    assert stale not in ids
+    assert len(ids) == 3
@@ -0,0 +1,194 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from bijux_vex.boundaries.pydantic_edges.models import (
+    ExecutionArtifactRequest,
+    ExecutionBatchRequestPayload,
+    ExecutionBudgetPayload,
+    IngestRequest,
+    RandomnessProfilePayload,
+)
+from bijux_vex.core.contracts.execution_contract import ExecutionContract
+from bijux_vex.core.errors import BudgetExceededError
+from bijux_vex.core.execution_intent import ExecutionIntent
+from bijux_vex.core.execution_mode import ExecutionMode
+from bijux_vex.core.types import (
+    ExecutionArtifact,
+    ExecutionBudget,
+    ExecutionRequest,
+    NDSettings,
+    Vector,
+)
+from bijux_vex.domain.execution_algorithms.exact_matrix import (
+    build_vector_matrix,
+    exact_top_k,
+)
+from bijux_vex.infra.adapters.ann_ivf import IvfFlatAnnRunner
+from bijux_vex.infra.adapters.memory.backend import memory_backend
+from bijux_vex.services._orchestrator import Orchestrator
+
+np = pytest.importorskip("numpy")
+
+DIM = 8
+
+
+def _vectors(count: int = 900, offset: int = 0) -> list[Vector]:
+    rng = np.random.default_rng(11 + offset)
+    centers = np.random.default_rng(11).normal(size=(10, DIM)) * 4.0
+    points = centers[rng.integers(0, len(centers), count)] + rng.normal(
+        size=(count, DIM)
+    )
+    return [
+        Vector(
+            vector_id=f"v{offset + i:05d}",
+            chunk_id=f"c{offset + i}",
+            values=tuple(points[i].tolist()),
+            dimension=DIM,
+        )
+        for i in range(count)
+    ]
+
+
+def _artifact(metric: str) -> ExecutionArtifact:
+    return ExecutionArtifact(
+        artifact_id="art-ivf",
+        corpus_fingerprint="corp",
+        vector_fingerprint="vec",
+        metric=metric,
+        scoring_version="v1",
+        execution_contract=ExecutionContract.NON_DETERMINISTIC,
+    )
+
+
+def _request(
+    query: tuple[float, ...],
+    top_k: int,
+    probes: int | None = None,
+    settings: NDSettings | None = None,
+) -> ExecutionRequest:
+    return ExecutionRequest(
+        request_id="req-ivf",
+        text=None,
+        vector=query,
+        top_k=top_k,
+        execution_contract=ExecutionContract.NON_DETERMINISTIC,
+        execution_intent=ExecutionIntent.EXPLORATORY_SEARCH,
+        execution_mode=ExecutionMode.BOUNDED,
+        execution_budget=ExecutionBudget(max_ann_probes=probes),
+        nd_settings=settings,
+    )
+
+
+@pytest.mark.parametrize("metric", ["l2", "cosine", "dot"])
+def test_probing_every_list_is_exact(metric: str) -> None:
+    vectors = _vectors()
+    runner = IvfFlatAnnRunner(memory_backend().stores.vectors, nprobe=10_000)
+    info = runner.build_index("art-ivf", vectors, metric)
+    assert info["index_kind"] == "ivfflat"
+    vm = build_vector_matrix(vectors, DIM)
+    for row in (0, 17, 333):
+        query = tuple((vm.matrix[row] + 0.05).tolist())
+        exact = [vid for _, vid, _ in exact_top_k(metric, query, vm, 10)]
+        found = runner.approximate_request(_artifact(metric), _request(query, 10))
+        assert [res.vector_id for res in found] == exact
+
+
+def test_max_ann_probes_bounds_nprobe() -> None:
+    vectors = _vectors()
+    runner = IvfFlatAnnRunner(memory_backend().stores.vectors, nprobe=16)
+    runner.build_index("art-ivf", vectors, "l2")
+    query = vectors[5].values
+    assert list(runner.approximate_request(_artifact("l2"), _request(query, 3, 2)))
+    assert ("nprobe", "2") in runner._query_params_metadata()
+    with pytest.raises(BudgetExceededError):
+        runner.approximate_request(_artifact("l2"), _request(query, 3, 0))
+
+
+def test_latency_budget_halves_nprobe(monkeypatch: pytest.MonkeyPatch) -> None:
+    runner = IvfFlatAnnRunner(memory_backend().stores.vectors, nprobe=16)
+    runner.build_index("art-ivf", _vectors(), "l2")
+    clock = iter(float(tick) for tick in range(0, 1000, 1))
+    monkeypatch.setattr(
+        "bijux_vex.infra.adapters.ann_ivf.time.time", lambda: next(clock)
+    )
+    settings = NDSettings(latency_budget_ms=5)
+    query = (0.0,) * DIM
+    probes = []
+    for _ in range(3):
+        runner.approximate_request(_artifact("l2"), _request(query, 3, None, settings))
+        probes.append(dict(runner._query_params_metadata())["nprobe"])
+    assert probes == ["16", "8", "4"]
+
+
+def test_append_without_retrain_and_reload(tmp_path: Path) -> None:
+    source = memory_backend().stores.vectors
+    runner = IvfFlatAnnRunner(source, index_dir=tmp_path, nprobe=10_000)
+    base = runner.build_index("art-ivf", _vectors(), "l2")
+    index = runner._indexes["art-ivf"]
+    # A scan that started before the delta keeps a consistent view.
+    lists_before = index.rows
+    sizes_before = [len(members) for members in lists_before]
+    added = _vectors(50, offset=900)
+    info = runner.apply_delta("art-ivf", added, ["v00003"])
+    assert index.rows is not lists_before
+    assert [len(members) for members in lists_before] == sizes_before
+    assert index.live_count == 900 + 50 - 1
+    assert info["vector_count"] == 900 + 50 - 1
+    assert info["trained_count"] == 900
+    assert info["index_hash"] != base["index_hash"]
+    query = added[7].values
+    found = list(runner.approximate_request(_artifact("l2"), _request(query, 1)))
+    assert found[0].vector_id == added[7].vector_id
+
+    reloaded = IvfFlatAnnRunner(source, index_dir=tmp_path, nprobe=10_000)
+    again = list(reloaded.approximate_request(_artifact("l2"), _request(query, 5)))
+    assert again == list(
+        runner.approximate_request(_artifact("l2"), _request(query, 5))
+    )
+    removed = _vectors()[3].values
+    hits = reloaded.approximate_request(_artifact("l2"), _request(removed, 5))
+    assert "v00003" not in {res.vector_id for res in hits}
+
+
+def test_orchestrator_appends_to_ivfflat_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("BIJUX_VEX_ANN_RUNNER", "ivfflat")
+    monkeypatch.setenv("BIJUX_VEX_HNSW_PATH", str(tmp_path))
+    orchestrator = Orchestrator(backend=memory_backend())
+    assert orchestrator.capabilities()["nd"]["default_runner"] == "ivfflat"
+    orchestrator.ingest(
+        IngestRequest(
+            documents=[f"doc {i}" for i in range(40)],
+            vectors=[[float(i), float(i % 7)] for i in range(40)],
+        )
+    )
+    orchestrator.materialize(
+        ExecutionArtifactRequest(
+            execution_contract=ExecutionContract.NON_DETERMINISTIC, index_mode="ann"
+        )
+    )
+    orchestrator.ingest(IngestRequest(documents=["late doc"], vectors=[[100.0, 100.0]]))
+    runner = orchestrator.backend.ann
+    assert runner.index_info(orchestrator.default_artifact_id)["vector_count"] == 41
+    out = orchestrator.execute_batch(
+        ExecutionBatchRequestPayload(
+            vectors=[(99.0, 99.0)],
+            top_k=1,
+            execution_contract=ExecutionContract.NON_DETERMINISTIC,
+            execution_intent=ExecutionIntent.EXPLORATORY_SEARCH,
+            execution_mode=ExecutionMode.BOUNDED,
+            execution_budget=ExecutionBudgetPayload(
+                max_latency_ms=1000, max_memory_mb=100, max_error=1.0
+            ),
+            randomness_profile=RandomnessProfilePayload(
+                seed=1, sources=("ivf",), bounded=True, non_replayable=False
+            ),
+        )
+    )
+    assert len(out["results"][0]) == 1
@@ -0,0 +1,86 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+import threading
+
+from bijux_vex.core.types import Vector
+from bijux_vex.infra.adapters.memory.arena import VectorArena
+from bijux_vex.infra.adapters.memory.backend import memory_backend
+
+
+def _vec(idx: int, dim: int = 2) -> Vector:
+    return Vector(
+        vector_id=f"v{idx:04d}",
+        chunk_id=f"c{idx}",
+        values=tuple(float(idx + j) for j in range(dim)),
+        dimension=dim,
+        model="m",
+        metadata={"k": str(idx)},
+    )
+
+
+def test_arena_keeps_sorted_view_across_writes_and_deletes() -> None:
+    arena = VectorArena()
+    arena.apply([_vec(i) for i in (5, 1, 3)], ())
+    arena.apply([_vec(2), _vec(4, dim=3)], ("v0003",))
+    assert arena.sorted_ids() == ("v0001", "v0002", "v0004", "v0005")
+    assert arena.get("v0003") is None
+    assert arena.get("v0004") == _vec(4, dim=3)
+    assert [v.vector_id for v in arena.vectors(chunk_id="c5")] == ["v0005"]
+
+
+def test_arena_overwrite_and_compaction_preserve_values() -> None:
+    arena = VectorArena()
+    arena.apply([_vec(i) for i in range(600)], ())
+    arena.apply([], tuple(f"v{i:04d}" for i in range(0, 600, 2)))
+    arena.apply([_vec(1)], ())
+    assert len(arena) == 300
+    assert [v.vector_id for v in arena.vectors()][:3] == ["v0001", "v0003", "v0005"]
+    assert arena.get("v0599") == _vec(599)
+
+
+def test_memory_backend_reads_through_arena() -> None:
+    backend = memory_backend()
+    with backend.tx_factory() as tx:
+        for i in (2, 1):
+            backend.stores.vectors.put_vector(tx, _vec(i))
+        tx.commit()
+    vectors = list(backend.stores.vectors.list_vectors())
+    assert [v.vector_id for v in vectors] == ["v0001", "v0002"]
+    assert backend.diagnostics["capacity"]()["vectors"] == 2
+
+
+def test_readers_never_see_a_commit_half_applied() -> None:
+    backend = memory_backend()
+    vectors = backend.stores.vectors
+    arena = vectors._state.vectors  # type: ignore[attr-defined]
+    ids = {f"v{i:04d}" for i in range(0, 600, 3)}
+    done = threading.Event()
+    errors: list[BaseException] = []
+
+    def churn() -> None:
+        try:
+            for round_ in range(6):
+                with backend.tx_factory() as tx:
+                    for i in range(600):
+                        if (i + round_) % 2:
+                            vectors.put_vector(tx, _vec(i))
+                        else:
+                            vectors.delete_vector(tx, f"v{i:04d}")
+                    tx.commit()
+        except BaseException as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+        finally:
+            done.set()
+
+    writer = threading.Thread(target=churn)
+    writer.start()
+    while not done.is_set():
+        listed = list(vectors.list_vectors())
+        assert all(v == _vec(int(v.vector_id[1:])) for v in listed)
+        vm, rows = arena.matrix_rows(2, ids)
+        if vm is not None and rows is not None:
+            assert all(vm.vector_ids[row] in ids for row in rows)
+    writer.join()
+    assert not errors
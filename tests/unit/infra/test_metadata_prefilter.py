@@ -0,0 +1,203 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+import pytest
+
+from bijux_vex.contracts.resources import VectorSource
+from bijux_vex.core.contracts.execution_contract import ExecutionContract
+from bijux_vex.core.execution_intent import ExecutionIntent
+from bijux_vex.core.execution_mode import ExecutionMode
+from bijux_vex.core.metadata_filter import parse_filter, vector_tags
+from bijux_vex.core.types import (
+    Chunk,
+    Document,
+    ExecutionArtifact,
+    ExecutionBudget,
+    ExecutionRequest,
+    Vector,
+)
+from bijux_vex.infra.adapters.memory.backend import memory_backend
+from bijux_vex.infra.adapters.sqlite.backend import sqlite_backend
+from bijux_vex.infra.adapters.vectorstore_registry import (
+    VectorStoreDescriptor,
+    VectorStoreResolution,
+)
+from bijux_vex.infra.adapters.vectorstore_source import VectorStoreVectorSource
+
+
+def _artifact(contract=ExecutionContract.DETERMINISTIC) -> ExecutionArtifact:
+    return ExecutionArtifact(
+        artifact_id="art",
+        corpus_fingerprint="corp",
+        vector_fingerprint="vec",
+        metric="l2",
+        scoring_version="v1",
+        execution_contract=contract,
+    )
+
+
+def _request(top_k: int, contract=ExecutionContract.DETERMINISTIC) -> ExecutionRequest:
+    return ExecutionRequest(
+        request_id="q",
+        text=None,
+        vector=(0.0, 0.0),
+        top_k=top_k,
+        execution_contract=contract,
+        execution_intent=ExecutionIntent.EXACT_VALIDATION,
+        execution_mode=ExecutionMode.STRICT
+        if contract is ExecutionContract.DETERMINISTIC
+        else ExecutionMode.BOUNDED,
+        execution_budget=None
+        if contract is ExecutionContract.DETERMINISTIC
+        else ExecutionBudget(),
+    )
+
+
+def _populate(backend, contract=ExecutionContract.DETERMINISTIC) -> None:
+    """Twenty vectors over two documents; every third vector is tagged ``red``."""
+    with backend.tx_factory() as tx:
+        stores = backend.stores
+        for doc in ("a", "b"):
+            stores.vectors.put_document(
+                tx, Document(document_id=doc, text=doc, source=f"s3://{doc}")
+            )
+        for i in range(20):
+            doc = "a" if i % 2 else "b"
+            stores.vectors.put_chunk(
+                tx, Chunk(chunk_id=f"c{i}", document_id=doc, text="t", ordinal=i)
+            )
+            tags = "red,blue" if i % 3 == 0 else "blue"
+            stores.vectors.put_vector(
+                tx,
+                Vector(
+                    vector_id=f"v{i:02d}",
+                    chunk_id=f"c{i}",
+                    values=(float(i), 0.0),
+                    dimension=2,
+                    metadata=(("tags", tags),),
+                ),
+            )
+        stores.ledger.put_artifact(tx, _artifact(contract))
+        tx.commit()
+
+
+def test_filter_parsing_and_tags() -> None:
+    flt = parse_filter({"doc_id": "a", "tags": ["red"]})
+    assert flt.document_ids == frozenset({"a"})
+    assert not flt.is_empty
+    assert vector_tags((("tags", '["x", "y"]'),)) == {"x", "y"}
+    assert vector_tags((("tags", "x, y"),)) == {"x", "y"}
+
+
+@pytest.mark.parametrize("factory", [memory_backend, sqlite_backend])
+def test_prefilter_returns_full_k_of_matches(factory) -> None:
+    backend = factory()
+    _populate(backend)
+    vectors = backend.stores.vectors
+    red_in_a = parse_filter({"doc_id": "a", "tags": "red"})
+    allowed = vectors.filter_vector_ids(red_in_a)
+    assert allowed == {"v03", "v09", "v15"}
+    by_source = vectors.filter_vector_ids(parse_filter({"source_uri": "s3://b"}))
+    assert by_source == {f"v{i:02d}" for i in range(0, 20, 2)}
+    # The generic ABC scan agrees with the indexed override.
+    assert VectorSource.filter_vector_ids(vectors, red_in_a) == allowed
+
+    results = list(vectors.query_allowed("art", _request(2), allowed))
+    assert [(r.vector_id, r.rank) for r in results] == [("v03", 1), ("v09", 2)]
+    assert [r.document_id for r in results] == ["a", "a"]
+    assert list(vectors.query_allowed("art", _request(2), frozenset())) == []
+
+
+def test_memory_index_follows_later_commits() -> None:
+    backend = memory_backend()
+    _populate(backend)
+    vectors = backend.stores.vectors
+    red = parse_filter({"tags": "red"})
+    with backend.tx_factory() as tx:
+        vectors.delete_vector(tx, "v03")
+        vectors.put_vector(
+            tx,
+            Vector(vector_id="v04", chunk_id="c4", values=(4.0, 0.0), dimension=2),
+        )
+        # c9 moves to a document that only arrives in this commit.
+        vectors.put_chunk(
+            tx, Chunk(chunk_id="c9", document_id="c", text="t", ordinal=9)
+        )
+        vectors.put_document(tx, Document(document_id="c", text="c", source="s3://c"))
+        tx.commit()
+    assert vectors.filter_vector_ids(red) == {"v00", "v06", "v09", "v12", "v15", "v18"}
+    assert vectors.filter_vector_ids(parse_filter({"tags": "blue", "doc_id": "b"})) == {
+        f"v{i:02d}" for i in range(0, 20, 2) if i != 4
+    }
+    assert vectors.filter_vector_ids(parse_filter({"source_uri": "s3://c"})) == {"v09"}
+    assert vectors.filter_vector_ids(
+        parse_filter({"doc_id": ["a", "c"], "tags": "red"})
+    ) == {
+        "v09",
+        "v15",
+    }
+    assert len(vectors.filter_vector_ids(parse_filter({}))) == 19
+
+
+class _StubAdapter:
+    is_noop = False
+
+    def __init__(self, options) -> None:
+        self.options = options
+
+    def insert(self, vectors, metadata=None):
+        return [entry["vector_id"] for entry in metadata or ()]
+
+    def query(self, vector, k, mode):
+        raise AssertionError("filtered queries must not post-filter adapter hits")
+
+    def delete(self, ids):  # pragma: no cover - unused
+        return 0
+
+
+def test_vector_store_filter_is_resolved_before_scoring() -> None:
+    backend = memory_backend()
+    descriptor = VectorStoreDescriptor(
+        name="stub",
+        available=True,
+        supports_exact=True,
+        supports_ann=False,
+        delete_supported=True,
+        filtering_supported=False,
+        deterministic_exact=True,
+        experimental=True,
+        consistency=None,
+        notes=None,
+        version=None,
+    )
+    source = VectorStoreVectorSource(
+        backend.stores.vectors,
+        VectorStoreResolution(
+            descriptor=descriptor,
+            adapter=_StubAdapter({"filter": '{"tags": ["red"]}'}),
+            uri_redacted=None,
+        ),
+    )
+    backend = backend._replace(stores=backend.stores._replace(vectors=source))
+    _populate(backend)
+    results = list(source.query("art", _request(5)))
+    assert [r.vector_id for r in results] == ["v00", "v03", "v06", "v09", "v12"]
+
+
+def test_hnsw_filter_callback_limits_candidates() -> None:
+    pytest.importorskip("hnswlib")
+    from bijux_vex.infra.adapters.ann_hnsw import HnswAnnRunner
+
+    backend = sqlite_backend()
+    _populate(backend, ExecutionContract.NON_DETERMINISTIC)
+    runner = HnswAnnRunner(backend.stores.vectors)
+    runner.build_index("art", list(backend.stores.vectors.list_vectors()), "l2")
+    allowed = backend.stores.vectors.filter_vector_ids(parse_filter({"tags": "red"}))
+    request = _request(4, ExecutionContract.NON_DETERMINISTIC)
+    results = list(
+        runner.approximate_filtered(
+            _artifact(ExecutionContract.NON_DETERMINISTIC), request, allowed
+        )
+    )
+    assert [r.vector_id for r in results] == ["v00", "v03", "v06", "v09"]
@@ -0,0 +1,162 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from bijux_vex.boundaries.pydantic_edges.models import (
+    ExecutionArtifactRequest,
+    ExecutionBatchRequestPayload,
+    ExecutionBudgetPayload,
+    IngestRequest,
+    RandomnessProfilePayload,
+)
+from bijux_vex.core.contracts.execution_contract import ExecutionContract
+from bijux_vex.core.errors import CorruptArtifactError
+from bijux_vex.core.execution_intent import ExecutionIntent
+from bijux_vex.core.execution_mode import ExecutionMode
+from bijux_vex.core.runtime.vector_execution import RandomnessProfile
+from bijux_vex.core.types import (
+    ExecutionArtifact,
+    ExecutionBudget,
+    ExecutionRequest,
+    Vector,
+)
+from bijux_vex.domain.execution_algorithms.exact_matrix import (
+    build_vector_matrix,
+    exact_top_k,
+)
+from bijux_vex.infra.adapters.ann_pq import PQAnnRunner
+from bijux_vex.infra.adapters.memory.backend import memory_backend
+from bijux_vex.services._orchestrator import Orchestrator
+
+np = pytest.importorskip("numpy")
+
+DIM = 16
+
+
+def _vectors(count: int = 1200) -> list[Vector]:
+    rng = np.random.default_rng(4)
+    centers = rng.normal(size=(12, DIM)) * 4.0
+    points = centers[rng.integers(0, len(centers), count)] + rng.normal(
+        size=(count, DIM)
+    )
+    return [
+        Vector(
+            vector_id=f"v{i:05d}",
+            chunk_id=f"c{i}",
+            values=tuple(points[i].tolist()),
+            dimension=DIM,
+        )
+        for i in range(count)
+    ]
+
+
+def _artifact(metric: str) -> ExecutionArtifact:
+    return ExecutionArtifact(
+        artifact_id="art-pq",
+        corpus_fingerprint="corp",
+        vector_fingerprint="vec",
+        metric=metric,
+        scoring_version="v1",
+        execution_contract=ExecutionContract.NON_DETERMINISTIC,
+    )
+
+
+def _request(query: tuple[float, ...], top_k: int) -> ExecutionRequest:
+    return ExecutionRequest(
+        request_id="req-pq",
+        text=None,
+        vector=query,
+        top_k=top_k,
+        execution_contract=ExecutionContract.NON_DETERMINISTIC,
+        execution_intent=ExecutionIntent.EXPLORATORY_SEARCH,
+        execution_mode=ExecutionMode.BOUNDED,
+        execution_budget=ExecutionBudget(),
+    )
+
+
+@pytest.mark.parametrize("metric", ["l2", "cosine", "dot"])
+def test_ivfpq_shortlist_recalls_exact_neighbours(metric: str) -> None:
+    vectors = _vectors()
+    runner = PQAnnRunner(memory_backend().stores.vectors, nprobe=8)
+    info = runner.build_index("art-pq", vectors, metric)
+    params = info["index_params"]
+    assert isinstance(params, dict)
+    assert (params["m"], params["nbits"]) == (4, 8)
+    assert info["code_bytes"] == len(vectors) * 4
+    vm = build_vector_matrix(vectors, DIM)
+    hits = 0
+    for row in range(0, 200, 10):
+        query = tuple((vm.matrix[row] + 0.1).tolist())
+        exact = {vid for _, vid, _ in exact_top_k(metric, query, vm, 10)}
+        found = runner.approximate_request(_artifact(metric), _request(query, 40))
+        hits += len(exact & {res.vector_id for res in found})
+    assert hits / (20 * 10) >= 0.9
+
+
+def test_training_is_seeded_and_persisted(tmp_path: Path) -> None:
+    vectors = _vectors(600)
+    source = memory_backend().stores.vectors
+    runner = PQAnnRunner(source, index_dir=tmp_path)
+    runner.set_randomness_profile(RandomnessProfile(seed=7, sources=("t",)))
+    query = vectors[3].values
+    first = runner.build_index("art-pq", vectors, "l2")
+    seeded = list(runner.approximate_request(_artifact("l2"), _request(query, 5)))
+    runner.set_randomness_profile(RandomnessProfile(seed=8, sources=("t",)))
+    assert runner.build_index("art-pq", vectors, "l2")["seed"] == 8
+    runner.set_randomness_profile(RandomnessProfile(seed=7, sources=("t",)))
+    rebuilt = runner.build_index("art-pq", vectors, "l2")
+    assert rebuilt["index_hash"] == first["index_hash"]
+    expected = list(runner.approximate_request(_artifact("l2"), _request(query, 5)))
+    assert expected == seeded
+
+    reloaded = PQAnnRunner(source, index_dir=tmp_path)
+    found = list(reloaded.approximate_request(_artifact("l2"), _request(query, 5)))
+    assert [res.vector_id for res in found] == [res.vector_id for res in expected]
+    assert reloaded.index_info("art-pq")["index_hash"] == first["index_hash"]
+
+    (tmp_path / "art-pq.ivfpq.npz").write_bytes(b"not an index")
+    with pytest.raises(CorruptArtifactError):
+        PQAnnRunner(source, index_dir=tmp_path).approximate_request(
+            _artifact("l2"), _request(query, 5)
+        )
+
+
+def test_orchestrator_selects_ivfpq_runner(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("BIJUX_VEX_ANN_RUNNER", "ivfpq")
+    monkeypatch.setenv("BIJUX_VEX_HNSW_PATH", str(tmp_path))
+    orchestrator = Orchestrator(backend=memory_backend())
+    assert orchestrator.capabilities()["nd"]["default_runner"] == "ivfpq"
+    orchestrator.ingest(
+        IngestRequest(
+            documents=[f"doc {i}" for i in range(40)],
+            vectors=[[float(i), float(i % 7)] for i in range(40)],
+        )
+    )
+    orchestrator.materialize(
+        ExecutionArtifactRequest(
+            execution_contract=ExecutionContract.NON_DETERMINISTIC, index_mode="ann"
+        )
+    )
+    assert list(tmp_path.glob("*.ivfpq.npz"))
+    out = orchestrator.execute_batch(
+        ExecutionBatchRequestPayload(
+            vectors=[(3.0, 3.0), (30.0, 2.0)],
+            top_k=2,
+            execution_contract=ExecutionContract.NON_DETERMINISTIC,
+            execution_intent=ExecutionIntent.EXPLORATORY_SEARCH,
+            execution_mode=ExecutionMode.BOUNDED,
+            execution_budget=ExecutionBudgetPayload(
+                max_latency_ms=1000, max_memory_mb=100, max_error=1.0
+            ),
+            randomness_profile=RandomnessProfilePayload(
+                seed=1, sources=("ivfpq",), bounded=True, non_replayable=False
+            ),
+        )
+    )
+    assert [len(rows) for rows in out["results"]] == [2, 2]
@@ -0,0 +1,134 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from bijux_vex.core.contracts.execution_contract import ExecutionContract
+from bijux_vex.core.execution_intent import ExecutionIntent
+from bijux_vex.core.execution_mode import ExecutionMode
+from bijux_vex.core.types import (
+    Chunk,
+    Document,
+    ExecutionArtifact,
+    ExecutionBudget,
+    ExecutionRequest,
+    Vector,
+)
+from bijux_vex.infra.adapters import ann_reference
+from bijux_vex.infra.adapters.ann_reference import ReferenceAnnRunner
+from bijux_vex.infra.adapters.memory.backend import memory_backend
+
+DIM = 12
+
+
+def _seeded_backend(count: int = 2000, metric: str = "l2"):  # type: ignore[no-untyped-def]
+    rng = random.Random(5)  # noqa: S311 - deterministic fixture data
+    centers = [[rng.gauss(0.0, 4.0) for _ in range(DIM)] for _ in range(16)]
+    backend = memory_backend()
+    with backend.tx_factory() as tx:
+        backend.stores.vectors.put_document(tx, Document(document_id="d", text="t"))
+        for i in range(count):
+            center = centers[i % len(centers)]
+            values = tuple(c + rng.gauss(0.0, 1.0) for c in center)
+            backend.stores.vectors.put_chunk(
+                tx, Chunk(chunk_id=f"c{i}", document_id="d", text="t", ordinal=i)
+            )
+            backend.stores.vectors.put_vector(
+                tx,
+                Vector(
+                    vector_id=f"v{i:05d}",
+                    chunk_id=f"c{i}",
+                    values=values,
+                    dimension=DIM,
+                ),
+            )
+        backend.stores.ledger.put_artifact(tx, _artifact(metric))
+    return backend
+
+
+def _artifact(metric: str = "l2") -> ExecutionArtifact:
+    return ExecutionArtifact(
+        artifact_id="art-lsh",
+        corpus_fingerprint="corp",
+        vector_fingerprint="vec",
+        metric=metric,
+        scoring_version="v1",
+        execution_contract=ExecutionContract.NON_DETERMINISTIC,
+    )
+
+
+def _request(query: tuple[float, ...], top_k: int = 10) -> ExecutionRequest:
+    return ExecutionRequest(
+        request_id="req-lsh",
+        text=None,
+        vector=query,
+        top_k=top_k,
+        execution_contract=ExecutionContract.NON_DETERMINISTIC,
+        execution_intent=ExecutionIntent.EXPLORATORY_SEARCH,
+        execution_mode=ExecutionMode.BOUNDED,
+        execution_budget=ExecutionBudget(),
+    )
+
+
+@pytest.mark.parametrize("metric", ["l2", "cosine", "dot"])
+def test_lsh_scores_a_fraction_of_the_corpus(metric: str) -> None:
+    backend = _seeded_backend(metric=metric)
+    vectors = list(backend.stores.vectors.list_vectors())
+    runner = ReferenceAnnRunner(backend.stores.vectors)
+    info = runner.build_index("art-lsh", vectors, metric)
+    assert info["index_kind"] == "lsh"
+    recalls = []
+    for vec in vectors[:40:4]:
+        request = _request(tuple(v + 0.1 for v in vec.values))
+        found = tuple(runner.approximate_request(_artifact(metric), request))
+        params = dict(runner._query_params_metadata())
+        assert int(params["candidates"]) < len(vectors) // 2
+        report = runner.approximation_report(_artifact(metric), request, found)
+        recalls.append(report.recall_at_k)
+        assert [res.rank for res in found] == list(range(1, 11))
+    assert sum(recalls) / len(recalls) >= 0.8
+
+
+def test_report_reuses_cached_exact_baseline(monkeypatch: pytest.MonkeyPatch) -> None:
+    backend = _seeded_backend(400)
+    source = backend.stores.vectors
+    runner = ReferenceAnnRunner(source)
+    runner.build_index("art-lsh", source.list_vectors(), "l2")
+    calls = []
+    exact_query = source.query
+
+    def counting_query(artifact_id, request):  # type: ignore[no-untyped-def]
+        calls.append(request.vector)
+        return exact_query(artifact_id, request)
+
+    monkeypatch.setattr(source, "query", counting_query)
+    request = _request(next(iter(source.list_vectors())).values, top_k=5)
+    for _ in range(3):
+        found = runner.approximate_request(_artifact(), request)
+        report = runner.approximation_report(_artifact(), request, found)
+    assert report.recall_at_k == 1.0
+    assert len(calls) == 1
+
+
+def test_pure_python_hashing_matches_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numpy")
+    rng = random.Random(2)  # noqa: S311 - deterministic fixture data
+    rows = [tuple(rng.uniform(-1, 1) for _ in range(DIM)) for _ in range(50)]
+    planes = [tuple(rng.gauss(0, 1) for _ in range(DIM)) for _ in range(6)]
+    offsets = [0.25] * len(planes)
+    with_numpy = ann_reference._hash_rows(rows, planes, offsets)
+    monkeypatch.setattr(ann_reference, "np", None)
+    assert ann_reference._hash_rows(rows, planes, offsets) == with_numpy
+
+
+def test_sparse_probe_falls_back_to_exact_scan() -> None:
+    backend = _seeded_backend(400)
+    source = backend.stores.vectors
+    runner = ReferenceAnnRunner(source)
+    runner.build_index("art-lsh", source.list_vectors(), "l2")
+    request = _request((0.0,) * DIM, top_k=400)
+    found = list(runner.approximate_request(_artifact(), request))
+    assert found == list(source.query("art-lsh", request))
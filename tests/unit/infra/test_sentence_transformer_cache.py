@@ -0,0 +1,64 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from bijux_vex.infra.embeddings import sentence_transformers as st_module
+from bijux_vex.infra.embeddings.registry import preload_embedding_models
+
+
+class _FakeEncoder:
+    loads: list[tuple[str, str | None]] = []
+
+    def __init__(self, model: str, device: str | None = None, **kwargs) -> None:
+        self.model = model
+        self.device = device or "cpu"
+        self.calls: list[int] = []
+        _FakeEncoder.loads.append((model, device))
+
+    def encode(self, texts, batch_size=32, **kwargs):
+        self.calls.append(batch_size)
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+@pytest.fixture
+def fake_st(monkeypatch):
+    _FakeEncoder.loads = []
+    monkeypatch.setattr(st_module, "SentenceTransformer", _FakeEncoder)
+    monkeypatch.setattr(
+        st_module, "sentence_transformers", SimpleNamespace(__version__="0-test")
+    )
+    cache = st_module.SentenceTransformerCache(max_models=2)
+    monkeypatch.setattr(st_module, "MODEL_CACHE", cache)
+    return cache
+
+
+def test_embed_reuses_loaded_model(fake_st) -> None:
+    provider = st_module.SentenceTransformersProvider()
+    first = provider.embed(["a", "bb"], "m1", options={"batch_size": "8"})
+    second = provider.embed(["ccc"], "m1")
+    assert _FakeEncoder.loads == [("m1", None)]
+    assert fake_st.stats()["hits"] == 1
+    assert second.vectors == [(3.0, 1.0)]
+    # Runtime knobs do not change the embedding config hash.
+    assert first.metadata.config_hash == second.metadata.config_hash
+
+
+def test_cache_evicts_least_recently_used(fake_st) -> None:
+    for model in ("m1", "m2", "m1", "m3"):
+        fake_st.get(model, None, {})
+    stats = fake_st.stats()
+    assert stats["resident"] == ["m1", "m3"]
+    assert stats["evictions"] == 1
+    # Load-time options get their own entry; encode-time options do not.
+    assert st_module.model_key("m", None, {"normalize": "true"}) == ("m", None, ())
+    assert st_module.model_key("m", None, {"revision": "v2"}) != ("m", None, ())
+
+
+def test_preload_from_spec(fake_st) -> None:
+    assert preload_embedding_models("sentence_transformers:m9, m8") == ["m9", "m8"]
+    assert _FakeEncoder.loads == [("m9", None), ("m8", None)]
+    assert preload_embedding_models("") == []
@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from bijux_vex.core.contracts.execution_contract import ExecutionContract
+from bijux_vex.core.execution_intent import ExecutionIntent
+from bijux_vex.core.types import (
+    Chunk,
+    Document,
+    ExecutionArtifact,
+    ExecutionRequest,
+    Vector,
+)
+from bijux_vex.infra.adapters.sqlite import backend as sqlite_module
+
+
+def _populated(tmp_path, vectors):
+    backend = sqlite_module.sqlite_backend(str(tmp_path / "scan.sqlite"))
+    with backend.tx_factory() as tx:
+        backend.stores.vectors.put_document(tx, Document(document_id="d", text="t"))
+        backend.stores.vectors.put_chunk(
+            tx, Chunk(chunk_id="c", document_id="d", text="t", ordinal=0)
+        )
+        for idx, values in enumerate(vectors):
+            backend.stores.vectors.put_vector(
+                tx,
+                Vector(
+                    vector_id=f"v{idx:03d}",
+                    chunk_id="c",
+                    values=values,
+                    dimension=len(values),
+                ),
+            )
+        backend.stores.ledger.put_artifact(
+            tx,
+            ExecutionArtifact(
+                artifact_id="art",
+                corpus_fingerprint="corp",
+                vector_fingerprint="vec",
+                metric="l2",
+                scoring_version="v1",
+                build_params=(),
+                execution_contract=ExecutionContract.DETERMINISTIC,
+            ),
+        )
+    return backend
+
+
+def _request(vector, top_k):
+    return ExecutionRequest(
+        request_id="q",
+        text=None,
+        vector=vector,
+        top_k=top_k,
+        execution_contract=ExecutionContract.DETERMINISTIC,
+        execution_intent=ExecutionIntent.EXACT_VALIDATION,
+    )
+
+
+@pytest.mark.parametrize("fetch_rows", [1, 7, 1024])
+def test_streaming_scan_matches_full_sort(tmp_path, monkeypatch, fetch_rows) -> None:
+    monkeypatch.setattr(sqlite_module, "QUERY_FETCH_ROWS", fetch_rows)
+    rng = random.Random(7)  # noqa: S311 - deterministic fixture data
+    # Duplicated vectors force ties that must resolve by vector id.
+    base = [(rng.uniform(-1, 1), rng.uniform(-1, 1)) for _ in range(40)]
+    vectors = base + base[:10] + [(0.5, 0.5, 0.5)]
+    backend = _populated(tmp_path, vectors)
+    query = (0.1, -0.2)
+    expected = sorted(
+        (
+            sum((q - v) * (q - v) for q, v in zip(query, values, strict=True)),
+            f"v{idx:03d}",
+        )
+        for idx, values in enumerate(vectors)
+        if len(values) == len(query)
+    )[:12]
+    results = list(backend.stores.vectors.query("art", _request(query, 12)))
+    assert [(r.score, r.vector_id) for r in results] == expected
+    assert [r.rank for r in results] == list(range(1, 13))
+    assert {r.document_id for r in results} == {"d"}
+
+
+def test_scan_with_nonpositive_top_k_is_empty(tmp_path) -> None:
+    backend = _populated(tmp_path, [(0.0, 1.0)])
+    assert list(backend.stores.vectors.query("art", _request((0.0, 0.0), 0))) == []
@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+import json
+import sqlite3
+
+from bijux_vex.core.types import Vector
+from bijux_vex.infra.adapters.sqlite.backend import sqlite_backend
+from bijux_vex.infra.migrations.sqlite_vectors import migrate_vector_storage
+from bijux_vex.infra.vector_codec import pack_vector, unpack_vector
+
+
+def test_pack_roundtrip_is_exact_for_float64() -> None:
+    values = (0.1, -2.5, 1e-300, 3.141592653589793)
+    assert unpack_vector(pack_vector(values, "float64"), "float64") == values
+    assert len(pack_vector(values, "float32")) == 16
+
+
+def test_sqlite_stores_vectors_as_blobs(tmp_path) -> None:
+    db = tmp_path / "vex.sqlite"
+    backend = sqlite_backend(str(db))
+    vec = Vector(vector_id="v1", chunk_id="c1", values=(0.1, 0.2), dimension=2)
+    with backend.tx_factory() as tx:
+        backend.stores.vectors.put_vector(tx, vec)
+        tx.commit()
+    assert backend.stores.vectors.get_vector("v1") == vec
+    conn = sqlite3.connect(db)
+    blob, dtype, legacy = conn.execute(
+        "SELECT vec_blob, vec_dtype, vec_values FROM vectors"
+    ).fetchone()
+    assert isinstance(blob, bytes)
+    assert dtype == "float64"
+    assert legacy is None
+
+
+def test_legacy_json_rows_are_migrated_in_place(tmp_path) -> None:
+    db = tmp_path / "legacy.sqlite"
+    conn = sqlite3.connect(db)
+    conn.execute(
+        "CREATE TABLE vectors(id TEXT PRIMARY KEY, chunk_id TEXT, dim INTEGER, vec_values TEXT, model TEXT, metadata TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO vectors(id, chunk_id, dim, vec_values) VALUES(?,?,?,?)",
+        [(f"v{i}", "c1", 2, json.dumps([i * 0.1, 1.0])) for i in range(5)],
+    )
+    conn.commit()
+    assert migrate_vector_storage(conn, batch_size=2) == 5
+    assert migrate_vector_storage(conn) == 0
+    conn.close()
+
+    backend = sqlite_backend(str(db))
+    vectors = list(backend.stores.vectors.list_vectors())
+    assert [v.vector_id for v in vectors] == [f"v{i}" for i in range(5)]
+    assert vectors[3].values == (3 * 0.1, 1.0)
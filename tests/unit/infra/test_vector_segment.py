@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from bijux_vex.boundaries.pydantic_edges.models import (
+    ExecutionArtifactRequest,
+    ExecutionRequestPayload,
+    IngestRequest,
+)
+from bijux_vex.core.contracts.execution_contract import ExecutionContract
+from bijux_vex.core.errors import CorruptArtifactError
+from bijux_vex.core.execution_intent import ExecutionIntent
+from bijux_vex.core.types import ExecutionArtifact, Vector
+from bijux_vex.domain.execution_algorithms.exact_matrix import (
+    MATRIX_CACHE,
+    build_vector_matrix,
+    exact_top_k,
+)
+from bijux_vex.infra.adapters.sqlite.backend import sqlite_backend
+from bijux_vex.infra.vector_segment import (
+    open_segment,
+    segment_store_for,
+    write_segment,
+)
+from bijux_vex.services._orchestrator import Orchestrator
+
+pytest.importorskip("numpy")
+
+ARTIFACT = ExecutionArtifact(
+    artifact_id="art",
+    corpus_fingerprint="corp",
+    vector_fingerprint="vec-fp",
+    metric="l2",
+    scoring_version="v1",
+    execution_contract=ExecutionContract.DETERMINISTIC,
+)
+
+
+def _vectors(step: float) -> list[Vector]:
+    return [
+        Vector(
+            vector_id=f"v{i:02d}",
+            chunk_id=f"chunk-é{i}",
+            values=(i * step, 1.0 - i * step, 0.5),
+            dimension=3,
+        )
+        for i in range(12)
+    ] + [Vector(vector_id="other", chunk_id="c", values=(1.0,), dimension=1)]
+
+
+@pytest.mark.parametrize(("step", "dtype"), [(0.25, "float32"), (0.1, "float64")])
+def test_segment_round_trips_bit_identically(
+    tmp_path: Path, step: float, dtype: str
+) -> None:
+    vectors = _vectors(step)
+    header = write_segment(tmp_path / "art.seg", ARTIFACT, vectors, 3)
+    assert (header.rows, header.dimension, header.dtype) == (12, 3, dtype)
+    segment = open_segment(tmp_path / "art.seg")
+    assert segment.header == header
+    assert segment.chunk_ids[3] == "chunk-é3"
+    mapped = segment.vector_matrix()
+    built = build_vector_matrix(vectors, 3)
+    assert mapped.vector_ids == built.vector_ids
+    query = (0.3, 0.2, 0.1)
+    assert exact_top_k("l2", query, mapped, 5) == exact_top_k("l2", query, built, 5)
+    segment.verify(ARTIFACT)
+
+
+def test_segment_verification_detects_mismatch_and_corruption(tmp_path: Path) -> None:
+    path = tmp_path / "art.seg"
+    header = write_segment(path, ARTIFACT, _vectors(0.25), 3)
+    other = ExecutionArtifact(**{**ARTIFACT.__dict__, "vector_fingerprint": "stale"})
+    with pytest.raises(CorruptArtifactError, match="does not match"):
+        open_segment(path).verify(other)
+    raw = bytearray(path.read_bytes())
+    raw[header.payload_offset + 5] ^= 0xFF
+    path.write_bytes(bytes(raw))
+    with pytest.raises(CorruptArtifactError, match="checksum"):
+        open_segment(path).verify(ARTIFACT)
+    path.write_bytes(b"garbage!" + bytes(raw[8:]))
+    with pytest.raises(CorruptArtifactError, match="Not a vector segment"):
+        open_segment(path)
+
+
+def test_materialize_writes_segments_that_exact_scans_read(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("BIJUX_VEX_SEGMENT_PATH", str(tmp_path / "segments"))
+    db = str(tmp_path / "db.sqlite")
+    writer = Orchestrator(backend=sqlite_backend(db))
+    writer.ingest(
+        IngestRequest(
+            documents=[f"doc {i}" for i in range(8)],
+            vectors=[[float(i), float(i % 3)] for i in range(8)],
+        )
+    )
+    writer.materialize(
+        ExecutionArtifactRequest(execution_contract=ExecutionContract.DETERMINISTIC)
+    )
+    # A second process sees the same files through its own store.
+    reader = Orchestrator(backend=sqlite_backend(db))
+    reader.default_artifact_id = writer.default_artifact_id
+    artifact = reader.stores.ledger.get_artifact(writer.default_artifact_id)
+    segments = segment_store_for(reader.stores.vectors)
+    assert segments is not None
+    assert segments.segment(artifact, 2) is not None
+    assert [h.rows for h in segments.verify(artifact)] == [8]
+    request = ExecutionRequestPayload(
+        vector=(2.2, 1.0),
+        top_k=3,
+        artifact_id=writer.default_artifact_id,
+        execution_contract=ExecutionContract.DETERMINISTIC,
+        execution_intent=ExecutionIntent.EXACT_VALIDATION,
+    )
+    with monkeypatch.context() as patched:
+
+        def _rebuild(*_args):
+            raise AssertionError("exact scan must read the mapped segment")
+
+        patched.setattr(MATRIX_CACHE, "get", _rebuild)
+        mapped = reader.execute(request)["results"]
+    monkeypatch.delenv("BIJUX_VEX_SEGMENT_PATH")
+    plain = Orchestrator(backend=sqlite_backend(db)).execute(request)["results"]
+    assert mapped == plain
+
+    writer.ingest(IngestRequest(documents=["late"], vectors=[[9.0, 9.0]]))
+    assert not list((tmp_path / "segments").glob("*.seg"))
+    assert segments.segment(artifact, 2) is None
+
+
+def test_vector_deletes_outside_ingest_invalidate_segments(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("BIJUX_VEX_SEGMENT_PATH", str(tmp_path / "segments"))
+    orchestrator = Orchestrator(backend=sqlite_backend(str(tmp_path / "db.sqlite")))
+    orchestrator.ingest(
+        IngestRequest(documents=["a", "b"], vectors=[[0.0, 1.0], [1.0, 0.0]])
+    )
+    orchestrator.materialize(
+        ExecutionArtifactRequest(execution_contract=ExecutionContract.DETERMINISTIC)
+    )
+    vectors = orchestrator.stores.vectors
+    artifact = orchestrator.stores.ledger.get_artifact(orchestrator.default_artifact_id)
+    segments = segment_store_for(vectors)
+    assert segments is not None
+    assert segments.segment(artifact, 2) is not None
+    victim = next(iter(vectors.list_vectors())).vector_id
+    with orchestrator.backend.tx_factory() as tx:
+        vectors.delete_vector(tx, victim)
+        tx.commit()
+    assert segment_store_for(vectors) is segments
+    assert segments.segment(artifact, 2) is None
+    assert not list((tmp_path / "segments").glob("*.seg"))
@@ -0,0 +1,124 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+import pytest
+
+from bijux_vex.boundaries.pydantic_edges.models import (
+    ExecutionArtifactRequest,
+    ExecutionBatchRequestPayload,
+    ExecutionBudgetPayload,
+    ExecutionRequestPayload,
+    IngestRequest,
+    RandomnessProfilePayload,
+)
+from bijux_vex.core.contracts.execution_contract import ExecutionContract
+from bijux_vex.core.execution_intent import ExecutionIntent
+from bijux_vex.core.execution_mode import ExecutionMode
+from bijux_vex.domain.provenance.lineage import explain_result
+from bijux_vex.infra.adapters.memory.backend import memory_backend
+from bijux_vex.infra.adapters.sqlite.backend import sqlite_backend
+from bijux_vex.services._orchestrator import Orchestrator
+
+QUERIES = [(0.0, 1.0), (2.5, 0.5), (4.0, 4.0)]
+
+
+def _orchestrator(
+    contract: ExecutionContract, index_mode: str, backend=None
+) -> Orchestrator:
+    orchestrator = Orchestrator(backend=backend or memory_backend())
+    orchestrator.ingest(
+        IngestRequest(
+            documents=[f"doc {i}" for i in range(6)],
+            vectors=[[float(i), float(i % 3)] for i in range(6)],
+        )
+    )
+    orchestrator.materialize(
+        ExecutionArtifactRequest(execution_contract=contract, index_mode=index_mode)
+    )
+    return orchestrator
+
+
+def test_deterministic_batch_matches_single_queries() -> None:
+    orchestrator = _orchestrator(ExecutionContract.DETERMINISTIC, "exact")
+    common = {
+        "top_k": 3,
+        "execution_contract": ExecutionContract.DETERMINISTIC,
+        "execution_intent": ExecutionIntent.EXACT_VALIDATION,
+    }
+    out = orchestrator.execute_batch(
+        ExecutionBatchRequestPayload(vectors=QUERIES, **common)
+    )
+    artifact = orchestrator.stores.ledger.get_artifact(orchestrator.default_artifact_id)
+    assert artifact.execution_id == out["execution_ids"][-1]
+    assert len(set(out["execution_ids"])) == len(QUERIES)
+    singles = [
+        orchestrator.execute(ExecutionRequestPayload(vector=query, **common))["results"]
+        for query in QUERIES
+    ]
+    assert out["results"] == singles
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_every_batch_execution_id_stays_explainable(backend, tmp_path) -> None:
+    fixture = (
+        memory_backend()
+        if backend == "memory"
+        else sqlite_backend(str(tmp_path / "db.sqlite"))
+    )
+    orchestrator = _orchestrator(ExecutionContract.DETERMINISTIC, "exact", fixture)
+    out = orchestrator.execute_batch(
+        ExecutionBatchRequestPayload(
+            vectors=[(float(i), 0.5) for i in range(10)],
+            top_k=2,
+            execution_contract=ExecutionContract.DETERMINISTIC,
+            execution_intent=ExecutionIntent.EXACT_VALIDATION,
+        )
+    )
+    ledger = orchestrator.stores.ledger
+    assert all(ledger.get_execution_result(eid) for eid in out["execution_ids"])
+    first = ledger.get_execution_result(out["execution_ids"][0])
+    assert [r.vector_id for r in first.results] == out["results"][0]
+    explained = explain_result(first.results[0], orchestrator.stores)
+    assert explained["vector"].vector_id == out["results"][0][0]
+
+
+def test_batch_payload_rejects_mixed_dimensions() -> None:
+    common = {
+        "top_k": 1,
+        "execution_contract": ExecutionContract.DETERMINISTIC,
+        "execution_intent": ExecutionIntent.EXACT_VALIDATION,
+    }
+    with pytest.raises(ValueError, match="dimension"):
+        ExecutionBatchRequestPayload(vectors=[(0.0, 1.0), (1.0,)], **common)
+    with pytest.raises(ValueError, match="use vectors"):
+        ExecutionBatchRequestPayload(vectors=[(0.0,)], vector=(1.0,), **common)
+    with pytest.raises(ValueError, match="request_text or vector"):
+        ExecutionRequestPayload(**common)
+    batch = ExecutionBatchRequestPayload(vectors=[(0.0, 1.0)], **common)
+    single = batch.single_request((2.0, 3.0))
+    assert isinstance(single, ExecutionRequestPayload)
+    assert single.vector == (2.0, 3.0)
+    assert single.top_k == 1
+
+
+def test_non_deterministic_batch_uses_ann_index() -> None:
+    pytest.importorskip("hnswlib")
+    orchestrator = _orchestrator(ExecutionContract.NON_DETERMINISTIC, "ann")
+    out = orchestrator.execute_batch(
+        ExecutionBatchRequestPayload(
+            vectors=QUERIES,
+            top_k=2,
+            execution_contract=ExecutionContract.NON_DETERMINISTIC,
+            execution_intent=ExecutionIntent.EXPLORATORY_SEARCH,
+            execution_mode=ExecutionMode.BOUNDED,
+            execution_budget=ExecutionBudgetPayload(
+                max_latency_ms=1000, max_memory_mb=100, max_error=1.0
+            ),
+            randomness_profile=RandomnessProfilePayload(
+                seed=1, sources=("hnsw",), bounded=True, non_replayable=False
+            ),
+        )
+    )
+    assert [len(rows) for rows in out["results"]] == [2, 2, 2]
+    assert out["execution_contract"] == "non_deterministic"
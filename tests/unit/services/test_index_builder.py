@@ -0,0 +1,183 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+from dataclasses import replace
+import threading
+
+import pytest
+
+from bijux_vex.boundaries.pydantic_edges.models import (
+    ExecutionArtifactRequest,
+    ExecutionBudgetPayload,
+    ExecutionRequestPayload,
+    IngestRequest,
+    RandomnessProfilePayload,
+)
+from bijux_vex.core.contracts.execution_contract import ExecutionContract
+from bijux_vex.core.execution_intent import ExecutionIntent
+from bijux_vex.core.execution_mode import ExecutionMode
+from bijux_vex.core.types import ExecutionArtifact
+from bijux_vex.domain.nd.model import NDExecutionModel
+from bijux_vex.infra.adapters.ann_fallback import ExactFallbackAnnRunner
+from bijux_vex.infra.adapters.ann_reference import ReferenceAnnRunner
+from bijux_vex.infra.adapters.memory.backend import memory_backend
+from bijux_vex.services._orchestrator import Orchestrator
+from bijux_vex.services.index_builder import BackgroundIndexBuilder
+
+
+def _nd_query(vector: tuple[float, float]) -> ExecutionRequestPayload:
+    return ExecutionRequestPayload(
+        vector=vector,
+        top_k=2,
+        execution_contract=ExecutionContract.NON_DETERMINISTIC,
+        execution_intent=ExecutionIntent.EXPLORATORY_SEARCH,
+        execution_mode=ExecutionMode.BOUNDED,
+        execution_budget=ExecutionBudgetPayload(
+            max_latency_ms=1000, max_memory_mb=100, max_error=1.0
+        ),
+        randomness_profile=RandomnessProfilePayload(
+            seed=1, sources=("hnsw",), bounded=True, non_replayable=False
+        ),
+    )
+
+
+def _gated_build(runner, monkeypatch):  # type: ignore[no-untyped-def]
+    gate = threading.Event()
+    build = runner.build_index
+
+    def gated(*args, **kwargs):  # type: ignore[no-untyped-def]
+        assert gate.wait(10)
+        return build(*args, **kwargs)
+
+    monkeypatch.setattr(runner, "build_index", gated)
+    return gate
+
+
+def test_invalidated_index_rebuilds_off_the_request_path(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pytest.importorskip("hnswlib")
+    orchestrator = Orchestrator(backend=memory_backend(), background_rebuild=True)
+    orchestrator.ingest(
+        IngestRequest(
+            documents=[f"doc {i}" for i in range(6)],
+            vectors=[[float(i), float(i % 3)] for i in range(6)],
+        )
+    )
+    orchestrator.materialize(
+        ExecutionArtifactRequest(
+            execution_contract=ExecutionContract.NON_DETERMINISTIC, index_mode="ann"
+        )
+    )
+    artifact_id = orchestrator.default_artifact_id
+    runner = orchestrator.backend.ann
+    monkeypatch.setattr(runner, "apply_delta", lambda *args, **kwargs: {})
+    gate = _gated_build(runner, monkeypatch)
+    orchestrator.ingest(IngestRequest(documents=["late"], vectors=[[9.0, 9.0]]))
+
+    ledger = orchestrator.stores.ledger
+    assert ledger.get_artifact(artifact_id).index_state == "invalidated"
+    builds = orchestrator.capabilities()["nd"]["index_builds"]
+    assert builds[artifact_id]["state"] in {"queued", "building"}
+    stale = orchestrator.execute(_nd_query((9.0, 9.0)))
+    assert len(stale["results"]) == 2
+
+    gate.set()
+    assert orchestrator.index_builder is not None
+    assert orchestrator.index_builder.wait(artifact_id, 10)
+    artifact = ledger.get_artifact(artifact_id)
+    info = runner.index_info(artifact_id)
+    assert artifact.index_state == "ready"
+    assert info["vector_count"] == 7
+    assert dict(artifact.build_params)["ann_index_hash"] == info["index_hash"]
+    status = orchestrator.capabilities()["nd"]["index_builds"][artifact_id]
+    assert status["state"] == "ready"
+    assert status["vectors_loaded"] == status["vectors_total"] == 7
+    fresh = orchestrator.execute(_nd_query((9.0, 9.0)))
+    (late,) = [
+        vec.vector_id
+        for vec in orchestrator.stores.vectors.list_vectors()
+        if vec.values == (9.0, 9.0)
+    ]
+    assert fresh["results"][0] == late
+
+
+def test_missing_index_serves_exact_fallback_while_rebuilding() -> None:
+    backend = memory_backend()
+    runner = ReferenceAnnRunner(backend.stores.vectors)
+    scheduled: list[str] = []
+    artifact = ExecutionArtifact(
+        artifact_id="art",
+        corpus_fingerprint="corp",
+        vector_fingerprint="vec",
+        metric="l2",
+        scoring_version="v1",
+        execution_contract=ExecutionContract.NON_DETERMINISTIC,
+        index_state="invalidated",
+    )
+    model = NDExecutionModel(
+        stores=backend.stores,
+        ann_runner=runner,
+        schedule_rebuild=lambda art, _settings: scheduled.append(art.artifact_id),
+    )
+    assert model.ensure_index(artifact, None, build_on_demand=False) is artifact
+    assert scheduled == ["art"]
+    assert isinstance(model._ann_runner, ExactFallbackAnnRunner)
+    report = model._ann_runner.approximation_report(artifact, None, ())  # type: ignore[arg-type]
+    assert report.deterministic_fallback_used
+    assert report.recall_at_k == 1.0
+    unbuilt = replace(artifact, index_state="unbuilt")
+    with pytest.raises(Exception, match="ANN index missing"):
+        NDExecutionModel(
+            stores=backend.stores, ann_runner=runner, schedule_rebuild=print
+        ).ensure_index(unbuilt, None, build_on_demand=False)
+
+
+def test_rebuild_requested_mid_build_reruns_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    backend = memory_backend()
+    runner = ReferenceAnnRunner(backend.stores.vectors)
+    gate = _gated_build(runner, monkeypatch)
+    built: list[str] = []
+    held: list[bool] = []
+
+    def on_built(art_id: str, _info: dict[str, object]) -> None:
+        held.append(builder._lock.locked())
+        built.append(art_id)
+
+    builder = BackgroundIndexBuilder(backend.stores.vectors, runner, on_built)
+    artifact = ExecutionArtifact(
+        artifact_id="art",
+        corpus_fingerprint="corp",
+        vector_fingerprint="vec",
+        metric="l2",
+        scoring_version="v1",
+        execution_contract=ExecutionContract.NON_DETERMINISTIC,
+    )
+    assert builder.schedule(artifact)
+    assert not builder.schedule(artifact)
+    assert not builder.schedule(artifact)
+    assert builder.is_building("art")
+    gate.set()
+    assert builder.wait("art", 10)
+    assert built == ["art"]
+    assert held == [False]
+    status = builder.status()["art"]
+    assert status["state"] == "ready"
+    assert status["builds"] == 2
+    assert not builder.is_building("art")
+
+
+def test_background_rebuild_is_opt_in_outside_the_api(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("BIJUX_VEX_ND_BACKGROUND_REBUILD", raising=False)
+    assert Orchestrator(backend=memory_backend()).index_builder is None
+    assert Orchestrator(backend=memory_backend(), background_rebuild=True).index_builder
+    monkeypatch.setenv("BIJUX_VEX_ND_BACKGROUND_REBUILD", "0")
+    engine = Orchestrator(backend=memory_backend(), background_rebuild=True)
+    assert engine.index_builder is None
+    monkeypatch.setenv("BIJUX_VEX_ND_BACKGROUND_REBUILD", "1")
+    assert Orchestrator(backend=memory_backend()).index_builder is not None
@@ -0,0 +1,136 @@
+# SPDX-License-Identifier: MIT
+# Copyright © 2026 Bijan Mousavi
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from bijux_vex.boundaries.pydantic_edges.models import IngestRequest
+from bijux_vex.core.errors import ValidationError
+from bijux_vex.core.types import Chunk, Document, Vector
+from bijux_vex.infra.adapters.memory.backend import memory_backend
+from bijux_vex.infra.adapters.sqlite.backend import sqlite_backend
+from bijux_vex.infra.adapters.vectorstore_registry import (
+    VectorStoreDescriptor,
+    VectorStoreResolution,
+)
+from bijux_vex.infra.adapters.vectorstore_source import VectorStoreVectorSource
+from bijux_vex.services._orchestrator import Orchestrator
+
+
+def _write_jsonl(path: Path, count: int, broken_at: int | None = None) -> None:
+    lines = []
+    for i in range(count):
+        if i == broken_at:
+            lines.append("{not json")
+            continue
+        lines.append(json.dumps({"text": f"doc {i}", "vector": [float(i), 1.0]}))
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_stream_commits_batches_and_resumes(tmp_path: Path) -> None:
+    source = tmp_path / "corpus.jsonl"
+    checkpoint = tmp_path / "corpus.ckpt"
+    _write_jsonl(source, 7, broken_at=5)
+    orchestrator = Orchestrator(backend=sqlite_backend(str(tmp_path / "db.sqlite")))
+
+    with pytest.raises(ValidationError):
+        orchestrator.ingest_stream(source, batch_size=2, checkpoint=checkpoint)
+    assert json.loads(checkpoint.read_text())["rows"] == 4
+    assert len(list(orchestrator.stores.vectors.list_vectors())) == 4
+
+    _write_jsonl(source, 7)
+    out = orchestrator.ingest_stream(source, batch_size=2, checkpoint=checkpoint)
+    assert out["resumed_from"] == 4
+    assert out["ingested"] == 3
+    assert (out["rows"], out["batches"]) == (7, 4)
+    assert len(list(orchestrator.stores.vectors.list_vectors())) == 7
+    assert orchestrator._latest_vector_fingerprint == out["vector_fingerprint"]
+
+
+def test_single_batch_stream_matches_ingest_fingerprints(tmp_path: Path) -> None:
+    source = tmp_path / "corpus.jsonl"
+    _write_jsonl(source, 3)
+    streamed = Orchestrator(backend=memory_backend())
+    streamed.ingest_stream(source, batch_size=10)
+    direct = Orchestrator(backend=memory_backend())
+    direct.ingest(
+        IngestRequest(
+            documents=[f"doc {i}" for i in range(3)],
+            vectors=[[float(i), 1.0] for i in range(3)],
+        )
+    )
+    assert streamed._latest_corpus_fingerprint == direct._latest_corpus_fingerprint
+    assert streamed._latest_vector_fingerprint == direct._latest_vector_fingerprint
+    assert [v.vector_id for v in streamed.stores.vectors.list_vectors()] == [
+        v.vector_id for v in direct.stores.vectors.list_vectors()
+    ]
+
+
+def test_stream_reads_npy_with_texts(tmp_path: Path) -> None:
+    np = pytest.importorskip("numpy")
+    source = tmp_path / "vectors.npy"
+    np.save(source, np.arange(8, dtype=np.float32).reshape(4, 2))
+    texts = tmp_path / "texts.txt"
+    texts.write_text("a\nb\nc\nd\n", encoding="utf-8")
+    orchestrator = Orchestrator(backend=memory_backend())
+    out = orchestrator.ingest_stream(source, texts=texts, batch_size=3)
+    assert (out["ingested"], out["batches"]) == (4, 2)
+    docs = sorted(d.text for d in orchestrator.stores.vectors.list_documents())
+    assert docs == ["a", "b", "c", "d"]
+
+
+class _RecordingAdapter:
+    is_noop = False
+
+    def __init__(self) -> None:
+        self.inserts: list[int] = []
+
+    def insert(self, vectors, metadata=None):
+        self.inserts.append(len(list(vectors)))
+        return [entry["vector_id"] for entry in metadata or ()]
+
+    def query(self, vector, k, mode):  # pragma: no cover - unused
+        return []
+
+    def delete(self, ids):  # pragma: no cover - unused
+        return 0
+
+
+def test_vector_store_put_batch_inserts_once() -> None:
+    backend = memory_backend()
+    adapter = _RecordingAdapter()
+    descriptor = VectorStoreDescriptor(
+        name="stub",
+        available=True,
+        supports_exact=True,
+        supports_ann=False,
+        delete_supported=True,
+        filtering_supported=False,
+        deterministic_exact=True,
+        experimental=True,
+        consistency=None,
+        notes=None,
+        version=None,
+    )
+    source = VectorStoreVectorSource(
+        backend.stores.vectors,
+        VectorStoreResolution(
+            descriptor=descriptor, adapter=adapter, uri_redacted=None
+        ),
+    )
+    docs = [Document(document_id=f"d{i}", text=str(i)) for i in range(3)]
+    chunks = [
+        Chunk(chunk_id=f"c{i}", document_id=f"d{i}", text=str(i), ordinal=0)
+        for i in range(3)
+    ]
+    vectors = [
+        Vector(vector_id=f"v{i}", chunk_id=f"c{i}", values=(float(i),), dimension=1)
+        for i in range(3)
+    ]
+    with backend.tx_factory() as tx:
+        source.put_batch(tx, docs, chunks, vectors)
+    assert adapter.inserts == [3]
+    assert [v.vector_id for v in source.list_vectors()] == ["v0", "v1", "v2"]
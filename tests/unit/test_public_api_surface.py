@@ -61,6 +61,7 @@ EXPECTED = {
     "bijux_vex.domain.execution_requests.plan": {
         "build_execution_plan",
         "run_plan",
+        "run_plan_batch",
     },
     "bijux_vex.domain.execution_requests.comparator": {"ExecutionComparator"},
     "bijux_vex.core.invariants": {"ALLOWED_METRICS", "validate_execution_artifact"},
@@ -68,6 +69,7 @@ EXPECTED = {
         "ExecutionResources",
         "BackendCapabilities",
         "VectorSource",
+        "StoredVectors",
         "ExecutionLedger",
     },
     "bijux_vex.contracts.tx": {"Tx"},